@@ -0,0 +1,78 @@
+"""Add vault_notes metadata index
+
+Adds the vault_notes table, a persistent index of vault note metadata
+(path, mtime, size, title, tags, type). GET /api/vault/notes reads from this
+table instead of walking the vault and parsing every note's frontmatter.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "018"
+down_revision = "017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "vault_notes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("path", sa.String(1000), nullable=False, unique=True),
+        sa.Column("name", sa.String(500), nullable=False),
+        sa.Column("folder", sa.String(1000), nullable=False, server_default=""),
+        # Frontmatter metadata
+        sa.Column("title", sa.String(1000), nullable=True),
+        sa.Column(
+            "tags",
+            postgresql.ARRAY(sa.String()),
+            nullable=False,
+            server_default="{}",
+        ),
+        sa.Column("note_type", sa.String(100), nullable=True),
+        # File stats
+        sa.Column("mtime", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False, server_default="0"),
+        # Case-insensitive sort keys
+        sa.Column("sort_name", sa.String(500), nullable=False),
+        sa.Column("sort_title", sa.String(1000), nullable=False),
+        sa.Column(
+            "indexed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+    op.create_index("ix_vault_notes_folder", "vault_notes", ["folder"])
+    op.create_index("ix_vault_notes_note_type", "vault_notes", ["note_type"])
+
+    # (sort_key, path) composites back keyset pagination for each sort order
+    op.create_index("ix_vault_notes_mtime_path", "vault_notes", ["mtime", "path"])
+    op.create_index(
+        "ix_vault_notes_sort_name_path", "vault_notes", ["sort_name", "path"]
+    )
+    op.create_index(
+        "ix_vault_notes_sort_title_path", "vault_notes", ["sort_title", "path"]
+    )
+    op.create_index("ix_vault_notes_size_path", "vault_notes", ["size", "path"])
+    op.create_index(
+        "ix_vault_notes_tags", "vault_notes", ["tags"], postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_vault_notes_tags", table_name="vault_notes")
+    op.drop_index("ix_vault_notes_size_path", table_name="vault_notes")
+    op.drop_index("ix_vault_notes_sort_title_path", table_name="vault_notes")
+    op.drop_index("ix_vault_notes_sort_name_path", table_name="vault_notes")
+    op.drop_index("ix_vault_notes_mtime_path", table_name="vault_notes")
+    op.drop_index("ix_vault_notes_note_type", table_name="vault_notes")
+    op.drop_index("ix_vault_notes_folder", table_name="vault_notes")
+    op.drop_table("vault_notes")
@@ -0,0 +1,62 @@
+"""Add processing_checkpoints table
+
+Adds per-stage checkpoints for the LLM processing pipeline. Each completed
+stage persists its output keyed by content + content hash + stage + config
+hash, so retried or re-queued runs skip LLM calls whose results are still
+valid.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "processing_checkpoints",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "content_uuid",
+            sa.String(36),
+            sa.ForeignKey("content.content_uuid", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("stage", sa.String(30), nullable=False),
+        # Validity keys
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("config_hash", sa.String(64), nullable=False),
+        # Stage output
+        sa.Column("output", postgresql.JSONB(), nullable=True),
+        sa.Column("cost_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.UniqueConstraint("content_uuid", "stage", name="uq_processing_checkpoint"),
+    )
+
+    op.create_index(
+        "ix_processing_checkpoints_content_uuid",
+        "processing_checkpoints",
+        ["content_uuid"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_processing_checkpoints_content_uuid",
+        table_name="processing_checkpoints",
+    )
+    op.drop_table("processing_checkpoints")
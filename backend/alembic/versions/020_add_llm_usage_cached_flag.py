@@ -0,0 +1,30 @@
+"""Add cached flag to llm_usage_logs
+
+Marks usage rows served from the LLM response cache. Cached rows carry zero
+tokens and cost, so spend reports stay truthful while still showing how many
+provider calls the cache saved.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "020"
+down_revision = "019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "llm_usage_logs",
+        sa.Column("cached", sa.Boolean(), nullable=False, server_default="false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("llm_usage_logs", "cached")
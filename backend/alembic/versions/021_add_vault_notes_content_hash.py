@@ -0,0 +1,30 @@
+"""Add content_hash to vault_notes
+
+Stores a SHA-256 of each note's normalized frontmatter, wikilinks and tags as
+of its last successful graph sync, so vault syncs can skip notes whose
+content hasn't changed.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "021"
+down_revision = "020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "vault_notes",
+        sa.Column("content_hash", sa.String(64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("vault_notes", "content_hash")
@@ -0,0 +1,31 @@
+"""Add GIN index on spaced_rep_cards.tags
+
+Backs topic-filtered card queries (due cards, review forecast, card stats,
+mastery) that match tags with array containment/overlap. Due-date ranges are
+already served by the composite ix_spaced_rep_cards_due_state (due_date, state).
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "022"
+down_revision = "021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_spaced_rep_cards_tags",
+        "spaced_rep_cards",
+        ["tags"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_spaced_rep_cards_tags", table_name="spaced_rep_cards")
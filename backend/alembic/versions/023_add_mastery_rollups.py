@@ -0,0 +1,69 @@
+"""Add mastery_rollups table
+
+Per-topic and global learning aggregates (card counts by state, review and
+exercise totals) maintained incrementally on card reviews and exercise
+attempts, so analytics reads scale with topics rather than cards. The table
+starts empty and is built by the first reconcile.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "mastery_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("topic_path", sa.String(200), nullable=False, unique=True),
+        # Spaced repetition cards
+        sa.Column("card_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("new_cards", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("learning_cards", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("mastered_cards", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("review_cards", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "review_stability_sum", sa.Float(), nullable=False, server_default="0"
+        ),
+        sa.Column("total_reviews", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("correct_reviews", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_reviewed", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "review_time_seconds", sa.Integer(), nullable=False, server_default="0"
+        ),
+        # Exercises
+        sa.Column("exercise_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "exercises_completed", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "exercises_mastered", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "exercise_attempts", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column("exercise_correct", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "exercise_score_sum", sa.Float(), nullable=False, server_default="0"
+        ),
+        sa.Column("last_attempted", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("mastery_rollups")
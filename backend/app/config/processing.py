@@ -93,6 +93,14 @@ class ProcessingSettings(BaseSettings):
     SUMMARY_MAX_TOKENS_DETAILED: int = 6000
     SUMMARY_TEMPERATURE: float = 0.3
 
+    # Map-reduce summarization for texts longer than SUMMARY_TRUNCATE_DETAILED:
+    # the text is split into chunks (characters) summarized concurrently, and
+    # the chunk summaries are reduced into the detailed summary
+    SUMMARY_CHUNK_SIZE: int = 24000
+    SUMMARY_CHUNK_OVERLAP: int = 400
+    SUMMARY_MAX_TOKENS_CHUNK: int = 1200
+    SUMMARY_MAX_CONCURRENT_CHUNKS: int = 4
+
     # Annotation formatting limits
     ANNOTATION_TRUNCATE: int = 300  # Max chars per annotation in prompts
 
@@ -120,6 +128,10 @@ class ProcessingSettings(BaseSettings):
     # Default max depth for graph traversal queries
     NEO4J_GRAPH_TRAVERSAL_DEPTH: int = 2
 
+    # Documents merged into one transaction by Neo4jClient.write_graph_batches()
+    # (bulk backfills)
+    NEO4J_BULK_DOCUMENTS_PER_TRANSACTION: int = 50
+
     # =========================================================================
     # CONNECTION DISCOVERY
     # =========================================================================
@@ -278,6 +290,11 @@ class ProcessingSettings(BaseSettings):
     # Maximum time for entire pipeline (seconds)
     PIPELINE_TIMEOUT_SECONDS: int = 300
 
+    # Maximum pipeline stages (LLM calls) running concurrently per content item.
+    # Independent stages (summarization/extraction, then tagging/connections/
+    # follow-ups/questions) run in parallel up to this cap.
+    PIPELINE_MAX_CONCURRENT_STAGES: int = 4
+
     # Maximum time for single LLM call (seconds)
     LLM_TIMEOUT_SECONDS: int = 60
 
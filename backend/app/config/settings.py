@@ -120,6 +120,11 @@ class Settings(BaseSettings):
     # =========================================================================
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/1"
+    # Persistent worker event loop: each worker process runs one long-lived
+    # event loop (started at worker_process_init) with a pooled Postgres
+    # engine and shared Neo4j/LLM clients, and tasks are submitted onto it.
+    # False keeps the asyncio.run() per task + NullPool behavior.
+    CELERY_PERSISTENT_EVENT_LOOP: bool = False
 
     # =========================================================================
     # TASK CLEANUP
@@ -136,6 +141,17 @@ class Settings(BaseSettings):
     NEO4J_PASSWORD: str = ""
     NEO4J_DATABASE: str = "neo4j"  # Default database name
 
+    # Graph visualization snapshots: the /graph page is served from node/edge
+    # lists precomputed after processing runs and vault sync batches and
+    # cached in Redis. Rebuilds are debounced by GRAPH_SNAPSHOT_REBUILD_DELAY
+    # seconds so a burst of writes causes one rebuild.
+    GRAPH_SNAPSHOT_ENABLED: bool = True
+    GRAPH_SNAPSHOT_REBUILD_DELAY: int = 30
+    # Nodes kept in the "top" level of detail (highest degree first)
+    GRAPH_SNAPSHOT_TOP_NODES: int = 500
+    # Clusters kept in the "clusters" level of detail (largest first)
+    GRAPH_SNAPSHOT_MAX_CLUSTERS: int = 200
+
     # =========================================================================
     # OBSIDIAN VAULT
     # =========================================================================
@@ -175,6 +191,14 @@ class Settings(BaseSettings):
     # Prevents excessive syncs when Obsidian saves frequently.
     VAULT_SYNC_DEBOUNCE_MS: int = 1000
     VAULT_SYNC_NEO4J_ENABLED: bool = True
+    # Vault-wide syncs (full sync, startup reconciliation): notes are parsed by
+    # VAULT_SYNC_PARSE_WORKERS threads and written to Neo4j and the note index
+    # VAULT_SYNC_BATCH_SIZE notes per transaction.
+    VAULT_SYNC_PARSE_WORKERS: int = 8
+    VAULT_SYNC_BATCH_SIZE: int = 200
+    # Watcher events of one debounce window are queued as sync_vault_notes
+    # tasks of at most this many paths (one task per chunk, not per file).
+    VAULT_SYNC_TASK_BATCH_SIZE: int = 500
 
     # =========================================================================
     # FILE UPLOADS
@@ -234,6 +258,33 @@ class Settings(BaseSettings):
     # See: https://docs.litellm.ai/blog/gemini_3_flash
     TEXT_MODEL: str = "gemini/gemini-3-flash-preview"
 
+    # =========================================================================
+    # LLM RESPONSE CACHE
+    # =========================================================================
+    # Opt-in cache for LLMClient.complete(), keyed by a hash of (model,
+    # messages, params). Cache hits are logged as zero-cost, cached=True usage.
+    LLM_CACHE_ENABLED: bool = False
+    LLM_CACHE_BACKEND: str = "redis"  # "redis" or "disk"
+    LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 3600  # Refreshed on every hit
+    # Comma-separated PipelineOperation values to cache (empty = all operations)
+    LLM_CACHE_OPERATIONS: str = ""
+    # Disk backend: directory and LRU bound (Redis relies on maxmemory-policy)
+    LLM_CACHE_DIR: str = str(Path(tempfile.gettempdir()) / "second_brain_llm_cache")
+    LLM_CACHE_MAX_ENTRIES: int = 10000
+
+    # Opt-in embedding cache (vectors keyed by model + text hash; shares the
+    # backend, TTL and directory settings above) and batching
+    EMBEDDING_CACHE_ENABLED: bool = False
+    # Max texts per embedding request (OpenAI accepts up to 2048 inputs)
+    EMBEDDING_MAX_BATCH_SIZE: int = 256
+
+    @property
+    def LLM_CACHE_OPERATIONS_LIST(self) -> list[str]:
+        """Parse LLM_CACHE_OPERATIONS into a list of operation values."""
+        return [
+            op.strip() for op in self.LLM_CACHE_OPERATIONS.split(",") if op.strip()
+        ]
+
     # =========================================================================
     # LLM BUDGET & COST MANAGEMENT
     # =========================================================================
@@ -247,6 +298,20 @@ class Settings(BaseSettings):
     PDF_HANDWRITING_DETECTION: bool = True
     PDF_IMAGE_DPI: int = 300
     PDF_MAX_FILE_SIZE_MB: int = 50
+    # Chunked OCR: PDFs with more than PDF_OCR_CHUNK_THRESHOLD_PAGES pages are
+    # split into PDF_OCR_CHUNK_PAGES-page ranges that are OCR'd concurrently
+    # and retried individually (threshold 0 disables chunking)
+    PDF_OCR_CHUNK_THRESHOLD_PAGES: int = 40
+    PDF_OCR_CHUNK_PAGES: int = 20
+    PDF_OCR_MAX_CONCURRENCY: int = 4
+    PDF_OCR_CHUNK_ATTEMPTS: int = 3
+    # OCR backend: "mistral" (Mistral OCR API) or "stub" (offline PyMuPDF text
+    # layer extraction for tests and local development)
+    PDF_OCR_BACKEND: str = "mistral"
+    # Shared executor for CPU-bound image transforms (decode, resize, encode,
+    # OCR preprocessing): 0 = one worker per core, negative = run in threads
+    # via asyncio.to_thread (no process pool)
+    CPU_EXECUTOR_MAX_WORKERS: int = 0
 
     # =========================================================================
     # IMAGE STORAGE (Extracted PDF/Book Images)
@@ -267,6 +332,16 @@ class Settings(BaseSettings):
     # Free tier: 20 RPM, Paid tiers: 500-5000 RPM
     # See: https://jina.ai/api-dashboard/rate-limit
 
+    # Shared HTTP client (article fetching, Raindrop, GitHub)
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+    HTTP_HTTP2: bool = True  # Used when the h2 package is installed
+    # Conditional-request cache for fetched article HTML (ETag/Last-Modified)
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_DIR: str = str(Path(tempfile.gettempdir()) / "second_brain_http_cache")
+    HTTP_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
+    HTTP_CACHE_MAX_ENTRIES: int = 5000
+
     # Raindrop sync - LLM title generation
     RAINDROP_TITLE_SAMPLE_LENGTH: int = 2000  # Chars to sample for title extraction
     RAINDROP_TITLE_MAX_TOKENS: int = 50  # Max tokens for LLM title response
@@ -392,6 +467,13 @@ class Settings(BaseSettings):
     # Lineage marker for content-based exercises (not concept-based)
     EXERCISE_CONTENT_SOURCE_MARKER: str = "__CONTENT__"
 
+    # Docker sandbox for learner code (code exercises)
+    SANDBOX_ENABLED: bool = True
+    SANDBOX_TIMEOUT_SECONDS: int = 10  # Whole execution (all test cases)
+    SANDBOX_TEST_TIMEOUT_SECONDS: int = 5  # Per test case in run_tests
+    # Idle pre-started containers kept per image (0 = start one per execution)
+    SANDBOX_WARM_POOL_SIZE: int = 0
+
     # =========================================================================
     # SESSION / PRACTICE SETTINGS
     # =========================================================================
@@ -454,6 +536,7 @@ class Settings(BaseSettings):
         2  # Fetch N times limit for better interleaving
     )
     REVIEW_INTERLEAVE_MAX_FETCH: int = 200  # Cap on cards fetched for interleaving
+    REVIEW_DUE_COUNT_CACHE_TTL: int = 60  # Seconds to cache due-card counts in Redis
 
     # =========================================================================
     # ASSISTANT SERVICE
@@ -12,6 +12,10 @@ The distinction is necessary because:
 - Celery tasks use asyncio.run() which creates a NEW event loop for each task/retry
 - Pooled connections are tied to their creation event loop and fail when used in a different loop
 
+With CELERY_PERSISTENT_EVENT_LOOP enabled, each worker process runs all tasks on
+one long-lived event loop (see app.services.worker_runtime), so the worker calls
+use_pooled_task_engine() at startup to rebind task_session_maker to a pooled engine.
+
 Usage:
     from app.db.base import async_session_maker, task_session_maker, Base
 
@@ -28,7 +32,12 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import NullPool
 
@@ -88,6 +97,32 @@ task_session_maker = async_sessionmaker(
 )
 
 
+def use_pooled_task_engine() -> AsyncEngine:
+    """
+    Rebind task_session_maker to a pooled engine.
+
+    Only safe when every task in the process runs on the same event loop, i.e.
+    a Celery worker with CELERY_PERSISTENT_EVENT_LOOP enabled. Called from
+    worker_process_init (after fork), so no pooled connection is ever shared
+    with the parent process. Modules that imported task_session_maker pick up
+    the new binding because the session factory object itself is reconfigured.
+
+    Returns:
+        The new pooled engine (dispose it on worker shutdown).
+    """
+    global task_engine
+    task_engine = create_async_engine(
+        settings.POSTGRES_URL,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_pre_ping=True,  # Long-lived connections may be dropped by the server
+        echo=settings.DEBUG,
+    )
+    task_session_maker.configure(bind=task_engine)
+    return task_engine
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
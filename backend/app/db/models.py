@@ -11,6 +11,7 @@ Tables:
 - llm_usage_logs: LLM API usage tracking
 - llm_cost_summaries: Aggregated cost reports
 - system_meta: System configuration key-value store
+- vault_notes: Metadata index of Obsidian vault notes (backs note browsing)
 
 Learning system models (practice_sessions, practice_attempts, spaced_rep_cards,
 mastery_snapshots, exercises, exercise_attempts) are defined in models_learning.py.
@@ -19,6 +20,8 @@ mastery_snapshots, exercises, exercise_attempts) are defined in models_learning.
 from datetime import datetime, timezone
 from typing import Optional, List, TYPE_CHECKING
 from sqlalchemy import (
+    BigInteger,
+    Index,
     String,
     Text,
     Integer,
@@ -29,6 +32,7 @@ from sqlalchemy import (
     JSON,
     Enum as SQLEnum,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 import enum
@@ -353,6 +357,9 @@ class LLMUsageLog(Base):
             Failed requests should still be logged for cost tracking.
         error_message: Error details if success is False. Optional. Useful for
             debugging and identifying problematic patterns.
+        cached: Whether the response was served from the LLM response cache.
+            Cached entries have zero cost and tokens; counting them shows how
+            many provider calls the cache saved.
         created_at: Timestamp when this log entry was created. Indexed for
             time-range queries in reports.
         content: Reference to associated Content record via db_content_id. Optional.
@@ -394,6 +401,7 @@ class LLMUsageLog(Base):
     latency_ms: Mapped[Optional[int]] = mapped_column(Integer)
     success: Mapped[bool] = mapped_column(Boolean, default=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text)
+    cached: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Timestamps (timezone-aware UTC)
     created_at: Mapped[datetime] = mapped_column(
@@ -497,3 +505,70 @@ class SystemMeta(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=_utc_now, onupdate=_utc_now
     )
+
+
+class VaultNote(Base):
+    """
+    Metadata index of markdown notes in the Obsidian vault.
+
+    One row per note, mirroring the file's stat info and the frontmatter
+    fields used for browsing. Lets GET /api/vault/notes filter, sort and
+    paginate without walking the vault or re-parsing frontmatter.
+
+    Kept current by VaultSyncService.sync_note() (watcher-driven) and
+    validated against file mtimes by NoteIndexService.rebuild() on startup.
+
+    Attributes:
+        id: Primary key, auto-incrementing integer identifier.
+        path: Path relative to the vault root (e.g., "sources/papers/foo.md").
+            Unique; used as the keyset pagination tiebreaker.
+        name: File name without extension.
+        folder: Parent folder relative to the vault root ("" for root notes).
+        title: Title from frontmatter (title or name), if any.
+        tags: Tags from frontmatter.
+        note_type: Content type from frontmatter (type or content_type).
+        mtime: File modification time (UTC).
+        size: File size in bytes.
+        sort_name: Lowercased name, for case-insensitive name sorting.
+        sort_title: Lowercased title (falls back to name) for title sorting.
+        indexed_at: When this row was last refreshed from the file.
+        content_hash: SHA-256 of the normalized frontmatter, wikilinks and
+            tags at the last successful graph sync (None if never synced).
+            Lets vault syncs skip notes whose content hasn't changed.
+    """
+
+    __tablename__ = "vault_notes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    path: Mapped[str] = mapped_column(String(1000), unique=True, nullable=False)
+    name: Mapped[str] = mapped_column(String(500), nullable=False)
+    folder: Mapped[str] = mapped_column(String(1000), default="", index=True)
+
+    # Frontmatter metadata
+    title: Mapped[Optional[str]] = mapped_column(String(1000))
+    tags: Mapped[List[str]] = mapped_column(ARRAY(String), default=list)
+    note_type: Mapped[Optional[str]] = mapped_column(String(100), index=True)
+
+    # File stats (used for mtime validation on startup)
+    mtime: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    # Precomputed case-insensitive sort keys
+    sort_name: Mapped[str] = mapped_column(String(500), nullable=False)
+    sort_title: Mapped[str] = mapped_column(String(1000), nullable=False)
+
+    indexed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utc_now, onupdate=_utc_now
+    )
+
+    # Graph sync change detection
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))
+
+    __table_args__ = (
+        # (sort_key, path) composites back keyset pagination for each sort order
+        Index("ix_vault_notes_mtime_path", "mtime", "path"),
+        Index("ix_vault_notes_sort_name_path", "sort_name", "path"),
+        Index("ix_vault_notes_sort_title_path", "sort_title", "path"),
+        Index("ix_vault_notes_size_path", "size", "path"),
+        Index("ix_vault_notes_tags", "tags", postgresql_using="gin"),
+    )
@@ -34,6 +34,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -208,6 +209,12 @@ class SpacedRepCard(Base):
     """
 
     __tablename__ = "spaced_rep_cards"
+    __table_args__ = (
+        # Due-date range scans (due cards, forecast buckets); due_date leads
+        Index("ix_spaced_rep_cards_due_state", "due_date", "state"),
+        # Topic filters (tags @> ARRAY[topic], tags && topics)
+        Index("ix_spaced_rep_cards_tags", "tags", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -379,6 +386,72 @@ class MasterySnapshot(Base):
     days_since_review: Mapped[Optional[int]] = mapped_column(Integer)
 
 
+class MasteryRollup(Base):
+    """
+    Incrementally maintained learning aggregates per topic.
+
+    One row per topic plus a global row (topic_path "*") covering all cards
+    and exercises. Updated in the same transaction as card creation/review
+    and exercise creation/attempts, and rebuilt from the source tables by a
+    periodic reconcile job. Backs the analytics overview, weak spots and
+    per-topic mastery endpoints so they read O(topics) rows instead of
+    scanning every card.
+
+    Attributes:
+        id: Primary key, auto-incrementing integer identifier.
+        topic_path: Topic path string, or "*" for the global rollup.
+        card_count: Cards in scope.
+        new_cards: Cards never reviewed.
+        learning_cards: Cards in learning/relearning/review, not yet mastered.
+        mastered_cards: Cards with stability >= MASTERY_MASTERED_STABILITY_DAYS.
+        review_cards: Cards in the review state.
+        review_stability_sum: Sum of stability over review-state cards.
+        total_reviews: Sum of card review counts.
+        correct_reviews: Sum of correct card review counts.
+        last_reviewed: Most recent card review.
+        review_time_seconds: Time spent reviewing cards.
+        exercise_count: Exercises in scope.
+        exercises_completed: Exercises with at least one attempt.
+        exercises_mastered: Exercises with an attempt scoring at least
+            EXERCISE_MASTERY_SCORE_THRESHOLD.
+        exercise_attempts: Exercise attempts.
+        exercise_correct: Correct exercise attempts.
+        exercise_score_sum: Sum of exercise attempt scores.
+        last_attempted: Most recent exercise attempt.
+        updated_at: When this row was last changed.
+    """
+
+    __tablename__ = "mastery_rollups"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    topic_path: Mapped[str] = mapped_column(String(200), unique=True)
+
+    # Spaced repetition cards
+    card_count: Mapped[int] = mapped_column(Integer, default=0)
+    new_cards: Mapped[int] = mapped_column(Integer, default=0)
+    learning_cards: Mapped[int] = mapped_column(Integer, default=0)
+    mastered_cards: Mapped[int] = mapped_column(Integer, default=0)
+    review_cards: Mapped[int] = mapped_column(Integer, default=0)
+    review_stability_sum: Mapped[float] = mapped_column(Float, default=0.0)
+    total_reviews: Mapped[int] = mapped_column(Integer, default=0)
+    correct_reviews: Mapped[int] = mapped_column(Integer, default=0)
+    last_reviewed: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    review_time_seconds: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Exercises
+    exercise_count: Mapped[int] = mapped_column(Integer, default=0)
+    exercises_completed: Mapped[int] = mapped_column(Integer, default=0)
+    exercises_mastered: Mapped[int] = mapped_column(Integer, default=0)
+    exercise_attempts: Mapped[int] = mapped_column(Integer, default=0)
+    exercise_correct: Mapped[int] = mapped_column(Integer, default=0)
+    exercise_score_sum: Mapped[float] = mapped_column(Float, default=0.0)
+    last_attempted: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utc_now, onupdate=_utc_now
+    )
+
+
 # ===========================================
 # Exercises
 # ===========================================
@@ -29,6 +29,7 @@ Tables:
 - connections: Discovered content connections
 - mastery_questions: Generated questions with spaced repetition state
 - followup_tasks: Generated follow-up tasks
+- processing_checkpoints: Per-stage pipeline outputs for resuming retried runs
 """
 
 from __future__ import annotations
@@ -45,6 +46,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -398,6 +400,56 @@ class FollowupRecord(Base):
     processing_run: Mapped["ProcessingRun"] = relationship(back_populates="followups")
 
 
+class ProcessingCheckpoint(Base):
+    """
+    Persisted output of a single pipeline stage.
+
+    Written as each stage completes so a retried or re-queued run can skip
+    the LLM calls whose results are still valid. A checkpoint is valid while
+    both the content hash and the stage's config hash match the current run.
+    There is at most one checkpoint per (content, stage); newer outputs
+    overwrite older ones.
+
+    Attributes:
+        id: Primary key UUID
+        content_uuid: UUID string of the processed content
+        stage: ProcessingStage value (e.g. "SUMMARIZATION")
+        content_hash: Hash of the content text the stage ran on
+        config_hash: Hash of the model/parameters that shape the stage output
+        output: Serialized stage output (JSON)
+        cost_usd: LLM cost originally spent producing the output
+        created_at: When the checkpoint was written
+    """
+
+    __tablename__ = "processing_checkpoints"
+    __table_args__ = (
+        UniqueConstraint("content_uuid", "stage", name="uq_processing_checkpoint"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    content_uuid: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("content.content_uuid", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    stage: Mapped[str] = mapped_column(String(30), nullable=False)
+
+    # Validity keys
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    config_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    # Stage output
+    output: Mapped[Optional[dict]] = mapped_column(JSONB)
+    cost_usd: Mapped[float] = mapped_column(Float, default=0.0)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utc_now
+    )
+
+
 # Import Content model to set up relationship
 # This is done at the bottom to avoid circular imports
 from app.db.models import Content  # noqa: E402
@@ -4,10 +4,14 @@ FastAPI Dependencies
 Common dependencies for authentication, database sessions, etc.
 """
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Response, status
 from fastapi.security import APIKeyHeader
 
 from app.config import settings
+from app.services.obsidian.lifecycle import is_vault_ready
+
+# Set on responses served while startup vault reconciliation is still running
+VAULT_RECONCILING_HEADER = "X-Vault-Reconciling"
 
 # API Key header scheme
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
@@ -57,5 +61,17 @@ async def verify_capture_api_key(
     return provided_key
 
 
+async def mark_vault_reconciling(response: Response) -> None:
+    """
+    Flag responses that may be stale while startup reconciliation runs.
+
+    Vault and knowledge routes keep serving during background reconciliation
+    (the note index and graph reflect the last completed sync); clients can
+    check this header, or poll /api/vault/sync/status, to know that.
+    """
+    if not is_vault_ready():
+        response.headers[VAULT_RECONCILING_HEADER] = "true"
+
+
 # Dependency that can be used in routers
 RequireCaptureAPIKey = Depends(verify_capture_api_key)
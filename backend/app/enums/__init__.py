@@ -56,6 +56,7 @@ from app.enums.learning import (
 from app.enums.knowledge import (
     GraphConnectionType,
     ConnectionDirection,
+    GraphLevelOfDetail,
 )
 from app.enums.api import (
     ExplanationStyle,
@@ -100,6 +101,7 @@ __all__ = [
     # Knowledge graph enums
     "GraphConnectionType",
     "ConnectionDirection",
+    "GraphLevelOfDetail",
     # API enums
     "ExplanationStyle",
     "RateLimitType",
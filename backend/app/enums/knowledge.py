@@ -58,3 +58,21 @@ class ConnectionDirection(str, Enum):
     INCOMING = "incoming"
     OUTGOING = "outgoing"
     BOTH = "both"
+
+
+class GraphLevelOfDetail(str, Enum):
+    """
+    Level of detail for the graph visualization snapshot.
+
+    Used by the /graph endpoint (when not centered on a node) to pick one of
+    the precomputed snapshot views, from coarsest to finest.
+
+    Values:
+        CLUSTERS: One node per cluster, edges weighted by cross-cluster links
+        TOP: The highest-degree nodes (up to the request limit) (default)
+        FULL: Every node and edge in the graph
+    """
+
+    CLUSTERS = "clusters"
+    TOP = "top"
+    FULL = "full"
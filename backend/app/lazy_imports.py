@@ -0,0 +1,157 @@
+"""
+Lazy Imports for Heavy Dependencies
+
+Importing app.main (API) or app.services.tasks (Celery worker) used to load
+litellm, pandas/numpy, docker, PyMuPDF, mistralai, trafilatura and
+langchain_text_splitters up front, through router and pipeline imports, even
+though most processes only touch a few of them and never in the first
+request. Those imports dominated cold start.
+
+Modules that depend on them bind a stand-in at module level instead, and
+the real import happens on first use:
+
+    - lazy_import(name): a module stand-in. Attribute access, assignment and
+      deletion are forwarded to the real module, imported on first use, so
+      `litellm.completion_cost(...)` and patch("...client.litellm.x") work
+      as before.
+    - lazy_callable(name, attr): a function/class stand-in for
+      `from name import attr`. Calling it imports the module and calls the
+      attribute, and it stays a plain module-level name that tests can patch.
+
+Stand-ins are shared per module name. Configuration that used to run right
+after `import x` (e.g. `litellm.drop_params = True`) is registered with
+on_load= and runs once, when the module is actually imported.
+
+Do not access lazy modules at import time (module-level code, default
+arguments, evaluated annotations); quote such annotations instead.
+tests/unit/test_startup_imports.py checks that app.main and the worker task
+module import none of HEAVY_MODULES.
+
+Usage:
+    from app.lazy_imports import lazy_callable, lazy_import
+
+    fitz = lazy_import("fitz")
+    Mistral = lazy_callable("mistralai", "Mistral")
+"""
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+# Heavy third-party modules kept out of API and worker startup
+HEAVY_MODULES = (
+    "litellm",
+    "pandas",
+    "docker",
+    "fitz",
+    "mistralai",
+    "trafilatura",
+    "langchain_text_splitters",
+)
+
+_modules: dict[str, "LazyModule"] = {}
+_registry_lock = threading.Lock()
+
+
+class LazyModule:
+    """Module stand-in that imports the real module on first attribute access."""
+
+    __slots__ = ("_lazy_name", "_lazy_module", "_lazy_hooks", "_lazy_lock")
+
+    def __init__(self, name: str):
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_module", None)
+        object.__setattr__(self, "_lazy_hooks", [])
+        object.__setattr__(self, "_lazy_lock", threading.RLock())
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._lazy_module is not None
+
+    def add_load_hook(self, hook: Callable[[ModuleType], None]) -> None:
+        """Run hook(module) when the module is loaded (now, if it already is)."""
+        with self._lazy_lock:
+            if self._lazy_module is None:
+                self._lazy_hooks.append(hook)
+                return
+        hook(self._lazy_module)
+
+    def load(self) -> ModuleType:
+        """Import the real module (once) and run its load hooks."""
+        module = self._lazy_module
+        if module is not None:
+            return module
+        with self._lazy_lock:
+            if self._lazy_module is None:
+                module = importlib.import_module(self._lazy_name)
+                for hook in self._lazy_hooks:
+                    hook(module)
+                self._lazy_hooks.clear()
+                object.__setattr__(self, "_lazy_module", module)
+            return self._lazy_module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self.load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self.load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self.load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module {self._lazy_name!r} ({state})>"
+
+
+def lazy_import(
+    name: str, on_load: Optional[Callable[[ModuleType], None]] = None
+) -> LazyModule:
+    """
+    Get a stand-in for module `name` that imports it on first use.
+
+    Args:
+        name: Absolute module name (submodules allowed, e.g. "docker.errors")
+        on_load: Optional hook called with the real module once it is imported
+
+    Returns:
+        The shared LazyModule for `name`
+    """
+    with _registry_lock:
+        module = _modules.get(name)
+        if module is None:
+            module = LazyModule(name)
+            _modules[name] = module
+    if on_load is not None:
+        module.add_load_hook(on_load)
+    return module
+
+
+def lazy_callable(name: str, attr: str) -> Callable[..., Any]:
+    """
+    Get a stand-in for `from name import attr` where attr is called.
+
+    Works for functions (sync or async, the call returns the coroutine) and
+    for classes that are only instantiated. Do not use it for classes used
+    with isinstance() or in except clauses; use lazy_import(name).attr at
+    the point of use instead.
+    """
+    module = lazy_import(name)
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(module, attr)(*args, **kwargs)
+
+    call.__name__ = attr
+    call.__qualname__ = attr
+    call.__doc__ = f"Lazily imported {name}.{attr}."
+    return call
+
+
+def is_imported(name: str) -> bool:
+    """True if module `name` has been imported in this process."""
+    return name in sys.modules
@@ -70,13 +70,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         logger.warning(f"Failed to start scheduler: {e}")
 
-    # Start vault services (reconciliation + watcher)
+    # Start vault services (watcher now, reconciliation in the background)
     try:
         vault_results = await startup_vault_services()
-        if vault_results.get("reconciliation"):
-            logger.info(
-                f"Vault reconciliation: {vault_results['reconciliation']['synced']} notes synced"
-            )
+        if vault_results.get("background_sync_started"):
+            logger.info("Vault reconciliation running in the background")
         if vault_results.get("watcher_started"):
             logger.info("Vault watcher started")
     except Exception as e:
@@ -100,6 +98,31 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception:
         pass
 
+    # Remove idle warm sandbox containers
+    try:
+        from app.services.learning import code_sandbox
+
+        if code_sandbox._sandbox_instance is not None:
+            await code_sandbox._sandbox_instance.close()
+    except Exception:
+        pass
+
+    # Stop image transform worker processes
+    try:
+        from app.services.cpu_executor import shutdown_cpu_executor
+
+        shutdown_cpu_executor()
+    except Exception:
+        pass
+
+    # Close pooled HTTP connections
+    try:
+        from app.services.http_client import close_http_client
+
+        await close_http_client()
+    except Exception:
+        pass
+
     # Close Neo4j client
     try:
         from app.services.knowledge_graph import get_neo4j_client
@@ -31,6 +31,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from app.enums.knowledge import GraphLevelOfDetail
 from app.models.base import StrictRequest, StrictResponse
 
 
@@ -51,17 +52,22 @@ class GraphNode(BaseModel):
         label: Display title for the node
         type: Node type - "Content", "Concept", or "Note"
         content_type: For Content nodes, the specific type (paper, article, etc.)
-        size: Visual weight based on connection count (for node sizing)
+        size: Visual weight based on connection count (for node sizing);
+            member count for cluster nodes
         color: Optional hex color code for custom styling
+        cluster_id: Cluster the node belongs to (snapshot responses only)
         metadata: Additional properties (tags, etc.)
     """
 
     id: str
     label: str
-    type: str  # "Content", "Concept", "Note"
+    type: str  # "Content", "Concept", "Note" ("Cluster" at the clusters LOD)
     content_type: Optional[str] = None  # "paper", "article", etc.
     size: int = Field(default=1, description="Node size weight based on connections")
     color: Optional[str] = Field(default=None, description="Optional hex color code")
+    cluster_id: Optional[int] = Field(
+        default=None, description="Cluster id from the graph snapshot"
+    )
     metadata: dict = Field(default_factory=dict, description="Additional properties")
 
 
@@ -108,6 +114,8 @@ class GraphResponse(BaseModel):
         center_id: ID of the center node (if centered query)
         total_nodes: Total nodes in the full graph (before limiting)
         total_edges: Total edges in the returned subgraph
+        lod: Level of detail served from the snapshot (None for live queries)
+        snapshot_version: Graph snapshot version (None for live queries)
     """
 
     nodes: list[GraphNode]
@@ -115,6 +123,8 @@ class GraphResponse(BaseModel):
     center_id: Optional[str] = None
     total_nodes: int
     total_edges: int
+    lod: Optional[GraphLevelOfDetail] = None
+    snapshot_version: Optional[str] = None
 
 
 class GraphStats(BaseModel):
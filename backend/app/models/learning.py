@@ -232,6 +232,17 @@ class DueCardsResponse(BaseModel):
     review_forecast: ReviewForecast
 
 
+class DueCountResponse(BaseModel):
+    """
+    Number of cards currently due for review.
+
+    Lightweight alternative to DueCardsResponse for badges and widgets that
+    only need the count, not the cards or the forecast.
+    """
+
+    due_count: int
+
+
 # ===========================================
 # Exercise Models
 # ===========================================
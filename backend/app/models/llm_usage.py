@@ -38,6 +38,8 @@ class LLMUsage:
         latency_ms: Request latency in milliseconds
         success: Whether the request succeeded
         error_message: Error message if request failed
+        cached: Whether the response was served from the LLM response cache
+            (no provider call, so tokens and cost are zero)
     """
 
     request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -66,6 +68,7 @@ class LLMUsage:
     latency_ms: Optional[int] = None
     success: bool = True
     error_message: Optional[str] = None
+    cached: bool = False
 
     def to_dict(self) -> dict:
         """Convert to dictionary for database storage or serialization."""
@@ -80,9 +83,10 @@ class LLMUsage:
         """Human-readable string representation."""
         cost_str = f"${self.cost_usd:.4f}" if self.cost_usd else "N/A"
         tokens_str = str(self.total_tokens) if self.total_tokens else "N/A"
+        cached_str = ", cached" if self.cached else ""
         return (
             f"LLMUsage({self.model}, {self.request_type}, "
-            f"cost={cost_str}, tokens={tokens_str})"
+            f"cost={cost_str}, tokens={tokens_str}{cached_str})"
         )
 
 
@@ -482,7 +482,12 @@ class ProcessingResult(BaseModel):
         obsidian_note_path: Path to generated Obsidian note (if created)
         neo4j_node_id: ID of created Neo4j node (if created)
         processing_time_seconds: Total pipeline execution time
-        estimated_cost_usd: Estimated total LLM cost
+        stage_timings: Wall time in seconds per stage (keyed by ProcessingStage
+            value); with concurrent stages these can sum to more than
+            processing_time_seconds
+        restored_stages: Stages whose output was restored from a checkpoint
+            instead of being recomputed
+        estimated_cost_usd: Estimated total LLM cost (excludes restored stages)
         processed_at: Timestamp when processing completed
     """
 
@@ -503,6 +508,12 @@ class ProcessingResult(BaseModel):
 
     # Metrics
     processing_time_seconds: float = Field(default=0.0)
+    stage_timings: dict[str, float] = Field(
+        default_factory=dict, description="stage -> wall time in seconds"
+    )
+    restored_stages: list[str] = Field(
+        default_factory=list, description="stages restored from checkpoints"
+    )
     estimated_cost_usd: float = Field(default=0.0)
     processed_at: datetime = Field(default_factory=datetime.now)
 
@@ -19,6 +19,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from app.enums.processing import ProcessingStage
 from app.models.base import StrictRequest
 from app.models.processing import (
     ContentAnalysis,
@@ -53,6 +54,10 @@ class ProcessingConfigRequest(StrictRequest):
     create_obsidian_note: bool = True
     create_neo4j_nodes: bool = True
     validate_output: bool = True
+    invalidate_stages: list[ProcessingStage] = Field(
+        default_factory=list,
+        description="Stages whose checkpoints are discarded so they are recomputed",
+    )
 
 
 class TriggerProcessingRequest(StrictRequest):
@@ -45,8 +45,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-from PIL import Image
-
 from app.models.content import (
     Annotation,
     AnnotationType,
@@ -73,6 +71,7 @@ from app.services.llm import (
     build_messages,
 )
 from app.services.cost_tracking import CostTracker
+from app.services.cpu_executor import run_cpu_bound
 from app.services.storage import check_hash_exists
 
 # =============================================================================
@@ -86,6 +85,9 @@ DEFAULT_OCR_MAX_TOKENS = (
 DEFAULT_MAX_CONCURRENCY = (
     5  # Concurrent OCR API calls (5-10 recommended, up to 20 for large batches)
 )
+PREPROCESS_LOOKAHEAD = (
+    2  # Pages preprocessed ahead of each OCR slot (bounds decoded pages in memory)
+)
 
 # Output formatting
 DEFAULT_BOOK_TITLE = "Unknown Book"
@@ -158,6 +160,28 @@ class BookMetadata:
         return self.inference_error is not None
 
 
+# =============================================================================
+# Image Preprocessing
+# =============================================================================
+
+
+def prepare_page_image(image_path: Path) -> str:
+    """
+    Rotate, preprocess and base64-encode a page photo for the vision model.
+
+    CPU-bound and module-level so it can run on the shared CPU executor.
+
+    Args:
+        image_path: Path to the page image.
+
+    Returns:
+        Base64-encoded PNG of the preprocessed page.
+    """
+    image = auto_rotate(image_path)
+    processed = preprocess_for_ocr(image)
+    return image_to_base64(processed)
+
+
 class BookOCRPipeline(BasePipeline):
     """
     Book photo OCR pipeline for extracting content from physical books.
@@ -356,23 +380,25 @@ class BookOCRPipeline(BasePipeline):
             f"(max {self.max_concurrency} concurrent)"
         )
 
-        # Process pages in parallel with concurrency limit
+        # Process pages in parallel with concurrency limit. Preprocessing runs
+        # on the CPU executor and is allowed to get ahead of the OCR calls, so
+        # page N+1 is being rotated/encoded while page N is in the VLM call.
         semaphore = asyncio.Semaphore(self.max_concurrency)
+        prefetch = asyncio.Semaphore(self.max_concurrency * PREPROCESS_LOOKAHEAD)
 
         async def process_with_semaphore(idx: int, image_path: Path) -> dict:
-            async with semaphore:
-                self.logger.info(
-                    f"Processing image {idx + 1}/{len(image_paths)}: {image_path.name}"
-                )
+            async with prefetch:
+                image_data = await run_cpu_bound(prepare_page_image, image_path)
 
-                # Preprocess image (CPU-bound, but fast)
-                image = auto_rotate(image_path)
-                processed = preprocess_for_ocr(image)
+                async with semaphore:
+                    self.logger.info(
+                        f"Processing image {idx + 1}/{len(image_paths)}: {image_path.name}"
+                    )
 
-                # Extract content including page number from OCR
-                page_result = await self._process_page(processed)
-                page_result.source_image = str(image_path)
-                return page_result
+                    # Extract content including page number from OCR
+                    page_result = await self._process_page(image_data)
+                    page_result.source_image = str(image_path)
+                    return page_result
 
         # Create tasks for all pages
         tasks = [
@@ -523,7 +549,7 @@ class BookOCRPipeline(BasePipeline):
         else:
             return f"[Image: {Path(source_image).name}]"
 
-    async def _process_page(self, image: Image.Image) -> PageResult:
+    async def _process_page(self, image_data: str) -> PageResult:
         """
         Process a book page using a vision chat model (Gemini, GPT-4o, Claude).
 
@@ -531,13 +557,11 @@ class BookOCRPipeline(BasePipeline):
         chapters, highlights, and margin notes in addition to the text.
 
         Args:
-            image: PIL Image to process.
+            image_data: Base64-encoded preprocessed page (see prepare_page_image).
 
         Returns:
             PageResult with structured extraction.
         """
-        image_data = image_to_base64(image)
-
         prompt = """Analyze this book page photo and extract:
 
 1. PAGE NUMBER: Look for printed page numbers (usually at top or bottom corners).
@@ -36,6 +36,7 @@ from app.services.llm import (
     build_messages,
 )
 from app.services.cost_tracking import CostTracker
+from app.services.http_client import HTTPSession
 from app.services.storage import check_url_exists
 
 # Default configuration
@@ -92,7 +93,7 @@ class GitHubImporter(BasePipeline):
         self.track_costs = track_costs
         self._usage_records: list[LLMUsage] = []
         self._content_id: Optional[str] = None
-        self.client = httpx.AsyncClient(
+        self.client = HTTPSession(
             headers={
                 "Authorization": f"Bearer {access_token}",
                 "Accept": "application/vnd.github.v3+json",
@@ -495,5 +496,5 @@ Be thorough and specific. Include concrete examples from the file structure and
         )
 
     async def close(self):
-        """Close the HTTP client."""
+        """Release the HTTP session (connections stay in the shared pool)."""
         await self.client.aclose()
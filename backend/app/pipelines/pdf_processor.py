@@ -194,7 +194,7 @@ class PDFProcessor(BasePipeline):
         Performs the full PDF processing pipeline:
         1. Validates file size and existence
         2. Calculates file hash for deduplication
-        3. Runs OCR on entire document
+        3. Runs OCR on entire document (large PDFs as concurrent page-range chunks)
         4. Extracts metadata from OCR result
         5. Classifies content type
         6. Logs LLM costs if tracking is enabled
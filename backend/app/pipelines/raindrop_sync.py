@@ -40,6 +40,7 @@ from app.models.llm_usage import LLMUsage
 from app.pipelines.base import BasePipeline, PipelineInput, PipelineContentType
 from app.pipelines.web_article import WebArticlePipeline
 from app.services.cost_tracking import CostTracker
+from app.services.http_client import HTTPSession
 from app.services.llm import get_llm_client, get_default_text_model, build_messages
 from app.services.storage import check_url_exists
 
@@ -117,7 +118,7 @@ class RaindropSync(BasePipeline):
         )
         self.track_costs: bool = track_costs
         self._usage_records: list[LLMUsage] = []
-        self.client: httpx.AsyncClient = httpx.AsyncClient(
+        self.client: HTTPSession = HTTPSession(
             headers={"Authorization": f"Bearer {access_token}"},
             timeout=self.timeout,
         )
@@ -631,5 +632,5 @@ Respond with ONLY the title, nothing else."""
             coll["full_path"] = get_full_path(coll)
 
     async def close(self) -> None:
-        """Close the HTTP client and release resources."""
+        """Release the HTTP session (connections stay in the shared pool)."""
         await self.client.aclose()
@@ -22,9 +22,12 @@ from app.pipelines.utils.vlm_client import (
 from app.pipelines.utils.mistral_ocr_client import (
     ocr_pdf_document,
     ocr_pdf_document_annotated,
+    ocr_pdf_document_chunked,
     ocr_pdf_document_sync,
     ocr_pdf_document_annotated_sync,
     ocr_image,
+    get_ocr_backend,
+    StubOCRBackend,
     OCRPage,
     MistralOCRResult,
     DocumentAnnotation,
@@ -86,9 +89,12 @@ __all__ = [
     # Mistral OCR client (PDF document OCR)
     "ocr_pdf_document",
     "ocr_pdf_document_annotated",
+    "ocr_pdf_document_chunked",
     "ocr_pdf_document_sync",
     "ocr_pdf_document_annotated_sync",
     "ocr_image",
+    "get_ocr_backend",
+    "StubOCRBackend",
     "OCRPage",
     "MistralOCRResult",
     "DocumentAnnotation",
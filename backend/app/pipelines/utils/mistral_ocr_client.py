@@ -33,6 +33,16 @@ Usage:
         for img in page.images:
             print(img.annotation)
 
+    # Large PDFs: page ranges OCR'd concurrently, failed ranges retried alone
+    # (ocr_pdf_document_annotated switches to this above
+    # PDF_OCR_CHUNK_THRESHOLD_PAGES pages)
+    result = await ocr_pdf_document_chunked(Path("textbook.pdf"), chunk_pages=20)
+
+Backends:
+    PDF_OCR_BACKEND="mistral" (default) calls the Mistral OCR API.
+    PDF_OCR_BACKEND="stub" uses StubOCRBackend, which returns each page's
+    embedded text via PyMuPDF so OCR flows can run offline.
+
 Requirements:
     pip install mistralai>=1.2.0  # For annotation support
 """
@@ -46,17 +56,27 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Optional
 
-import fitz  # PyMuPDF
-from mistralai import Mistral
 from pydantic import BaseModel, Field
+from tenacity import (
+    AsyncRetrying,
+    before_sleep_log,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from app.config.settings import settings
 from app.models.llm_usage import LLMUsage, create_error_usage
+from app.lazy_imports import lazy_callable, lazy_import
 
 logger = logging.getLogger(__name__)
 
+# PyMuPDF and the Mistral SDK are imported on first use (see app.lazy_imports)
+fitz = lazy_import("fitz")
+Mistral = lazy_callable("mistralai", "Mistral")
+
 
 # =============================================================================
 # Constants
@@ -65,6 +85,10 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL = "mistral-ocr-latest"
 MAX_ANNOTATED_PAGES = 8  # Document annotations limited to 8 pages by Mistral API
 
+# Backoff between attempts of a single failed chunk in chunked OCR
+OCR_CHUNK_RETRY_MIN_SEC = 2
+OCR_CHUNK_RETRY_MAX_SEC = 30
+
 
 def _normalize_model_name(model: str) -> str:
     """
@@ -482,7 +506,7 @@ def _get_pdf_page_count(pdf_path: Path) -> int:
         return len(doc)
 
 
-def get_mistral_client() -> Mistral:
+def get_mistral_client() -> "Mistral":
     """Get or create Mistral client instance using API key from settings."""
     api_key = settings.MISTRAL_API_KEY
     if not api_key:
@@ -493,6 +517,92 @@ def get_mistral_client() -> Mistral:
     return Mistral(api_key=api_key)
 
 
+class StubOCRBackend:
+    """
+    Offline OCR backend with the same `process()` interface as `client.ocr`.
+
+    Returns each page's embedded text layer (via PyMuPDF) as its markdown
+    instead of calling the Mistral API, so OCR flows, including chunking,
+    can be exercised without network access or an API key. Scanned pages
+    without a text layer come back empty.
+    """
+
+    def process(
+        self,
+        model: str,
+        document: dict[str, str],
+        pages: Optional[list[int]] = None,
+        include_image_base64: bool = False,
+        **kwargs: Any,
+    ) -> SimpleNamespace:
+        """Mimic a Mistral OCR response for a base64 data-URL PDF document."""
+        pdf_bytes = base64.b64decode(document["document_url"].split(",", 1)[1])
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            indices = pages if pages is not None else range(len(doc))
+            ocr_pages = [
+                SimpleNamespace(index=i, markdown=doc[i].get_text(), images=[])
+                for i in indices
+            ]
+        return SimpleNamespace(
+            pages=ocr_pages,
+            document_annotation=None,
+            usage_info=SimpleNamespace(pages_processed=len(ocr_pages)),
+        )
+
+
+def get_ocr_backend() -> Any:
+    """Get the PDF OCR backend selected by settings.PDF_OCR_BACKEND."""
+    if settings.PDF_OCR_BACKEND == "stub":
+        return StubOCRBackend()
+    return get_mistral_client().ocr
+
+
+def _encode_pdf_pages_to_base64(pdf_path: Path, start: int, end: int) -> str:
+    """Copy pages [start, end) into a standalone PDF and base64-encode it."""
+    with fitz.open(pdf_path) as src, fitz.open() as chunk:
+        chunk.insert_pdf(src, from_page=start, to_page=end - 1)
+        return base64.b64encode(chunk.tobytes()).decode("utf-8")
+
+
+def _page_ranges(total_pages: int, chunk_pages: int) -> list[tuple[int, int]]:
+    """Split [0, total_pages) into consecutive [start, end) ranges."""
+    return [
+        (start, min(start + chunk_pages, total_pages))
+        for start in range(0, total_pages, chunk_pages)
+    ]
+
+
+def _build_page_markdown(
+    pages: list[OCRPage], include_images: bool
+) -> tuple[str, str]:
+    """Build (full_text, full_markdown) with page markers and image annotations."""
+    text_parts = []
+    markdown_parts = []
+    for page in pages:
+        if page.markdown:
+            text_parts.append(page.markdown)
+            page_md = f"[Page {page.index + 1}]\n\n{page.markdown}"
+
+            # Add image annotations as markdown
+            for img in page.images:
+                if img.annotation:
+                    img_type = img.annotation.get("image_type", "unknown")
+                    img_desc = img.annotation.get("description", "")
+                    page_md = page_md.replace(
+                        f"![{img.id}]({img.id})",
+                        f"![{img.id}]({img.id})\n\n"
+                        f"**[{img_type.upper()}]** {img_desc}",
+                    )
+
+            # Replace image placeholders with base64 if available
+            if include_images:
+                page_md = _replace_images_in_markdown(page_md, page.images)
+
+            markdown_parts.append(page_md)
+
+    return "\n\n".join(text_parts), "\n\n---\n\n".join(markdown_parts)
+
+
 # =============================================================================
 # Public API - Basic OCR
 # =============================================================================
@@ -539,7 +649,7 @@ async def ocr_pdf_document(
     # Normalize model name (strip mistral/ prefix for native SDK)
     model = _normalize_model_name(model)
 
-    client = get_mistral_client()
+    ocr_backend = get_ocr_backend()
     base64_pdf = _encode_pdf_to_base64(pdf_path)
 
     document = {
@@ -564,7 +674,7 @@ async def ocr_pdf_document(
         loop = asyncio.get_event_loop()
         response = await loop.run_in_executor(
             None,
-            lambda: client.ocr.process(**kwargs),
+            lambda: ocr_backend.process(**kwargs),
         )
 
         latency_ms = int((time.perf_counter() - start_time) * 1000)
@@ -654,6 +764,10 @@ async def ocr_pdf_document_annotated(
       annotation to 8 pages, but image annotations work on all pages)
     - Results are combined into a single MistralOCRResult
 
+    Documents with more than settings.PDF_OCR_CHUNK_THRESHOLD_PAGES pages are
+    handed to ocr_pdf_document_chunked instead, so large PDFs are never sent
+    as a single request.
+
     Args:
         pdf_path: Path to the PDF file.
         model: Mistral OCR model to use. Defaults to "mistral-ocr-latest".
@@ -679,6 +793,19 @@ async def ocr_pdf_document_annotated(
     # Determine total page count
     total_pages = _get_pdf_page_count(pdf_path)
 
+    # Large documents: concurrent page-range chunks
+    chunk_threshold = settings.PDF_OCR_CHUNK_THRESHOLD_PAGES
+    if chunk_threshold and total_pages > chunk_threshold:
+        return await ocr_pdf_document_chunked(
+            pdf_path=pdf_path,
+            model=model,
+            include_images=include_images,
+            pipeline=pipeline,
+            content_id=content_id,
+            operation=operation,
+            total_pages=total_pages,
+        )
+
     # If document has <= 8 pages, process all with annotations
     if total_pages <= MAX_ANNOTATED_PAGES:
         return await _ocr_with_annotations(
@@ -792,6 +919,197 @@ async def ocr_pdf_document_annotated(
     )
 
 
+async def ocr_pdf_document_chunked(
+    pdf_path: Path,
+    model: str = DEFAULT_MODEL,
+    include_images: bool = True,
+    chunk_pages: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    pipeline: Optional[str] = None,
+    content_id: Optional[int] = None,
+    operation: Optional[str] = None,
+    total_pages: Optional[int] = None,
+) -> MistralOCRResult:
+    """
+    Process a large PDF as concurrent page-range chunks.
+
+    The PDF is split with PyMuPDF into standalone PDFs of `chunk_pages` pages,
+    so each request only carries (and base64-encodes) its own pages. Chunks
+    run concurrently under a semaphore; a failing chunk is retried on its own
+    (settings.PDF_OCR_CHUNK_ATTEMPTS) without redoing the others. Results are
+    merged in page order into a single MistralOCRResult with document-level
+    page indices.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        model: Mistral OCR model to use. Defaults to "mistral-ocr-latest".
+        include_images: Whether to include base64-encoded images.
+        chunk_pages: Pages per chunk. Defaults to settings.PDF_OCR_CHUNK_PAGES.
+        max_concurrency: Max chunks in flight. Defaults to
+            settings.PDF_OCR_MAX_CONCURRENCY.
+        pipeline: Name of calling pipeline for cost attribution.
+        content_id: Associated content ID for cost attribution.
+        operation: Specific operation name for tracking.
+        total_pages: Page count if already known (avoids reopening the PDF).
+
+    Returns:
+        MistralOCRResult covering all pages, with combined usage.
+
+    Raises:
+        Exception: The last error of a chunk that failed all attempts.
+    """
+    pdf_path = Path(pdf_path)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+    model = _normalize_model_name(model)
+    chunk_pages = max(1, chunk_pages or settings.PDF_OCR_CHUNK_PAGES)
+    max_concurrency = max(1, max_concurrency or settings.PDF_OCR_MAX_CONCURRENCY)
+    if total_pages is None:
+        total_pages = _get_pdf_page_count(pdf_path)
+    page_ranges = _page_ranges(total_pages, chunk_pages)
+
+    logger.info(
+        f"Starting chunked OCR on {pdf_path.name}: {total_pages} pages in "
+        f"{len(page_ranges)} chunks of {chunk_pages} (concurrency {max_concurrency})"
+    )
+    start_time = time.perf_counter()
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_chunk(start: int, end: int) -> MistralOCRResult:
+        async with semaphore:
+            return await _ocr_page_range(
+                pdf_path=pdf_path,
+                start=start,
+                end=end,
+                model=model,
+                include_images=include_images,
+                pipeline=pipeline,
+                content_id=content_id,
+                operation=operation,
+            )
+
+    chunk_results = await asyncio.gather(
+        *(run_chunk(start, end) for start, end in page_ranges)
+    )
+
+    total_latency_ms = int((time.perf_counter() - start_time) * 1000)
+
+    # Merge chunks in page order
+    all_pages = [page for result in chunk_results for page in result.pages]
+    full_text, full_markdown = _build_page_markdown(all_pages, include_images)
+    document_annotation = next(
+        (r.document_annotation for r in chunk_results if r.document_annotation),
+        None,
+    )
+
+    usages = [r.usage for r in chunk_results if r.usage]
+    costs = [u.cost_usd for u in usages if u.cost_usd is not None]
+    combined_usage = LLMUsage(
+        model=model,
+        request_type="ocr",
+        latency_ms=total_latency_ms,
+        prompt_tokens=sum(u.prompt_tokens or 0 for u in usages),
+        cost_usd=sum(costs) if costs else None,
+        pipeline=pipeline,
+        content_id=content_id,
+        operation=operation,
+    )
+
+    logger.info(
+        f"Chunked OCR complete: {len(all_pages)} pages from "
+        f"{len(page_ranges)} chunks, {total_latency_ms}ms"
+    )
+
+    return MistralOCRResult(
+        pages=all_pages,
+        full_text=full_text,
+        full_markdown=full_markdown,
+        document_annotation=document_annotation,
+        usage=combined_usage,
+        model=model,
+        processing_time_ms=total_latency_ms,
+    )
+
+
+async def _ocr_page_range(
+    pdf_path: Path,
+    start: int,
+    end: int,
+    model: str,
+    include_images: bool,
+    pipeline: Optional[str],
+    content_id: Optional[int],
+    operation: Optional[str],
+) -> MistralOCRResult:
+    """Internal: OCR pages [start, end) as a standalone PDF, retrying on failure."""
+    ocr_backend = get_ocr_backend()
+
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(settings.PDF_OCR_CHUNK_ATTEMPTS),
+        wait=wait_exponential(
+            min=OCR_CHUNK_RETRY_MIN_SEC, max=OCR_CHUNK_RETRY_MAX_SEC
+        ),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    ):
+        with attempt:
+            start_time = time.perf_counter()
+            try:
+                # Splitting and encoding are CPU/IO bound; keep them off the loop
+                base64_pdf = await asyncio.to_thread(
+                    _encode_pdf_pages_to_base64, pdf_path, start, end
+                )
+                response = await asyncio.to_thread(
+                    ocr_backend.process,
+                    model=model,
+                    document={
+                        "type": "document_url",
+                        "document_url": f"data:application/pdf;base64,{base64_pdf}",
+                    },
+                    include_image_base64=include_images,
+                )
+            except Exception as e:
+                create_error_usage(
+                    model=model,
+                    request_type="ocr",
+                    latency_ms=int((time.perf_counter() - start_time) * 1000),
+                    error_message=str(e),
+                    pipeline=pipeline,
+                    content_id=content_id,
+                    operation=operation,
+                )
+                logger.warning(f"OCR of pages {start + 1}-{end} failed: {e}")
+                raise
+
+    latency_ms = int((time.perf_counter() - start_time) * 1000)
+    ocr_pages, doc_annotation = _parse_ocr_response(response, include_images)
+
+    # Chunk pages are numbered from 0; shift them to document page indices
+    for page in ocr_pages:
+        page.index += start
+
+    full_text, full_markdown = _build_page_markdown(ocr_pages, include_images)
+
+    return MistralOCRResult(
+        pages=ocr_pages,
+        full_text=full_text,
+        full_markdown=full_markdown,
+        document_annotation=doc_annotation,
+        usage=_extract_usage(
+            response=response,
+            model=model,
+            latency_ms=latency_ms,
+            pipeline=pipeline,
+            content_id=content_id,
+            operation=operation,
+        ),
+        model=model,
+        processing_time_ms=latency_ms,
+    )
+
+
 async def _ocr_with_annotations(
     pdf_path: Path,
     model: str,
@@ -805,7 +1123,7 @@ async def _ocr_with_annotations(
     # Normalize model name (strip mistral/ prefix for native SDK)
     model = _normalize_model_name(model)
 
-    client = get_mistral_client()
+    ocr_backend = get_ocr_backend()
     base64_pdf = _encode_pdf_to_base64(pdf_path)
 
     document = {
@@ -835,7 +1153,7 @@ async def _ocr_with_annotations(
 
         response = await loop.run_in_executor(
             None,
-            lambda: client.ocr.process(**base_kwargs),
+            lambda: ocr_backend.process(**base_kwargs),
         )
 
         latency_ms = int((time.perf_counter() - start_time) * 1000)
@@ -930,7 +1248,7 @@ async def _ocr_basic(
     # Normalize model name (strip mistral/ prefix for native SDK)
     model = _normalize_model_name(model)
 
-    client = get_mistral_client()
+    ocr_backend = get_ocr_backend()
     base64_pdf = _encode_pdf_to_base64(pdf_path)
 
     document = {
@@ -950,7 +1268,7 @@ async def _ocr_basic(
         # Note: bbox_annotation_format was removed in mistralai SDK 1.5.x
         response = await loop.run_in_executor(
             None,
-            lambda: client.ocr.process(
+            lambda: ocr_backend.process(
                 model=model,
                 document=document,
                 pages=page_indices,
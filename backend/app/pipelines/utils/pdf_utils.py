@@ -59,7 +59,9 @@ import json
 from pathlib import Path
 from typing import Any
 
-import fitz  # PyMuPDF
+from app.lazy_imports import lazy_import
+
+fitz = lazy_import("fitz")  # PyMuPDF, imported on first use
 
 
 # Annotation type constants from PyMuPDF
@@ -23,11 +23,14 @@ from typing import Any, Optional
 
 import markdown
 from bs4 import BeautifulSoup
-from langchain_text_splitters import (
-    RecursiveCharacterTextSplitter,
-    MarkdownTextSplitter,
-    TokenTextSplitter,
+from app.lazy_imports import lazy_callable
+
+# LangChain splitters are imported on first use (see app.lazy_imports)
+RecursiveCharacterTextSplitter = lazy_callable(
+    "langchain_text_splitters", "RecursiveCharacterTextSplitter"
 )
+MarkdownTextSplitter = lazy_callable("langchain_text_splitters", "MarkdownTextSplitter")
+TokenTextSplitter = lazy_callable("langchain_text_splitters", "TokenTextSplitter")
 
 
 def normalize_llm_json_response(data: Any, expected_key: str) -> dict:
@@ -43,9 +43,8 @@ import os
 import time
 from typing import Any, Optional
 
-from litellm import acompletion, completion
-
 from app.config.settings import settings
+from app.lazy_imports import lazy_callable
 from app.pipelines.utils.api_utils import adjust_temperature_for_model
 from app.models.llm_usage import (
     LLMUsage,
@@ -55,6 +54,10 @@ from app.models.llm_usage import (
 
 logger = logging.getLogger(__name__)
 
+# LiteLLM is imported on first use (see app.lazy_imports)
+acompletion = lazy_callable("litellm", "acompletion")
+completion = lazy_callable("litellm", "completion")
+
 # Configure LiteLLM logging (set_verbose is deprecated)
 if settings.DEBUG:
     os.environ["LITELLM_LOG"] = "DEBUG"
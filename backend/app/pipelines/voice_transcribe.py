@@ -31,11 +31,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-import litellm
-from litellm import transcription
 from mutagen import File as MutagenFile
 
 from app.config.settings import settings
+from app.lazy_imports import lazy_callable
 from app.models.content import (
     Annotation,
     AnnotationType,
@@ -56,6 +55,9 @@ from app.services.storage import check_hash_exists
 
 logger = logging.getLogger(__name__)
 
+# LiteLLM is imported on first use (see app.lazy_imports)
+transcription = lazy_callable("litellm", "transcription")
+
 # Configure LiteLLM logging (set_verbose is deprecated)
 if settings.DEBUG:
     os.environ["LITELLM_LOG"] = "DEBUG"
@@ -30,7 +30,6 @@ from typing import Any, Optional
 from urllib.parse import urlparse
 
 import httpx
-from trafilatura import bare_extraction
 
 from app.config import settings
 from app.enums.content import ContentType
@@ -39,9 +38,14 @@ from app.models.llm_usage import LLMUsage
 from app.pipelines.base import BasePipeline, PipelineContentType, PipelineInput, DuplicateContentError
 from app.enums.pipeline import PipelineName, PipelineOperation
 from app.services.cost_tracking import CostTracker
+from app.services.http_client import HTTPSession, fetch_text
+from app.lazy_imports import lazy_callable
 from app.services.llm import get_llm_client, get_default_text_model, build_messages
 from app.services.storage import check_url_exists
 
+# Trafilatura is imported on first use (see app.lazy_imports)
+bare_extraction = lazy_callable("trafilatura", "bare_extraction")
+
 
 # =============================================================================
 # CONSTANTS
@@ -70,7 +74,6 @@ DEFAULT_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
     "Accept-Encoding": "gzip, deflate, br",
     "DNT": "1",
-    "Connection": "keep-alive",
     "Upgrade-Insecure-Requests": "1",
 }
 
@@ -395,14 +398,9 @@ Respond with ONLY the title, nothing else."""
     async def _extract_with_trafilatura(self, url: str) -> dict[str, Any]:
         """Extract using trafilatura (works for static HTML pages)."""
         try:
-            async with httpx.AsyncClient(
-                headers=DEFAULT_HEADERS,
-                timeout=self.timeout,
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                downloaded = response.text
+            downloaded = await fetch_text(
+                url, headers=DEFAULT_HEADERS, timeout=self.timeout
+            )
 
             if downloaded:
                 loop = asyncio.get_event_loop()
@@ -448,13 +446,10 @@ Respond with ONLY the title, nothing else."""
             await rate_limiter.acquire()
 
             jina_url = f"{JINA_READER_URL}{url}"
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(jina_url)
-                response.raise_for_status()
-                content = response.text
+            client = HTTPSession(timeout=self.timeout, follow_redirects=True)
+            response = await client.get(jina_url)
+            response.raise_for_status()
+            content = response.text
 
             if content:
                 # Jina returns markdown with title on first line
@@ -5,6 +5,7 @@ Exposes AI assistant and chat operations via REST API.
 
 Endpoints:
     POST /api/assistant/chat                              - Send message to assistant
+    POST /api/assistant/chat/stream                       - Stream assistant reply (SSE)
     GET  /api/assistant/conversations                     - List conversations
     GET  /api/assistant/conversations/{id}                - Get conversation with messages
     DELETE /api/assistant/conversations/{id}              - Delete conversation
@@ -20,12 +21,15 @@ Endpoints:
 Models are defined in app.models.assistant.
 """
 
+import json
 import logging
+from typing import Any, AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.db.base import async_session_maker, get_db
 from app.enums import ExplanationStyle
 from app.middleware.error_handling import handle_endpoint_errors
 from app.models.assistant import (
@@ -72,6 +76,11 @@ async def get_assistant_service(
     Returns:
         Configured AssistantService instance.
     """
+    return await _build_assistant_service(db)
+
+
+async def _build_assistant_service(db: AsyncSession) -> AssistantService:
+    """Create an AssistantService on db with optional Neo4j and LLM clients."""
     neo4j_client = None
     llm_client = None
 
@@ -121,6 +130,76 @@ async def send_message(
     )
 
 
+def _format_sse(event: str, data: dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _sse_chat_stream(
+    db: AsyncSession,
+    first_event: tuple[str, dict[str, Any]],
+    events: AsyncIterator[tuple[str, dict[str, Any]]],
+) -> AsyncIterator[str]:
+    """Relay chat stream events as SSE, then commit and close the session."""
+    try:
+        yield _format_sse(*first_event)
+        async for event, data in events:
+            yield _format_sse(event, data)
+        await db.commit()
+    except Exception as e:
+        logger.error(f"Chat stream failed: {e}")
+        await db.rollback()
+        yield _format_sse("error", {"detail": f"Chat stream failed: {e!s}"})
+    finally:
+        await db.close()
+
+
+@router.post("/chat/stream")
+@handle_endpoint_errors("Chat stream")
+async def stream_message(request: ChatRequest) -> StreamingResponse:
+    """
+    Send a message to the AI assistant and stream the response as SSE.
+
+    Events: `start` (conversation_id, sources), one `token` per text delta,
+    then `done` (conversation_id, message_id) once the reply is saved, or
+    `error` if the stream fails midway.
+
+    The stream owns its database session, so the conversation stays usable
+    until the reply is persisted regardless of when request dependencies
+    are torn down.
+
+    Args:
+        request: Chat request with message and optional conversation_id.
+
+    Returns:
+        StreamingResponse of text/event-stream events.
+
+    Raises:
+        HTTPException 404: If specified conversation not found.
+        HTTPException 500: If chat preparation fails.
+    """
+    db = async_session_maker()
+    try:
+        service = await _build_assistant_service(db)
+        events = service.chat_stream(
+            message=request.message,
+            conversation_id=request.conversation_id,
+        )
+        # Resolve the conversation and context before the response starts,
+        # so a missing conversation still maps to a 404
+        first_event = await anext(events)
+    except Exception:
+        await db.rollback()
+        await db.close()
+        raise
+
+    return StreamingResponse(
+        _sse_chat_stream(db, first_event, events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # =============================================================================
 # Conversation Endpoints
 # =============================================================================
@@ -44,7 +44,6 @@ import re
 from pathlib import Path
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile
-import httpx
 
 from app.dependencies import verify_capture_api_key
 from app.models.content import (
@@ -54,11 +53,13 @@ from app.models.content import (
     UnifiedContent,
 )
 from app.pipelines.base import PipelineContentType
-from app.pipelines.utils.hash_utils import (
-    calculate_file_hash,
-    calculate_content_hash,
+from app.pipelines.utils.hash_utils import calculate_content_hash
+from app.services.http_client import HTTPSession
+from app.services.storage import (
+    check_hash_exists,
+    save_content,
+    save_upload_with_hash,
 )
-from app.services.storage import save_upload, save_content
 from app.services.tasks import (
     ingest_book,
     ingest_content,
@@ -86,6 +87,30 @@ router = APIRouter(
 )
 
 
+async def _find_duplicate_upload(
+    file_hash: Optional[str], file_paths: list[Path]
+) -> Optional[str]:
+    """
+    Check an upload's hash against existing content before any pipeline work.
+
+    If the content already exists, the freshly staged files are deleted.
+
+    Args:
+        file_hash: SHA-256 of the upload (or batch hash for multi-file uploads)
+        file_paths: Staged files of this upload
+
+    Returns:
+        The existing content_id if the upload is a duplicate, else None
+    """
+    if not file_hash:
+        return None
+    existing_id = await check_hash_exists(file_hash)
+    if existing_id:
+        for path in file_paths:
+            path.unlink(missing_ok=True)
+    return existing_id
+
+
 @router.post("/text")
 async def capture_text(
     background_tasks: BackgroundTasks,
@@ -294,8 +319,17 @@ async def capture_photo(
     if not file.content_type or not file.content_type.startswith("image/"):
         raise HTTPException(400, "File must be an image")
 
-    # Save file
-    file_path = await save_upload(file, directory="photos")
+    # Save file, hashing while writing, and reject duplicates early
+    file_path, file_hash = await save_upload_with_hash(file, directory="photos")
+    existing_id = await _find_duplicate_upload(file_hash, [file_path])
+    if existing_id:
+        return {
+            "status": "deduped",
+            "id": existing_id,
+            "capture_type": capture_type,
+            "message": "File already exists; skipping re-ingestion",
+            "existing_id": existing_id,
+        }
 
     # Determine content type based on capture type
     content_type = ContentType.IDEA
@@ -314,8 +348,6 @@ async def capture_photo(
 
     title = book_title or f"Photo capture - {capture_type}"
 
-    file_hash = calculate_file_hash(file_path)
-
     ucf = UnifiedContent(
         source_type=content_type,
         source_file_path=str(file_path),
@@ -419,10 +451,16 @@ async def capture_voice(
         if ext not in {"mp3", "mp4", "wav", "webm", "m4a", "ogg", "flac"}:
             raise HTTPException(400, f"Unsupported audio format: {file.content_type}")
 
-    # Save file
-    file_path = await save_upload(file, directory="voice_memos")
-
-    file_hash = calculate_file_hash(file_path)
+    # Save file, hashing while writing, and reject duplicates early
+    file_path, file_hash = await save_upload_with_hash(file, directory="voice_memos")
+    existing_id = await _find_duplicate_upload(file_hash, [file_path])
+    if existing_id:
+        return {
+            "status": "deduped",
+            "id": existing_id,
+            "message": "Voice memo already exists; skipping re-ingestion",
+            "existing_id": existing_id,
+        }
 
     ucf = UnifiedContent(
         source_type=ContentType.VOICE_MEMO,
@@ -510,7 +548,7 @@ async def capture_pdf(
         if ext != "pdf":
             raise HTTPException(400, "File must be a PDF")
 
-    # Capture original filename BEFORE saving (save_upload may rename)
+    # Capture original filename BEFORE saving (save_upload_with_hash renames)
     original_filename = file.filename or "Untitled PDF"
     # Clean up the title: remove .pdf extension and clean up
     title = original_filename
@@ -519,10 +557,17 @@ async def capture_pdf(
     # Replace underscores with spaces for readability
     title = title.replace("_", " ").strip()
 
-    # Save file
-    file_path = await save_upload(file, directory="pdfs")
-
-    file_hash = calculate_file_hash(file_path)
+    # Save file, hashing while writing, and reject duplicates early
+    file_path, file_hash = await save_upload_with_hash(file, directory="pdfs")
+    existing_id = await _find_duplicate_upload(file_hash, [file_path])
+    if existing_id:
+        return {
+            "status": "deduped",
+            "id": existing_id,
+            "filename": file.filename,
+            "message": "PDF already exists; skipping re-ingestion",
+            "existing_id": existing_id,
+        }
 
     ucf = UnifiedContent(
         source_type=ContentType.PAPER,
@@ -637,6 +682,7 @@ async def capture_book(
     # formats like HEIC which curl sends as application/octet-stream)
     valid_extensions = {".jpg", ".jpeg", ".png", ".heic", ".webp", ".tiff"}
     saved_paths = []
+    per_file_hashes = []
 
     for file in files:
         # Check extension (primary validation - more reliable than content_type)
@@ -649,16 +695,28 @@ async def capture_book(
                     f"Unsupported image format: {ext}. Supported: {valid_extensions}",
                 )
 
-        # Save file
-        file_path = await save_upload(file, directory="book_pages")
+        # Save file, hashing while writing
+        file_path, file_hash = await save_upload_with_hash(
+            file, directory="book_pages"
+        )
         saved_paths.append(str(file_path))
+        per_file_hashes.append(file_hash)
 
     # Create a stable combined hash of the batch to dedupe repeated uploads
-    try:
-        per_file_hashes = sorted(calculate_file_hash(Path(p)) for p in saved_paths)
-        batch_hash = calculate_content_hash("|".join(per_file_hashes))
-    except Exception:
-        batch_hash = None
+    batch_hash = calculate_content_hash("|".join(sorted(per_file_hashes)))
+    existing_id = await _find_duplicate_upload(
+        batch_hash, [Path(p) for p in saved_paths]
+    )
+    if existing_id:
+        return {
+            "status": "deduped",
+            "id": existing_id,
+            "title": title,
+            "page_count": len(files),
+            "max_concurrency": max_concurrency,
+            "message": "Book batch already exists; skipping re-ingestion",
+            "existing_id": existing_id,
+        }
 
     # Parse authors
     author_list = []
@@ -775,19 +833,19 @@ async def _fetch_page_title(url: str) -> str:
              Uses a 10-second timeout and follows redirects.
     """
     try:
-        async with httpx.AsyncClient(timeout=URL_FETCH_TIMEOUT_SEC, follow_redirects=True) as client:
-            response = await client.get(
-                url,
-                headers={"User-Agent": URL_FETCH_USER_AGENT},
-            )
+        client = HTTPSession(timeout=URL_FETCH_TIMEOUT_SEC, follow_redirects=True)
+        response = await client.get(
+            url,
+            headers={"User-Agent": URL_FETCH_USER_AGENT},
+        )
 
-            if response.status_code == 200:
-                # Extract title from HTML
-                match = re.search(
-                    r"<title[^>]*>([^<]+)</title>", response.text, re.IGNORECASE
-                )
-                if match:
-                    return match.group(1).strip()
+        if response.status_code == 200:
+            # Extract title from HTML
+            match = re.search(
+                r"<title[^>]*>([^<]+)</title>", response.text, re.IGNORECASE
+            )
+            if match:
+                return match.group(1).strip()
     except Exception:
         pass
 
@@ -4,15 +4,19 @@ Health Check Endpoints
 Provides health check endpoints for monitoring and orchestration.
 
 Endpoints:
-- GET /api/health - Basic health check
+- GET /api/health - Basic health check (liveness and readiness summary)
+- GET /api/health/live - Liveness probe (process is up and serving)
 - GET /api/health/detailed - Detailed health with dependency checks
 - GET /api/health/ready - Readiness probe for orchestration systems
+
+Liveness vs readiness: the API starts serving before startup vault
+reconciliation finishes, so it can be live but not yet ready.
 """
 
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from neo4j import GraphDatabase
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,7 +25,11 @@ from app.config import settings
 from app.db.base import get_db
 from app.db.redis import get_redis
 from app.services.knowledge_graph.queries import VERIFY_CONNECTIVITY
-from app.services.obsidian.lifecycle import get_watcher_status
+from app.services.obsidian.lifecycle import (
+    get_startup_status,
+    get_watcher_status,
+    is_vault_ready,
+)
 from app.services.obsidian.vault import get_vault_manager
 from app.services.queue import celery_app
 
@@ -32,18 +40,35 @@ router = APIRouter(prefix="/api/health", tags=["health"])
 
 
 @router.get("")
-async def health_check() -> dict[str, str]:
+async def health_check() -> dict[str, Any]:
     """
     Basic health check.
 
-    Returns a simple status response indicating the API is running.
+    Returns a simple status response indicating the API is running, with
+    separate liveness and readiness flags (readiness is False while startup
+    vault reconciliation is still running).
     """
     return {
         "status": "healthy",
         "service": settings.APP_NAME,
+        "live": True,
+        "ready": is_vault_ready(),
+        "startup_phase": get_startup_status()["phase"],
     }
 
 
+@router.get("/live")
+async def liveness_check() -> dict[str, bool]:
+    """
+    Liveness probe for orchestration systems.
+
+    Always returns 200 while the process can serve requests; checks no
+    dependencies, so a slow startup or a dependency outage never triggers
+    a restart.
+    """
+    return {"live": True}
+
+
 @router.get("/detailed")
 async def detailed_health_check(db: AsyncSession = Depends(get_db)) -> dict[str, Any]:
     """
@@ -129,6 +154,7 @@ async def detailed_health_check(db: AsyncSession = Depends(get_db)) -> dict[str,
             "watcher_running": watcher_status["watcher_running"],
             "sync_enabled": watcher_status["sync_enabled"],
             "watch_enabled": watcher_status["watch_enabled"],
+            "startup_phase": get_startup_status()["phase"],
         }
         # Watcher being stopped is not a degraded state - it's configurable
     except Exception as e:
@@ -172,12 +198,15 @@ async def detailed_health_check(db: AsyncSession = Depends(get_db)) -> dict[str,
 
 
 @router.get("/ready")
-async def readiness_check(db: AsyncSession = Depends(get_db)) -> dict[str, Any]:
+async def readiness_check(
+    response: Response, db: AsyncSession = Depends(get_db)
+) -> dict[str, Any]:
     """
     Readiness probe for orchestration systems.
 
-    Returns 200 only if the service is ready to accept traffic.
-    Checks critical dependencies (database, Redis).
+    Returns 200 only if the service is ready to accept traffic, 503 otherwise.
+    Checks critical dependencies (database, Redis) and that startup vault
+    reconciliation has finished.
 
     Used by: Docker health checks, load balancers, Kubernetes, etc.
     """
@@ -188,7 +217,13 @@ async def readiness_check(db: AsyncSession = Depends(get_db)) -> dict[str, Any]:
         # Check Redis connectivity
         r = await get_redis()
         await r.ping()
-
-        return {"ready": True}
     except Exception as e:
+        response.status_code = 503
         return {"ready": False, "error": str(e)}
+
+    startup = get_startup_status()
+    if not startup["ready"]:
+        response.status_code = 503
+        return {"ready": False, "startup_phase": startup["phase"]}
+
+    return {"ready": True, "startup_phase": startup["phase"]}
@@ -4,7 +4,7 @@ Knowledge Graph API Router
 Exposes knowledge graph visualization and query operations via REST API.
 
 Endpoints:
-    GET  /api/knowledge/graph           - Get graph data for visualization
+    GET  /api/knowledge/graph           - Get graph data for visualization (ETag)
     GET  /api/knowledge/stats           - Get graph statistics
     GET  /api/knowledge/node/{node_id}  - Get node details
     GET  /api/knowledge/health          - Check Neo4j connection health
@@ -19,9 +19,10 @@ Enums are defined in app.enums.knowledge.
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
-from app.enums.knowledge import ConnectionDirection
+from app.dependencies import mark_vault_reconciling
+from app.enums.knowledge import ConnectionDirection, GraphLevelOfDetail
 from app.middleware.error_handling import handle_endpoint_errors
 from app.models.knowledge import (
     ConnectionsResponse,
@@ -41,11 +42,16 @@ from app.services.knowledge_graph import (
     get_neo4j_client,
     get_visualization_service,
 )
+from app.services.knowledge_graph.snapshot import snapshot_etag
 from app.services.llm import get_llm_client
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/knowledge", tags=["knowledge"])
+router = APIRouter(
+    prefix="/api/knowledge",
+    tags=["knowledge"],
+    dependencies=[Depends(mark_vault_reconciling)],
+)
 
 
 # =============================================================================
@@ -56,23 +62,35 @@ router = APIRouter(prefix="/api/knowledge", tags=["knowledge"])
 @router.get("/graph", response_model=GraphResponse)
 @handle_endpoint_errors("Get graph visualization")
 async def get_graph_visualization(
+    request: Request,
+    response: Response,
     center_id: Optional[str] = Query(None, description="Center graph on this node ID"),
     node_types: str = Query(
         "Content,Concept,Note", description="Comma-separated node types"
     ),
     depth: int = Query(2, ge=1, le=4, description="Traversal depth from center"),
     limit: int = Query(100, ge=10, le=500, description="Max nodes to return"),
+    lod: GraphLevelOfDetail = Query(
+        GraphLevelOfDetail.TOP,
+        description="Level of detail for uncentered graphs (clusters, top, full)",
+    ),
 ) -> GraphResponse:
     """
     Get graph data for visualization.
 
     Returns nodes and edges in D3-compatible format for force-directed graphs.
 
+    Uncentered graphs are served from the precomputed graph snapshot and
+    carry an ETag; a matching If-None-Match gets 304 Not Modified without
+    reading the snapshot.
+
     Args:
         center_id: Optional node ID to center the graph on
         node_types: Comma-separated list of node types to include
         depth: How many hops from center to traverse (only used with center_id)
-        limit: Maximum number of nodes to return
+        limit: Maximum number of nodes (clusters at the clusters level of
+            detail); not applied at the full level of detail
+        lod: Level of detail (only used without center_id)
 
     Returns:
         GraphResponse with nodes, edges, and metadata
@@ -80,12 +98,24 @@ async def get_graph_visualization(
     service = await get_visualization_service()
     node_type_list = [t.strip() for t in node_types.split(",")]
 
+    version = None if center_id else await service.get_snapshot_version()
+    etag = snapshot_etag(version, lod, node_type_list, limit) if version else None
+    if etag:
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers={"ETag": etag})
+
     result = await service.get_graph(
         center_id=center_id,
         node_types=node_type_list,
         depth=depth,
         limit=limit,
+        lod=lod,
+        snapshot_version=version,
     )
+    if etag and result.get("snapshot_version") == version:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
 
     # Convert to response models
     nodes = [
@@ -94,6 +124,8 @@ async def get_graph_visualization(
             label=n["label"],
             type=n["type"],
             content_type=n.get("content_type"),
+            size=n.get("size", 1),
+            cluster_id=n.get("cluster_id"),
             metadata=n.get("metadata", {}),
         )
         for n in result["nodes"]
@@ -105,6 +137,7 @@ async def get_graph_visualization(
             target=e["target"],
             type=e["type"],
             strength=e["strength"],
+            label=e.get("label"),
         )
         for e in result["edges"]
     ]
@@ -115,6 +148,8 @@ async def get_graph_visualization(
         center_id=result["center_id"],
         total_nodes=result["total_nodes"],
         total_edges=result["total_edges"],
+        lod=result.get("lod"),
+        snapshot_version=result.get("snapshot_version"),
     )
 
 
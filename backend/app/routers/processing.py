@@ -61,6 +61,7 @@ from app.models.processing_api import (
     UpdateFollowupResponse,
 )
 from app.services.processing.pipeline import process_content, PipelineConfig
+from app.services.processing.checkpoints import CheckpointStore
 from app.services.processing.cleanup import cleanup_before_reprocessing
 
 logger = logging.getLogger(__name__)
@@ -162,7 +163,9 @@ async def _run_processing(content_id: str, config_dict: Optional[dict] = None) -
 
         # Run pipeline with database session for card generation
         async with async_session_maker() as db_session:
-            processing_result = await process_content(content, config, db=db_session)
+            processing_result = await process_content(
+                content, config, db=db_session, checkpoints=CheckpointStore()
+            )
 
         # Save result to database
         async with async_session_maker() as session:
@@ -520,6 +523,8 @@ async def reprocess_content(
     Reprocess specific stages for existing content.
 
     Useful when prompts are updated or specific stages need to be re-run.
+    The checkpoints of the requested stages (all stages if none are given)
+    are invalidated, so they are recomputed rather than restored.
 
     Args:
         content_id: UUID of content to reprocess
@@ -541,6 +546,7 @@ async def reprocess_content(
         or not stages,
         generate_questions=ProcessingStage.QUESTIONS.value in stage_values
         or not stages,
+        invalidate_stages=stages or list(ProcessingStage),
     )
 
     request = TriggerProcessingRequest(content_id=content_id, config=config)
@@ -5,12 +5,14 @@ Endpoints for spaced repetition card management and review.
 
 Endpoints:
 - GET /api/review/due - Get cards due for review
+- GET /api/review/due/count - Get number of cards due (cached, no cards)
 - POST /api/review/rate - Submit a card review rating
 - POST /api/review/evaluate - Evaluate typed answer and get rating (active recall)
 - POST /api/review/cards - Create a new card
 - POST /api/review/generate - Generate cards for a topic on-demand
 - GET /api/review/cards/{id} - Get a card by ID
 - GET /api/review/stats - Get card statistics
+- GET /api/review/forecast - Get review workload forecast (counts only)
 """
 
 import logging
@@ -32,6 +34,8 @@ from app.models.learning import (
     CardReviewResponse,
     CardStats,
     DueCardsResponse,
+    DueCountResponse,
+    ReviewForecast,
 )
 from app.services.cost_tracking import CostTracker
 from app.services.learning import SpacedRepService
@@ -148,6 +152,20 @@ async def get_due_cards(
     )
 
 
+@router.get("/due/count", response_model=DueCountResponse)
+@handle_endpoint_errors("Get due count")
+async def get_due_count(
+    topic: Optional[str] = Query(None, description="Filter by topic tag"),
+    service: SpacedRepService = Depends(get_spaced_rep_service),
+) -> DueCountResponse:
+    """
+    Get the number of cards due for review.
+
+    Cheap count for badges and widgets; does not fetch cards or a forecast.
+    """
+    return DueCountResponse(due_count=await service.count_due(topic_filter=topic))
+
+
 @router.post("/rate", response_model=CardReviewResponse)
 @handle_endpoint_errors("Rate card")
 async def rate_card(
@@ -232,6 +250,20 @@ async def get_card_stats(
     return await service.get_card_stats(topic_filter=topic)
 
 
+@router.get("/forecast", response_model=ReviewForecast)
+@handle_endpoint_errors("Get review forecast")
+async def get_review_forecast(
+    topic: Optional[str] = Query(None, description="Filter by topic tag"),
+    service: SpacedRepService = Depends(get_spaced_rep_service),
+) -> ReviewForecast:
+    """
+    Get the review workload forecast without fetching cards.
+
+    Returns due counts for overdue, today, tomorrow, this week and later.
+    """
+    return await service.get_review_forecast(topic_filter=topic)
+
+
 # ===========================================
 # Card Generation Endpoints
 # ===========================================
@@ -16,10 +16,9 @@ import logging
 import mimetypes
 import os
 from datetime import date, datetime
-from pathlib import Path
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
@@ -28,16 +27,22 @@ from sqlalchemy import select
 from app.content_types import content_registry
 from app.db.base import async_session_maker
 from app.db.models import Image as DBImage
+from app.dependencies import mark_vault_reconciling
 from app.services.obsidian.daily import DailyNoteGenerator
 from app.services.obsidian.frontmatter import parse_frontmatter
 from app.services.obsidian.indexer import FolderIndexer
-from app.services.obsidian.lifecycle import get_watcher_status
+from app.services.obsidian.lifecycle import get_startup_status, get_watcher_status
+from app.services.obsidian.note_index import NoteIndexService
 from app.services.obsidian.sync import VaultSyncService, get_sync_status
 from app.services.obsidian.vault import VaultManager, get_vault_manager
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/vault", tags=["vault"])
+router = APIRouter(
+    prefix="/api/vault",
+    tags=["vault"],
+    dependencies=[Depends(mark_vault_reconciling)],
+)
 
 
 class DailyNoteRequest(BaseModel):
@@ -82,6 +87,7 @@ class NotesListResponse(BaseModel):
     page: int
     page_size: int
     has_more: bool
+    next_cursor: Optional[str] = None  # Keyset cursor for the next page
 
 
 @router.get("/status")
@@ -194,13 +200,25 @@ async def add_inbox_item(request: InboxItemRequest) -> dict[str, str]:
 
 
 @router.post("/sync")
-async def sync_vault_to_neo4j(background_tasks: BackgroundTasks) -> dict[str, str]:
+async def sync_vault_to_neo4j(
+    background_tasks: BackgroundTasks,
+    force: bool = Query(
+        False, description="Rewrite notes whose content hash is unchanged"
+    ),
+) -> dict[str, str]:
     """Sync entire vault to Neo4j (runs in background)."""
+    sync_status = get_sync_status()
+    if sync_status["is_running"]:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Vault sync already in progress ({sync_status['sync_type']})",
+        )
+
     try:
         vault = get_vault_manager()
         sync_service = VaultSyncService()
 
-        background_tasks.add_task(sync_service.full_sync, vault.vault_path)
+        background_tasks.add_task(sync_service.full_sync, vault.vault_path, force=force)
 
         return {"status": "syncing", "message": "Full vault sync started"}
     except ValueError as e:
@@ -261,10 +279,12 @@ async def get_vault_sync_status() -> dict[str, Any]:
     Returns:
         - is_running: Whether a sync is currently in progress
         - sync_type: Type of sync ("full" or "reconciliation")
-        - progress: Current progress (total, processed, synced, failed, percent)
+        - progress: Current progress (total, processed, synced, skipped, failed,
+          percent)
         - last_result: Result of the last completed sync
         - last_completed_at: When the last sync completed
         - last_error: Error message if the last sync failed
+        - startup: Background startup phase (indexing, reconciling, ready, ...)
     """
     sync_status = get_sync_status()
 
@@ -275,6 +295,7 @@ async def get_vault_sync_status() -> dict[str, Any]:
     return {
         **sync_status,
         "last_sync_time": last_sync_time.isoformat() if last_sync_time else None,
+        "startup": get_startup_status(),
     }
 
 
@@ -295,120 +316,60 @@ async def list_notes(
         "modified", description="Sort by: modified, name, title, size"
     ),
     sort_desc: bool = Query(True, description="Sort descending"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor from a previous response's next_cursor "
+        "(takes precedence over page)",
+    ),
 ):
     """List notes in the vault with filtering and pagination.
 
-    Scans the vault for markdown files and returns metadata.
-    Supports filtering by folder, search term, tag, and content type.
+    Reads from the vault_notes metadata index (kept current by the vault
+    watcher and validated on startup), so no files are touched per request.
+    Supports filtering by folder, search term, tag, and content type, with
+    either page-based or keyset (cursor) pagination.
     """
     try:
         vault = get_vault_manager()
-        vault_path = vault.vault_path
 
-        if not vault_path.exists():
+        if not vault.vault_path.exists():
             raise HTTPException(status_code=404, detail="Vault not found")
 
-        # Collect all markdown files
-        notes = []
-        search_path = vault_path / folder if folder else vault_path
-
-        if not search_path.exists():
-            return NotesListResponse(
-                notes=[], total=0, page=page, page_size=page_size, has_more=False
-            )
-
-        for md_file in search_path.rglob("*.md"):
-            # Skip hidden files and folders
-            if any(part.startswith(".") for part in md_file.parts):
-                continue
-
-            rel_path = md_file.relative_to(vault_path)
-
-            # Get file stats
-            stat = md_file.stat()
-
-            # Try to parse frontmatter for metadata
-            note_title = None
-            note_tags = []
-            note_content_type = None
-
-            try:
-                content = md_file.read_text(encoding="utf-8")
-                fm, _ = await parse_frontmatter(content)
-                if fm:
-                    note_title = fm.get("title") or fm.get("name")
-                    note_tags = fm.get("tags", [])
-                    if isinstance(note_tags, str):
-                        note_tags = [note_tags]
-                    note_content_type = fm.get("type") or fm.get("content_type")
-            except Exception:
-                pass  # Skip frontmatter parsing errors
-
-            # Apply search filter - check file name, title, and path
-            # Match if ANY significant search word appears in the searchable text
-            if search:
-                search_lower = search.lower()
-                searchable_text = (
-                    f"{md_file.stem} {note_title or ''} {str(rel_path)}".lower()
-                )
-
-                # Check if the full search term matches anywhere
-                full_match = search_lower in searchable_text
-
-                # Also check if ANY significant word matches (for fuzzy matching)
-                search_words = [w for w in search_lower.split() if len(w) > 2]
-                any_word_match = search_words and any(
-                    word in searchable_text for word in search_words
-                )
-
-                if not (full_match or any_word_match):
-                    continue
-
-            # Apply tag filter
-            if tag and tag not in note_tags:
-                continue
-
-            # Apply content type filter
-            if content_type and note_content_type != content_type:
-                continue
+        result = await NoteIndexService().query(
+            folder=folder,
+            search=search,
+            tag=tag,
+            content_type=content_type,
+            sort_by=sort_by,
+            sort_desc=sort_desc,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
 
-            notes.append(
+        return NotesListResponse(
+            notes=[
                 NoteInfo(
-                    path=str(rel_path),
-                    name=md_file.stem,
-                    folder=str(rel_path.parent) if rel_path.parent != Path(".") else "",
-                    modified=datetime.fromtimestamp(stat.st_mtime),
-                    size=stat.st_size,
-                    title=note_title,
-                    tags=note_tags,
-                    content_type=note_content_type,
+                    path=note.path,
+                    name=note.name,
+                    folder=note.folder,
+                    modified=note.mtime,
+                    size=note.size,
+                    title=note.title,
+                    tags=note.tags,
+                    content_type=note.note_type,
                 )
-            )
-
-        # Sort notes
-        if sort_by == "modified":
-            notes.sort(key=lambda n: n.modified, reverse=sort_desc)
-        elif sort_by == "name":
-            notes.sort(key=lambda n: n.name.lower(), reverse=sort_desc)
-        elif sort_by == "title":
-            notes.sort(key=lambda n: (n.title or n.name).lower(), reverse=sort_desc)
-        elif sort_by == "size":
-            notes.sort(key=lambda n: n.size, reverse=sort_desc)
-
-        # Paginate
-        total = len(notes)
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated_notes = notes[start:end]
-
-        return NotesListResponse(
-            notes=paginated_notes,
-            total=total,
+                for note in result.notes
+            ],
+            total=result.total,
             page=page,
             page_size=page_size,
-            has_more=end < total,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
         )
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -12,11 +12,16 @@ Core service for AI assistant functionality including:
 Usage:
     service = AssistantService(db, neo4j_client, llm_client)
     response = await service.chat(conversation_id, message)
+
+    # Streaming: (event, data) pairs, tokens emitted as they are generated
+    async for event, data in service.chat_stream(message, conversation_id):
+        ...
 """
 
+import asyncio
 import logging
 import uuid
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -79,6 +84,15 @@ When answering questions:
 Keep responses focused, helpful, and well-structured. Use markdown formatting \
 when appropriate."""
 
+LLM_UNAVAILABLE_MESSAGE = (
+    "I apologize, but I'm currently unable to generate responses. "
+    "The AI service is not available."
+)
+LLM_ERROR_MESSAGE = (
+    "I apologize, but I encountered an error while generating a "
+    "response. Please try again."
+)
+
 
 # =============================================================================
 # Service Implementation
@@ -266,30 +280,62 @@ class AssistantService:
             for msg in messages
         ]
 
-    async def _generate_response(
+    async def _retrieve_context(
+        self, message: str
+    ) -> tuple[str, list[SourceReference]]:
+        """
+        Retrieve RAG context and source references for a message.
+
+        Search failures are logged and degrade to no context.
+
+        Args:
+            message: User's message used as the search query.
+
+        Returns:
+            Tuple of (formatted context, source references).
+        """
+        if not (self.neo4j and self.llm):
+            return "", []
+
+        try:
+            results = await self._search_knowledge_base(query=message)
+        except Exception as e:
+            logger.warning(f"Knowledge search failed: {e}")
+            return "", []
+
+        if not results:
+            return "", []
+
+        sources = [
+            SourceReference(
+                id=r.get("id", ""),
+                title=r.get("title", "Untitled"),
+                # Clamp relevance to [0, 1]
+                relevance=min(r.get("score", 0), 1.0),
+            )
+            for r in results
+            if r.get("id")
+        ]
+        return self._format_context(results), sources
+
+    def _build_chat_messages(
         self,
         message: str,
         context: str = "",
         history: Optional[list[dict[str, str]]] = None,
-    ) -> str:
+    ) -> list[dict[str, str]]:
         """
-        Generate a response using the LLM.
+        Build the LLM messages for a chat turn.
 
         Args:
             message: User's current message.
             context: Optional RAG context from knowledge base.
-            history: Optional conversation history (excludes current message).
+            history: Optional conversation history (its last entry is the
+                current message, which is added separately with context).
 
         Returns:
-            Generated response text, or error message if LLM unavailable.
+            Messages in OpenAI format.
         """
-        if not self.llm:
-            return (
-                "I apologize, but I'm currently unable to generate responses. "
-                "The AI service is not available."
-            )
-
-        # Build messages for the LLM
         messages: list[dict[str, str]] = [
             {"role": "system", "content": ASSISTANT_SYSTEM_PROMPT}
         ]
@@ -304,6 +350,29 @@ class AssistantService:
             user_content = f"{context}\n\nUser question: {message}"
 
         messages.append({"role": "user", "content": user_content})
+        return messages
+
+    async def _generate_response(
+        self,
+        message: str,
+        context: str = "",
+        history: Optional[list[dict[str, str]]] = None,
+    ) -> str:
+        """
+        Generate a response using the LLM.
+
+        Args:
+            message: User's current message.
+            context: Optional RAG context from knowledge base.
+            history: Optional conversation history (excludes current message).
+
+        Returns:
+            Generated response text, or error message if LLM unavailable.
+        """
+        if not self.llm:
+            return LLM_UNAVAILABLE_MESSAGE
+
+        messages = self._build_chat_messages(message, context, history)
 
         try:
             response, usage = await self.llm.complete(
@@ -321,10 +390,7 @@ class AssistantService:
             return str(response) if not isinstance(response, str) else response
         except Exception as e:
             logger.error(f"LLM completion failed: {e}")
-            return (
-                "I apologize, but I encountered an error while generating a "
-                "response. Please try again."
-            )
+            return LLM_ERROR_MESSAGE
 
     # =========================================================================
     # Conversation Persistence Methods (delegated to ConversationManager)
@@ -353,31 +419,38 @@ class AssistantService:
     # Chat Methods
     # =========================================================================
 
-    async def chat(
+    async def _add_user_message(
+        self,
+        conversation: AssistantConversation,
+        message: str,
+    ) -> list[dict[str, str]]:
+        """Save the user message and return the updated conversation history."""
+        await self._add_message(conversation, MessageRole.USER, message)
+        return await self._get_conversation_history(conversation)
+
+    async def _prepare_chat(
         self,
         message: str,
         conversation_id: Optional[str] = None,
-    ) -> ChatResponse:
+    ) -> tuple[
+        AssistantConversation, str, list[SourceReference], list[dict[str, str]]
+    ]:
         """
-        Send a message to the assistant and get a response.
+        Resolve the conversation and gather everything needed for a reply.
 
-        Uses RAG to retrieve relevant context from the knowledge base
-        before generating a response.
+        Knowledge search (Neo4j + embeddings) runs concurrently with saving
+        the user message and loading history (database), since neither
+        depends on the other.
 
         Args:
             message: User's message text.
             conversation_id: Existing conversation UUID, or None to create new.
 
         Returns:
-            ChatResponse with conversation_id, response text, and sources.
+            Tuple of (conversation, context, sources, history).
 
         Raises:
             ValueError: If conversation_id is provided but not found.
-
-        Example:
-            >>> response = await service.chat("What is machine learning?")
-            >>> print(response.response)
-            Machine learning is...
         """
         # Get or create conversation
         if conversation_id:
@@ -387,33 +460,41 @@ class AssistantService:
         else:
             conversation = await self._create_conversation(message)
 
-        # Save user message
-        await self._add_message(conversation, MessageRole.USER, message)
+        (context, sources), history = await asyncio.gather(
+            self._retrieve_context(message),
+            self._add_user_message(conversation, message),
+        )
+        return conversation, context, sources, history
 
-        # Search knowledge base for relevant context
-        sources: list[SourceReference] = []
-        context = ""
+    async def chat(
+        self,
+        message: str,
+        conversation_id: Optional[str] = None,
+    ) -> ChatResponse:
+        """
+        Send a message to the assistant and get a response.
 
-        if self.neo4j and self.llm:
-            try:
-                results = await self._search_knowledge_base(query=message)
-                if results:
-                    context = self._format_context(results)
-                    sources = [
-                        SourceReference(
-                            id=r.get("id", ""),
-                            title=r.get("title", "Untitled"),
-                            # Clamp relevance to [0, 1]
-                            relevance=min(r.get("score", 0), 1.0),
-                        )
-                        for r in results
-                        if r.get("id")
-                    ]
-            except Exception as e:
-                logger.warning(f"Knowledge search failed: {e}")
+        Uses RAG to retrieve relevant context from the knowledge base
+        before generating a response.
 
-        # Get conversation history for context
-        history = await self._get_conversation_history(conversation)
+        Args:
+            message: User's message text.
+            conversation_id: Existing conversation UUID, or None to create new.
+
+        Returns:
+            ChatResponse with conversation_id, response text, and sources.
+
+        Raises:
+            ValueError: If conversation_id is provided but not found.
+
+        Example:
+            >>> response = await service.chat("What is machine learning?")
+            >>> print(response.response)
+            Machine learning is...
+        """
+        conversation, context, sources, history = await self._prepare_chat(
+            message, conversation_id
+        )
 
         # Generate response
         response_text = await self._generate_response(
@@ -431,6 +512,83 @@ class AssistantService:
             sources=sources,
         )
 
+    async def chat_stream(
+        self,
+        message: str,
+        conversation_id: Optional[str] = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Send a message to the assistant and stream the response.
+
+        Yields (event, data) pairs:
+        - ("start", {"conversation_id", "sources"}) once context is ready
+        - ("token", {"content"}) for each generated text delta
+        - ("done", {"conversation_id", "message_id"}) after the assistant
+          message is saved
+
+        The assistant message is saved (flushed, not committed) and its LLM
+        usage logged after the stream ends. Generation errors are reported
+        in-band as a final apology token, like chat().
+
+        Args:
+            message: User's message text.
+            conversation_id: Existing conversation UUID, or None to create new.
+
+        Yields:
+            Tuples of (event name, JSON-serializable data).
+
+        Raises:
+            ValueError: If conversation_id is provided but not found (raised
+                before the first event).
+        """
+        conversation, context, sources, history = await self._prepare_chat(
+            message, conversation_id
+        )
+
+        yield "start", {
+            "conversation_id": conversation.conversation_uuid,
+            "sources": [source.model_dump() for source in sources],
+        }
+
+        if not self.llm:
+            response_text = LLM_UNAVAILABLE_MESSAGE
+            yield "token", {"content": response_text}
+        else:
+            stream = self.llm.stream(
+                operation=PipelineOperation.CONTENT_ANALYSIS,
+                messages=self._build_chat_messages(message, context, history),
+                model=get_default_text_model(),
+                temperature=settings.ASSISTANT_LLM_TEMPERATURE,
+                max_tokens=settings.ASSISTANT_LLM_MAX_TOKENS,
+            )
+            parts: list[str] = []
+            try:
+                async for token in stream:
+                    parts.append(token)
+                    yield "token", {"content": token}
+            except Exception as e:
+                logger.error(f"LLM stream failed: {e}")
+                error_text = f"\n\n{LLM_ERROR_MESSAGE}" if parts else LLM_ERROR_MESSAGE
+                parts.append(error_text)
+                yield "token", {"content": error_text}
+            response_text = "".join(parts)
+
+            # Track LLM usage for cost monitoring
+            if stream.usage:
+                stream.usage.pipeline = "assistant"
+                stream.usage.operation = "chat_response"
+                await CostTracker.log_usage(stream.usage)
+
+        # Save assistant response
+        assistant_message = await self._add_message(
+            conversation, MessageRole.ASSISTANT, response_text
+        )
+
+        yield "done", {
+            "conversation_id": conversation.conversation_uuid,
+            "message_id": assistant_message.message_uuid,
+        }
+
     # =========================================================================
     # Conversation Management (delegated to ConversationManager)
     # =========================================================================
@@ -501,11 +659,11 @@ class AssistantService:
 
         # Try to get due card count for suggestion
         try:
-            due_response = await self.spaced_rep_service.get_due_cards(limit=1)
-            if due_response.total_due > 0:
+            due_count = await self.spaced_rep_service.count_due()
+            if due_count > 0:
                 suggestions.append(
                     PromptSuggestion(
-                        text=f"I have {due_response.total_due} cards due for review. Help me study!",
+                        text=f"I have {due_count} cards due for review. Help me study!",
                         category="review",
                     )
                 )
@@ -605,13 +763,13 @@ class AssistantService:
 
         # Get due cards count for spaced repetition recommendation
         try:
-            due_response = await self.spaced_rep_service.get_due_cards(limit=1)
-            if due_response.total_due > 0:
+            due_count = await self.spaced_rep_service.count_due()
+            if due_count > 0:
                 recommendations.append(
                     StudyRecommendation(
                         topic_id="spaced-rep",
                         topic_name="Review Due Cards",
-                        reason=f"You have {due_response.total_due} cards due for spaced repetition review",
+                        reason=f"You have {due_count} cards due for spaced repetition review",
                         priority="high",
                     )
                 )
@@ -94,6 +94,7 @@ class CostTracker:
                 latency_ms=usage.latency_ms,
                 success=usage.success,
                 error_message=usage.error_message,
+                cached=usage.cached,
             )
             session.add(log_entry)
             await session.flush()
@@ -166,6 +167,7 @@ class CostTracker:
                     latency_ms=usage.latency_ms,
                     success=usage.success,
                     error_message=usage.error_message,
+                    cached=usage.cached,
                 )
                 session.add(log_entry)
                 entries.append(log_entry)
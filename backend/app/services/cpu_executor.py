@@ -0,0 +1,142 @@
+"""
+Shared CPU Executor for Image Transforms
+
+Image work in the pipelines (base64 decode, PIL open, RGBA→RGB compositing,
+LANCZOS resize, PNG/JPEG encode, OCR preprocessing) is CPU-bound. Running it
+directly inside async code blocks the event loop for every other request or
+page in flight, and asyncio.to_thread() only helps for the parts of PIL that
+release the GIL.
+
+This module owns one process pool per process, sized to the number of cores
+(CPU_EXECUTOR_MAX_WORKERS overrides), created lazily on first use and reused
+across requests and tasks. Callers await run_cpu_bound() with a picklable
+module-level function and picklable arguments (paths, bytes, str), never PIL
+images or open files.
+
+Pool processes are started with the forkserver method (spawn where that is
+unavailable), never plain fork: the API process runs threads (vault watcher,
+scheduler, Neo4j driver, LiteLLM logging), and forking it could copy locks
+held by those threads, e.g. logging's, into a child that then deadlocks.
+
+Celery prefork children are daemonic and may not start child processes, so
+inside a worker process the pool is a thread pool of the same size instead.
+CPU_EXECUTOR_MAX_WORKERS=0 means "one worker per core"; a negative value
+disables the pool and runs transforms via asyncio.to_thread() (used by tests).
+
+Usage:
+    from app.services.cpu_executor import run_cpu_bound
+
+    image_bytes, width, height = await run_cpu_bound(
+        process_image_bytes, base64_data, True
+    )
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+
+def _max_workers() -> int:
+    """Worker count from settings, defaulting to the number of cores."""
+    configured = settings.CPU_EXECUTOR_MAX_WORKERS
+    if configured > 0:
+        return configured
+    return os.cpu_count() or 1
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """Start method for pool processes: forkserver, else spawn (never fork)."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def get_cpu_executor() -> Optional[Executor]:
+    """
+    Get (or lazily create) the shared CPU executor.
+
+    Returns None when the executor is disabled (CPU_EXECUTOR_MAX_WORKERS < 0).
+    """
+    global _executor
+
+    if settings.CPU_EXECUTOR_MAX_WORKERS < 0:
+        return None
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                workers = _max_workers()
+                if multiprocessing.current_process().daemon:
+                    # Celery prefork child: daemonic processes can't fork
+                    _executor = ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="cpu-executor"
+                    )
+                    logger.info(f"CPU executor: {workers} threads (daemon process)")
+                else:
+                    _executor = ProcessPoolExecutor(
+                        max_workers=workers, mp_context=_mp_context()
+                    )
+                    logger.info(f"CPU executor: {workers} processes")
+    return _executor
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a CPU-bound function on the shared executor without blocking the loop.
+
+    func and args must be picklable (module-level function, plain data).
+    If a worker process died and broke the pool, the pool is recreated and
+    the call retried once.
+
+    Args:
+        func: Module-level function to run
+        *args: Positional arguments for func
+
+    Returns:
+        The function's return value
+    """
+    executor = get_cpu_executor()
+    if executor is None:
+        return await asyncio.to_thread(func, *args)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, partial(func, *args))
+    except BrokenProcessPool:
+        logger.warning("CPU executor pool broken, recreating")
+        _reset_executor(executor)
+        return await loop.run_in_executor(get_cpu_executor(), partial(func, *args))
+
+
+def _reset_executor(broken: Executor) -> None:
+    """Drop a broken executor so the next call creates a fresh one."""
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_cpu_executor(wait: bool = True) -> None:
+    """Shut down the shared executor (application/worker shutdown)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+        logger.info("CPU executor shut down")
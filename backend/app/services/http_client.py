@@ -0,0 +1,292 @@
+"""
+Shared Pooled HTTP Client
+
+One httpx.AsyncClient per process for outbound HTTP (article fetching,
+Raindrop.io and GitHub APIs), instead of a new client per URL or per
+pipeline instance. Sharing the client gives connection reuse, keep-alive and
+HTTP/2 multiplexing across the hundreds of requests a Raindrop sync makes.
+
+Pooling:
+    - HTTP_MAX_CONNECTIONS bounds open connections overall
+    - HTTP_MAX_CONNECTIONS_PER_HOST bounds in-flight requests per host (httpx
+      only has a global limit, so this is a per-host semaphore)
+    - HTTP_HTTP2 enables HTTP/2 when the h2 package is installed
+
+Connections are bound to the event loop that opened them. Celery tasks run
+with asyncio.run() get a fresh loop each time, so the shared client is
+recreated whenever it is requested from a different loop; run_async() closes
+it before that loop ends, and a client replaced while its loop is still
+running is closed on that loop. In the API process and with
+CELERY_PERSISTENT_EVENT_LOOP there is one loop and one client.
+
+Sessions:
+    HTTPSession carries per-caller defaults (auth headers, timeout, redirect
+    policy) over the shared pool, so pipelines keep their `self.client.get()`
+    call sites without owning a connection pool.
+
+Conditional Requests:
+    fetch_text() caches article HTML on disk (HTTP_CACHE_DIR) together with
+    its ETag/Last-Modified validators. Later fetches of the same URL send
+    If-None-Match/If-Modified-Since and reuse the cached body on 304. Cache
+    failures are logged and treated as misses.
+
+Usage:
+    from app.services.http_client import HTTPSession, fetch_text
+
+    client = HTTPSession(headers={"Authorization": f"Bearer {token}"})
+    response = await client.get("https://api.example.com/items")
+
+    html = await fetch_text("https://example.com/article", follow_redirects=True)
+"""
+
+import asyncio
+import hashlib
+import logging
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.config.settings import settings
+from app.services.llm.cache import DiskCacheBackend
+
+logger = logging.getLogger(__name__)
+
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+def _http2_available() -> bool:
+    """True if the optional h2 package (httpx[http2]) is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class SharedHTTPClient:
+    """Process-wide httpx.AsyncClient with per-host concurrency limits."""
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_connections_per_host: int,
+        http2: bool = False,
+    ):
+        self.loop = asyncio.get_running_loop()
+        self.max_connections_per_host = max_connections_per_host
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=http2,
+            timeout=DEFAULT_TIMEOUT_SECONDS,
+        )
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(str(url)).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET a URL, waiting for a free slot on its host."""
+        async with self._host_slot(url):
+            return await self.client.get(url, **kwargs)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+_shared_client: Optional[SharedHTTPClient] = None
+
+
+def get_http_client() -> SharedHTTPClient:
+    """
+    Get the shared HTTP client for the running event loop.
+
+    Must be called from async code. Creates the client on first use and
+    replaces it when called from a different loop than the one it was
+    created on (the old loop's connections cannot be reused).
+    """
+    global _shared_client
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.loop is not loop:
+        if _shared_client is not None:
+            _discard_client(_shared_client)
+        http2 = settings.HTTP_HTTP2 and _http2_available()
+        _shared_client = SharedHTTPClient(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_connections_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+            http2=http2,
+        )
+        logger.debug(f"Created shared HTTP client (http2={http2})")
+    return _shared_client
+
+
+def _discard_client(client: SharedHTTPClient) -> None:
+    """
+    Close a client bound to another event loop.
+
+    The close is scheduled on the client's own loop while that loop is still
+    running. A stopped or closed loop can no longer run it; its connections
+    are abandoned with the loop.
+    """
+    if client.loop.is_closed() or not client.loop.is_running():
+        logger.debug("Dropped shared HTTP client of a finished event loop")
+        return
+    asyncio.run_coroutine_threadsafe(client.aclose(), client.loop)
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client of the running loop.
+
+    Called at application/worker shutdown and by run_async() before a
+    task's event loop ends. A client bound to another loop is left alone.
+    """
+    global _shared_client
+    client = _shared_client
+    if client is None or client.loop is not asyncio.get_running_loop():
+        return
+    _shared_client = None
+    await client.aclose()
+
+
+class HTTPSession:
+    """
+    Per-caller request defaults over the shared HTTP client.
+
+    Replaces a pipeline-owned httpx.AsyncClient: headers, timeout and the
+    redirect policy are applied to every request, but connections come from
+    the process-wide pool, so closing a session releases nothing.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        follow_redirects: bool = False,
+    ):
+        self.headers = dict(headers or {})
+        self.timeout = timeout if timeout is not None else DEFAULT_TIMEOUT_SECONDS
+        self.follow_redirects = follow_redirects
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """GET a URL with the session defaults merged into the request."""
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("follow_redirects", self.follow_redirects)
+        return await get_http_client().get(
+            url, headers={**self.headers, **(headers or {})}, **kwargs
+        )
+
+    async def aclose(self) -> None:
+        """No-op: connections belong to the shared client."""
+
+
+# =============================================================================
+# Conditional-request cache
+# =============================================================================
+
+_response_cache: Optional[DiskCacheBackend] = None
+
+
+def get_http_cache() -> Optional[DiskCacheBackend]:
+    """Get the on-disk response cache, or None if HTTP_CACHE_ENABLED is off."""
+    global _response_cache
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+    if _response_cache is None:
+        _response_cache = DiskCacheBackend(
+            settings.HTTP_CACHE_DIR,
+            ttl_seconds=settings.HTTP_CACHE_TTL_SECONDS,
+            max_entries=settings.HTTP_CACHE_MAX_ENTRIES,
+        )
+    return _response_cache
+
+
+def reset_http_cache() -> None:
+    """Reset the response cache singleton (e.g., after changing settings)."""
+    global _response_cache
+    _response_cache = None
+
+
+async def fetch_text(
+    url: str,
+    headers: Optional[dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    follow_redirects: bool = True,
+) -> str:
+    """
+    Fetch a page body, revalidating a cached copy with ETag/Last-Modified.
+
+    Only responses carrying a validator are cached; a 304 returns the cached
+    body without downloading it again.
+
+    Args:
+        url: URL to fetch
+        headers: Extra request headers
+        timeout: Request timeout in seconds
+        follow_redirects: Whether to follow redirects
+
+    Returns:
+        Response body as text
+
+    Raises:
+        httpx.HTTPStatusError: On 4xx/5xx responses
+    """
+    cache = get_http_cache()
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    request_headers = dict(headers or {})
+
+    cached: Optional[dict] = None
+    if cache is not None:
+        try:
+            cached = await cache.get(key)
+        except Exception as e:
+            logger.warning(f"HTTP cache read failed: {e}")
+    if cached:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+
+    session = HTTPSession(timeout=timeout, follow_redirects=follow_redirects)
+    response = await session.get(url, headers=request_headers)
+
+    if response.status_code == 304 and cached:
+        logger.debug(f"Not modified, using cached copy of {url}")
+        return cached["text"]
+
+    response.raise_for_status()
+    text = response.text
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if cache is not None and (etag or last_modified):
+        try:
+            await cache.set(
+                key,
+                {
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "text": text,
+                },
+            )
+        except Exception as e:
+            logger.warning(f"HTTP cache write failed: {e}")
+
+    return text
@@ -6,9 +6,11 @@ Provides Neo4j client wrapper for knowledge graph operations:
 - Vector similarity search for connection discovery
 - Content and concept node creation
 - Relationship management
+- Batched graph writes (GraphWriteBatch)
 - Graph traversal queries
 - Semantic search across knowledge base
-- Graph visualization data
+- Graph visualization data (cached level-of-detail snapshots)
+- Versioned schema migrations (constraints and indexes)
 
 Usage:
     from app.services.knowledge_graph import get_neo4j_client, KnowledgeSearchService
@@ -29,7 +31,9 @@ Usage:
     roots, depth = build_topic_tree(flat_topics)
 """
 
+from app.services.knowledge_graph.batch import GraphWriteBatch
 from app.services.knowledge_graph.client import Neo4jClient, get_neo4j_client
+from app.services.knowledge_graph.schema_manager import GraphSchemaManager
 from app.services.knowledge_graph.search import (
     KnowledgeSearchService,
     get_search_service,
@@ -43,6 +47,8 @@ from app.services.knowledge_graph.visualization import (
 __all__ = [
     "Neo4jClient",
     "get_neo4j_client",
+    "GraphWriteBatch",
+    "GraphSchemaManager",
     "KnowledgeSearchService",
     "get_search_service",
     "KnowledgeVisualizationService",
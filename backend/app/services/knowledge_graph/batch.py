@@ -0,0 +1,225 @@
+"""
+Knowledge Graph Write Batches
+
+Collects the nodes and relationships produced for one or more documents so
+Neo4jClient.write_graph_batch() can write them with a handful of UNWIND
+statements inside a single transaction, instead of one session and
+transaction per node and per relationship.
+
+Rows are stored in the shape the bulk queries in queries.py expect; concept
+names are canonicalized on insertion, as in Neo4jClient.create_concept_node().
+
+Usage:
+    from app.services.knowledge_graph.batch import GraphWriteBatch
+
+    batch = GraphWriteBatch()
+    batch.add_content_node(content_id, title, "paper", summary, embedding, tags)
+    batch.add_concept_node(concept, embedding)
+    batch.link_content_to_concept(content_id, concept.name, concept.importance)
+    counts = await neo4j_client.write_graph_batch(batch)
+
+    # Backfills: merge many documents and write them in chunked transactions
+    await neo4j_client.write_graph_batches(batches, documents_per_transaction=50)
+"""
+
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.config.processing import processing_settings
+from app.enums import ConceptImportance, RelationshipType
+from app.models.processing import Concept
+
+
+# Runs of characters that can't appear in an unquoted Cypher relationship type
+_INVALID_TYPE_CHARS = re.compile(r"[^A-Z0-9]+")
+
+
+def normalize_relationship_type(relationship_type: str) -> str:
+    """
+    Sanitize a relationship type for use as a Cypher identifier.
+
+    Relationship types are formatted into queries unescaped and concept
+    relationships are free text from the LLM, so the result is always
+    [A-Z][A-Z0-9_]*: other characters collapse to underscores, and a type
+    that is empty or starts with a digit becomes RELATES_TO.
+    """
+    rel_type = _INVALID_TYPE_CHARS.sub("_", str(relationship_type).upper()).strip("_")
+    if not rel_type or not rel_type[0].isalpha():
+        return RelationshipType.RELATES_TO.value
+    return rel_type
+
+
+@dataclass
+class GraphWriteBatch:
+    """
+    Pending knowledge graph writes for one or more documents.
+
+    Attributes:
+        replace_relationships_for: Content ids whose outgoing relationships are
+            deleted before anything is written (reprocessing)
+        content_nodes: Rows for BULK_MERGE_CONTENT_NODES
+        concept_nodes: Rows for BULK_MERGE_CONCEPT_NODES
+        concept_links: Rows for BULK_LINK_CONTENT_TO_CONCEPTS
+        concept_relationships: Rows for BULK_LINK_CONCEPTS_BY_NAME, by type
+        relationships: Rows for BULK_CREATE_RELATIONSHIPS, by type
+        note_paths: File paths to link Content to Note nodes (REPRESENTS)
+    """
+
+    replace_relationships_for: list[str] = field(default_factory=list)
+    content_nodes: list[dict] = field(default_factory=list)
+    concept_nodes: list[dict] = field(default_factory=list)
+    concept_links: list[dict] = field(default_factory=list)
+    concept_relationships: dict[str, list[dict]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    relationships: dict[str, list[dict]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    note_paths: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Number of content nodes (documents) in the batch."""
+        return len(self.content_nodes)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.replace_relationships_for
+            or self.content_nodes
+            or self.concept_nodes
+            or self.concept_links
+            or self.concept_relationships
+            or self.relationships
+            or self.note_paths
+        )
+
+    def add_content_node(
+        self,
+        content_id: str,
+        title: str,
+        content_type: str,
+        summary: str,
+        embedding: list[float],
+        tags: list[str],
+        source_url: Optional[str] = None,
+        file_path: Optional[str] = None,
+        metadata: Optional[dict] = None,
+    ) -> None:
+        """Queue a Content node (see Neo4jClient.create_content_node)."""
+        self.content_nodes.append(
+            {
+                "id": content_id,
+                "title": title,
+                "content_type": content_type,
+                "summary": (
+                    summary[: processing_settings.NEO4J_SUMMARY_TRUNCATE]
+                    if summary
+                    else ""
+                ),
+                "embedding": embedding,
+                "tags": tags,
+                "source_url": source_url,
+                "file_path": file_path,
+                # JSON string avoids Neo4j nested collection issues
+                "metadata": json.dumps(metadata) if metadata else "{}",
+            }
+        )
+
+    def add_concept_node(
+        self,
+        concept: Concept,
+        embedding: list[float],
+        file_path: Optional[str] = None,
+    ) -> None:
+        """Queue a Concept node, merged by canonical name."""
+        # Import here to avoid circular import
+        from app.services.processing.concept_dedup import (
+            extract_aliases,
+            get_canonical_name,
+        )
+
+        display_name = get_canonical_name(concept.name)
+        self.concept_nodes.append(
+            {
+                "id": concept.id,
+                "canonical_name": display_name.lower(),
+                "display_name": display_name,
+                "definition": concept.definition,
+                "embedding": embedding,
+                "importance": concept.importance,
+                "aliases": extract_aliases(concept.name),
+                "file_path": file_path,
+            }
+        )
+
+    def link_content_to_concept(
+        self,
+        content_id: str,
+        concept_name: str,
+        importance: str = ConceptImportance.SUPPORTING.value,
+    ) -> None:
+        """Queue a CONTAINS relationship from content to a concept."""
+        from app.services.processing.concept_dedup import get_canonical_name
+
+        self.concept_links.append(
+            {
+                "content_id": content_id,
+                "canonical_name": get_canonical_name(concept_name).lower(),
+                "importance": importance,
+            }
+        )
+
+    def link_concepts(
+        self,
+        source_name: str,
+        target_name: str,
+        relationship_type: str,
+        properties: Optional[dict] = None,
+    ) -> None:
+        """Queue a concept-to-concept relationship by canonical name."""
+        from app.services.processing.concept_dedup import get_canonical_name
+
+        self.concept_relationships[
+            normalize_relationship_type(relationship_type)
+        ].append(
+            {
+                "source_canonical": get_canonical_name(source_name).lower(),
+                "target_canonical": get_canonical_name(target_name).lower(),
+                "properties": properties or {},
+            }
+        )
+
+    def add_relationship(
+        self,
+        source_id: str,
+        target_id: str,
+        relationship_type: str,
+        properties: Optional[dict] = None,
+    ) -> None:
+        """Queue a relationship between two nodes identified by id."""
+        self.relationships[normalize_relationship_type(relationship_type)].append(
+            {
+                "source_id": source_id,
+                "target_id": target_id,
+                "properties": properties or {},
+            }
+        )
+
+    def link_content_to_note(self, file_path: str) -> None:
+        """Queue a REPRESENTS link between Content and Note sharing file_path."""
+        self.note_paths.append(file_path)
+
+    def extend(self, other: "GraphWriteBatch") -> None:
+        """Append all writes from another batch (multi-document bulk mode)."""
+        self.replace_relationships_for.extend(other.replace_relationships_for)
+        self.content_nodes.extend(other.content_nodes)
+        self.concept_nodes.extend(other.concept_nodes)
+        self.concept_links.extend(other.concept_links)
+        for rel_type, rows in other.concept_relationships.items():
+            self.concept_relationships[rel_type].extend(rows)
+        for rel_type, rows in other.relationships.items():
+            self.relationships[rel_type].extend(rows)
+        self.note_paths.extend(other.note_paths)
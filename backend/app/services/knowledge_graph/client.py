@@ -5,6 +5,7 @@ Provides a clean interface for knowledge graph operations:
 - Vector similarity search for connection discovery
 - Content and concept node creation
 - Relationship management
+- Batched graph writes (UNWIND statements in one transaction)
 - Graph traversal queries
 
 Usage:
@@ -17,6 +18,9 @@ Usage:
 
     # Create a content node
     node_id = await client.create_content_node(content, embedding, tags)
+
+    # Write a document's nodes and relationships in one transaction
+    counts = await client.write_graph_batch(batch)
 """
 
 import json
@@ -29,13 +33,14 @@ from app.config.settings import settings
 from app.config.processing import processing_settings
 from app.models.processing import Concept
 from app.enums import ConceptImportance, NodeType
+from app.services.knowledge_graph.batch import (
+    GraphWriteBatch,
+    normalize_relationship_type,
+)
 from app.services.knowledge_graph.queries import (
-    SETUP_INDEX_QUERIES,
     MERGE_CONTENT_NODE,
     MERGE_CONCEPT_NODE,
     MERGE_NOTE_NODE,
-    DELETE_NOTE_OUTGOING_LINKS,
-    CREATE_NOTE_LINK,
     GET_CONTENT_BY_ID,
     DELETE_CONTENT_AND_RELATIONS,
     DELETE_CONTENT_OUTGOING_RELATIONSHIPS,
@@ -44,13 +49,23 @@ from app.services.knowledge_graph.queries import (
     GET_CONNECTED_NODES,
     VECTOR_SEARCH,
     VERIFY_CONNECTIVITY,
-    LIST_INDEX_NAMES,
     GET_ALL_GRAPH_DATA,
     LINK_CONTENT_TO_NOTE_BY_FILE_PATH,
     FIND_NOTE_BY_FILE_PATH,
     FIND_CONTENT_BY_FILE_PATH,
     LINK_ALL_CONTENT_TO_NOTES,
+    BULK_DELETE_CONTENT_OUTGOING_RELATIONSHIPS,
+    BULK_MERGE_CONTENT_NODES,
+    BULK_MERGE_CONCEPT_NODES,
+    BULK_LINK_CONTENT_TO_CONCEPTS,
+    BULK_LINK_CONCEPTS_BY_NAME,
+    BULK_CREATE_RELATIONSHIPS,
+    BULK_LINK_CONTENT_TO_NOTES_BY_PATH,
+    BULK_MERGE_NOTE_NODES,
+    BULK_DELETE_STALE_NOTE_LINKS,
+    BULK_MERGE_NOTE_LINKS,
 )
+from app.services.knowledge_graph.schema_manager import GraphSchemaManager
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +93,7 @@ class Neo4jClient:
         self._initialized = False
 
     async def _ensure_initialized(self):
-        """Lazily initialize drivers and indexes on first use."""
+        """Lazily initialize drivers and migrate the schema on first use."""
         if not self._initialized:
             try:
                 self._async_driver = AsyncGraphDatabase.driver(
@@ -92,37 +107,30 @@ class Neo4jClient:
                 self._initialized = True
                 logger.info(f"Neo4j client connected to {settings.NEO4J_URI}")
 
-                # Only setup indexes if they don't exist
-                if not await self._are_indexes_initialized():
-                    await self._setup_indexes_internal()
+                await self._migrate_schema()
             except Exception as e:
                 logger.error(f"Failed to connect to Neo4j: {e}")
                 raise
 
-    async def _are_indexes_initialized(self) -> bool:
+    async def _migrate_schema(self) -> list[int]:
         """
-        Check if required vector indexes already exist.
+        Apply pending schema migrations (called during initialization).
+
+        Does NOT call _ensure_initialized() to avoid circular calls. A failed
+        migration is logged rather than raised: queries still work without
+        the newer indexes, and the migration is retried on the next start.
 
         Returns:
-            True if all required indexes exist, False otherwise
+            Versions applied (empty if up to date or the migration failed)
         """
-        required_indexes = {"content_embedding_index", "concept_embedding_index"}
-
+        manager = GraphSchemaManager(
+            self._async_driver, database=settings.NEO4J_DATABASE
+        )
         try:
-            async with self._async_driver.session(
-                database=settings.NEO4J_DATABASE
-            ) as session:
-                result = await session.run(LIST_INDEX_NAMES)
-                existing_indexes = {record["name"] async for record in result}
-
-                missing = required_indexes - existing_indexes
-                if missing:
-                    logger.debug(f"Missing Neo4j indexes: {missing}")
-                    return False
-                return True
+            return await manager.migrate()
         except Exception as e:
-            logger.debug(f"Could not check indexes: {e}")
-            return False
+            logger.warning(f"Knowledge graph schema migration failed: {e}")
+            return []
 
     async def close(self):
         """Close database connections."""
@@ -151,45 +159,19 @@ class Neo4jClient:
             logger.error(f"Neo4j connectivity check failed: {e}")
             return False
 
-    async def _setup_indexes_internal(self):
-        """
-        Internal method to create indexes (called during initialization).
-
-        Does NOT call _ensure_initialized() to avoid circular calls.
-        """
-        logger.info("Creating Neo4j indexes (first-time setup)...")
-        async with self._async_driver.session(
-            database=settings.NEO4J_DATABASE
-        ) as session:
-            for query in SETUP_INDEX_QUERIES:
-                try:
-                    await session.run(query)
-                    logger.debug(f"Executed: {query[:50]}...")
-                except Exception as e:
-                    # Index might already exist
-                    logger.debug(f"Index creation note: {e}")
-
-        logger.info("Neo4j indexes setup complete")
-
-    async def setup_indexes(self):
+    async def setup_indexes(self) -> list[int]:
         """
-        Create necessary indexes for efficient querying.
-
-        Creates:
-        - Vector index on Content.embedding
-        - Vector index on Concept.embedding
-        - Unique constraint on Content.id
-        - Unique constraint on Concept.name
-        - Regular indexes for type and created_at
+        Apply pending schema migrations (constraints and indexes).
 
-        Queries are defined in app.services.knowledge_graph.queries
+        Migrations are declared in app.services.knowledge_graph.schema_manager
+        and run automatically on first connection; call this to apply them
+        explicitly (e.g., after restoring a backup).
 
-        Note: Indexes are automatically created on first connection,
-        but this method can be called explicitly if needed.
+        Returns:
+            Versions applied by this call
         """
         await self._ensure_initialized()
-        # Indexes already created during initialization, but run again to be safe
-        await self._setup_indexes_internal()
+        return await self._migrate_schema()
 
     async def vector_search(
         self,
@@ -362,7 +344,7 @@ class Neo4jClient:
         await self._ensure_initialized()
 
         # Sanitize relationship type for Cypher
-        rel_type = relationship_type.upper().replace("-", "_").replace(" ", "_")
+        rel_type = normalize_relationship_type(relationship_type)
         query = CREATE_RELATIONSHIP.format(rel_type=rel_type)
 
         async with self._async_driver.session(
@@ -430,7 +412,7 @@ class Neo4jClient:
         target_canonical = get_canonical_name(target_name).lower()
 
         # Sanitize relationship type for Cypher
-        rel_type = relationship_type.upper().replace("-", "_").replace(" ", "_")
+        rel_type = normalize_relationship_type(relationship_type)
         query = LINK_CONCEPTS_BY_NAME.format(rel_type=rel_type)
 
         async with self._async_driver.session(
@@ -580,6 +562,119 @@ class Neo4jClient:
             record = await result.single()
             return record["deleted_count"] if record else 0
 
+    # =========================================================================
+    # Batched Graph Writes
+    # =========================================================================
+    # Write all nodes and relationships of one or more documents with a few
+    # UNWIND statements in a single transaction (see batch.py).
+
+    async def write_graph_batch(self, batch: GraphWriteBatch) -> dict[str, int]:
+        """
+        Write a GraphWriteBatch in a single transaction.
+
+        Statements run in dependency order: relationship deletes, content
+        nodes, concept nodes, CONTAINS links, concept-to-concept links (one
+        statement per relationship type), content relationships (likewise)
+        and REPRESENTS links. Either everything is written or nothing is.
+
+        Args:
+            batch: Pending writes
+
+        Returns:
+            Dict of rows affected per statement kind, e.g.
+            {"content_nodes": 1, "concept_nodes": 4, "relationships": 3, ...}
+        """
+        if batch.is_empty:
+            return {}
+        await self._ensure_initialized()
+
+        async def work(tx) -> dict[str, int]:
+            counts: dict[str, int] = {}
+
+            async def run(kind: str, query: str, **params) -> None:
+                result = await tx.run(query, **params)
+                record = await result.single()
+                counts[kind] = counts.get(kind, 0) + (record["count"] if record else 0)
+
+            if batch.replace_relationships_for:
+                await run(
+                    "deleted_relationships",
+                    BULK_DELETE_CONTENT_OUTGOING_RELATIONSHIPS,
+                    ids=batch.replace_relationships_for,
+                )
+            if batch.content_nodes:
+                await run(
+                    "content_nodes", BULK_MERGE_CONTENT_NODES, rows=batch.content_nodes
+                )
+            if batch.concept_nodes:
+                await run(
+                    "concept_nodes", BULK_MERGE_CONCEPT_NODES, rows=batch.concept_nodes
+                )
+            if batch.concept_links:
+                await run(
+                    "concept_links",
+                    BULK_LINK_CONTENT_TO_CONCEPTS,
+                    rows=batch.concept_links,
+                )
+            for rel_type, rows in batch.concept_relationships.items():
+                await run(
+                    "concept_relationships",
+                    BULK_LINK_CONCEPTS_BY_NAME.format(rel_type=rel_type),
+                    rows=rows,
+                )
+            for rel_type, rows in batch.relationships.items():
+                await run(
+                    "relationships",
+                    BULK_CREATE_RELATIONSHIPS.format(rel_type=rel_type),
+                    rows=rows,
+                )
+            if batch.note_paths:
+                await run(
+                    "note_links",
+                    BULK_LINK_CONTENT_TO_NOTES_BY_PATH,
+                    file_paths=batch.note_paths,
+                )
+            return counts
+
+        async with self._async_driver.session(
+            database=settings.NEO4J_DATABASE
+        ) as session:
+            return await session.execute_write(work)
+
+    async def write_graph_batches(
+        self,
+        batches: list[GraphWriteBatch],
+        documents_per_transaction: Optional[int] = None,
+    ) -> dict[str, int]:
+        """
+        Bulk-write many documents' batches (backfills, rebuilds).
+
+        Batches are merged into groups of documents_per_transaction documents
+        and each group is written with write_graph_batch(), so a backfill of
+        N documents takes about N / documents_per_transaction transactions.
+
+        Args:
+            batches: One GraphWriteBatch per document
+            documents_per_transaction: Group size (default from
+                NEO4J_BULK_DOCUMENTS_PER_TRANSACTION)
+
+        Returns:
+            Rows affected per statement kind, summed over all transactions
+        """
+        group_size = max(
+            1,
+            documents_per_transaction
+            or processing_settings.NEO4J_BULK_DOCUMENTS_PER_TRANSACTION,
+        )
+        totals: dict[str, int] = {}
+        for start in range(0, len(batches), group_size):
+            merged = GraphWriteBatch()
+            for batch in batches[start : start + group_size]:
+                merged.extend(batch)
+            for kind, count in (await self.write_graph_batch(merged)).items():
+                totals[kind] = totals.get(kind, 0) + count
+        return totals
+
     # =========================================================================
     # Obsidian Vault Sync Operations (Note nodes)
     # =========================================================================
@@ -634,34 +729,81 @@ class Neo4jClient:
         """
         Synchronize outgoing wikilinks for a Note node.
 
-        Uses delete-and-recreate strategy: clears existing LINKS_TO relationships
-        then creates new ones. Target notes are created as placeholders if they
-        don't exist yet.
+        Applies the links as a diff in one transaction: LINKS_TO edges to
+        targets that are no longer linked are deleted, missing edges are
+        created and existing ones are left untouched. Target notes are
+        created as placeholders if they don't exist yet.
 
         Args:
             source_id: ID of the source Note node
             target_ids: List of target Note IDs (from extracted wikilinks)
 
         Returns:
-            Number of links created
+            Number of distinct link targets
         """
         await self._ensure_initialized()
+        rows = [{"node_id": source_id, "target_ids": list(dict.fromkeys(target_ids))}]
+
+        async def work(tx) -> None:
+            await tx.run(BULK_DELETE_STALE_NOTE_LINKS, rows=rows)
+            await tx.run(BULK_MERGE_NOTE_LINKS, rows=rows)
 
         async with self._async_driver.session(
             database=settings.NEO4J_DATABASE
         ) as session:
-            # Clear existing links
-            await session.run(DELETE_NOTE_OUTGOING_LINKS, source_id=source_id)
-
-            # Create new links
-            for target_id in target_ids:
-                await session.run(
-                    CREATE_NOTE_LINK,
-                    source_id=source_id,
-                    target_id=target_id,
-                )
+            await session.execute_write(work)
+
+        return len(rows[0]["target_ids"])
+
+    async def write_note_batch(self, notes: list[dict]) -> dict[str, int]:
+        """
+        Sync many vault notes in a single transaction.
+
+        Bulk equivalent of merge_note_node() + sync_note_links() +
+        link_content_to_note_by_path() for each note: Note nodes are merged,
+        their outgoing LINKS_TO edges diffed against target_ids and
+        REPRESENTS links to Content nodes with the same file_path created,
+        with one UNWIND statement per step.
 
-            return len(target_ids)
+        Args:
+            notes: One row per note with node_id, title, note_type, tags,
+                file_path, source_url and target_ids (wikilink targets)
+
+        Returns:
+            Rows affected per step: notes, stale_links (deleted), links,
+            content_links
+        """
+        if not notes:
+            return {}
+        await self._ensure_initialized()
+
+        async def work(tx) -> dict[str, int]:
+            counts: dict[str, int] = {}
+
+            async def run(kind: str, query: str, **params) -> None:
+                result = await tx.run(query, **params)
+                record = await result.single()
+                counts[kind] = record["count"] if record else 0
+
+            await run("notes", BULK_MERGE_NOTE_NODES, rows=notes)
+            await run("stale_links", BULK_DELETE_STALE_NOTE_LINKS, rows=notes)
+            await run(
+                "links",
+                BULK_MERGE_NOTE_LINKS,
+                rows=[note for note in notes if note["target_ids"]],
+            )
+            file_paths = [note["file_path"] for note in notes if note["file_path"]]
+            await run(
+                "content_links",
+                BULK_LINK_CONTENT_TO_NOTES_BY_PATH,
+                file_paths=file_paths,
+            )
+            return counts
+
+        async with self._async_driver.session(
+            database=settings.NEO4J_DATABASE
+        ) as session:
+            return await session.execute_write(work)
 
     # =========================================================================
     # Content-Note Linking Operations
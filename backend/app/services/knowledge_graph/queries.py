@@ -3,6 +3,12 @@ Common Neo4j Graph Queries
 
 Pre-defined Cypher queries for common knowledge graph operations.
 These can be used directly or as templates for more complex queries.
+
+Content, Concept and Note nodes also carry the shared :Node label, indexed
+on id (see schema_manager.py). Lookups by id alone match (n:Node {id: ...})
+so they are index seeks instead of scans over every node; node writes set
+the label. Since :Node is an extra label, queries report a node's type as
+its first label other than Node.
 """
 
 # =============================================================================
@@ -144,7 +150,7 @@ WHERE score >= $min_score
 AND any(label IN labels(node) WHERE label IN $node_types)
 RETURN 
     node.id AS id,
-    labels(node)[0] AS node_type,
+    [label IN labels(node) WHERE label <> 'Node'][0] AS node_type,
     COALESCE(node.title, node.name, node.id) AS title,
     node.summary AS summary,
     score
@@ -168,7 +174,7 @@ WITH n,
     END AS score
 RETURN 
     n.id AS id,
-    labels(n)[0] AS node_type,
+    [label IN labels(n) WHERE label <> 'Node'][0] AS node_type,
     COALESCE(n.title, n.name, n.id) AS title,
     n.summary AS summary,
     score
@@ -183,7 +189,7 @@ WHERE score >= $min_score
 AND any(label IN labels(node) WHERE label IN $node_types)
 RETURN 
     node.id AS id,
-    labels(node)[0] AS node_type,
+    [label IN labels(node) WHERE label <> 'Node'][0] AS node_type,
     COALESCE(node.title, node.name, node.id) AS title,
     node.summary AS summary,
     score
@@ -272,6 +278,7 @@ ON MATCH SET
     c.file_path = $file_path,
     c.metadata = $metadata,
     c.updated_at = datetime()
+SET c:Node
 RETURN c.id AS id
 """
 
@@ -300,6 +307,7 @@ ON MATCH SET
                      THEN [x IN coalesce(c.aliases, []) + $aliases WHERE x IS NOT NULL | x]
                      ELSE c.aliases END,
     c.updated_at = datetime()
+SET c:Node
 RETURN c.id AS id, c.name AS name
 """
 
@@ -313,8 +321,8 @@ RETURN c.id AS id, c.name AS name
 # Usage: query = CREATE_RELATIONSHIP.format(rel_type="RELATES_TO")
 
 CREATE_RELATIONSHIP = """
-MATCH (source {{id: $source_id}})
-MATCH (target {{id: $target_id}})
+MATCH (source:Node {{id: $source_id}})
+MATCH (target:Node {{id: $target_id}})
 MERGE (source)-[r:{rel_type}]->(target)
 SET r += $properties
 RETURN type(r) AS rel_type
@@ -331,12 +339,12 @@ RETURN type(r) AS rel_type, source.name AS source, target.name AS target
 """
 
 GET_CONNECTED_NODES = """
-MATCH (start {{id: $node_id}})-[r{rel_filter}*1..{max_depth}]-(connected)
+MATCH (start:Node {{id: $node_id}})-[r{rel_filter}*1..{max_depth}]-(connected)
 RETURN DISTINCT 
     connected.id AS id,
     connected.title AS title,
     connected.name AS name,
-    labels(connected)[0] AS type,
+    [label IN labels(connected) WHERE label <> 'Node'][0] AS type,
     min(length(r)) AS distance
 ORDER BY distance
 """
@@ -355,9 +363,112 @@ ORDER BY score DESC
 """
 
 
+# =============================================================================
+# Bulk Write Queries (UNWIND)
+# =============================================================================
+# Batched counterparts of the per-item writes above, used by
+# Neo4jClient.write_graph_batch(). Each statement writes every row of one kind
+# in a single round trip; all statements of a batch share one transaction.
+# Relationship-type statements are templates (see above) and run once per
+# distinct type.
+
+BULK_DELETE_CONTENT_OUTGOING_RELATIONSHIPS = """
+UNWIND $ids AS id
+MATCH (c:Content {id: id})-[r]->()
+DELETE r
+RETURN count(r) AS count
+"""
+
+BULK_MERGE_CONTENT_NODES = """
+UNWIND $rows AS row
+MERGE (c:Content {id: row.id})
+ON CREATE SET c.created_at = datetime()
+ON MATCH SET c.updated_at = datetime()
+SET c.title = row.title,
+    c.type = row.content_type,
+    c.summary = row.summary,
+    c.embedding = row.embedding,
+    c.tags = row.tags,
+    c.source_url = row.source_url,
+    c.file_path = row.file_path,
+    c.metadata = row.metadata,
+    c:Node
+RETURN count(c) AS count
+"""
+
+BULK_MERGE_CONCEPT_NODES = """
+UNWIND $rows AS row
+MERGE (c:Concept {canonical_name: row.canonical_name})
+ON CREATE SET
+    c.id = row.id,
+    c.name = row.display_name,
+    c.definition = row.definition,
+    c.embedding = row.embedding,
+    c.importance = row.importance,
+    c.aliases = row.aliases,
+    c.file_path = row.file_path,
+    c.created_at = datetime()
+ON MATCH SET
+    c.name = CASE WHEN row.importance = 'core' AND size(row.display_name) > size(c.name)
+                  THEN row.display_name ELSE c.name END,
+    c.definition = CASE WHEN row.importance = 'core' AND size(row.definition) > size(coalesce(c.definition, ''))
+                       THEN row.definition ELSE c.definition END,
+    c.embedding = CASE WHEN row.importance = 'core'
+                      THEN row.embedding ELSE c.embedding END,
+    c.file_path = CASE WHEN row.file_path IS NOT NULL
+                       THEN row.file_path ELSE c.file_path END,
+    c.aliases = CASE WHEN row.aliases IS NOT NULL AND size(row.aliases) > 0
+                     THEN [x IN coalesce(c.aliases, []) + row.aliases WHERE x IS NOT NULL | x]
+                     ELSE c.aliases END,
+    c.updated_at = datetime()
+SET c:Node
+RETURN count(c) AS count
+"""
+
+# Concepts are matched by canonical_name: a merged concept keeps the id of
+# the document that created it, so the new document's concept id may not exist
+BULK_LINK_CONTENT_TO_CONCEPTS = """
+UNWIND $rows AS row
+MATCH (content:Content {id: row.content_id})
+MATCH (concept:Concept {canonical_name: row.canonical_name})
+MERGE (content)-[r:CONTAINS]->(concept)
+SET r.importance = row.importance
+RETURN count(r) AS count
+"""
+
+BULK_LINK_CONCEPTS_BY_NAME = """
+UNWIND $rows AS row
+MATCH (source:Concept {{canonical_name: row.source_canonical}})
+MATCH (target:Concept {{canonical_name: row.target_canonical}})
+WHERE source <> target
+MERGE (source)-[r:{rel_type}]->(target)
+SET r += row.properties
+RETURN count(r) AS count
+"""
+
+BULK_CREATE_RELATIONSHIPS = """
+UNWIND $rows AS row
+MATCH (source:Node {{id: row.source_id}})
+MATCH (target:Node {{id: row.target_id}})
+MERGE (source)-[r:{rel_type}]->(target)
+SET r += row.properties
+RETURN count(r) AS count
+"""
+
+BULK_LINK_CONTENT_TO_NOTES_BY_PATH = """
+UNWIND $file_paths AS file_path
+MATCH (c:Content {file_path: file_path})
+MATCH (n:Note {file_path: file_path})
+MERGE (c)-[r:REPRESENTS]->(n)
+SET r.linked_at = datetime()
+RETURN count(r) AS count
+"""
+
 # =============================================================================
 # Index and Constraint Setup Queries
 # =============================================================================
+# Applied as versioned migrations by GraphSchemaManager (schema_manager.py);
+# add new statements there as a new migration, never to an applied one.
 
 CREATE_CONTENT_EMBEDDING_INDEX = """
 CREATE VECTOR INDEX content_embedding_index IF NOT EXISTS
@@ -399,15 +510,55 @@ CREATE INDEX content_created_index IF NOT EXISTS
 FOR (c:Content) ON (c.created_at)
 """
 
-# All setup queries in order
-SETUP_INDEX_QUERIES = [
-    CREATE_CONTENT_EMBEDDING_INDEX,
-    CREATE_CONCEPT_EMBEDDING_INDEX,
-    CREATE_CONTENT_ID_CONSTRAINT,
-    CREATE_CONCEPT_NAME_CONSTRAINT,
-    CREATE_CONTENT_TYPE_INDEX,
-    CREATE_CONTENT_CREATED_INDEX,
-]
+CREATE_NOTE_ID_CONSTRAINT = """
+CREATE CONSTRAINT note_id_unique IF NOT EXISTS
+FOR (n:Note) REQUIRE n.id IS UNIQUE
+"""
+
+CREATE_CONCEPT_ID_INDEX = """
+CREATE INDEX concept_id_index IF NOT EXISTS
+FOR (c:Concept) ON (c.id)
+"""
+
+CREATE_NOTE_FILE_PATH_INDEX = """
+CREATE INDEX note_file_path_index IF NOT EXISTS
+FOR (n:Note) ON (n.file_path)
+"""
+
+CREATE_CONTENT_FILE_PATH_INDEX = """
+CREATE INDEX content_file_path_index IF NOT EXISTS
+FOR (c:Content) ON (c.file_path)
+"""
+
+# Not unique: a vault note's frontmatter id is the id of the Content node it
+# represents, so a Content and a Note node may share an id
+CREATE_NODE_ID_INDEX = """
+CREATE INDEX node_id_index IF NOT EXISTS
+FOR (n:Node) ON (n.id)
+"""
+
+# Template: label is one of Content, Concept, Note. Batched so large graphs
+# don't need one huge transaction (requires an auto-commit session.run()).
+BACKFILL_NODE_LABEL = """
+MATCH (n:{label})
+WHERE NOT n:Node
+CALL {{
+    WITH n
+    SET n:Node
+}} IN TRANSACTIONS OF 10000 ROWS
+"""
+
+GET_SCHEMA_VERSION = """
+MATCH (s:SchemaVersion {name: $name})
+RETURN s.version AS version
+"""
+
+SET_SCHEMA_VERSION = """
+MERGE (s:SchemaVersion {name: $name})
+SET s.version = $version,
+    s.description = $description,
+    s.applied_at = datetime()
+"""
 
 
 # =============================================================================
@@ -423,23 +574,46 @@ SET n.title = $title,
     n.tags = $tags,
     n.file_path = $file_path,
     n.source_url = $source_url,
-    n.updated_at = datetime()
+    n.updated_at = datetime(),
+    n:Node
 RETURN n.id AS id
 """
 
-DELETE_NOTE_OUTGOING_LINKS = """
-MATCH (source:Note {id: $source_id})-[r:LINKS_TO]->()
+# Note rows are UNWIND-ed so a single note (sync_note_links) and a vault-wide
+# batch (write_note_batch) use the same statements.
+
+BULK_MERGE_NOTE_NODES = """
+UNWIND $rows AS row
+MERGE (n:Note {id: row.node_id})
+SET n.title = row.title,
+    n.type = row.note_type,
+    n.tags = row.tags,
+    n.file_path = row.file_path,
+    n.source_url = row.source_url,
+    n.updated_at = datetime(),
+    n:Node
+RETURN count(n) AS count
+"""
+
+# Links are applied as a diff: edges to targets no longer linked are deleted,
+# missing ones are created and unchanged edges are left untouched.
+BULK_DELETE_STALE_NOTE_LINKS = """
+UNWIND $rows AS row
+MATCH (source:Note {id: row.node_id})-[r:LINKS_TO]->(target:Note)
+WHERE NOT target.id IN row.target_ids
 DELETE r
-RETURN count(r) AS deleted_count
+RETURN count(r) AS count
 """
 
-CREATE_NOTE_LINK = """
-MATCH (source:Note {id: $source_id})
-MERGE (target:Note {id: $target_id})
-ON CREATE SET target.title = $target_id
+BULK_MERGE_NOTE_LINKS = """
+UNWIND $rows AS row
+MATCH (source:Note {id: row.node_id})
+UNWIND row.target_ids AS target_id
+MERGE (target:Note {id: target_id})
+ON CREATE SET target.title = target_id, target:Node
 MERGE (source)-[r:LINKS_TO]->(target)
-SET r.synced_at = datetime()
-RETURN type(r) AS rel_type
+ON CREATE SET r.synced_at = datetime()
+RETURN count(r) AS count
 """
 
 
@@ -524,7 +698,7 @@ def get_centered_visualization_query(depth: int) -> str:
         Cypher query string with depth interpolated
     """
     return f"""
-MATCH (center {{id: $center_id}})
+MATCH (center:Node {{id: $center_id}})
 CALL {{
     WITH center
     MATCH (center)-[r*1..{depth}]-(connected)
@@ -581,13 +755,13 @@ RETURN
 
 
 GET_NODE_DETAILS_BY_ID = """
-MATCH (n {id: $node_id})
+MATCH (n:Node {id: $node_id})
 OPTIONAL MATCH (n)-[r]-()
 WITH n, count(r) AS connections
 RETURN {
     id: n.id,
     label: COALESCE(n.title, n.name, n.id),
-    type: labels(n)[0],
+    type: [label IN labels(n) WHERE label <> 'Node'][0],
     content_type: n.type,
     summary: n.summary,
     tags: COALESCE(n.tags, []),
@@ -607,16 +781,42 @@ RETURN count(n) AS total
 """
 
 
+# =============================================================================
+# Graph Snapshot Queries (precomputed visualization, see snapshot.py)
+# =============================================================================
+# Read the whole graph once per snapshot rebuild; degree, clusters and the
+# level-of-detail views are computed from these rows outside Neo4j.
+
+GET_SNAPSHOT_NODES = """
+MATCH (n:Node)
+RETURN
+    n.id AS id,
+    COALESCE(n.title, n.name, n.id, 'Unnamed') AS label,
+    [l IN labels(n) WHERE l <> 'Node'][0] AS type,
+    n.type AS content_type,
+    COALESCE(n.tags, []) AS tags
+"""
+
+GET_SNAPSHOT_EDGES = """
+MATCH (source:Node)-[r]->(target:Node)
+RETURN
+    source.id AS source,
+    target.id AS target,
+    type(r) AS type,
+    COALESCE(r.strength, 1.0) AS strength
+"""
+
+
 # =============================================================================
 # Connection Queries (for /connections/{node_id} endpoint)
 # =============================================================================
 
 GET_INCOMING_CONNECTIONS = """
-MATCH (source)-[r]->(target {id: $node_id})
+MATCH (source)-[r]->(target:Node {id: $node_id})
 RETURN 
     source.id AS source_id,
     COALESCE(source.title, source.name, source.id) AS source_title,
-    labels(source)[0] AS source_type,
+    [label IN labels(source) WHERE label <> 'Node'][0] AS source_type,
     type(r) AS rel_type,
     COALESCE(r.strength, 1.0) AS strength,
     r.context AS context
@@ -625,11 +825,11 @@ LIMIT $limit
 """
 
 GET_OUTGOING_CONNECTIONS = """
-MATCH (source {id: $node_id})-[r]->(target)
+MATCH (source:Node {id: $node_id})-[r]->(target)
 RETURN 
     target.id AS target_id,
     COALESCE(target.title, target.name, target.id) AS target_title,
-    labels(target)[0] AS target_type,
+    [label IN labels(target) WHERE label <> 'Node'][0] AS target_type,
     type(r) AS rel_type,
     COALESCE(r.strength, 1.0) AS strength,
     r.context AS context
@@ -0,0 +1,174 @@
+"""
+Knowledge Graph Schema Manager
+
+Declares every Neo4j constraint and index the knowledge graph relies on as
+numbered migrations and applies the ones a database hasn't seen yet. The
+applied version is stored on a (:SchemaVersion {name: "knowledge_graph"})
+node, so each start only compares versions instead of re-running DDL.
+
+Migrations:
+    1. Vector indexes, Content.id / Concept.canonical_name uniqueness and
+       Content type/created_at indexes (the original index setup)
+    2. Note.id uniqueness, Concept.id index and file_path indexes for the
+       Content <-> Note REPRESENTS linking queries
+    3. Shared :Node label on Content, Concept and Note nodes (backfilled)
+       with an index on :Node(id), used by lookups that only know an id
+
+Every statement is idempotent (IF NOT EXISTS), so a migration interrupted
+halfway, or applied concurrently by the API and a worker, can safely run
+again. Schema statements can't share a transaction with data writes, so
+each statement runs on its own and the version is recorded after the whole
+migration succeeded.
+
+To change the schema, append a migration with the next version number;
+never edit one that has already shipped.
+
+Usage:
+    manager = GraphSchemaManager(driver, database=settings.NEO4J_DATABASE)
+    applied = await manager.migrate()
+"""
+
+import logging
+from dataclasses import dataclass
+
+from app.services.knowledge_graph.queries import (
+    BACKFILL_NODE_LABEL,
+    CREATE_CONCEPT_EMBEDDING_INDEX,
+    CREATE_CONCEPT_ID_INDEX,
+    CREATE_CONCEPT_NAME_CONSTRAINT,
+    CREATE_CONTENT_CREATED_INDEX,
+    CREATE_CONTENT_EMBEDDING_INDEX,
+    CREATE_CONTENT_FILE_PATH_INDEX,
+    CREATE_CONTENT_ID_CONSTRAINT,
+    CREATE_CONTENT_TYPE_INDEX,
+    CREATE_NODE_ID_INDEX,
+    CREATE_NOTE_FILE_PATH_INDEX,
+    CREATE_NOTE_ID_CONSTRAINT,
+    GET_SCHEMA_VERSION,
+    SET_SCHEMA_VERSION,
+)
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_NAME = "knowledge_graph"
+
+
+@dataclass(frozen=True)
+class SchemaMigration:
+    """One schema version: idempotent statements applied in order."""
+
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+MIGRATIONS: tuple[SchemaMigration, ...] = (
+    SchemaMigration(
+        version=1,
+        description="Content/Concept vector indexes, constraints and indexes",
+        statements=(
+            CREATE_CONTENT_EMBEDDING_INDEX,
+            CREATE_CONCEPT_EMBEDDING_INDEX,
+            CREATE_CONTENT_ID_CONSTRAINT,
+            CREATE_CONCEPT_NAME_CONSTRAINT,
+            CREATE_CONTENT_TYPE_INDEX,
+            CREATE_CONTENT_CREATED_INDEX,
+        ),
+    ),
+    SchemaMigration(
+        version=2,
+        description="Note id constraint, Concept id and file_path indexes",
+        statements=(
+            CREATE_NOTE_ID_CONSTRAINT,
+            CREATE_CONCEPT_ID_INDEX,
+            CREATE_NOTE_FILE_PATH_INDEX,
+            CREATE_CONTENT_FILE_PATH_INDEX,
+        ),
+    ),
+    SchemaMigration(
+        version=3,
+        description="Shared :Node label with id index",
+        statements=(
+            BACKFILL_NODE_LABEL.format(label="Content"),
+            BACKFILL_NODE_LABEL.format(label="Concept"),
+            BACKFILL_NODE_LABEL.format(label="Note"),
+            CREATE_NODE_ID_INDEX,
+        ),
+    ),
+)
+
+# Version a fully migrated database is at
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+class GraphSchemaManager:
+    """Applies pending knowledge graph schema migrations."""
+
+    def __init__(
+        self,
+        driver,
+        database: str,
+        migrations: tuple[SchemaMigration, ...] = MIGRATIONS,
+    ):
+        """
+        Args:
+            driver: neo4j AsyncDriver
+            database: Database name to migrate
+            migrations: Migrations in ascending version order
+        """
+        self._driver = driver
+        self._database = database
+        self._migrations = migrations
+
+    async def current_version(self) -> int:
+        """
+        Get the schema version recorded in the database.
+
+        Returns:
+            Last applied migration version, 0 for a database never migrated
+        """
+        async with self._driver.session(database=self._database) as session:
+            result = await session.run(GET_SCHEMA_VERSION, name=SCHEMA_NAME)
+            record = await result.single()
+            return record["version"] if record and record["version"] else 0
+
+    async def pending(self) -> list[SchemaMigration]:
+        """Migrations newer than the database's schema version."""
+        current = await self.current_version()
+        return [m for m in self._migrations if m.version > current]
+
+    async def migrate(self) -> list[int]:
+        """
+        Apply all pending migrations in version order.
+
+        A failing statement aborts the run with its migration unrecorded, so
+        the next start retries from that migration.
+
+        Returns:
+            Versions applied by this call (empty if already up to date)
+
+        Raises:
+            neo4j.exceptions.Neo4jError: If a schema statement fails
+        """
+        applied = []
+        for migration in await self.pending():
+            logger.info(
+                f"Applying knowledge graph schema v{migration.version}: "
+                f"{migration.description}"
+            )
+            async with self._driver.session(database=self._database) as session:
+                for statement in migration.statements:
+                    result = await session.run(statement)
+                    await result.consume()
+                result = await session.run(
+                    SET_SCHEMA_VERSION,
+                    name=SCHEMA_NAME,
+                    version=migration.version,
+                    description=migration.description,
+                )
+                await result.consume()
+            applied.append(migration.version)
+
+        if applied:
+            logger.info(f"Knowledge graph schema at v{applied[-1]}")
+        return applied
@@ -8,6 +8,9 @@ Node Labels:
 - Content: Papers, articles, books, code, ideas, voice memos
 - Concept: Key concepts, terms, ideas extracted from content
 - Tag: Tags from the controlled taxonomy
+- Note: Obsidian vault files (from vault sync)
+- Node: Shared label on Content, Concept and Note nodes, indexed on id
+  (constraints and indexes are managed by schema_manager.py)
 
 Relationship Types:
 - CONTAINS: Content -> Concept (content contains a concept)
@@ -0,0 +1,447 @@
+"""
+Graph Visualization Snapshots
+
+The graph page used to run a node count and a label-list scan with a
+per-node OPTIONAL MATCH on every view. Instead, the whole graph is read once
+after it changes, and the views the page needs are precomputed and cached in
+Redis, so a page view is a version lookup plus one cached read.
+
+Snapshot Contents:
+    Every Content, Concept and Note node (via the shared :Node label) with its
+    degree (distinct neighbours) and cluster id (label propagation), and every
+    relationship between them, precomputed as three levels of detail:
+
+    - clusters: one node per cluster (largest GRAPH_SNAPSHOT_MAX_CLUSTERS),
+      edges weighted by the number of links between clusters
+    - top: the GRAPH_SNAPSHOT_TOP_NODES highest-degree nodes and their edges
+    - full: all nodes (highest degree first) and edges
+
+Versioning:
+    A snapshot's version is a hash of its full view, so rebuilding an
+    unchanged graph keeps the version (and the ETags derived from it). Views
+    are stored under graph_snapshot:{version}:{lod} and published by pointing
+    graph_snapshot:current at the new version; the previous version's keys
+    expire shortly after. API processes keep the parsed views of the current
+    version in memory.
+
+Rebuilds:
+    request_snapshot_rebuild() is called after each processing run and vault
+    sync batch. It queues the rebuild_graph_snapshot task with a countdown of
+    GRAPH_SNAPSHOT_REBUILD_DELAY seconds unless one is already queued, so a
+    burst of writes causes a single rebuild. The task clears the marker
+    before reading the graph, so writes during a rebuild queue another one.
+    Degree, clusters and serialization run on the shared CPU executor.
+
+Usage:
+    from app.services.knowledge_graph.snapshot import (
+        get_snapshot_version,
+        get_snapshot_view,
+        request_snapshot_rebuild,
+    )
+
+    version = await get_snapshot_version()
+    view = await get_snapshot_view(version, GraphLevelOfDetail.TOP)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Optional
+
+from app.config.settings import settings
+from app.db.redis import get_redis
+from app.enums.knowledge import GraphLevelOfDetail
+from app.services.cpu_executor import run_cpu_bound
+from app.services.knowledge_graph.queries import (
+    GET_SNAPSHOT_EDGES,
+    GET_SNAPSHOT_NODES,
+)
+
+if TYPE_CHECKING:
+    from app.services.knowledge_graph.client import Neo4jClient
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "graph_snapshot"
+CURRENT_VERSION_KEY = f"{REDIS_KEY_PREFIX}:current"
+REBUILD_SCHEDULED_KEY = f"{REDIS_KEY_PREFIX}:rebuild_scheduled"
+REBUILD_TASK_NAME = "app.services.tasks.rebuild_graph_snapshot"
+
+# Readers that looked up the previous version can still fetch its views
+STALE_VIEW_TTL_SECONDS = 120
+LABEL_PROPAGATION_ITERATIONS = 10
+CLUSTER_NODE_TYPE = "Cluster"
+CLUSTER_EDGE_TYPE = "CLUSTER_LINK"
+# Member ids listed on each cluster node
+CLUSTER_SAMPLE_SIZE = 5
+
+
+# =============================================================================
+# Snapshot computation (pure, runs on the CPU executor)
+# =============================================================================
+
+
+def assign_clusters(
+    node_ids: list[str],
+    neighbors: dict[str, set[str]],
+    max_iterations: int = LABEL_PROPAGATION_ITERATIONS,
+) -> dict[str, int]:
+    """
+    Group nodes into clusters by label propagation.
+
+    Every node starts in its own cluster and repeatedly adopts the cluster
+    most common among its neighbours until nothing changes or max_iterations
+    passes are done. A node keeps its own cluster if that is among the most
+    common; other ties go to the cluster started latest in processing order,
+    which hasn't spread yet, so one early label can't sweep across weakly
+    bridged groups in the first pass. Deterministic for a given input order.
+
+    Args:
+        node_ids: All node ids, in processing order
+        neighbors: Undirected adjacency (node id -> neighbour ids)
+        max_iterations: Maximum propagation passes
+
+    Returns:
+        Cluster id per node; 0 is the largest cluster
+    """
+    labels = {node_id: index for index, node_id in enumerate(node_ids)}
+    for _ in range(max_iterations):
+        changed = False
+        for node_id in node_ids:
+            adjacent = neighbors.get(node_id)
+            if not adjacent:
+                continue
+            counts = Counter(labels[other] for other in adjacent)
+            top = max(counts.values())
+            if counts.get(labels[node_id]) == top:
+                continue
+            labels[node_id] = max(
+                label for label, count in counts.items() if count == top
+            )
+            changed = True
+        if not changed:
+            break
+
+    sizes = Counter(labels.values())
+    order = sorted(sizes, key=lambda label: (-sizes[label], label))
+    renumbered = {label: index for index, label in enumerate(order)}
+    return {node_id: renumbered[labels[node_id]] for node_id in node_ids}
+
+
+def compute_snapshot(
+    raw_nodes: list[dict[str, Any]],
+    raw_edges: list[dict[str, Any]],
+    top_nodes: int,
+    max_clusters: int,
+) -> dict[str, dict[str, Any]]:
+    """
+    Compute the level-of-detail views of a graph.
+
+    Nodes sharing an id (a Content node and the vault Note representing it)
+    are collapsed into the first one read, and duplicate edges dropped.
+
+    Args:
+        raw_nodes: GET_SNAPSHOT_NODES rows
+        raw_edges: GET_SNAPSHOT_EDGES rows
+        top_nodes: Nodes kept in the "top" view
+        max_clusters: Clusters kept in the "clusters" view
+
+    Returns:
+        Dict mapping each GraphLevelOfDetail value to a view with nodes,
+        edges and type_counts (node count per type in the whole graph)
+    """
+    nodes: dict[str, dict[str, Any]] = {}
+    for row in sorted(raw_nodes, key=lambda row: str(row.get("id") or "")):
+        node_id = row.get("id")
+        if not node_id or node_id in nodes:
+            continue
+        nodes[node_id] = {
+            "id": node_id,
+            "label": row.get("label") or node_id,
+            "type": row.get("type") or "Unknown",
+            "content_type": row.get("content_type"),
+            "metadata": {"tags": list(row.get("tags") or [])},
+        }
+
+    edges: list[dict[str, Any]] = []
+    seen: set[tuple[str, str, str]] = set()
+    neighbors: dict[str, set[str]] = {}
+    for row in raw_edges:
+        source, target = row.get("source"), row.get("target")
+        if source not in nodes or target not in nodes:
+            continue
+        edge_type = row.get("type") or "RELATED"
+        if (source, target, edge_type) in seen:
+            continue
+        seen.add((source, target, edge_type))
+        strength = row.get("strength")
+        edges.append(
+            {
+                "source": source,
+                "target": target,
+                "type": edge_type,
+                "strength": 1.0 if strength is None else strength,
+            }
+        )
+        if source != target:
+            neighbors.setdefault(source, set()).add(target)
+            neighbors.setdefault(target, set()).add(source)
+
+    clusters = assign_clusters(list(nodes), neighbors)
+    for node_id, node in nodes.items():
+        node["size"] = max(1, len(neighbors.get(node_id, ())))
+        node["cluster_id"] = clusters[node_id]
+
+    ranked = sorted(nodes.values(), key=lambda n: (-n["size"], n["label"], n["id"]))
+    type_counts = dict(Counter(node["type"] for node in ranked))
+
+    top = ranked[:top_nodes]
+    top_ids = {node["id"] for node in top}
+
+    return {
+        GraphLevelOfDetail.FULL.value: {
+            "nodes": ranked,
+            "edges": edges,
+            "type_counts": type_counts,
+        },
+        GraphLevelOfDetail.TOP.value: {
+            "nodes": top,
+            "edges": [
+                e for e in edges if e["source"] in top_ids and e["target"] in top_ids
+            ],
+            "type_counts": type_counts,
+        },
+        GraphLevelOfDetail.CLUSTERS.value: {
+            **_cluster_view(ranked, edges, clusters, max_clusters),
+            "type_counts": type_counts,
+        },
+    }
+
+
+def _cluster_view(
+    ranked: list[dict[str, Any]],
+    edges: list[dict[str, Any]],
+    clusters: dict[str, int],
+    max_clusters: int,
+) -> dict[str, list[dict[str, Any]]]:
+    """Collapse ranked nodes into cluster nodes and cross-cluster edges."""
+    members: dict[int, list[dict[str, Any]]] = {}
+    for node in ranked:
+        members.setdefault(node["cluster_id"], []).append(node)
+    kept = sorted(members, key=lambda c: (-len(members[c]), c))[:max_clusters]
+    kept_set = set(kept)
+
+    nodes = []
+    for cluster_id in kept:
+        cluster_members = members[cluster_id]
+        nodes.append(
+            {
+                "id": f"cluster:{cluster_id}",
+                "label": cluster_members[0]["label"],
+                "type": CLUSTER_NODE_TYPE,
+                "content_type": None,
+                "size": len(cluster_members),
+                "cluster_id": cluster_id,
+                "metadata": {
+                    "node_count": len(cluster_members),
+                    "types": dict(Counter(n["type"] for n in cluster_members)),
+                    "top_nodes": [
+                        n["id"] for n in cluster_members[:CLUSTER_SAMPLE_SIZE]
+                    ],
+                },
+            }
+        )
+
+    links: Counter[tuple[int, int]] = Counter()
+    for edge in edges:
+        a, b = clusters[edge["source"]], clusters[edge["target"]]
+        if a != b and a in kept_set and b in kept_set:
+            links[(min(a, b), max(a, b))] += 1
+    heaviest = max(links.values(), default=1)
+    cluster_edges = [
+        {
+            "source": f"cluster:{a}",
+            "target": f"cluster:{b}",
+            "type": CLUSTER_EDGE_TYPE,
+            "strength": round(count / heaviest, 3),
+            "label": str(count),
+        }
+        for (a, b), count in sorted(links.items())
+    ]
+    return {"nodes": nodes, "edges": cluster_edges}
+
+
+def serialize_snapshot(
+    raw_nodes: list[dict[str, Any]],
+    raw_edges: list[dict[str, Any]],
+    top_nodes: int,
+    max_clusters: int,
+) -> tuple[str, dict[str, str], dict[str, int]]:
+    """
+    Compute and serialize a snapshot (CPU-bound, for run_cpu_bound).
+
+    Returns:
+        (version, JSON payload per level of detail, counts for logging)
+    """
+    views = compute_snapshot(raw_nodes, raw_edges, top_nodes, max_clusters)
+    payloads = {
+        lod: json.dumps(view, sort_keys=True, separators=(",", ":"))
+        for lod, view in views.items()
+    }
+    full = payloads[GraphLevelOfDetail.FULL.value]
+    version = hashlib.sha256(full.encode("utf-8")).hexdigest()[:16]
+    counts = {
+        "nodes": len(views[GraphLevelOfDetail.FULL.value]["nodes"]),
+        "edges": len(views[GraphLevelOfDetail.FULL.value]["edges"]),
+        "clusters": len(views[GraphLevelOfDetail.CLUSTERS.value]["nodes"]),
+    }
+    return version, payloads, counts
+
+
+# =============================================================================
+# Build and publish
+# =============================================================================
+
+
+def _view_key(version: str, lod: str) -> str:
+    return f"{REDIS_KEY_PREFIX}:{version}:{lod}"
+
+
+async def build_graph_snapshot(neo4j_client: Neo4jClient) -> dict[str, Any]:
+    """
+    Read the graph, compute all views and publish them as the current snapshot.
+
+    Args:
+        neo4j_client: Client used to read nodes and edges
+
+    Returns:
+        Dict with version, nodes, edges and clusters counts
+    """
+    r = await get_redis()
+    # Writes from here on are not in this snapshot: let them queue a rebuild
+    await r.delete(REBUILD_SCHEDULED_KEY)
+
+    await neo4j_client._ensure_initialized()
+    async with neo4j_client._async_driver.session(
+        database=settings.NEO4J_DATABASE
+    ) as session:
+        result = await session.run(GET_SNAPSHOT_NODES)
+        raw_nodes = [dict(record) async for record in result]
+        result = await session.run(GET_SNAPSHOT_EDGES)
+        raw_edges = [dict(record) async for record in result]
+
+    version, payloads, counts = await run_cpu_bound(
+        serialize_snapshot,
+        raw_nodes,
+        raw_edges,
+        settings.GRAPH_SNAPSHOT_TOP_NODES,
+        settings.GRAPH_SNAPSHOT_MAX_CLUSTERS,
+    )
+
+    previous = await r.get(CURRENT_VERSION_KEY)
+    async with r.pipeline(transaction=True) as pipe:
+        for lod, payload in payloads.items():
+            pipe.set(_view_key(version, lod), payload)
+        pipe.set(CURRENT_VERSION_KEY, version)
+        if previous and previous != version:
+            for lod in payloads:
+                pipe.expire(_view_key(previous, lod), STALE_VIEW_TTL_SECONDS)
+        await pipe.execute()
+
+    logger.info(
+        f"Graph snapshot {version}: {counts['nodes']} nodes, "
+        f"{counts['edges']} edges, {counts['clusters']} clusters"
+    )
+    return {"version": version, **counts}
+
+
+async def request_snapshot_rebuild() -> bool:
+    """
+    Queue a debounced snapshot rebuild after the graph changed.
+
+    Best effort: Redis or broker errors are logged and ignored, the page then
+    shows the previous snapshot until the next rebuild.
+
+    Returns:
+        True if a rebuild task was queued by this call
+    """
+    if not settings.GRAPH_SNAPSHOT_ENABLED:
+        return False
+    delay = max(0, settings.GRAPH_SNAPSHOT_REBUILD_DELAY)
+    try:
+        r = await get_redis()
+        # Expiry only guards against a lost task; the task clears the marker
+        if not await r.set(REBUILD_SCHEDULED_KEY, "1", nx=True, ex=delay * 10 + 60):
+            return False
+
+        from app.services.queue import celery_app
+
+        celery_app.send_task(REBUILD_TASK_NAME, countdown=delay)
+        return True
+    except Exception as e:
+        logger.warning(f"Could not queue graph snapshot rebuild: {e}")
+        return False
+
+
+# =============================================================================
+# Reads
+# =============================================================================
+
+# Parsed views of the current version: (version, lod) -> view
+_views: dict[tuple[str, str], dict[str, Any]] = {}
+
+
+async def get_snapshot_version() -> Optional[str]:
+    """Version of the current snapshot, or None if none was built yet."""
+    if not settings.GRAPH_SNAPSHOT_ENABLED:
+        return None
+    r = await get_redis()
+    return await r.get(CURRENT_VERSION_KEY)
+
+
+async def get_snapshot_view(
+    version: str, lod: GraphLevelOfDetail
+) -> Optional[dict[str, Any]]:
+    """
+    Get one level of detail of a snapshot version.
+
+    Parsed views are kept in memory until the version changes, so repeated
+    page views only cost the version lookup.
+
+    Returns:
+        View dict with nodes, edges and type_counts, or None if the version's
+        views are gone (expired after a newer snapshot was published)
+    """
+    key = (version, lod.value)
+    view = _views.get(key)
+    if view is not None:
+        return view
+
+    r = await get_redis()
+    payload = await r.get(_view_key(version, lod.value))
+    if payload is None:
+        return None
+    view = await asyncio.to_thread(json.loads, payload)
+
+    for stale in [k for k in _views if k[0] != version]:
+        del _views[stale]
+    _views[key] = view
+    return view
+
+
+def snapshot_etag(
+    version: str, lod: GraphLevelOfDetail, node_types: list[str], limit: int
+) -> str:
+    """Weak ETag for a /graph response served from a snapshot."""
+    request_key = f"{lod.value}|{','.join(sorted(node_types))}|{limit}"
+    digest = hashlib.sha256(request_key.encode("utf-8")).hexdigest()[:8]
+    return f'W/"{version}-{digest}"'
+
+
+def clear_snapshot_views() -> None:
+    """Drop parsed views held in memory (tests, settings changes)."""
+    _views.clear()
@@ -5,7 +5,8 @@ Provides graph visualization data for the frontend knowledge graph viewer.
 Handles data retrieval and transformation for D3.js force-directed rendering.
 
 Main capabilities:
-- Graph data retrieval (nodes and edges for D3 rendering)
+- Graph data retrieval (nodes and edges for D3 rendering), served from the
+  precomputed snapshot (see snapshot.py) unless centered on a node
 - Graph statistics aggregation
 - Node detail lookups
 - Connection exploration (incoming/outgoing)
@@ -34,7 +35,7 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 
 from app.config.settings import settings
-from app.enums.knowledge import ConnectionDirection
+from app.enums.knowledge import ConnectionDirection, GraphLevelOfDetail
 from app.services.knowledge_graph.queries import (
     GET_INCOMING_CONNECTIONS,
     GET_NODE_COUNT_BY_TYPES,
@@ -45,6 +46,11 @@ from app.services.knowledge_graph.queries import (
     GET_VISUALIZATION_STATS,
     get_centered_visualization_query,
 )
+from app.services.knowledge_graph.snapshot import (
+    get_snapshot_version,
+    get_snapshot_view,
+    request_snapshot_rebuild,
+)
 from app.services.knowledge_graph.utils import build_topic_tree
 
 if TYPE_CHECKING:
@@ -185,6 +191,8 @@ class KnowledgeVisualizationService:
         node_types: Optional[list[str]] = None,
         depth: int = 2,
         limit: int = 100,
+        lod: GraphLevelOfDetail = GraphLevelOfDetail.TOP,
+        snapshot_version: Optional[str] = None,
     ) -> GraphResponseDict:
         """
         Get graph data for visualization.
@@ -192,13 +200,21 @@ class KnowledgeVisualizationService:
         Returns nodes and edges in D3-compatible format for force-directed graphs.
         Can optionally center on a specific node and expand outward to a given depth.
 
+        Uncentered graphs are served from the precomputed snapshot at the
+        requested level of detail. Without a snapshot (not built yet, or
+        disabled) the graph is queried live and a rebuild is requested.
+
         Args:
             center_id: Optional node ID to center the graph on. If provided,
                 returns the ego-network around this node.
             node_types: List of node types to include (default: Content, Concept, Note).
             depth: How many hops from center to traverse (only used with center_id).
                 Range: 1-4 recommended for performance.
-            limit: Maximum number of nodes to return (default: 100).
+            limit: Maximum number of nodes to return (default: 100). Applies
+                to the "top" and "clusters" levels of detail, not "full".
+            lod: Snapshot level of detail (ignored with center_id).
+            snapshot_version: Snapshot version already looked up by the
+                caller (e.g., for ETags); looked up if not given.
 
         Returns:
             Dict containing:
@@ -207,6 +223,8 @@ class KnowledgeVisualizationService:
                 - center_id: The center node ID (None if not centered)
                 - total_nodes: Total matching nodes in the graph (before limiting)
                 - total_edges: Number of edges in the returned subgraph
+                - lod: Level of detail served (None for live queries)
+                - snapshot_version: Snapshot version served (None for live queries)
 
         Example:
             >>> graph = await service.get_graph(limit=50)
@@ -217,6 +235,14 @@ class KnowledgeVisualizationService:
         """
         node_type_list = node_types or self.DEFAULT_NODE_TYPES
 
+        if not center_id:
+            graph = await self._snapshot_graph(
+                node_type_list, limit, lod, snapshot_version
+            )
+            if graph is not None:
+                return graph
+            await request_snapshot_rebuild()
+
         # Get total count for stats (separate from limit)
         count_record = await self._run_single_query(
             GET_NODE_COUNT_BY_TYPES, node_types=node_type_list
@@ -254,6 +280,97 @@ class KnowledgeVisualizationService:
             "center_id": center_id,
             "total_nodes": total_nodes,
             "total_edges": len(edges),
+            "lod": None,
+            "snapshot_version": None,
+        }
+
+    async def get_snapshot_version(self) -> Optional[str]:
+        """
+        Version of the current graph snapshot.
+
+        Returns:
+            Snapshot version, or None if no snapshot is available (Redis
+            errors are logged and treated the same)
+        """
+        try:
+            return await get_snapshot_version()
+        except Exception as e:
+            logger.warning(f"Graph snapshot unavailable: {e}")
+            return None
+
+    async def _snapshot_graph(
+        self,
+        node_types: list[str],
+        limit: int,
+        lod: GraphLevelOfDetail,
+        version: Optional[str],
+    ) -> Optional[GraphResponseDict]:
+        """
+        Serve the graph from the snapshot.
+
+        Returns:
+            Graph response, or None if there is no usable snapshot (Redis
+            errors are logged and treated the same)
+        """
+        version = version or await self.get_snapshot_version()
+        if not version:
+            return None
+        view_lod = lod
+        if lod == GraphLevelOfDetail.TOP and set(node_types) != set(
+            self.DEFAULT_NODE_TYPES
+        ):
+            # The precomputed top nodes are ranked across all types
+            view_lod = GraphLevelOfDetail.FULL
+        try:
+            view = await get_snapshot_view(version, view_lod)
+        except Exception as e:
+            logger.warning(f"Graph snapshot unavailable: {e}")
+            return None
+        if view is None:
+            return None
+        return self._graph_from_snapshot(view, version, lod, node_types, limit)
+
+    def _graph_from_snapshot(
+        self,
+        view: dict[str, Any],
+        version: str,
+        lod: GraphLevelOfDetail,
+        node_types: list[str],
+        limit: int,
+    ) -> GraphResponseDict:
+        """
+        Select the requested nodes and edges from a snapshot view.
+
+        Views list nodes highest degree first, so limiting keeps the most
+        connected ones. Cluster views are not filtered by node type.
+        """
+        if lod == GraphLevelOfDetail.CLUSTERS:
+            nodes = view["nodes"][:limit]
+        else:
+            wanted = set(node_types)
+            nodes = [n for n in view["nodes"] if n["type"] in wanted]
+            if lod == GraphLevelOfDetail.TOP:
+                nodes = nodes[:limit]
+
+        node_ids = {n["id"] for n in nodes}
+        if len(nodes) == len(view["nodes"]):
+            edges = view["edges"]
+        else:
+            edges = [
+                e
+                for e in view["edges"]
+                if e["source"] in node_ids and e["target"] in node_ids
+            ]
+
+        type_counts = view.get("type_counts") or {}
+        return {
+            "nodes": nodes,
+            "edges": edges,
+            "center_id": None,
+            "total_nodes": sum(type_counts.get(t, 0) for t in node_types),
+            "total_edges": len(edges),
+            "lod": lod,
+            "snapshot_version": version,
         }
 
     def _empty_graph_response(
@@ -266,6 +383,8 @@ class KnowledgeVisualizationService:
             "center_id": center_id,
             "total_nodes": total_nodes,
             "total_edges": 0,
+            "lod": None,
+            "snapshot_version": None,
         }
 
     def _transform_nodes(self, raw_nodes: list[Any]) -> list[GraphNodeDict]:
@@ -70,6 +70,7 @@ from app.enums.learning import CardState
 from app.enums.pipeline import PipelineOperation
 from app.models.llm_usage import LLMUsage
 from app.models.processing import ExtractionResult
+from app.services.learning.mastery_rollup import MasteryRollupService
 from app.services.llm.client import LLMClient, get_llm_client
 
 logger = logging.getLogger(__name__)
@@ -329,6 +330,7 @@ class CardGeneratorService:
         # Bulk save all cards
         if cards:
             self.db.add_all(cards)
+            await MasteryRollupService(self.db).apply_cards_created(cards)
             await self.db.commit()
 
             # Refresh to get IDs
@@ -420,6 +422,7 @@ class CardGeneratorService:
             # Save cards
             if cards:
                 self.db.add_all(cards)
+                await MasteryRollupService(self.db).apply_cards_created(cards)
                 await self.db.commit()
 
                 for card in cards:
@@ -19,12 +19,22 @@ Usage:
         language="python",
     )
 
-    # Run tests
+    # Run tests (all cases in one container, per-test timeouts)
     test_results = await sandbox.run_tests(
         code="def solution(x): return x * 2",
         test_cases=[{"input": "5", "expected": "10"}],
         language="python",
     )
+
+Performance:
+    - run_tests executes every test case in a single container through a
+      batched harness that prints per-test results as one JSON line, instead
+      of starting a container per test case.
+    - Blocking docker SDK calls run in worker threads, off the event loop.
+    - An optional warm pool (warm_pool_size > 0) keeps idle containers
+      created and started ahead of time. Each warm container runs exactly one
+      execution and is then discarded and replaced, so learner code never
+      shares a container.
 """
 
 import asyncio
@@ -32,19 +42,21 @@ import json
 import logging
 import shutil
 import tempfile
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-
-import docker
-from docker.errors import APIError, ContainerError, ImageNotFound
+from typing import Any, Optional
 
 from app.config.settings import get_settings
+from app.lazy_imports import lazy_import
 from app.models.learning import CodeExecutionResult
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Docker SDK is imported on first use (see app.lazy_imports)
+docker = lazy_import("docker")
+
 
 @dataclass
 class ExecutionResult:
@@ -83,50 +95,189 @@ LANGUAGE_CONFIG = {
 }
 
 
-# Test wrapper templates for each language
+# Marker prefixing the harness's JSON results line, so learner prints on
+# stdout cannot be mistaken for results
+RESULTS_MARKER = "__SANDBOX_TEST_RESULTS__"
+
+# Batched test harness templates for each language. All test cases run in one
+# process; each case gets its own timeout enforced inside the harness.
 TEST_WRAPPERS = {
     "python": """
 {code}
 
 # Test harness
-import json
-import sys
+import json as _json
+import signal as _signal
+
+_TEST_CASES = _json.loads({test_cases!r})
+_TEST_TIMEOUT = {test_timeout}
+
+
+class _TestTimeout(BaseException):
+    # BaseException so learner `except Exception` blocks cannot swallow it
+    pass
+
+
+def _on_timeout(signum, frame):
+    raise _TestTimeout()
+
 
 def _run_test(input_val, expected):
+    expected_str = str(expected) if not isinstance(expected, str) else expected
+    _signal.signal(_signal.SIGALRM, _on_timeout)
+    _signal.setitimer(_signal.ITIMER_REAL, _TEST_TIMEOUT)
     try:
         result = solution(input_val)
         result_str = str(result) if not isinstance(result, str) else result
-        expected_str = str(expected) if not isinstance(expected, str) else expected
         passed = result_str.strip() == expected_str.strip()
         return {{"passed": passed, "actual": result_str, "expected": expected_str}}
+    except _TestTimeout:
+        return {{"passed": False, "actual": "", "expected": expected_str, "error": "Test timed out", "timed_out": True}}
     except Exception as e:
         return {{"passed": False, "actual": str(e), "expected": expected_str, "error": str(e)}}
+    finally:
+        _signal.setitimer(_signal.ITIMER_REAL, 0)
+
 
-test_input = {test_input}
-expected_output = {expected_output}
-result = _run_test(test_input, expected_output)
-print(json.dumps(result))
+_results = [_run_test(case["input"], case["expected"]) for case in _TEST_CASES]
+print("{marker}" + _json.dumps(_results), flush=True)
 """,
     "javascript": """
-{code}
-
-// Test harness
-const testInput = {test_input};
-const expectedOutput = {expected_output};
-
+// Test harness: learner code runs in a vm context so each test can be
+// interrupted by the vm timeout, even inside synchronous infinite loops.
+// The context gets the CommonJS and Node globals the code had when it ran
+// directly in node (require, module, exports, process, Buffer, timers).
+const vm = require("vm");
+const testCases = {test_cases};
+const testTimeoutMs = {test_timeout_ms};
+const learnerModule = {{ exports: {{}} }};
+const context = vm.createContext({{
+    console,
+    require,
+    module: learnerModule,
+    exports: learnerModule.exports,
+    __filename,
+    __dirname,
+    process,
+    Buffer,
+    setTimeout,
+    clearTimeout,
+    setInterval,
+    clearInterval,
+    setImmediate,
+    clearImmediate,
+    queueMicrotask,
+}});
+
+let loadError = null;
 try {{
-    const result = solution(testInput);
-    const resultStr = String(result).trim();
-    const expectedStr = String(expectedOutput).trim();
-    const passed = resultStr === expectedStr;
-    console.log(JSON.stringify({{passed, actual: resultStr, expected: expectedStr}}));
+    vm.runInContext({code_literal}, context, {{ timeout: testTimeoutMs }});
 }} catch (e) {{
-    console.log(JSON.stringify({{passed: false, actual: e.message, expected: expectedStr, error: e.message}}));
+    loadError = e;
 }}
+
+const results = testCases.map((testCase) => {{
+    const expectedStr = String(testCase.expected).trim();
+    if (loadError) {{
+        return {{passed: false, actual: String(loadError.message), expected: expectedStr, error: String(loadError.message)}};
+    }}
+    context.__testInput = testCase.input;
+    try {{
+        const result = vm.runInContext("solution(__testInput)", context, {{ timeout: testTimeoutMs }});
+        const resultStr = String(result).trim();
+        return {{passed: resultStr === expectedStr, actual: resultStr, expected: expectedStr}};
+    }} catch (e) {{
+        if (e && e.code === "ERR_SCRIPT_EXECUTION_TIMEOUT") {{
+            return {{passed: false, actual: "", expected: expectedStr, error: "Test timed out", timed_out: true}};
+        }}
+        return {{passed: false, actual: String(e.message), expected: expectedStr, error: String(e.message)}};
+    }}
+}});
+console.log("{marker}" + JSON.stringify(results));
 """,
 }
 
 
+def _parse_test_value(value: Any) -> Any:
+    """Parse a test input/expected value as JSON for proper typing, else keep it."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value
+
+
+@dataclass
+class _WarmContainer:
+    """An idle, started container with a host directory bind-mounted at /code."""
+
+    container: Any
+    code_dir: str
+
+
+class WarmContainerPool:
+    """
+    Pool of pre-created, started sandbox containers per image.
+
+    Containers idle on `sleep infinity` with the same security limits as
+    cold containers; code is written into their bind-mounted directory and
+    run with exec. A container serves one execution and is then removed, and
+    a replacement is started in the background.
+    """
+
+    def __init__(self, sandbox: "CodeSandbox", size: int):
+        """
+        Initialize the pool.
+
+        Args:
+            sandbox: Sandbox whose docker client and limits are used
+            size: Idle containers to keep per image
+        """
+        self.sandbox = sandbox
+        self.size = size
+        self._idle: dict[str, deque[_WarmContainer]] = defaultdict(deque)
+        self._pending: dict[str, int] = defaultdict(int)
+        self._tasks: set[asyncio.Task] = set()
+
+    def acquire(self, image: str) -> Optional[_WarmContainer]:
+        """Take an idle container for image (None if none is ready) and refill."""
+        idle = self._idle[image]
+        warm = idle.popleft() if idle else None
+        self._refill(image)
+        return warm
+
+    def _refill(self, image: str) -> None:
+        """Start background creation of containers up to the pool size."""
+        missing = self.size - len(self._idle[image]) - self._pending[image]
+        for _ in range(max(0, missing)):
+            self._pending[image] += 1
+            task = asyncio.create_task(self._add(image))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _add(self, image: str) -> None:
+        code_dir = tempfile.mkdtemp(prefix="sandbox_warm_")
+        try:
+            container = await asyncio.to_thread(
+                self.sandbox._start_container, image, ["sleep", "infinity"], code_dir
+            )
+            self._idle[image].append(_WarmContainer(container, code_dir))
+        except Exception as e:
+            logger.warning(f"Failed to create warm sandbox container: {e}")
+            shutil.rmtree(code_dir, ignore_errors=True)
+        finally:
+            self._pending[image] -= 1
+
+    async def close(self) -> None:
+        """Cancel pending creations and remove all idle containers."""
+        for task in list(self._tasks):
+            task.cancel()
+        for idle in self._idle.values():
+            while idle:
+                await asyncio.to_thread(self.sandbox._discard, idle.popleft())
+
+
 class CodeSandbox:
     """
     Secure Docker sandbox for code execution.
@@ -139,10 +290,12 @@ class CodeSandbox:
     - Non-root user
     - Process limit (50 max)
     - Execution timeout (10s)
+    - Per-test timeout inside the batched test harness (5s)
     """
 
     # Security limits
     DEFAULT_TIMEOUT = 10  # seconds
+    DEFAULT_TEST_TIMEOUT = 5  # seconds, per test case
     MEMORY_LIMIT = "128m"
     CPU_QUOTA = 50000  # 50% of one core
     MAX_PIDS = 50
@@ -151,6 +304,8 @@ class CodeSandbox:
         self,
         timeout: Optional[int] = None,
         enabled: bool = True,
+        test_timeout: Optional[int] = None,
+        warm_pool_size: int = 0,
     ):
         """
         Initialize code sandbox.
@@ -158,10 +313,15 @@ class CodeSandbox:
         Args:
             timeout: Execution timeout in seconds
             enabled: Whether sandbox is enabled
+            test_timeout: Per-test-case timeout in seconds for run_tests
+            warm_pool_size: Idle pre-started containers to keep per image
+                (0 disables the warm pool)
         """
         self.timeout = timeout or self.DEFAULT_TIMEOUT
+        self.test_timeout = test_timeout or self.DEFAULT_TEST_TIMEOUT
         self.enabled = enabled
         self.docker_client: Optional[docker.DockerClient] = None
+        self.warm_pool: Optional[WarmContainerPool] = None
 
         if self.enabled:
             try:
@@ -172,6 +332,9 @@ class CodeSandbox:
                 logger.warning(f"Docker not available: {e}")
                 self.enabled = False
 
+        if self.enabled and warm_pool_size > 0:
+            self.warm_pool = WarmContainerPool(self, warm_pool_size)
+
     async def execute_code(
         self,
         code: str,
@@ -216,6 +379,12 @@ class CodeSandbox:
             # Build command
             command = config["command"] + [f"/code/code{config['extension']}"]
 
+            # Prefer a pre-started container from the warm pool
+            warm = self.warm_pool.acquire(config["image"]) if self.warm_pool else None
+            if warm is not None:
+                shutil.copy(code_file, Path(warm.code_dir) / code_file.name)
+                return await self._run_in_warm_container(warm, command, timeout)
+
             # Run in container
             result = await self._run_container(
                 image=config["image"],
@@ -242,6 +411,10 @@ class CodeSandbox:
         """
         Run test cases against learner code.
 
+        All test cases run in a single container execution through a batched
+        harness. Each test case has its own timeout (self.test_timeout)
+        enforced inside the harness; the container timeout covers all of them.
+
         Args:
             code: Learner's code (should define a `solution` function)
             test_cases: List of test cases with input/expected
@@ -260,60 +433,140 @@ class CodeSandbox:
                 for i in range(len(test_cases))
             ]
 
-        results = []
+        if not test_cases:
+            return []
 
-        for i, test_case in enumerate(test_cases):
-            test_code = self._create_test_wrapper(
-                code=code,
-                test_input=test_case.get("input", ""),
-                expected_output=test_case.get("expected", ""),
-                language=language,
-            )
-
-            exec_result = await self.execute_code(test_code, language)
+        test_code = self._create_test_wrapper(
+            code=code,
+            test_cases=test_cases,
+            language=language,
+        )
+        exec_result = await self.execute_code(
+            test_code,
+            language,
+            timeout=self.timeout + self.test_timeout * len(test_cases),
+        )
 
-            if exec_result.success and exec_result.stdout:
-                # Parse JSON result from test harness
-                try:
-                    result_data = json.loads(exec_result.stdout.strip())
-                    results.append(
-                        CodeExecutionResult(
-                            test_index=i,
-                            passed=result_data.get("passed", False),
-                            input_value=str(test_case.get("input", "")),
-                            expected=result_data.get("expected", ""),
-                            actual=result_data.get("actual", ""),
-                            error=result_data.get("error"),
-                        )
-                    )
-                except json.JSONDecodeError:
-                    results.append(
-                        CodeExecutionResult(
-                            test_index=i,
-                            passed=False,
-                            input_value=str(test_case.get("input", "")),
-                            expected=str(test_case.get("expected", "")),
-                            actual=exec_result.stdout,
-                            error="Failed to parse test output",
-                        )
-                    )
+        results_data = self._parse_harness_output(exec_result.stdout)
+        if results_data is None or len(results_data) != len(test_cases):
+            # Harness did not report (syntax error, crash, exit, timeout)
+            if exec_result.timed_out:
+                error_msg = "Execution timed out"
+            elif results_data is None and exec_result.success:
+                error_msg = "Failed to parse test output"
             else:
-                # Execution failed
-                error_msg = exec_result.error or exec_result.stderr
-                if exec_result.timed_out:
-                    error_msg = "Execution timed out"
-
-                results.append(
-                    CodeExecutionResult(
-                        test_index=i,
-                        passed=False,
-                        input_value=str(test_case.get("input", "")),
-                        expected=str(test_case.get("expected", "")),
-                        error=error_msg,
-                    )
+                error_msg = exec_result.error or exec_result.stderr or exec_result.stdout
+            return [
+                CodeExecutionResult(
+                    test_index=i,
+                    passed=False,
+                    input_value=str(test_case.get("input", "")),
+                    expected=str(test_case.get("expected", "")),
+                    error=error_msg,
                 )
+                for i, test_case in enumerate(test_cases)
+            ]
+
+        return [
+            CodeExecutionResult(
+                test_index=i,
+                passed=result_data.get("passed", False),
+                input_value=str(test_case.get("input", "")),
+                expected=result_data.get("expected", ""),
+                actual=result_data.get("actual", ""),
+                error=result_data.get("error"),
+            )
+            for i, (test_case, result_data) in enumerate(
+                zip(test_cases, results_data)
+            )
+        ]
+
+    @staticmethod
+    def _parse_harness_output(stdout: str) -> Optional[list[dict]]:
+        """Extract per-test results from the harness's marker line, if any."""
+        for line in reversed(stdout.splitlines()):
+            marker_at = line.find(RESULTS_MARKER)
+            if marker_at < 0:
+                continue
+            try:
+                results = json.loads(line[marker_at + len(RESULTS_MARKER) :])
+            except json.JSONDecodeError:
+                return None
+            return results if isinstance(results, list) else None
+        return None
+
+    def _start_container(self, image: str, command: list[str], code_dir: str) -> Any:
+        """
+        Create and start a container with security limits (blocking).
+
+        Args:
+            image: Docker image to use
+            command: Command to execute
+            code_dir: Host directory mounted read-only at /code
 
-        return results
+        Returns:
+            The started container
+        """
+        # Ensure image is available
+        try:
+            self.docker_client.images.get(image)
+        except docker.errors.ImageNotFound:
+            logger.info(f"Pulling image {image}...")
+            self.docker_client.images.pull(image)
+
+        # Create container with security limits
+        container = self.docker_client.containers.create(
+            image=image,
+            command=command,
+            volumes={
+                code_dir: {"bind": "/code", "mode": "ro"},  # Read-only
+            },
+            working_dir="/code",
+            # Security limits
+            mem_limit=self.MEMORY_LIMIT,
+            memswap_limit=self.MEMORY_LIMIT,  # No swap
+            cpu_quota=self.CPU_QUOTA,
+            network_disabled=True,
+            read_only=True,  # Read-only root filesystem
+            pids_limit=self.MAX_PIDS,
+            # Minimal capabilities
+            cap_drop=["ALL"],
+            security_opt=["no-new-privileges"],
+            # Temporary writable directory
+            tmpfs={"/tmp": "size=10m,mode=1777"},
+            # Non-root user (if image supports it)
+            user="nobody" if "python" in image or "node" in image else None,
+        )
+        try:
+            container.start()
+        except Exception:
+            container.remove(force=True)
+            raise
+        return container
+
+    @staticmethod
+    def _read_logs(container: Any) -> tuple[str, str]:
+        """Read a container's stdout and stderr (blocking)."""
+        logs = container.logs(stdout=True, stderr=True)
+        if isinstance(logs, bytes):
+            # Combined output
+            return logs.decode("utf-8", errors="replace"), ""
+        stdout = container.logs(stdout=True, stderr=False).decode(
+            "utf-8", errors="replace"
+        )
+        stderr = container.logs(stdout=False, stderr=True).decode(
+            "utf-8", errors="replace"
+        )
+        return stdout, stderr
+
+    @staticmethod
+    def _discard(warm: _WarmContainer) -> None:
+        """Remove a used warm container and its code directory (blocking)."""
+        try:
+            warm.container.remove(force=True)
+        except Exception as e:
+            logger.warning(f"Failed to remove container: {e}")
+        shutil.rmtree(warm.code_dir, ignore_errors=True)
 
     async def _run_container(
         self,
@@ -325,6 +578,8 @@ class CodeSandbox:
         """
         Run code in a Docker container with security limits.
 
+        Docker SDK calls are blocking, so each runs in a worker thread.
+
         Args:
             image: Docker image to use
             command: Command to execute
@@ -337,72 +592,28 @@ class CodeSandbox:
         container = None
 
         try:
-            # Ensure image is available
-            try:
-                self.docker_client.images.get(image)
-            except ImageNotFound:
-                logger.info(f"Pulling image {image}...")
-                self.docker_client.images.pull(image)
-
-            # Create container with security limits
-            container = self.docker_client.containers.create(
-                image=image,
-                command=command,
-                volumes={
-                    code_dir: {"bind": "/code", "mode": "ro"},  # Read-only
-                },
-                working_dir="/code",
-                # Security limits
-                mem_limit=self.MEMORY_LIMIT,
-                memswap_limit=self.MEMORY_LIMIT,  # No swap
-                cpu_quota=self.CPU_QUOTA,
-                network_disabled=True,
-                read_only=True,  # Read-only root filesystem
-                pids_limit=self.MAX_PIDS,
-                # Minimal capabilities
-                cap_drop=["ALL"],
-                security_opt=["no-new-privileges"],
-                # Temporary writable directory
-                tmpfs={"/tmp": "size=10m,mode=1777"},
-                # Non-root user (if image supports it)
-                user="nobody" if "python" in image or "node" in image else None,
+            container = await asyncio.to_thread(
+                self._start_container, image, command, code_dir
             )
 
-            # Run with timeout
-            container.start()
-
             # Wait for completion with timeout
             try:
                 result = await asyncio.wait_for(
-                    asyncio.get_event_loop().run_in_executor(None, container.wait),
-                    timeout=timeout,
+                    asyncio.to_thread(container.wait), timeout=timeout
                 )
                 exit_code = result.get("StatusCode", 1)
                 timed_out = False
             except asyncio.TimeoutError:
                 # Kill container on timeout
                 try:
-                    container.kill()
+                    await asyncio.to_thread(container.kill)
                 except Exception:
                     pass
                 exit_code = -1
                 timed_out = True
 
             # Get logs
-            logs = container.logs(stdout=True, stderr=True)
-            stdout = ""
-            stderr = ""
-
-            if isinstance(logs, bytes):
-                # Combined output
-                stdout = logs.decode("utf-8", errors="replace")
-            else:
-                stdout = container.logs(stdout=True, stderr=False).decode(
-                    "utf-8", errors="replace"
-                )
-                stderr = container.logs(stdout=False, stderr=True).decode(
-                    "utf-8", errors="replace"
-                )
+            stdout, stderr = await asyncio.to_thread(self._read_logs, container)
 
             return ExecutionResult(
                 success=exit_code == 0 and not timed_out,
@@ -412,14 +623,14 @@ class CodeSandbox:
                 timed_out=timed_out,
             )
 
-        except ContainerError as e:
+        except docker.errors.ContainerError as e:
             return ExecutionResult(
                 success=False,
                 stderr=str(e.stderr) if e.stderr else "",
                 exit_code=e.exit_status,
                 error=str(e),
             )
-        except APIError as e:
+        except docker.errors.APIError as e:
             logger.error(f"Docker API error: {e}")
             return ExecutionResult(
                 success=False,
@@ -435,24 +646,78 @@ class CodeSandbox:
             # Clean up container
             if container:
                 try:
-                    container.remove(force=True)
+                    await asyncio.to_thread(container.remove, force=True)
                 except Exception as e:
                     logger.warning(f"Failed to remove container: {e}")
 
+    async def _run_in_warm_container(
+        self,
+        warm: _WarmContainer,
+        command: list[str],
+        timeout: int,
+    ) -> ExecutionResult:
+        """
+        Run a command in a pre-started warm container, then discard it.
+
+        Args:
+            warm: Idle container whose code directory already holds the code
+            command: Command to execute
+            timeout: Execution timeout
+
+        Returns:
+            Execution result
+        """
+        try:
+            try:
+                exit_code, (stdout, stderr) = await asyncio.wait_for(
+                    asyncio.to_thread(
+                        warm.container.exec_run,
+                        command,
+                        workdir="/code",
+                        demux=True,
+                    ),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                # Killing the container also ends the exec'd process
+                try:
+                    await asyncio.to_thread(warm.container.kill)
+                except Exception:
+                    pass
+                return ExecutionResult(success=False, exit_code=-1, timed_out=True)
+
+            return ExecutionResult(
+                success=exit_code == 0,
+                stdout=(stdout or b"").decode("utf-8", errors="replace"),
+                stderr=(stderr or b"").decode("utf-8", errors="replace"),
+                exit_code=exit_code,
+            )
+        except docker.errors.APIError as e:
+            logger.error(f"Docker API error: {e}")
+            return ExecutionResult(success=False, error=f"Docker error: {e}")
+        except Exception as e:
+            logger.error(f"Sandbox execution error: {e}")
+            return ExecutionResult(success=False, error=str(e))
+        finally:
+            await asyncio.to_thread(self._discard, warm)
+
+    async def close(self) -> None:
+        """Remove idle warm containers."""
+        if self.warm_pool:
+            await self.warm_pool.close()
+
     def _create_test_wrapper(
         self,
         code: str,
-        test_input: str,
-        expected_output: str,
+        test_cases: list[dict],
         language: str,
     ) -> str:
         """
-        Create code with test harness wrapper.
+        Create code with the batched test harness wrapper.
 
         Args:
             code: Learner's code
-            test_input: Test input value
-            expected_output: Expected output
+            test_cases: Test cases with input/expected values
             language: Programming language
 
         Returns:
@@ -464,20 +729,21 @@ class CodeSandbox:
         wrapper = TEST_WRAPPERS.get(language, TEST_WRAPPERS["python"])
 
         # Format test values - try to parse as JSON for proper typing
-        try:
-            test_input_formatted = json.dumps(json.loads(test_input))
-        except (json.JSONDecodeError, TypeError):
-            test_input_formatted = repr(test_input)
-
-        try:
-            expected_formatted = json.dumps(json.loads(expected_output))
-        except (json.JSONDecodeError, TypeError):
-            expected_formatted = repr(expected_output)
+        cases = [
+            {
+                "input": _parse_test_value(case.get("input", "")),
+                "expected": _parse_test_value(case.get("expected", "")),
+            }
+            for case in test_cases
+        ]
 
         return wrapper.format(
             code=code,
-            test_input=test_input_formatted,
-            expected_output=expected_formatted,
+            code_literal=json.dumps(code),
+            test_cases=json.dumps(cases),
+            test_timeout=self.test_timeout,
+            test_timeout_ms=self.test_timeout * 1000,
+            marker=RESULTS_MARKER,
         )
 
 
@@ -491,8 +757,10 @@ def get_code_sandbox() -> CodeSandbox:
 
     if _sandbox_instance is None:
         _sandbox_instance = CodeSandbox(
-            timeout=getattr(settings, "SANDBOX_TIMEOUT_SECONDS", 10),
-            enabled=getattr(settings, "SANDBOX_ENABLED", True),
+            timeout=settings.SANDBOX_TIMEOUT_SECONDS,
+            enabled=settings.SANDBOX_ENABLED,
+            test_timeout=settings.SANDBOX_TEST_TIMEOUT_SECONDS,
+            warm_pool_size=settings.SANDBOX_WARM_POOL_SIZE,
         )
 
     return _sandbox_instance
@@ -65,6 +65,7 @@ from app.models.learning import (
 )
 from app.services.cost_tracking import CostTracker
 from app.services.llm.client import LLMClient, build_messages, get_default_text_model
+from app.services.learning.mastery_rollup import MasteryRollupService
 from app.services.learning.evaluation_prompts import (
     EVALUATION_PROMPT,
     CODE_EVALUATION_PROMPT,
@@ -377,6 +378,8 @@ class ResponseEvaluator:
         )
 
         self.db.add(attempt)
+        await self.db.flush()
+        await MasteryRollupService(self.db).apply_exercise_attempt(exercise, attempt)
         await self.db.commit()
         await self.db.refresh(attempt)
 
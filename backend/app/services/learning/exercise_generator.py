@@ -82,6 +82,7 @@ from app.models.learning import (
 )
 from app.models.processing import ExtractionResult
 from app.models.llm_usage import LLMUsage
+from app.services.learning.mastery_rollup import MasteryRollupService
 from app.services.llm.client import LLMClient, build_messages, get_default_text_model
 from app.services.tag_service import TagService
 from app.config import settings
@@ -648,6 +649,7 @@ class ExerciseGenerator:
         )
 
         self.db.add(exercise)
+        await MasteryRollupService(self.db).apply_exercise_created(exercise.topic)
         await self.db.commit()
         await self.db.refresh(exercise)
 
@@ -33,6 +33,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Content
 from app.db.models_learning import SpacedRepCard, Exercise, ExerciseContent
+from app.services.learning.mastery_rollup import MasteryRollupService
 
 logger = logging.getLogger(__name__)
 
@@ -283,7 +284,8 @@ class LineageService:
         """
         Delete all cards for a content item.
 
-        Useful for re-processing content with fresh card generation.
+        Useful for re-processing content with fresh card generation. The
+        cards are removed from the mastery rollups in the same transaction.
 
         Args:
             content_uuid: UUID of the content
@@ -293,6 +295,11 @@ class LineageService:
         """
         from sqlalchemy import delete
 
+        cards = await self.db.execute(
+            select(SpacedRepCard).where(SpacedRepCard.content_id == content_uuid)
+        )
+        await MasteryRollupService(self.db).apply_cards_deleted(cards.scalars().all())
+
         result = await self.db.execute(
             delete(SpacedRepCard)
             .where(SpacedRepCard.content_id == content_uuid)
@@ -311,7 +318,9 @@ class LineageService:
         Note: This only deletes exercises that are ONLY linked to this content.
         Exercises linked to multiple contents are preserved.
 
-        Useful for re-processing content with fresh exercise generation.
+        Useful for re-processing content with fresh exercise generation. The
+        deleted exercises and their attempts are removed from the mastery
+        rollups in the same transaction.
 
         Args:
             content_uuid: UUID of the content
@@ -353,6 +362,12 @@ class LineageService:
         # Delete exercises that were only linked to this content
         deleted_count = 0
         if exercises_to_delete:
+            exercises = await self.db.execute(
+                select(Exercise).where(Exercise.id.in_(exercises_to_delete))
+            )
+            await MasteryRollupService(self.db).apply_exercises_deleted(
+                exercises.scalars().all()
+            )
             result = await self.db.execute(
                 delete(Exercise)
                 .where(Exercise.id.in_(exercises_to_delete))
@@ -0,0 +1,535 @@
+"""
+Mastery Rollup Service
+
+Maintains the mastery_rollups table: per-topic and global aggregates of card
+and exercise activity that back the analytics overview, weak spots and
+per-topic mastery endpoints.
+
+Rollups are updated incrementally, in the caller's transaction, whenever a
+card is created, reviewed or deleted and whenever an exercise is created,
+attempted or deleted.
+A periodic reconcile (see app/services/scheduler.py) rebuilds the table from
+the source tables, which also repairs drift from writes that bypass these
+hooks. Until the first reconcile has created the global row, incremental
+updates are skipped, so a partially built table is never mistaken for a
+complete one.
+
+Usage:
+    from app.services.learning.mastery_rollup import MasteryRollupService
+
+    rollups = MasteryRollupService(db)
+
+    # Inside review_card, before commit
+    before = card_contribution(card)
+    ...  # apply FSRS update to card
+    await rollups.apply_card_change(card.tags, before, card_contribution(card))
+
+    # Before a bulk delete of cards or exercises
+    await rollups.apply_cards_deleted(cards)
+    await rollups.apply_exercises_deleted(exercises)
+
+    # Periodic rebuild
+    await rollups.reconcile()
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import case, delete, distinct, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.models_learning import (
+    CardReviewHistory,
+    Exercise,
+    ExerciseAttempt,
+    MasteryRollup,
+    SpacedRepCard,
+)
+from app.enums.learning import CardState
+
+logger = logging.getLogger(__name__)
+
+# topic_path of the rollup row covering all cards and exercises
+GLOBAL_ROLLUP_TOPIC = "*"
+
+# Counter columns, incremented by deltas
+CARD_COUNTERS = (
+    "card_count",
+    "new_cards",
+    "learning_cards",
+    "mastered_cards",
+    "review_cards",
+    "review_stability_sum",
+    "total_reviews",
+    "correct_reviews",
+)
+ROLLUP_COUNTERS = CARD_COUNTERS + (
+    "review_time_seconds",
+    "exercise_count",
+    "exercises_completed",
+    "exercises_mastered",
+    "exercise_attempts",
+    "exercise_correct",
+    "exercise_score_sum",
+)
+
+# Timestamp columns, updated with GREATEST
+ROLLUP_LATEST = ("last_reviewed", "last_attempted")
+
+_LEARNING_STATES = (CardState.LEARNING, CardState.RELEARNING, CardState.REVIEW)
+
+# pg_advisory_xact_lock key serializing reconcile() across sessions
+RECONCILE_LOCK_KEY = 7_201_453_901
+
+
+def card_contribution(card: SpacedRepCard) -> dict[str, float]:
+    """
+    Compute what a card contributes to each card counter of a rollup.
+
+    Mirrors the SQL definitions used by reconcile(): a card with NULL
+    stability is neither learning nor mastered.
+
+    Args:
+        card: Card in its current state.
+
+    Returns:
+        Dict mapping CARD_COUNTERS to the card's contribution.
+    """
+    stability = card.stability
+    threshold = settings.MASTERY_MASTERED_STABILITY_DAYS
+    is_review = card.state == CardState.REVIEW
+    return {
+        "card_count": 1,
+        "new_cards": int(card.state == CardState.NEW),
+        "learning_cards": int(
+            card.state in _LEARNING_STATES
+            and stability is not None
+            and stability < threshold
+        ),
+        "mastered_cards": int(stability is not None and stability >= threshold),
+        "review_cards": int(is_review),
+        "review_stability_sum": (stability or 0.0) if is_review else 0.0,
+        "total_reviews": card.total_reviews or 0,
+        "correct_reviews": card.correct_reviews or 0,
+    }
+
+
+class MasteryRollupService:
+    """
+    Incremental maintenance and reconciliation of mastery rollups.
+
+    Write methods only stage statements on the session; the caller commits
+    them together with the change they describe.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the rollup service.
+
+        Args:
+            db: Async database session (shared with the caller's transaction).
+        """
+        self.db = db
+
+    # ===========================================
+    # Incremental updates
+    # ===========================================
+
+    async def apply_card_change(
+        self,
+        tags: Optional[Iterable[str]],
+        before: Optional[dict[str, float]],
+        after: Optional[dict[str, float]],
+        review_seconds: int = 0,
+        reviewed_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Apply a card creation, review or deletion to the rollups.
+
+        Args:
+            tags: Card topic tags.
+            before: card_contribution() before the change (None for creation).
+            after: card_contribution() after the change (None for deletion).
+            review_seconds: Time spent on the review, if this was a review.
+            reviewed_at: Review timestamp, if this was a review.
+        """
+        deltas = {
+            col: (after or {}).get(col, 0) - (before or {}).get(col, 0)
+            for col in CARD_COUNTERS
+        }
+        deltas["review_time_seconds"] = review_seconds or 0
+        await self._apply(tags, deltas, {"last_reviewed": reviewed_at})
+
+    async def apply_cards_created(self, cards: Iterable[SpacedRepCard]) -> None:
+        """Apply a batch of newly created cards to the rollups."""
+        for card in cards:
+            await self.apply_card_change(card.tags, None, card_contribution(card))
+
+    async def apply_exercise_created(self, topic: Optional[str]) -> None:
+        """Apply a newly created exercise to the rollups."""
+        await self._apply([topic] if topic else None, {"exercise_count": 1})
+
+    async def apply_cards_deleted(self, cards: Iterable[SpacedRepCard]) -> None:
+        """
+        Apply a batch of cards about to be deleted to the rollups.
+
+        Contributions are summed per distinct tag set, so a bulk delete costs
+        one update per tag set rather than per card.
+
+        Args:
+            cards: Cards in their current state, loaded before the delete.
+        """
+        totals: dict[tuple[str, ...], dict[str, float]] = {}
+        for card in cards:
+            key = tuple(sorted(set(card.tags or ())))
+            total = totals.setdefault(key, {col: 0 for col in CARD_COUNTERS})
+            for col, value in card_contribution(card).items():
+                total[col] += value
+        for tags, total in totals.items():
+            await self.apply_card_change(tags, total, None)
+
+    async def apply_exercises_deleted(self, exercises: Iterable[Exercise]) -> None:
+        """
+        Apply a batch of exercises about to be deleted to the rollups.
+
+        Removes each exercise and its attempts (one aggregate query over the
+        attempts), summed per topic.
+
+        Args:
+            exercises: Exercises loaded before the delete.
+        """
+        exercises = list(exercises)
+        if not exercises:
+            return
+
+        threshold = settings.EXERCISE_MASTERY_SCORE_THRESHOLD
+        result = await self.db.execute(
+            select(
+                ExerciseAttempt.exercise_id,
+                func.count(ExerciseAttempt.id),
+                func.count().filter(ExerciseAttempt.is_correct.is_(True)),
+                func.sum(ExerciseAttempt.score),
+                func.max(ExerciseAttempt.score),
+            )
+            .where(ExerciseAttempt.exercise_id.in_([e.id for e in exercises]))
+            .group_by(ExerciseAttempt.exercise_id)
+        )
+        attempts = {row[0]: row[1:] for row in result.all()}
+
+        totals: dict[Optional[str], dict[str, float]] = {}
+        for exercise in exercises:
+            count, correct, score_sum, best = attempts.get(
+                exercise.id, (0, 0, None, None)
+            )
+            total = totals.setdefault(
+                exercise.topic,
+                dict.fromkeys(
+                    (
+                        "exercise_count",
+                        "exercise_attempts",
+                        "exercise_correct",
+                        "exercise_score_sum",
+                        "exercises_completed",
+                        "exercises_mastered",
+                    ),
+                    0,
+                ),
+            )
+            total["exercise_count"] -= 1
+            total["exercise_attempts"] -= count
+            total["exercise_correct"] -= correct or 0
+            total["exercise_score_sum"] -= score_sum or 0.0
+            total["exercises_completed"] -= int(count > 0)
+            total["exercises_mastered"] -= int(best is not None and best >= threshold)
+
+        for topic, deltas in totals.items():
+            await self._apply([topic] if topic else None, deltas)
+
+    async def apply_exercise_attempt(
+        self, exercise: Exercise, attempt: ExerciseAttempt
+    ) -> None:
+        """
+        Apply a new exercise attempt to the rollups.
+
+        Looks up the exercise's earlier attempts (one indexed query) to decide
+        whether this attempt completes or masters the exercise for the first
+        time.
+
+        Args:
+            exercise: Exercise that was attempted.
+            attempt: The new attempt (already flushed, so it has an id).
+        """
+        prior = await self.db.execute(
+            select(func.count(ExerciseAttempt.id), func.max(ExerciseAttempt.score))
+            .where(ExerciseAttempt.exercise_id == exercise.id)
+            .where(ExerciseAttempt.id != attempt.id)
+        )
+        prior_count, prior_best = prior.one()
+
+        score = attempt.score or 0.0
+        threshold = settings.EXERCISE_MASTERY_SCORE_THRESHOLD
+        newly_mastered = score >= threshold and (prior_best or 0.0) < threshold
+
+        deltas = {
+            "exercise_attempts": 1,
+            "exercise_correct": int(bool(attempt.is_correct)),
+            "exercise_score_sum": score,
+            "exercises_completed": int(not prior_count),
+            "exercises_mastered": int(newly_mastered),
+        }
+        attempted_at = attempt.attempted_at or datetime.now(timezone.utc)
+        await self._apply(
+            [exercise.topic] if exercise.topic else None,
+            deltas,
+            {"last_attempted": attempted_at},
+        )
+
+    async def _apply(
+        self,
+        topics: Optional[Iterable[str]],
+        deltas: dict[str, float],
+        latest: Optional[dict[str, Optional[datetime]]] = None,
+    ) -> None:
+        """
+        Add deltas to the global row and to each topic's row.
+
+        Topic rows are upserted. Nothing is written while the global row does
+        not exist yet (the first reconcile has not run).
+        """
+        deltas = {col: value for col, value in deltas.items() if value}
+        latest = {col: ts for col, ts in (latest or {}).items() if ts is not None}
+        if not deltas and not latest:
+            return
+
+        now = datetime.now(timezone.utc)
+        set_global = {
+            **{col: getattr(MasteryRollup, col) + value for col, value in deltas.items()},
+            **{
+                col: func.greatest(getattr(MasteryRollup, col), ts)
+                for col, ts in latest.items()
+            },
+            "updated_at": now,
+        }
+        result = await self.db.execute(
+            update(MasteryRollup)
+            .where(MasteryRollup.topic_path == GLOBAL_ROLLUP_TOPIC)
+            .values(**set_global)
+        )
+        if not result.rowcount:
+            return
+
+        topic_paths = sorted(set(topics or ()) - {GLOBAL_ROLLUP_TOPIC})
+        if not topic_paths:
+            return
+
+        stmt = pg_insert(MasteryRollup).values(
+            [
+                {"topic_path": topic, **deltas, **latest, "updated_at": now}
+                for topic in topic_paths
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["topic_path"],
+            set_={
+                **{
+                    col: getattr(MasteryRollup, col) + getattr(stmt.excluded, col)
+                    for col in deltas
+                },
+                **{
+                    col: func.greatest(
+                        getattr(MasteryRollup, col), getattr(stmt.excluded, col)
+                    )
+                    for col in latest
+                },
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.db.execute(stmt)
+
+    # ===========================================
+    # Reads
+    # ===========================================
+
+    async def get_rollups(
+        self, topics: Optional[list[str]] = None
+    ) -> dict[str, MasteryRollup]:
+        """
+        Load rollup rows.
+
+        Args:
+            topics: Topic paths to load (all rows if None). The global row is
+                always included.
+
+        Returns:
+            Dict mapping topic_path -> MasteryRollup.
+        """
+        query = select(MasteryRollup)
+        if topics is not None:
+            query = query.where(
+                MasteryRollup.topic_path.in_([GLOBAL_ROLLUP_TOPIC, *topics])
+            )
+        result = await self.db.execute(query)
+        return {row.topic_path: row for row in result.scalars().all()}
+
+    # ===========================================
+    # Reconcile
+    # ===========================================
+
+    async def reconcile(self) -> int:
+        """
+        Rebuild all rollups from the card, review and exercise tables.
+
+        Aggregates in SQL (a few GROUP BY queries), then replaces the table
+        contents in one transaction. A transaction-level advisory lock makes
+        concurrent reconciles (e.g. two first reads building the missing
+        rollups) run one after the other instead of racing on topic_path.
+
+        Returns:
+            Number of rollup rows written (including the global row).
+        """
+        await self.db.execute(select(func.pg_advisory_xact_lock(RECONCILE_LOCK_KEY)))
+
+        rows: dict[str, dict] = {}
+
+        def row_for(topic: str) -> dict:
+            return rows.setdefault(
+                topic, {col: 0 for col in ROLLUP_COUNTERS} | {"topic_path": topic}
+            )
+
+        # --- Cards: per tag (one row per distinct card/tag pair) and global ---
+        card_tags = (
+            select(
+                SpacedRepCard.id,
+                SpacedRepCard.state,
+                SpacedRepCard.stability,
+                SpacedRepCard.total_reviews,
+                SpacedRepCard.correct_reviews,
+                SpacedRepCard.last_reviewed,
+                func.unnest(SpacedRepCard.tags).label("topic"),
+            )
+            .where(SpacedRepCard.tags.isnot(None))
+            .distinct()
+            .subquery()
+        )
+        for source, group_col in (
+            (card_tags, card_tags.c.topic),
+            (SpacedRepCard.__table__, None),
+        ):
+            query = select(*self._card_aggregates(source.c))
+            if group_col is not None:
+                query = query.add_columns(group_col).group_by(group_col)
+            result = await self.db.execute(query)
+            for agg in result.mappings().all():
+                row = row_for(agg["topic"] if group_col is not None else GLOBAL_ROLLUP_TOPIC)
+                row.update(
+                    {col: agg[col] or 0 for col in CARD_COUNTERS},
+                    last_reviewed=agg["last_reviewed"],
+                )
+
+        # --- Card review time: per tag and global ---
+        review_tags = (
+            select(
+                CardReviewHistory.id,
+                CardReviewHistory.time_spent_seconds,
+                func.unnest(SpacedRepCard.tags).label("topic"),
+            )
+            .join(SpacedRepCard, SpacedRepCard.id == CardReviewHistory.card_id)
+            .where(SpacedRepCard.tags.isnot(None))
+            .distinct()
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(
+                review_tags.c.topic, func.sum(review_tags.c.time_spent_seconds)
+            ).group_by(review_tags.c.topic)
+        )
+        for topic, seconds in result.all():
+            row_for(topic)["review_time_seconds"] = seconds or 0
+        result = await self.db.execute(
+            select(func.sum(CardReviewHistory.time_spent_seconds))
+        )
+        row_for(GLOBAL_ROLLUP_TOPIC)["review_time_seconds"] = result.scalar() or 0
+
+        # --- Exercises: per topic and global ---
+        for group_col in (Exercise.topic, None):
+            count_query = select(func.count(Exercise.id).label("exercise_count"))
+            attempt_query = select(*self._attempt_aggregates()).join(
+                Exercise, Exercise.id == ExerciseAttempt.exercise_id
+            )
+            if group_col is not None:
+                count_query = count_query.add_columns(group_col).group_by(group_col)
+                attempt_query = attempt_query.add_columns(group_col).group_by(
+                    group_col
+                )
+            for query in (count_query, attempt_query):
+                result = await self.db.execute(query)
+                for agg in result.mappings().all():
+                    topic = (
+                        agg["topic"] if group_col is not None else GLOBAL_ROLLUP_TOPIC
+                    )
+                    if topic is None:
+                        continue
+                    row = row_for(topic)
+                    for col, value in agg.items():
+                        if col != "topic":
+                            row[col] = value if col in ROLLUP_LATEST else value or 0
+
+        # Always write the global row; incremental updates depend on it
+        row_for(GLOBAL_ROLLUP_TOPIC)
+
+        now = datetime.now(timezone.utc)
+        await self.db.execute(delete(MasteryRollup))
+        await self.db.execute(
+            pg_insert(MasteryRollup).values(
+                [{**row, "updated_at": now} for row in rows.values()]
+            )
+        )
+        await self.db.commit()
+
+        logger.info(f"Reconciled mastery rollups: {len(rows)} rows")
+        return len(rows)
+
+    @staticmethod
+    def _card_aggregates(c) -> list:
+        """Aggregate columns matching card_contribution() over a card source."""
+        threshold = settings.MASTERY_MASTERED_STABILITY_DAYS
+        is_review = c.state == CardState.REVIEW.value
+        return [
+            func.count(distinct(c.id)).label("card_count"),
+            func.count().filter(c.state == CardState.NEW.value).label("new_cards"),
+            func.count()
+            .filter(
+                c.state.in_([s.value for s in _LEARNING_STATES]),
+                c.stability < threshold,
+            )
+            .label("learning_cards"),
+            func.count().filter(c.stability >= threshold).label("mastered_cards"),
+            func.count().filter(is_review).label("review_cards"),
+            func.sum(case((is_review, func.coalesce(c.stability, 0.0)), else_=0.0))
+            .label("review_stability_sum"),
+            func.sum(c.total_reviews).label("total_reviews"),
+            func.sum(c.correct_reviews).label("correct_reviews"),
+            func.max(c.last_reviewed).label("last_reviewed"),
+        ]
+
+    @staticmethod
+    def _attempt_aggregates() -> list:
+        """Aggregate columns over exercise attempts."""
+        threshold = settings.EXERCISE_MASTERY_SCORE_THRESHOLD
+        return [
+            func.count(ExerciseAttempt.id).label("exercise_attempts"),
+            func.count()
+            .filter(ExerciseAttempt.is_correct.is_(True))
+            .label("exercise_correct"),
+            func.sum(ExerciseAttempt.score).label("exercise_score_sum"),
+            func.count(distinct(ExerciseAttempt.exercise_id)).label(
+                "exercises_completed"
+            ),
+            func.count(distinct(ExerciseAttempt.exercise_id))
+            .filter(ExerciseAttempt.score >= threshold)
+            .label("exercises_mastered"),
+            func.max(ExerciseAttempt.attempted_at).label("last_attempted"),
+        ]
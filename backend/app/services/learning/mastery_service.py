@@ -25,12 +25,12 @@ Usage:
     await service.take_daily_snapshot()
 """
 
+import itertools
 import logging
 from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
-import pandas as pd
-from sqlalchemy import select, func, and_, distinct, case
+from sqlalchemy import select, func, and_, distinct
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -42,6 +42,7 @@ from app.db.models_learning import (
     ExerciseAttempt,
     Exercise,
     CardReviewHistory,
+    MasteryRollup,
 )
 from app.enums.learning import (
     MasteryTrend,
@@ -51,6 +52,11 @@ from app.enums.learning import (
     GroupBy,
 )
 from app.services.learning.exercise_generator import get_suggested_exercise_types
+from app.services.learning.mastery_rollup import (
+    GLOBAL_ROLLUP_TOPIC,
+    MasteryRollupService,
+)
+from app.services.learning.spaced_rep_service import SpacedRepService
 from app.services.tag_service import TagService
 from app.models.learning import (
     DailyStatsResponse,
@@ -67,9 +73,25 @@ from app.models.learning import (
 )
 from app.services.learning.streak_tracking import StreakTrackingService
 from app.services.learning.time_tracking import TimeTrackingService
+from app.lazy_imports import lazy_import
 
 logger = logging.getLogger(__name__)
 
+# numpy/pandas are imported on first use (see app.lazy_imports)
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# SpacedRepCard columns loaded for mastery calculation
+CARD_FRAME_COLUMNS = (
+    "id",
+    "tags",
+    "state",
+    "stability",
+    "total_reviews",
+    "correct_reviews",
+    "last_reviewed",
+)
+
 
 def _calculate_trend(current_score: float, previous_score: float) -> MasteryTrend:
     """
@@ -115,6 +137,7 @@ class MasteryService:
         self.db = db
         self._time_tracking = TimeTrackingService(db)
         self._streak_tracking = StreakTrackingService(db)
+        self._rollups = MasteryRollupService(db)
 
     async def get_mastery_state(self, topic: str) -> MasteryState:
         """
@@ -150,9 +173,9 @@ class MasteryService:
         Returns:
             List of WeakSpot objects with recommendations and suggested exercises.
         """
-        # Get all topics and calculate mastery in batch (2 queries instead of N)
+        # Get all topics and read mastery from their rollups (O(topics))
         topics = await self._get_all_topics()
-        all_states = await self._calculate_mastery_batch(topics)
+        all_states = await self._calculate_mastery_from_rollups(topics)
 
         # Filter to weak spots
         weak_spots = []
@@ -193,89 +216,48 @@ class MasteryService:
             MasteryOverview with comprehensive learning statistics including
             separate breakdowns for spaced repetition cards and exercises.
         """
-        # ==== SPACED REPETITION CARDS STATS ====
-
-        # Total spaced rep cards
-        total_spaced_cards_result = await self.db.execute(
-            select(func.count(SpacedRepCard.id))
-        )
-        spaced_rep_cards_total = total_spaced_cards_result.scalar() or 0
-
-        # Mastered cards (stability >= threshold)
-        spaced_mastered_result = await self.db.execute(
-            select(func.count(SpacedRepCard.id)).where(
-                SpacedRepCard.stability >= settings.MASTERY_MASTERED_STABILITY_DAYS
-            )
-        )
-        spaced_rep_cards_mastered = spaced_mastered_result.scalar() or 0
-
-        # Learning cards (in learning/relearning/review but not yet mastered)
-        spaced_learning_result = await self.db.execute(
-            select(func.count(SpacedRepCard.id)).where(
-                and_(
-                    SpacedRepCard.state.in_(
-                        [CardState.LEARNING, CardState.RELEARNING, CardState.REVIEW]
-                    ),
-                    SpacedRepCard.stability < settings.MASTERY_MASTERED_STABILITY_DAYS,
-                )
-            )
-        )
-        spaced_rep_cards_learning = spaced_learning_result.scalar() or 0
+        # Card and exercise totals come from the global rollup, per-topic
+        # mastery from the topic rollups: O(topics) rows, no card scans
+        topics = await self._get_all_topics()
+        topics_to_calculate = topics[: settings.MASTERY_MAX_TOPICS_IN_OVERVIEW]
+        rollups = await self._load_rollups(topics_to_calculate)
+        totals = rollups[GLOBAL_ROLLUP_TOPIC]
 
-        # New cards (never reviewed)
-        spaced_new_result = await self.db.execute(
-            select(func.count(SpacedRepCard.id)).where(
-                SpacedRepCard.state == CardState.NEW
-            )
-        )
-        spaced_rep_cards_new = spaced_new_result.scalar() or 0
+        # ==== SPACED REPETITION CARDS STATS ====
 
-        # Total reviews on spaced rep cards
-        spaced_reviews_result = await self.db.execute(
-            select(func.sum(SpacedRepCard.total_reviews))
-        )
-        spaced_rep_reviews_total = spaced_reviews_result.scalar() or 0
+        # Mastered: stability >= threshold. Learning: in learning/relearning/
+        # review but not yet mastered. New: never reviewed.
+        spaced_rep_cards_total = totals.card_count
+        spaced_rep_cards_mastered = totals.mastered_cards
+        spaced_rep_cards_learning = totals.learning_cards
+        spaced_rep_cards_new = totals.new_cards
+        spaced_rep_reviews_total = totals.total_reviews
 
         # ==== EXERCISES STATS ====
 
-        # Total exercises
-        exercises_total_result = await self.db.execute(select(func.count(Exercise.id)))
-        exercises_total = exercises_total_result.scalar() or 0
-
-        # Exercises with at least one attempt (completed)
-        exercises_completed_result = await self.db.execute(
-            select(func.count(distinct(ExerciseAttempt.exercise_id)))
-        )
-        exercises_completed = exercises_completed_result.scalar() or 0
-
-        # Exercises with avg score >= threshold (mastered)
-        exercises_mastered_result = await self.db.execute(
-            select(func.count(distinct(ExerciseAttempt.exercise_id))).where(
-                ExerciseAttempt.score >= settings.EXERCISE_MASTERY_SCORE_THRESHOLD
-            )
+        # Completed: at least one attempt. Mastered: an attempt scoring at
+        # least EXERCISE_MASTERY_SCORE_THRESHOLD.
+        exercises_total = totals.exercise_count
+        exercises_completed = totals.exercises_completed
+        exercises_mastered = totals.exercises_mastered
+        exercises_attempts_total = totals.exercise_attempts
+        exercises_avg_score = (
+            totals.exercise_score_sum / totals.exercise_attempts
+            if totals.exercise_attempts
+            else 0.0
         )
-        exercises_mastered = exercises_mastered_result.scalar() or 0
-
-        # Total exercise attempts
-        exercises_attempts_result = await self.db.execute(
-            select(func.count(ExerciseAttempt.id))
-        )
-        exercises_attempts_total = exercises_attempts_result.scalar() or 0
-
-        # Average score across all exercise attempts
-        exercises_avg_result = await self.db.execute(
-            select(func.avg(ExerciseAttempt.score))
-        )
-        exercises_avg_score = exercises_avg_result.scalar() or 0.0
 
         # ==== TOPIC MASTERY STATES ====
 
-        topics = await self._get_all_topics()
-        topics_to_calculate = topics[: settings.MASTERY_MAX_TOPICS_IN_OVERVIEW]
-        topic_states = await self._calculate_mastery_batch(topics_to_calculate)
+        topic_states = await self._calculate_mastery_from_rollups(
+            topics_to_calculate, rollups
+        )
 
         # Enhance topic states with exercise attempt data
-        topic_states = await self._enhance_with_exercise_data(topic_states)
+        topic_states = [
+            self._merge_exercise_rollup(state, rollups.get(state.topic_path))
+            for state in topic_states
+        ]
 
         # Compute overall mastery as average across all topics
         if topic_states:
@@ -297,12 +279,8 @@ class MasteryService:
         )
         total_practice_minutes = practice_time_result.scalar() or 0
 
-        # Also include time from card reviews (CardReviewHistory.time_spent_seconds)
-        card_review_time_result = await self.db.execute(
-            select(func.sum(CardReviewHistory.time_spent_seconds))
-        )
-        total_card_review_seconds = card_review_time_result.scalar() or 0
-        total_card_review_minutes = total_card_review_seconds / 60.0
+        # Also include time from card reviews (rolled up from CardReviewHistory)
+        total_card_review_minutes = totals.review_time_seconds / 60.0
 
         # Combined total
         total_practice_time_hours = (total_practice_minutes + total_card_review_minutes) / 60.0
@@ -329,164 +307,67 @@ class MasteryService:
             total_practice_time_hours=total_practice_time_hours,
         )
 
-    async def _enhance_with_exercise_data(
-        self, topic_states: list[MasteryState]
-    ) -> list[MasteryState]:
+    @staticmethod
+    def _merge_exercise_rollup(
+        state: MasteryState, rollup: Optional[MasteryRollup]
+    ) -> MasteryState:
         """
-        Enhance topic mastery states with data from exercise attempts.
+        Enhance a topic's card mastery state with its exercise rollup.
 
-        For topics that have exercise attempts, compute mastery based on
-        exercise performance.
+        For topics that have exercise attempts, exercise mastery is the
+        average attempt score and the combined mastery is the max of card
+        and exercise mastery.
         """
-        if not topic_states:
-            return topic_states
-
-        # Get exercise attempt stats by topic
-        topic_paths = [s.topic_path for s in topic_states]
-
-        # Query exercise attempts grouped by topic
-        exercise_stats = await self.db.execute(
-            select(
-                Exercise.topic,
-                func.count(ExerciseAttempt.id).label("practice_count"),
-                func.avg(ExerciseAttempt.score).label("avg_score"),
-                func.sum(case((ExerciseAttempt.is_correct == True, 1), else_=0)).label(
-                    "correct_count"
-                ),
-                func.max(ExerciseAttempt.attempted_at).label("last_practiced"),
+        card_count = rollup.card_count if rollup else 0
+        exercise_count = rollup.exercise_count if rollup else 0
+
+        # Card mastery is the original state's mastery score
+        card_mastery = state.mastery_score
+
+        if rollup is None or not rollup.exercise_attempts:
+            # No exercise data, keep original state with card data
+            return MasteryState(
+                topic_path=state.topic_path,
+                mastery_score=state.mastery_score,
+                card_mastery_score=card_mastery if card_count > 0 else None,
+                exercise_mastery_score=None,
+                card_count=card_count,
+                exercise_count=exercise_count,
+                practice_count=state.practice_count,
+                success_rate=state.success_rate,
+                trend=state.trend,
+                last_practiced=state.last_practiced,
+                days_since_review=state.days_since_review,
+                retention_estimate=state.retention_estimate,
+                confidence_avg=state.confidence_avg,
             )
-            .join(ExerciseAttempt, Exercise.id == ExerciseAttempt.exercise_id)
-            .where(Exercise.topic.in_(topic_paths))
-            .group_by(Exercise.topic)
-        )
 
-        stats_by_topic = {
-            row.topic: {
-                "practice_count": row.practice_count or 0,
-                "avg_score": row.avg_score or 0.0,
-                "correct_count": row.correct_count or 0,
-                "last_practiced": row.last_practiced,
-            }
-            for row in exercise_stats.fetchall()
-        }
+        practice_count = rollup.exercise_attempts
+        exercise_mastery = rollup.exercise_score_sum / practice_count
+        success_rate = rollup.exercise_correct / practice_count
+        last_practiced = rollup.last_attempted
 
-        # Get exercise counts per topic
-        exercise_count_query = (
-            select(
-                Exercise.topic,
-                func.count(Exercise.id).label("exercise_count"),
-            )
-            .where(Exercise.topic.in_(topic_paths))
-            .group_by(Exercise.topic)
-        )
-        exercise_count_result = await self.db.execute(exercise_count_query)
-        exercise_counts = {
-            row.topic: row.exercise_count for row in exercise_count_result.fetchall()
-        }
+        # Calculate days since last practice
+        days_since = None
+        if last_practiced:
+            days_since = (datetime.now(timezone.utc) - last_practiced).days
 
-        # Get card counts per topic using unnest to properly handle the tags array
-        # This uses a single batched query instead of N+1 queries (TD-014 fix)
-        # Create a subquery that unnests the tags array into individual rows
-        unnested_tags = (
-            select(
-                SpacedRepCard.id.label("card_id"),
-                func.unnest(SpacedRepCard.tags).label("topic"),
-            )
-            .where(SpacedRepCard.tags.isnot(None))
-            .subquery()
-        )
-
-        # Count cards per topic, filtering to only the topics we care about
-        card_count_query = (
-            select(
-                unnested_tags.c.topic,
-                func.count(distinct(unnested_tags.c.card_id)).label("card_count"),
-            )
-            .where(unnested_tags.c.topic.in_(topic_paths))
-            .group_by(unnested_tags.c.topic)
+        return MasteryState(
+            topic_path=state.topic_path,
+            # Combined mastery is the max of card and exercise mastery
+            mastery_score=max(card_mastery, exercise_mastery),
+            card_mastery_score=card_mastery if card_count > 0 else None,
+            exercise_mastery_score=exercise_mastery,
+            card_count=card_count,
+            exercise_count=exercise_count,
+            practice_count=state.practice_count + practice_count,
+            success_rate=success_rate,
+            trend=state.trend,
+            last_practiced=last_practiced or state.last_practiced,
+            days_since_review=(
+                days_since if days_since is not None else state.days_since_review
+            ),
         )
-        card_count_result = await self.db.execute(card_count_query)
-        card_counts = {
-            row.topic: row.card_count for row in card_count_result.fetchall()
-        }
-
-        # Enhance each topic state
-        enhanced_states = []
-        now = datetime.now(timezone.utc)
-
-        for state in topic_states:
-            topic_data = stats_by_topic.get(state.topic_path)
-            exercise_count = exercise_counts.get(state.topic_path, 0)
-            card_count = card_counts.get(state.topic_path, 0)
-
-            # Card mastery is the original state's mastery score
-            card_mastery = state.mastery_score
-
-            if topic_data and topic_data["practice_count"] > 0:
-                # Compute exercise mastery from exercise scores
-                exercise_mastery = topic_data["avg_score"]
-                practice_count = topic_data["practice_count"]
-                success_rate = (
-                    topic_data["correct_count"] / practice_count
-                    if practice_count > 0
-                    else None
-                )
-                last_practiced = topic_data["last_practiced"]
-
-                # Calculate days since last practice
-                days_since = None
-                if last_practiced:
-                    delta = now - last_practiced
-                    days_since = delta.days
-
-                # Combined mastery is the max of card and exercise mastery
-                combined_mastery = max(card_mastery, exercise_mastery)
-
-                # Create enhanced state with separate scores
-                enhanced_states.append(
-                    MasteryState(
-                        topic_path=state.topic_path,
-                        mastery_score=combined_mastery,
-                        card_mastery_score=card_mastery if card_count > 0 else None,
-                        exercise_mastery_score=exercise_mastery,
-                        card_count=card_count,
-                        exercise_count=exercise_count,
-                        practice_count=state.practice_count + practice_count,
-                        success_rate=(
-                            success_rate
-                            if success_rate is not None
-                            else state.success_rate
-                        ),
-                        trend=state.trend,
-                        last_practiced=last_practiced or state.last_practiced,
-                        days_since_review=(
-                            days_since
-                            if days_since is not None
-                            else state.days_since_review
-                        ),
-                    )
-                )
-            else:
-                # No exercise data, keep original state with card data
-                enhanced_states.append(
-                    MasteryState(
-                        topic_path=state.topic_path,
-                        mastery_score=state.mastery_score,
-                        card_mastery_score=card_mastery if card_count > 0 else None,
-                        exercise_mastery_score=None,
-                        card_count=card_count,
-                        exercise_count=exercise_count,
-                        practice_count=state.practice_count,
-                        success_rate=state.success_rate,
-                        trend=state.trend,
-                        last_practiced=state.last_practiced,
-                        days_since_review=state.days_since_review,
-                        retention_estimate=state.retention_estimate,
-                        confidence_avg=state.confidence_avg,
-                    )
-                )
-
-        return enhanced_states
 
     async def get_learning_curve(
         self,
@@ -745,7 +626,8 @@ class MasteryService:
         if not topics:
             return 0
 
-        # Calculate mastery for all topics using batched pandas approach
+        # Calculate mastery for all topics using batched pandas approach. This
+        # scans the cards rather than reading rollups, so snapshots are exact
         all_states = await self._calculate_mastery_batch(topics)
         prev_snapshots = await self._get_recent_snapshots_batch(
             topics, days=settings.MASTERY_SNAPSHOT_LOOKBACK_DAYS
@@ -787,10 +669,7 @@ class MasteryService:
 
     async def _calculate_mastery(self, topic: str) -> MasteryState:
         """
-        Calculate mastery state for a single topic.
-
-        For single-topic queries, uses pandas DataFrame internally.
-        For batch operations, use _calculate_mastery_batch instead.
+        Calculate mastery state for a single topic from its rollup.
 
         Args:
             topic: Topic path to calculate mastery for.
@@ -798,56 +677,139 @@ class MasteryService:
         Returns:
             MasteryState with calculated score, trend, and statistics.
         """
-        # Use batch method for consistency (still efficient for single topic)
-        states = await self._calculate_mastery_batch([topic])
-        return (
-            states[0]
-            if states
-            else MasteryState(
-                topic_path=topic,
-                mastery_score=0.0,
-                practice_count=0,
-            )
+        states = await self._calculate_mastery_from_rollups([topic])
+        return states[0]
+
+    async def _load_rollups(
+        self, topics: Optional[list[str]] = None
+    ) -> dict[str, MasteryRollup]:
+        """
+        Load rollups for the given topics (plus the global row).
+
+        Builds the rollups from the source tables on first use, when the
+        global row does not exist yet.
+        """
+        rollups = await self._rollups.get_rollups(topics)
+        if GLOBAL_ROLLUP_TOPIC not in rollups:
+            logger.info("Mastery rollups missing; reconciling from source tables")
+            await self._rollups.reconcile()
+            rollups = await self._rollups.get_rollups(topics)
+        return rollups
+
+    async def _calculate_mastery_from_rollups(
+        self,
+        topics: list[str],
+        rollups: Optional[dict[str, MasteryRollup]] = None,
+    ) -> list[MasteryState]:
+        """
+        Calculate card mastery states for topics from their rollups.
+
+        Same scoring as _compute_mastery_dataframe, but reads one rollup row
+        per topic instead of scanning cards.
+
+        Args:
+            topics: List of topic paths to calculate mastery for.
+            rollups: Preloaded rollups (loaded if None).
+
+        Returns:
+            List of MasteryState objects for each topic.
+        """
+        if not topics:
+            return []
+        if rollups is None:
+            rollups = await self._load_rollups(topics)
+        snapshots_by_topic = await self._get_recent_snapshots_batch(
+            topics, days=settings.MASTERY_SNAPSHOT_LOOKBACK_DAYS
         )
 
-    async def _fetch_cards_dataframe(self) -> pd.DataFrame:
+        now = datetime.now(timezone.utc)
+        states = []
+        for topic in topics:
+            rollup = rollups.get(topic)
+            if rollup is None or not rollup.card_count:
+                states.append(
+                    MasteryState(topic_path=topic, mastery_score=0.0, practice_count=0)
+                )
+                continue
+
+            total = rollup.total_reviews
+            success_rate = rollup.correct_reviews / total if total > 0 else None
+
+            # Stability factor (average stability of review cards, normalized)
+            avg_stability = (
+                rollup.review_stability_sum / rollup.review_cards
+                if rollup.review_cards
+                else 0.0
+            )
+            stability_factor = min(
+                1.0, avg_stability / settings.MASTERY_STABILITY_NORMALIZATION_DAYS
+            )
+
+            # Mastery score (requires MIN_ATTEMPTS)
+            if total > 0 and total >= settings.MASTERY_MIN_ATTEMPTS:
+                mastery_score = (
+                    success_rate * settings.MASTERY_SUCCESS_RATE_WEIGHT
+                    + stability_factor * settings.MASTERY_STABILITY_WEIGHT
+                )
+            else:
+                mastery_score = 0.0
+
+            # Trend against the most recent snapshot
+            prev_snapshot = snapshots_by_topic.get(topic)
+            if prev_snapshot and prev_snapshot.mastery_score is not None:
+                trend = _calculate_trend(mastery_score, prev_snapshot.mastery_score)
+            else:
+                trend = MasteryTrend.STABLE
+
+            last_practiced = rollup.last_reviewed
+            states.append(
+                MasteryState(
+                    topic_path=topic,
+                    mastery_score=mastery_score,
+                    practice_count=total,
+                    success_rate=success_rate,
+                    trend=trend,
+                    last_practiced=last_practiced,
+                    days_since_review=(
+                        (now - last_practiced).days if last_practiced else None
+                    ),
+                )
+            )
+
+        return states
+
+    async def _fetch_cards_dataframe(
+        self, topics: Optional[list[str]] = None
+    ) -> "pd.DataFrame":
         """
-        Fetch all cards and return as a pandas DataFrame.
+        Fetch card statistics as a columnar pandas DataFrame.
+
+        Selects only the columns mastery needs (not question/answer text) and
+        builds the frame directly from the row tuples.
+
+        Args:
+            topics: If given, only cards tagged with at least one of these
+                topics are fetched.
 
         Returns:
             DataFrame with columns: id, tags, state, stability, total_reviews,
             correct_reviews, last_reviewed.
         """
-        result = await self.db.execute(select(SpacedRepCard))
-        cards = result.scalars().all()
-
-        if not cards:
-            return pd.DataFrame(
-                columns=[
-                    "id",
-                    "tags",
-                    "state",
-                    "stability",
-                    "total_reviews",
-                    "correct_reviews",
-                    "last_reviewed",
-                ]
-            )
+        query = select(*(getattr(SpacedRepCard, col) for col in CARD_FRAME_COLUMNS))
+        if topics is not None:
+            query = query.where(SpacedRepCard.tags.overlap(topics))
+        result = await self.db.execute(query)
 
-        return pd.DataFrame(
-            [
-                {
-                    "id": c.id,
-                    "tags": c.tags or [],
-                    "state": c.state,
-                    "stability": c.stability or 0.0,
-                    "total_reviews": c.total_reviews or 0,
-                    "correct_reviews": c.correct_reviews or 0,
-                    "last_reviewed": c.last_reviewed,
-                }
-                for c in cards
-            ]
+        cards_df = pd.DataFrame.from_records(
+            result.all(), columns=list(CARD_FRAME_COLUMNS)
         )
+        if cards_df.empty:
+            return cards_df
+
+        cards_df["stability"] = cards_df["stability"].astype(float).fillna(0.0)
+        for col in ("total_reviews", "correct_reviews"):
+            cards_df[col] = cards_df[col].fillna(0).astype("int64")
+        return cards_df
 
     async def _get_recent_snapshots_batch(
         self, topics: list[str], days: int = 1
@@ -901,7 +863,7 @@ class MasteryService:
             return []
 
         # Fetch all data
-        cards_df = await self._fetch_cards_dataframe()
+        cards_df = await self._fetch_cards_dataframe(topics)
         snapshots_by_topic = await self._get_recent_snapshots_batch(
             topics, days=settings.MASTERY_SNAPSHOT_LOOKBACK_DAYS
         )
@@ -917,10 +879,11 @@ class MasteryService:
         mastery_df = self._compute_mastery_dataframe(cards_df, topics)
 
         # Convert to MasteryState objects with trend from snapshots
+        mastery_rows = mastery_df.to_dict("index")
         states = []
         for topic in topics:
-            if topic in mastery_df.index:
-                row = mastery_df.loc[topic]
+            row = mastery_rows.get(topic)
+            if row is not None:
                 prev_snapshot = snapshots_by_topic.get(topic)
 
                 # Calculate trend
@@ -966,99 +929,117 @@ class MasteryService:
         return states
 
     def _compute_mastery_dataframe(
-        self, cards_df: pd.DataFrame, topics: list[str]
-    ) -> pd.DataFrame:
+        self, cards_df: "pd.DataFrame", topics: list[str]
+    ) -> "pd.DataFrame":
         """
-        Compute mastery statistics per topic using vectorized pandas operations.
+        Compute mastery statistics per topic with vectorized NumPy operations.
+
+        Each card is expanded to one entry per tag, tags are mapped to topic
+        codes, and per-topic sums are taken with np.bincount, so the cost is
+        a handful of array passes regardless of the number of topics.
 
         Args:
             cards_df: DataFrame with card data.
             topics: List of topics to compute mastery for.
 
         Returns:
-            DataFrame indexed by topic with mastery statistics.
+            DataFrame indexed by topic with mastery statistics (topics without
+            cards are omitted).
         """
-        # Explode tags so each card-topic pair is a row
-        exploded = cards_df.explode("tags").copy()
-        exploded = exploded[exploded["tags"].isin(topics)]
+        topic_index = pd.Index(topics).unique()
+
+        # One entry per (card, tag), flattened straight from the tag lists;
+        # rows holds the position of the card each tag came from
+        tag_lists = cards_df["tags"].to_numpy()
+        tag_counts = np.fromiter(
+            (len(tags) if tags is not None else 0 for tags in tag_lists),
+            dtype=np.int64,
+            count=len(tag_lists),
+        )
+        flat_tags = np.fromiter(
+            itertools.chain.from_iterable(t for t in tag_lists if t is not None),
+            dtype=object,
+            count=int(tag_counts.sum()),
+        )
+        codes = topic_index.get_indexer(flat_tags)
+        matched = codes >= 0
+        codes = codes[matched]
+        rows = np.repeat(np.arange(len(tag_lists)), tag_counts)[matched]
 
-        if exploded.empty:
+        if not len(codes):
             return pd.DataFrame()
 
-        # Add helper column for review-state stability (0 for non-review cards)
-        exploded["review_stability"] = exploded.apply(
-            lambda r: r["stability"] if r["state"] == CardState.REVIEW else 0.0, axis=1
-        )
-        exploded["is_review"] = (exploded["state"] == CardState.REVIEW).astype(int)
-
-        # Group by topic and aggregate
-        grouped = exploded.groupby("tags").agg(
-            total_reviews=("total_reviews", "sum"),
-            correct_reviews=("correct_reviews", "sum"),
-            last_practiced=("last_reviewed", "max"),
-            review_cards=("is_review", "sum"),
-            review_stability_sum=("review_stability", "sum"),
+        n_topics = len(topic_index)
+        is_review = (cards_df["state"] == CardState.REVIEW.value).to_numpy()[rows]
+        stability = cards_df["stability"].to_numpy(dtype=float)[rows]
+
+        def topic_sum(values: np.ndarray) -> np.ndarray:
+            return np.bincount(codes, weights=values, minlength=n_topics)
+
+        card_count = np.bincount(codes, minlength=n_topics)
+        total = topic_sum(cards_df["total_reviews"].to_numpy(dtype=float)[rows])
+        correct = topic_sum(cards_df["correct_reviews"].to_numpy(dtype=float)[rows])
+        review_cards = topic_sum(is_review.astype(float))
+        stability_sum = topic_sum(np.where(is_review, stability, 0.0))
+
+        # Latest review per topic. Timestamps are normalized to UTC so naive
+        # and aware values compare; NaT is int64 min, so it never wins the max
+        last_reviewed = (
+            pd.to_datetime(cards_df["last_reviewed"], utc=True)
+            .dt.tz_convert(None)
+            .to_numpy(dtype="datetime64[ns]")
+            .view("int64")[rows]
         )
+        latest = np.full(n_topics, np.iinfo(np.int64).min, dtype=np.int64)
+        np.maximum.at(latest, codes, last_reviewed)
 
-        # Compute derived metrics
-        # Use naive UTC for days_since_review to handle both naive/aware timestamps from DB
-        now_naive = datetime.now(timezone.utc).replace(tzinfo=None)
+        has_reviews = total > 0
 
-        # Success rate (None if no reviews)
-        grouped["success_rate"] = grouped.apply(
-            lambda r: (
-                r["correct_reviews"] / r["total_reviews"]
-                if r["total_reviews"] > 0
-                else None
-            ),
-            axis=1,
+        # Success rate (NaN if no reviews)
+        success_rate = np.divide(
+            correct, total, out=np.full(n_topics, np.nan), where=has_reviews
         )
 
         # Stability factor (average stability of review cards, normalized)
-        grouped["stability_factor"] = grouped.apply(
-            lambda r: (
-                min(
-                    1.0,
-                    (r["review_stability_sum"] / r["review_cards"])
-                    / settings.MASTERY_STABILITY_NORMALIZATION_DAYS,
-                )
-                if r["review_cards"] > 0
-                else 0.0
-            ),
-            axis=1,
+        avg_stability = np.divide(
+            stability_sum,
+            review_cards,
+            out=np.zeros(n_topics),
+            where=review_cards > 0,
+        )
+        stability_factor = np.minimum(
+            1.0, avg_stability / settings.MASTERY_STABILITY_NORMALIZATION_DAYS
         )
 
         # Mastery score (requires MIN_ATTEMPTS)
-        grouped["mastery_score"] = grouped.apply(
-            lambda r: (
-                (
-                    (r["success_rate"] * settings.MASTERY_SUCCESS_RATE_WEIGHT)
-                    + (r["stability_factor"] * settings.MASTERY_STABILITY_WEIGHT)
-                )
-                if r["total_reviews"] >= settings.MASTERY_MIN_ATTEMPTS
-                and r["success_rate"] is not None
-                else 0.0
-            ),
-            axis=1,
+        mastery_score = np.where(
+            has_reviews & (total >= settings.MASTERY_MIN_ATTEMPTS),
+            np.nan_to_num(success_rate) * settings.MASTERY_SUCCESS_RATE_WEIGHT
+            + stability_factor * settings.MASTERY_STABILITY_WEIGHT,
+            0.0,
         )
 
-        # Days since review (strip tz from timestamp if present for consistent comparison)
-        grouped["days_since_review"] = grouped["last_practiced"].apply(
-            lambda x: (
-                (
-                    now_naive
-                    - (
-                        x.replace(tzinfo=None)
-                        if hasattr(x, "tzinfo") and x.tzinfo
-                        else x
-                    )
-                ).days
-                if pd.notna(x)
-                else None
-            )
+        last_practiced = pd.to_datetime(latest.view("datetime64[ns]"), utc=True)
+        now = pd.Timestamp.now(tz=timezone.utc)
+
+        grouped = pd.DataFrame(
+            {
+                "total_reviews": total.astype(np.int64),
+                "correct_reviews": correct.astype(np.int64),
+                "last_practiced": last_practiced,
+                "review_cards": review_cards.astype(np.int64),
+                "review_stability_sum": stability_sum,
+                # Object dtype so topics without reviews report None
+                "success_rate": pd.array(success_rate, dtype=object),
+                "stability_factor": stability_factor,
+                "mastery_score": mastery_score,
+                # Days since review (NaN if never reviewed)
+                "days_since_review": (now - last_practiced).days,
+            },
+            index=topic_index,
         )
-
-        return grouped
+        grouped.loc[~has_reviews, "success_rate"] = None
+        return grouped[card_count > 0]
 
     async def _get_recent_snapshot(
         self,
@@ -1322,11 +1303,8 @@ class MasteryService:
         total_result = await self.db.execute(select(func.count(SpacedRepCard.id)))
         total_cards = total_result.scalar() or 0
 
-        # Count due cards (due_date <= now)
-        due_result = await self.db.execute(
-            select(func.count(SpacedRepCard.id)).where(SpacedRepCard.due_date <= now)
-        )
-        due_cards = due_result.scalar() or 0
+        # Count due cards (due_date <= now); cached briefly in Redis
+        due_cards = await SpacedRepService(self.db).count_due()
 
         # Count cards reviewed today
         reviewed_today_result = await self.db.execute(
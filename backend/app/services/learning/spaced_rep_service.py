@@ -13,6 +13,9 @@ Usage:
     # Get due cards
     due_response = await service.get_due_cards(limit=50)
 
+    # Count due cards only (cached briefly in Redis)
+    due_count = await service.count_due()
+
     # Process a review
     result = await service.review_card(CardReviewRequest(
         card_id=123,
@@ -30,6 +33,7 @@ from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models_learning import SpacedRepCard, CardReviewHistory
+from app.db.redis import RedisCache
 from app.enums.learning import CardState as CardStateEnum, Rating
 from app.models.learning import (
     CardCreate,
@@ -41,6 +45,10 @@ from app.models.learning import (
     CardStats,
 )
 from app.services.learning.fsrs import CardState, create_scheduler
+from app.services.learning.mastery_rollup import (
+    MasteryRollupService,
+    card_contribution,
+)
 from app.services.tag_service import TagService
 from app.config.settings import settings
 
@@ -58,6 +66,31 @@ _STATE_MAP = {
 
 logger = logging.getLogger(__name__)
 
+# Due-card counts keyed by topic filter; invalidated when cards change
+_due_count_cache = RedisCache(prefix="review:due_count")
+_ALL_TOPICS_KEY = "_all"
+
+
+def _topic_condition(topic: str):
+    """
+    Filter for cards tagged with a topic.
+
+    Uses the array containment operator (tags @> ARRAY[topic]) rather than
+    topic = ANY(tags), so the GIN index on tags can serve it.
+    """
+    return SpacedRepCard.tags.contains([topic])
+
+
+def _forecast_from_counts(counts: dict[str, int]) -> ReviewForecast:
+    """Build a ReviewForecast from _count_due_buckets() counts."""
+    return ReviewForecast(
+        overdue=counts["overdue"],
+        today=counts["today"],
+        tomorrow=counts["tomorrow"],
+        this_week=counts["this_week"],
+        later=counts["later"],
+    )
+
 
 class SpacedRepService:
     """
@@ -135,8 +168,10 @@ class SpacedRepService:
         )
 
         self.db.add(card)
+        await MasteryRollupService(self.db).apply_cards_created([card])
         await self.db.commit()
         await self.db.refresh(card)
+        await self._invalidate_due_counts()
 
         logger.info(f"Created card {card.id} of type {card.card_type}")
 
@@ -179,8 +214,7 @@ class SpacedRepService:
 
         # Apply filters
         if topic_filter:
-            # Match any tag that contains the topic filter
-            query = query.where(SpacedRepCard.tags.any(topic_filter))
+            query = query.where(_topic_condition(topic_filter))
 
         if card_type:
             query = query.where(SpacedRepCard.card_type == card_type)
@@ -239,8 +273,7 @@ class SpacedRepService:
 
         # Apply topic filter if provided
         if topic_filter:
-            # PostgreSQL array contains operator
-            query = query.where(SpacedRepCard.tags.any(topic_filter))
+            query = query.where(_topic_condition(topic_filter))
 
         # Get cards ordered by due date first (prioritize overdue cards)
         # but fetch more than needed for interleaving
@@ -256,24 +289,62 @@ class SpacedRepService:
         # Interleave cards by topic
         interleaved_cards = self._interleave_by_topic(cards, limit)
 
-        # Get total count of due cards
-        count_query = select(func.count(SpacedRepCard.id)).where(
-            SpacedRepCard.due_date <= now
+        # Total due count and forecast buckets in one aggregate query
+        counts = await self._count_due_buckets(topic_filter, as_of=now)
+
+        return DueCardsResponse(
+            cards=[self._to_response(c) for c in interleaved_cards],
+            total_due=counts["due_now"],
+            review_forecast=_forecast_from_counts(counts),
         )
-        if topic_filter:
-            count_query = count_query.where(SpacedRepCard.tags.any(topic_filter))
 
-        total_result = await self.db.execute(count_query)
-        total_due = total_result.scalar() or 0
+    async def count_due(self, topic_filter: Optional[str] = None) -> int:
+        """
+        Count cards due for review right now.
 
-        # Get forecast
-        forecast = await self._get_review_forecast(topic_filter)
+        Cheap alternative to get_due_cards() when only the count is needed:
+        a single COUNT query, cached in Redis for REVIEW_DUE_COUNT_CACHE_TTL
+        seconds and invalidated when a card is created or reviewed. Redis
+        errors fall back to querying the database.
 
-        return DueCardsResponse(
-            cards=[self._to_response(c) for c in interleaved_cards],
-            total_due=total_due,
-            review_forecast=forecast,
+        Args:
+            topic_filter: Optional topic tag to filter by
+
+        Returns:
+            Number of cards with due_date <= now.
+        """
+        key = topic_filter or _ALL_TOPICS_KEY
+        try:
+            cached = await _due_count_cache.get(key)
+            if cached is not None:
+                return cached
+        except Exception as e:
+            logger.debug(f"Due count cache read failed: {e}")
+
+        query = select(func.count(SpacedRepCard.id)).where(
+            SpacedRepCard.due_date <= datetime.now(timezone.utc)
         )
+        if topic_filter:
+            query = query.where(_topic_condition(topic_filter))
+
+        result = await self.db.execute(query)
+        due_count = result.scalar() or 0
+
+        try:
+            await _due_count_cache.set(
+                key, due_count, ttl=settings.REVIEW_DUE_COUNT_CACHE_TTL
+            )
+        except Exception as e:
+            logger.debug(f"Due count cache write failed: {e}")
+
+        return due_count
+
+    async def _invalidate_due_counts(self) -> None:
+        """Drop cached due counts for all topic filters."""
+        try:
+            await _due_count_cache.clear_pattern("*")
+        except Exception as e:
+            logger.debug(f"Due count cache invalidation failed: {e}")
 
     def _interleave_by_topic(
         self,
@@ -401,6 +472,7 @@ class SpacedRepService:
 
         # Process review with FSRS
         new_state, log = self.scheduler.review(card_state, request.rating)
+        contribution_before = card_contribution(card)
 
         # Update card in database (FSRS returns timezone-aware UTC datetimes)
         card.state = new_state.state.name.lower()
@@ -430,8 +502,18 @@ class SpacedRepService:
         )
         self.db.add(history_record)
 
+        # Keep mastery rollups in step, in the same transaction
+        await MasteryRollupService(self.db).apply_card_change(
+            card.tags,
+            contribution_before,
+            card_contribution(card),
+            review_seconds=request.time_spent_seconds,
+            reviewed_at=new_state.last_review,
+        )
+
         await self.db.commit()
         await self.db.refresh(card)
+        await self._invalidate_due_counts()
 
         logger.info(
             f"Reviewed card {card.id}: {log.state_before} -> {log.state_after}, "
@@ -479,69 +561,61 @@ class SpacedRepService:
             - Difficulty represents how hard a card is to learn (0-1 scale)
             - Overdue cards should be prioritized in review sessions
         """
-        # Build filter conditions (reused across all queries for consistency)
-        conditions = []
-        if topic_filter:
-            # PostgreSQL array 'any' operator: matches if tag is in the tags array
-            conditions.append(SpacedRepCard.tags.any(topic_filter))
-
-        # --- Total card count ---
-        total_query = select(func.count(SpacedRepCard.id))
-        if conditions:
-            total_query = total_query.where(*conditions)
-        total_result = await self.db.execute(total_query)
-        total_cards = total_result.scalar() or 0
-
-        # --- Cards grouped by FSRS state ---
-        # States: new (never reviewed), learning (initial phase), review (graduated),
-        # relearning (lapsed and re-entering learning)
-        state_query = select(
-            SpacedRepCard.state, func.count(SpacedRepCard.id)
-        ).group_by(SpacedRepCard.state)
-        if conditions:
-            state_query = state_query.where(*conditions)
-        state_result = await self.db.execute(state_query)
-        cards_by_state = {state: count for state, count in state_result.fetchall()}
-
-        # --- Average FSRS metrics (review cards only) ---
-        # Only review-state cards have meaningful stability/difficulty values.
-        # New and learning cards have initial/partial values that would skew averages.
-        avg_query = select(
-            func.avg(SpacedRepCard.stability), func.avg(SpacedRepCard.difficulty)
-        ).where(SpacedRepCard.state == CardStateEnum.REVIEW.value)
-        if conditions:
-            avg_query = avg_query.where(*conditions)
-        avg_result = await self.db.execute(avg_query)
-        avg_row = avg_result.fetchone()
-        avg_stability = avg_row[0] or 0.0  # Days until 90% retention drops to ~90%
-        avg_difficulty = avg_row[1] or 0.0  # 0 = easy, 1 = hard
-
         # --- Time boundaries for due/overdue calculations ---
         now = datetime.now(timezone.utc)
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         tomorrow_start = today_start + timedelta(days=1)
 
-        # --- Cards due today (between start of today and start of tomorrow) ---
-        due_today_query = select(func.count(SpacedRepCard.id)).where(
-            and_(
-                SpacedRepCard.due_date >= today_start,
-                SpacedRepCard.due_date < tomorrow_start,
+        is_review = SpacedRepCard.state == CardStateEnum.REVIEW.value
+
+        # All statistics come from one conditional-aggregate query:
+        # - total card count
+        # - cards per FSRS state: new (never reviewed), learning (initial
+        #   phase), review (graduated), relearning (lapsed)
+        # - average FSRS metrics over review cards only; new and learning
+        #   cards have initial/partial values that would skew averages
+        # - due today (start of today to start of tomorrow) and overdue (due
+        #   before start of today, a review backlog to prioritize)
+        query = select(
+            func.count().label("total"),
+            *(
+                func.count()
+                .filter(SpacedRepCard.state == state.value)
+                .label(state.value)
+                for state in CardStateEnum
+            ),
+            func.avg(SpacedRepCard.stability).filter(is_review).label("avg_stability"),
+            func.avg(SpacedRepCard.difficulty)
+            .filter(is_review)
+            .label("avg_difficulty"),
+            func.count()
+            .filter(
+                and_(
+                    SpacedRepCard.due_date >= today_start,
+                    SpacedRepCard.due_date < tomorrow_start,
+                )
             )
+            .label("due_today"),
+            func.count()
+            .filter(SpacedRepCard.due_date < today_start)
+            .label("overdue"),
         )
-        if conditions:
-            due_today_query = due_today_query.where(*conditions)
-        due_today_result = await self.db.execute(due_today_query)
-        due_today = due_today_result.scalar() or 0
-
-        # --- Overdue cards (due before start of today) ---
-        # These represent a review backlog and should be prioritized
-        overdue_query = select(func.count(SpacedRepCard.id)).where(
-            SpacedRepCard.due_date < today_start
-        )
-        if conditions:
-            overdue_query = overdue_query.where(*conditions)
-        overdue_result = await self.db.execute(overdue_query)
-        overdue = overdue_result.scalar() or 0
+        if topic_filter:
+            query = query.where(_topic_condition(topic_filter))
+
+        result = await self.db.execute(query)
+        stats = result.mappings().one()
+
+        total_cards = stats["total"] or 0
+        cards_by_state = {
+            state.value: stats[state.value]
+            for state in CardStateEnum
+            if stats[state.value]
+        }
+        avg_stability = stats["avg_stability"] or 0.0  # Memory strength in days
+        avg_difficulty = stats["avg_difficulty"] or 0.0  # 0 = easy, 1 = hard
+        due_today = stats["due_today"] or 0
+        overdue = stats["overdue"] or 0
 
         return CardStats(
             total_cards=total_cards,
@@ -552,43 +626,7 @@ class SpacedRepService:
             overdue=overdue,
         )
 
-    async def _count_cards_in_date_range(
-        self,
-        start: Optional[datetime],
-        end: Optional[datetime],
-        extra_conditions: Optional[list] = None,
-    ) -> int:
-        """
-        Count cards with due_date in a given range.
-
-        Args:
-            start: Inclusive lower bound (None = no lower bound)
-            end: Exclusive upper bound (None = no upper bound)
-            extra_conditions: Additional SQLAlchemy filter conditions (e.g., topic filter)
-
-        Returns:
-            Count of cards matching the date range and conditions.
-        """
-        query = select(func.count(SpacedRepCard.id))
-
-        # Build date range filter
-        if start is not None and end is not None:
-            query = query.where(
-                and_(SpacedRepCard.due_date >= start, SpacedRepCard.due_date < end)
-            )
-        elif start is not None:
-            query = query.where(SpacedRepCard.due_date >= start)
-        elif end is not None:
-            query = query.where(SpacedRepCard.due_date < end)
-
-        # Apply extra conditions (e.g., topic filter)
-        if extra_conditions:
-            query = query.where(*extra_conditions)
-
-        result = await self.db.execute(query)
-        return result.scalar() or 0
-
-    async def _get_review_forecast(
+    async def get_review_forecast(
         self,
         topic_filter: Optional[str] = None,
     ) -> ReviewForecast:
@@ -623,33 +661,57 @@ class SpacedRepService:
             All time calculations use UTC and calendar day boundaries
             (midnight to midnight) for consistency.
         """
+        counts = await self._count_due_buckets(topic_filter)
+        return _forecast_from_counts(counts)
+
+    async def _count_due_buckets(
+        self,
+        topic_filter: Optional[str] = None,
+        as_of: Optional[datetime] = None,
+    ) -> dict[str, int]:
+        """
+        Count cards per forecast bucket, plus cards due right now.
+
+        Runs a single query with one COUNT(*) FILTER (WHERE ...) per bucket
+        instead of one COUNT query per bucket.
+
+        Args:
+            topic_filter: Optional topic tag to filter by.
+            as_of: Reference time (defaults to now, UTC).
+
+        Returns:
+            Dict with due_now, overdue, today, tomorrow, this_week and later.
+        """
         # Define time boundaries (all calculations use UTC)
-        now = datetime.now(timezone.utc)
+        now = as_of or datetime.now(timezone.utc)
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         tomorrow_start = today_start + timedelta(days=1)
         day_after_tomorrow = tomorrow_start + timedelta(days=1)
         week_end = today_start + timedelta(days=7)
 
-        # Build topic filter condition (reused across all queries)
-        conditions = [SpacedRepCard.tags.any(topic_filter)] if topic_filter else None
+        due = SpacedRepCard.due_date
 
-        # Count cards in each time bucket using date range helper
         # Ranges use [start, end) notation: inclusive start, exclusive end
-        return ReviewForecast(
-            overdue=await self._count_cards_in_date_range(
-                None, today_start, conditions
-            ),
-            today=await self._count_cards_in_date_range(
-                today_start, tomorrow_start, conditions
-            ),
-            tomorrow=await self._count_cards_in_date_range(
-                tomorrow_start, day_after_tomorrow, conditions
-            ),
-            this_week=await self._count_cards_in_date_range(
-                day_after_tomorrow, week_end, conditions
-            ),
-            later=await self._count_cards_in_date_range(week_end, None, conditions),
+        buckets = {
+            "due_now": due <= now,
+            "overdue": due < today_start,
+            "today": and_(due >= today_start, due < tomorrow_start),
+            "tomorrow": and_(due >= tomorrow_start, due < day_after_tomorrow),
+            "this_week": and_(due >= day_after_tomorrow, due < week_end),
+            "later": due >= week_end,
+        }
+        query = select(
+            *(
+                func.count().filter(condition).label(name)
+                for name, condition in buckets.items()
+            )
         )
+        if topic_filter:
+            query = query.where(_topic_condition(topic_filter))
+
+        result = await self.db.execute(query)
+        row = result.mappings().one()
+        return {name: row[name] or 0 for name in buckets}
 
     def _to_response(self, card: SpacedRepCard) -> CardResponse:
         """Convert database model to response model."""
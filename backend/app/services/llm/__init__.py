@@ -5,7 +5,9 @@ Provides a unified interface to multiple LLM providers via LiteLLM.
 Supports operation-based model selection and cost tracking.
 
 Key Components:
-- client.py: LLMClient class with async/sync completion and embedding methods
+- client.py: LLMClient class with async/sync/streaming completion and embedding methods
+- cache.py: Opt-in content-addressed response cache used by LLMClient.complete()
+- embeddings.py: EmbeddingService (cached, batched, per-run memoized embeddings)
 
 All methods return (response, LLMUsage) tuples for consistent cost tracking.
 
@@ -26,6 +28,7 @@ Usage:
 from app.models.llm_usage import LLMUsage
 from app.services.llm.client import (
     LLMClient,
+    LLMStream,
     get_llm_client,
     reset_llm_client,
     get_default_text_model,
@@ -34,6 +37,7 @@ from app.services.llm.client import (
 
 __all__ = [
     "LLMClient",
+    "LLMStream",
     "LLMUsage",
     "get_llm_client",
     "reset_llm_client",
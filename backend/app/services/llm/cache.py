@@ -0,0 +1,290 @@
+"""
+Content-Addressed LLM Response Cache
+
+Opt-in cache for LLMClient.complete(). Responses are stored under a SHA-256
+hash of the request (model, messages and generation params), so identical
+requests, e.g. reprocessing after cleanup_before_reprocessing, test re-runs or
+re-ingested articles, are answered without calling the provider.
+
+Backends:
+    - redis: Shared across API and workers. Entries expire via TTL (refreshed
+      on each hit); size is bounded by the server's maxmemory-policy
+      (use allkeys-lru).
+    - disk: One JSON file per entry under LLM_CACHE_DIR. Entries expire via
+      TTL; the least recently used entries are evicted beyond
+      LLM_CACHE_MAX_ENTRIES.
+
+Enablement:
+    LLM_CACHE_ENABLED turns the cache on; LLM_CACHE_OPERATIONS restricts it to
+    specific PipelineOperation values. Callers can also force it per request
+    with complete(..., cache=True/False).
+
+Cost Tracking:
+    A cache hit returns an LLMUsage with zero tokens and cost and
+    cached=True, so CostTracker reports only count money actually spent while
+    still showing how many calls the cache saved.
+
+Cache failures never fail a completion: backend errors are logged and treated
+as misses.
+
+Usage:
+    from app.services.llm.cache import get_response_cache, make_cache_key
+
+    cache = get_response_cache()
+    if cache.enabled_for(operation):
+        key = make_cache_key(model, messages, {"temperature": 0.3})
+        hit = await cache.get(key)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional, Protocol, Union
+
+from app.config.settings import settings
+from app.enums.pipeline import PipelineOperation
+
+logger = logging.getLogger(__name__)
+
+# Redis key namespace for cached responses
+REDIS_KEY_PREFIX = "llm_cache"
+
+# Disk eviction (a directory scan) runs once every
+# LLM_CACHE_MAX_ENTRIES * DISK_EVICTION_FRACTION writes rather than on every write
+DISK_EVICTION_FRACTION = 0.1
+
+
+def make_cache_key(model: str, messages: list[dict], params: dict[str, Any]) -> str:
+    """
+    Build the content-addressed key for a completion request.
+
+    Args:
+        model: Resolved model identifier
+        messages: Chat messages in OpenAI format
+        params: Generation parameters that affect the output (temperature,
+            max_tokens, json_mode, ...)
+
+    Returns:
+        Hex SHA-256 of the canonical JSON encoding of the request
+    """
+    payload = json.dumps(
+        {"model": model, "messages": messages, "params": params},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Storage backend for cached responses (JSON-serializable dicts)."""
+
+    async def get(self, key: str) -> Optional[dict]:
+        ...
+
+    async def set(self, key: str, value: dict) -> None:
+        ...
+
+
+class RedisCacheBackend:
+    """
+    Redis-backed response cache with sliding TTL.
+
+    Uses the shared app.db.redis pool; in Celery tasks run_async() closes it
+    before each task's event loop ends, so every task gets live connections.
+    """
+
+    def __init__(self, ttl_seconds: int, prefix: str = REDIS_KEY_PREFIX):
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def get(self, key: str) -> Optional[dict]:
+        from app.db.redis import get_redis
+
+        r = await get_redis()
+        raw = await r.get(self._key(key))
+        if raw is None:
+            return None
+        # Sliding expiration keeps frequently used entries alive
+        await r.expire(self._key(key), self.ttl_seconds)
+        return json.loads(raw)
+
+    async def set(self, key: str, value: dict) -> None:
+        from app.db.redis import get_redis
+
+        r = await get_redis()
+        await r.setex(self._key(key), self.ttl_seconds, json.dumps(value))
+
+
+class DiskCacheBackend:
+    """
+    File-per-entry response cache with TTL and LRU eviction.
+
+    Entry files are sharded by the first two hex characters of the key. The
+    file mtime records the last access and drives both expiry and LRU order.
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], ttl_seconds: int, max_entries: int
+    ):
+        self.directory = Path(directory).expanduser()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._writes_since_evict = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if age > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        value = json.loads(path.read_text(encoding="utf-8"))
+        os.utime(path)  # Mark as recently used
+        return value
+
+    def _write(self, key: str, value: dict) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(value), encoding="utf-8")
+        tmp.replace(path)
+
+        self._writes_since_evict += 1
+        if self._writes_since_evict >= max(
+            1, int(self.max_entries * DISK_EVICTION_FRACTION)
+        ):
+            self._writes_since_evict = 0
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop expired entries, then the least recently used ones above the limit.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self.directory.glob("*/*.json"):
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if now - mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((mtime, path))
+
+        overflow = len(entries) - self.max_entries
+        if overflow > 0:
+            entries.sort()
+            for _, path in entries[:overflow]:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    async def get(self, key: str) -> Optional[dict]:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: dict) -> None:
+        await asyncio.to_thread(self._write, key, value)
+
+
+class LLMResponseCache:
+    """
+    Facade over a cache backend with per-operation enablement.
+
+    Attributes:
+        enabled: Global switch (LLM_CACHE_ENABLED)
+        operations: Operation values to cache; empty means all operations
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        enabled: bool = True,
+        operations: Optional[list[str]] = None,
+    ):
+        self.backend = backend
+        self.enabled = enabled
+        self.operations = {op.upper() for op in operations or []}
+
+    def enabled_for(
+        self,
+        operation: Union[PipelineOperation, str],
+        override: Optional[bool] = None,
+    ) -> bool:
+        """
+        Whether responses for this operation should be cached.
+
+        Args:
+            operation: The completion's operation
+            override: Per-request setting; takes precedence when not None
+        """
+        if override is not None:
+            return override
+        if not self.enabled:
+            return False
+        if not self.operations:
+            return True
+        value = getattr(operation, "value", operation)
+        return str(value).upper() in self.operations
+
+    async def get(self, key: str) -> Optional[dict]:
+        """Look up a cached response (backend errors count as a miss)."""
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    async def set(self, key: str, value: dict) -> None:
+        """Store a response (backend errors are logged and ignored)."""
+        try:
+            await self.backend.set(key, value)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+
+_response_cache: Optional[LLMResponseCache] = None
+
+
+def get_response_cache() -> LLMResponseCache:
+    """Get the process-wide response cache configured from settings."""
+    global _response_cache
+    if _response_cache is None:
+        if settings.LLM_CACHE_BACKEND == "disk":
+            backend: CacheBackend = DiskCacheBackend(
+                settings.LLM_CACHE_DIR,
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            )
+        else:
+            backend = RedisCacheBackend(ttl_seconds=settings.LLM_CACHE_TTL_SECONDS)
+        _response_cache = LLMResponseCache(
+            backend,
+            enabled=settings.LLM_CACHE_ENABLED,
+            operations=settings.LLM_CACHE_OPERATIONS_LIST,
+        )
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Reset the response cache singleton (e.g., after changing settings)."""
+    global _response_cache
+    _response_cache = None
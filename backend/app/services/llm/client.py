@@ -31,27 +31,43 @@ Usage:
         messages=[...]
     )
 
+    # Streaming completion (usage is available once the stream is exhausted)
+    stream = client.stream(
+        operation=PipelineOperation.CONTENT_ANALYSIS,
+        messages=[...],
+    )
+    async for token in stream:
+        print(token, end="")
+    print(f"Cost: ${stream.usage.cost_usd:.4f}")
+
     # Generate embeddings
     embeddings, usage = await client.embed(["text1", "text2"])
+
+Response Cache:
+    complete() can serve identical requests from the content-addressed
+    response cache (see app/services/llm/cache.py). It is opt-in via
+    LLM_CACHE_ENABLED / LLM_CACHE_OPERATIONS or per call with cache=True.
+    Hits return a zero-cost LLMUsage with cached=True.
 """
 
 import json
 import logging
 import os
 import time
-from typing import Any, Optional, Union
+from typing import Any, AsyncIterator, Optional, Union
 
-import litellm
-from litellm import acompletion, aembedding, completion, embedding
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.config.settings import settings
+from app.lazy_imports import lazy_callable, lazy_import
 from app.enums.pipeline import PipelineName, PipelineOperation
 from app.models.llm_usage import (
     LLMUsage,
+    extract_provider,
     extract_usage_from_response,
     create_error_usage,
 )
+from app.services.llm.cache import get_response_cache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -71,8 +87,18 @@ DEFAULT_TEMPERATURE = 0.3
 DEFAULT_MAX_TOKENS = 4096
 
 
-# Configure LiteLLM
-litellm.drop_params = True  # Drop unsupported params instead of erroring
+def _configure_litellm(module) -> None:
+    """Configure LiteLLM when it is first imported."""
+    module.drop_params = True  # Drop unsupported params instead of erroring
+
+
+# LiteLLM is imported on first use (see app.lazy_imports)
+litellm = lazy_import("litellm", on_load=_configure_litellm)
+acompletion = lazy_callable("litellm", "acompletion")
+aembedding = lazy_callable("litellm", "aembedding")
+completion = lazy_callable("litellm", "completion")
+embedding = lazy_callable("litellm", "embedding")
+
 if settings.DEBUG:
     os.environ["LITELLM_LOG"] = "DEBUG"
 
@@ -124,6 +150,96 @@ def _adjust_temperature_for_model(model: str, temperature: float) -> float:
     return temperature
 
 
+class LLMStream:
+    """
+    Async iterator over the text deltas of a streamed completion.
+
+    The request is sent when iteration starts. Once the stream is exhausted,
+    `text` holds the full response and `usage` the LLMUsage built from the
+    collected chunks (token counts from the final usage chunk where the
+    provider sends one, cost computed by LiteLLM).
+
+    Streams are not retried: a failure after tokens were emitted cannot be
+    replayed transparently, so errors are tracked and re-raised to the caller.
+    """
+
+    def __init__(
+        self,
+        kwargs: dict[str, Any],
+        pipeline: Optional[Union[PipelineName, str]] = None,
+        content_id: Optional[str] = None,
+        operation: Optional[Union[PipelineOperation, str]] = None,
+    ):
+        self._kwargs = kwargs
+        self._pipeline = pipeline
+        self._content_id = content_id
+        self._operation = operation
+        self.text = ""
+        self.usage: Optional[LLMUsage] = None
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        model = self._kwargs["model"]
+        chunks = []
+        parts: list[str] = []
+        start_time = time.perf_counter()
+
+        try:
+            response = await acompletion(
+                **self._kwargs,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async for chunk in response:
+                chunks.append(chunk)
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            latency_ms = int((time.perf_counter() - start_time) * 1000)
+            logger.error(f"LLM stream failed: {e} (model={model})")
+            create_error_usage(
+                model=model,
+                request_type="text",
+                latency_ms=latency_ms,
+                error_message=str(e),
+                pipeline=self._pipeline,
+                content_id=self._content_id,
+                operation=self._operation,
+            )
+            raise
+
+        latency_ms = int((time.perf_counter() - start_time) * 1000)
+        self.text = "".join(parts)
+
+        # Rebuild a complete response from the chunks for usage extraction
+        complete_response = litellm.stream_chunk_builder(
+            chunks, messages=self._kwargs["messages"]
+        )
+        self.usage = extract_usage_from_response(
+            response=complete_response,
+            model=model,
+            request_type="text",
+            latency_ms=latency_ms,
+            pipeline=self._pipeline,
+            content_id=self._content_id,
+            operation=self._operation,
+        )
+        if self.usage.cost_usd is None and complete_response is not None:
+            try:
+                self.usage.cost_usd = litellm.completion_cost(
+                    completion_response=complete_response, model=model
+                )
+            except Exception as e:
+                logger.debug(f"Could not compute stream cost for {model}: {e}")
+
+        if self.usage.cost_usd:
+            logger.debug(
+                f"LLM stream [{model}] - Cost: ${self.usage.cost_usd:.4f}, "
+                f"Tokens: {self.usage.total_tokens}, Latency: {latency_ms}ms"
+            )
+
+
 class LLMClient:
     """
     Unified LLM client with operation-based model selection and usage tracking.
@@ -222,6 +338,7 @@ class LLMClient:
         pipeline: Optional[Union[PipelineName, str]] = None,
         content_id: Optional[str] = None,
         model: Optional[str] = None,
+        cache: Optional[bool] = None,
     ) -> tuple[Union[str, Any], LLMUsage]:
         """
         Generate a completion using the appropriate model for the operation.
@@ -238,6 +355,8 @@ class LLMClient:
             pipeline: PipelineName enum for cost attribution (which pipeline)
             content_id: Content UUID for cost attribution
             model: Optional model override (bypasses operation-based selection)
+            cache: Use the response cache for this call (True/False), or None to
+                follow LLM_CACHE_ENABLED / LLM_CACHE_OPERATIONS
 
         Returns:
             Tuple of (response_text or parsed JSON if json_mode, LLMUsage)
@@ -250,6 +369,40 @@ class LLMClient:
         model = model or self.get_model_for_operation(operation)
         adjusted_temp = _adjust_temperature_for_model(model, temperature)
 
+        response_cache = get_response_cache()
+        cache_key = None
+        if response_cache.enabled_for(operation, override=cache):
+            cache_key = make_cache_key(
+                model,
+                messages,
+                {
+                    "temperature": adjusted_temp,
+                    "max_tokens": max_tokens,
+                    "json_mode": json_mode,
+                },
+            )
+            lookup_start = time.perf_counter()
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit [{model}] for {operation}")
+                content = cached["content"]
+                if json_mode:
+                    content = json.loads(content)
+                return content, LLMUsage(
+                    model=model,
+                    provider=extract_provider(model),
+                    request_type="text",
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    total_tokens=0,
+                    cost_usd=0.0,
+                    latency_ms=int((time.perf_counter() - lookup_start) * 1000),
+                    pipeline=pipeline,
+                    content_id=content_id,
+                    operation=operation,
+                    cached=True,
+                )
+
         kwargs = {
             "model": model,
             "messages": messages,
@@ -282,11 +435,16 @@ class LLMClient:
                     f"Tokens: {usage.total_tokens}, Latency: {latency_ms}ms"
                 )
 
-            content = response.choices[0].message.content
+            raw_content = response.choices[0].message.content
+            content = raw_content
 
             if json_mode:
                 # JSONDecodeError will trigger @retry
-                content = json.loads(content)
+                content = json.loads(raw_content)
+
+            # Only cache responses that parsed successfully
+            if cache_key is not None and raw_content is not None:
+                await response_cache.set(cache_key, {"content": raw_content})
 
             return content, usage
 
@@ -310,6 +468,48 @@ class LLMClient:
             )
             raise
 
+    def stream(
+        self,
+        operation: Union[PipelineOperation, str],
+        messages: list[dict],
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        pipeline: Optional[Union[PipelineName, str]] = None,
+        content_id: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> LLMStream:
+        """
+        Stream a completion, yielding text deltas as they arrive.
+
+        Streamed responses bypass the response cache and are not retried.
+
+        Args:
+            operation: PipelineOperation enum specifying the operation type.
+                Used for both model selection and cost attribution.
+            messages: Chat messages in OpenAI format
+            temperature: Sampling temperature (0-1, lower = more deterministic)
+            max_tokens: Maximum tokens in response
+            pipeline: PipelineName enum for cost attribution (which pipeline)
+            content_id: Content UUID for cost attribution
+            model: Optional model override (bypasses operation-based selection)
+
+        Returns:
+            LLMStream to iterate; its `text` and `usage` are set once exhausted
+        """
+        model = model or self.get_model_for_operation(operation)
+        kwargs = {
+            "model": model,
+            "messages": messages,
+            "temperature": _adjust_temperature_for_model(model, temperature),
+            "max_tokens": max_tokens,
+        }
+        return LLMStream(
+            kwargs,
+            pipeline=pipeline,
+            content_id=content_id,
+            operation=operation,
+        )
+
     @retry(
         stop=stop_after_attempt(LLM_RETRY_ATTEMPTS),
         wait=wait_exponential(
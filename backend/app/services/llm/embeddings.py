@@ -0,0 +1,238 @@
+"""
+Embedding Service
+
+Wraps LLMClient.embed() with three layers that cut embedding round trips:
+
+    1. Run memo: vectors computed during this service's lifetime are reused,
+       so the title+summary text embedded for connection discovery is not
+       embedded again when Neo4j nodes are created.
+    2. Persistent cache: vectors are stored under a SHA-256 of (model, text)
+       in the same Redis/disk backends as the LLM response cache
+       (EMBEDDING_CACHE_ENABLED). Embeddings are deterministic, so entries
+       never go stale for a given model.
+    3. Coalescing: embed() calls issued concurrently are queued and sent as a
+       single batched aembedding request, split at EMBEDDING_MAX_BATCH_SIZE
+       inputs to stay within the provider's limit.
+
+Create one service per pipeline run (or request) and pass it to every stage
+that embeds; usages from the batched provider calls accumulate on
+service.usages for cost logging.
+
+Usage:
+    from app.services.llm.embeddings import EmbeddingService
+
+    service = EmbeddingService(get_llm_client(), content_id=content.id)
+    vectors = await service.embed_many([content_text, *concept_texts])
+    all_usages.extend(service.usages)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional, Union
+
+from app.config.settings import settings
+from app.enums.pipeline import PipelineName, PipelineOperation
+from app.services.llm.cache import (
+    CacheBackend,
+    DiskCacheBackend,
+    LLMResponseCache,
+    RedisCacheBackend,
+)
+from app.services.llm.client import LLMClient, LLMUsage
+
+logger = logging.getLogger(__name__)
+
+# Redis key namespace for cached embedding vectors
+EMBEDDING_REDIS_KEY_PREFIX = "embedding_cache"
+
+
+def make_embedding_key(model: str, text: str) -> str:
+    """Hex SHA-256 identifying the embedding of `text` under `model`."""
+    return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+
+class EmbeddingService:
+    """
+    Cached, coalescing front end to LLMClient.embed().
+
+    Attributes:
+        usages: LLMUsage of every provider call made by this service
+        max_batch_size: Maximum number of texts per provider request
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        cache: Optional[LLMResponseCache] = None,
+        max_batch_size: Optional[int] = None,
+        pipeline: Optional[Union[PipelineName, str]] = None,
+        content_id: Optional[str] = None,
+    ):
+        """
+        Initialize the embedding service.
+
+        Args:
+            llm_client: Client used for provider calls
+            cache: Persistent vector cache (defaults to get_embedding_cache())
+            max_batch_size: Texts per request (defaults to EMBEDDING_MAX_BATCH_SIZE)
+            pipeline: PipelineName for cost attribution
+            content_id: Content UUID for cost attribution
+        """
+        self.llm_client = llm_client
+        self.cache = cache if cache is not None else get_embedding_cache()
+        self.max_batch_size = max(
+            1, max_batch_size or settings.EMBEDDING_MAX_BATCH_SIZE
+        )
+        self.pipeline = pipeline
+        self.content_id = content_id
+        self.usages: list[LLMUsage] = []
+
+        self._model = llm_client.get_model_for_operation(
+            PipelineOperation.EMBEDDINGS
+        )
+        self._memo: dict[str, asyncio.Future] = {}
+        self._pending: dict[str, str] = {}  # key -> text awaiting the next flush
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed a single text (coalesced with other concurrent calls)."""
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed several texts, reusing memoized and cached vectors.
+
+        A vector the provider failed to return comes back as an empty list, so
+        callers can skip it the same way they handle an empty embed() result.
+
+        Raises:
+            Exception: Provider errors are propagated to every waiting caller
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            key = make_embedding_key(self._model, text)
+            future = self._memo.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._memo[key] = future
+                self._pending[key] = text
+            futures.append(future)
+
+        if self._pending and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        return list(await asyncio.gather(*futures))
+
+    async def _flush(self) -> None:
+        """Resolve all pending texts from the cache or batched provider calls."""
+        # Let callers scheduled in the same tick enqueue their texts first
+        await asyncio.sleep(0)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+
+        try:
+            misses = await self._resolve_from_cache(pending)
+            items = list(misses.items())
+            for start in range(0, len(items), self.max_batch_size):
+                await self._embed_batch(items[start : start + self.max_batch_size])
+        except Exception as e:
+            for key in pending:
+                future = self._memo.get(key)
+                if future is not None and not future.done():
+                    del self._memo[key]
+                    future.set_exception(e)
+            return
+
+        # Later callers may have queued more texts while we awaited I/O
+        if self._pending and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+
+    async def _resolve_from_cache(self, pending: dict[str, str]) -> dict[str, str]:
+        """Resolve cached vectors and return the texts still to embed."""
+        if not self.cache.enabled:
+            return pending
+        misses: dict[str, str] = {}
+        for key, text in pending.items():
+            hit = await self.cache.get(key)
+            if hit and hit.get("embedding"):
+                self._memo[key].set_result(hit["embedding"])
+            else:
+                misses[key] = text
+        return misses
+
+    async def _embed_batch(self, batch: list[tuple[str, str]]) -> None:
+        """Embed one provider-sized batch and resolve its futures."""
+        embeddings, usage = await self.llm_client.embed(
+            [text for _, text in batch],
+            pipeline=self.pipeline,
+            content_id=self.content_id,
+        )
+        self.usages.append(usage)
+
+        if len(embeddings) != len(batch):
+            logger.warning(
+                f"Embedding provider returned {len(embeddings)} vectors "
+                f"for {len(batch)} inputs"
+            )
+        for index, (key, _) in enumerate(batch):
+            vector = embeddings[index] if index < len(embeddings) else []
+            future = self._memo.get(key)
+            if vector and self.cache.enabled:
+                await self.cache.set(key, {"embedding": vector})
+            elif not vector:
+                # Don't memoize failures; a later call may succeed
+                self._memo.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(vector)
+
+
+def content_embedding_text(title: str, summary: Optional[str]) -> str:
+    """
+    Text embedded for a content item (connection discovery and Neo4j node).
+
+    Both stages must embed the exact same string for the run memo and the
+    persistent cache to serve the second request.
+    """
+    from app.config.processing import processing_settings
+
+    summary = (summary or title)[: processing_settings.CONNECTION_EMBEDDING_TRUNCATE]
+    return f"{title}\n\n{summary}"
+
+
+def concept_embedding_text(name: str, definition: str) -> str:
+    """Text embedded for a concept node."""
+    return f"{name}: {definition}"
+
+
+_embedding_cache: Optional[LLMResponseCache] = None
+
+
+def get_embedding_cache() -> LLMResponseCache:
+    """Get the process-wide embedding vector cache configured from settings."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        if settings.LLM_CACHE_BACKEND == "disk":
+            backend: CacheBackend = DiskCacheBackend(
+                Path(settings.LLM_CACHE_DIR) / "embeddings",
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            )
+        else:
+            backend = RedisCacheBackend(
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                prefix=EMBEDDING_REDIS_KEY_PREFIX,
+            )
+        _embedding_cache = LLMResponseCache(
+            backend, enabled=settings.EMBEDDING_CACHE_ENABLED
+        )
+    return _embedding_cache
+
+
+def reset_embedding_cache() -> None:
+    """Reset the embedding cache singleton (e.g., after changing settings)."""
+    global _embedding_cache
+    _embedding_cache = None
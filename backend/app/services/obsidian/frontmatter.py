@@ -146,6 +146,12 @@ async def parse_frontmatter_file(path: Path) -> tuple[dict, str]:
     return await parse_frontmatter(content)
 
 
+def load_frontmatter_file(path: Path) -> tuple[dict, str]:
+    """Parse frontmatter from a markdown file (blocking; for worker threads)."""
+    post = frontmatter.loads(path.read_text(encoding="utf-8"))
+    return dict(post.metadata), post.content
+
+
 async def update_frontmatter(
     path: Path, updates: dict[str, Any], remove_keys: list[str] | None = None
 ) -> None:
@@ -11,31 +11,51 @@ Architecture:
     startup_vault_services()
             |
             +---> VaultManager (validates vault path)
-            +---> VaultSyncService.reconcile_on_startup() (sync offline changes)
             +---> VaultWatcher.start() (begin real-time monitoring)
+            +---> background task (app starts serving immediately):
+                      NoteIndexService.rebuild() (mtime-validate note index)
+                      VaultSyncService.reconcile_on_startup() (offline changes)
             |
     [Application Running - watcher syncs changes to Neo4j]
             |
             V
     shutdown_vault_services()
             |
+            +---> cancel background reconciliation if still running
             +---> VaultWatcher.stop()
-            +---> VaultSyncService._update_last_sync_time()
+            +---> VaultSyncService._update_last_sync_time() (only if
+                  reconciliation completed)
 
 Startup Sequence:
     1. Validate vault path exists (via VaultManager)
-    2. Run reconciliation to sync notes modified while app was offline
-    3. Start file watcher for real-time change detection
-    4. Watcher calls sync_note() on file changes (debounced)
+    2. Start file watcher for real-time change detection
+    3. Watcher queues one sync_vault_notes task per chunk of each debounce
+       window (VaultSyncService.sync_notes() in the worker)
+    4. In the background: bring the note metadata index (vault_notes) in
+       line with the vault, then sync notes modified while app was offline
+
+    The watcher starts before reconciliation so edits made while
+    reconciliation runs are still picked up; notes touched by both are
+    skipped by the content-hash check.
+
+Readiness:
+    get_startup_status() reports the background phase ("not_started",
+    "pending", "indexing", "reconciling", "ready", "failed",
+    "not_configured") and is_vault_ready() is False until it finishes. Progress is on
+    GET /api/vault/sync/status; GET /api/health/ready returns 503 meanwhile,
+    and vault/knowledge routes keep serving (possibly stale) data with an
+    X-Vault-Reconciling header.
 
 Configuration (from settings):
     - VAULT_WATCH_ENABLED: Enable/disable file system monitoring
     - VAULT_SYNC_NEO4J_ENABLED: Enable/disable Neo4j synchronization
     - VAULT_SYNC_DEBOUNCE_MS: Debounce delay for rapid file changes
+    - VAULT_SYNC_TASK_BATCH_SIZE: Maximum paths per queued sync task
 
 Thread Safety:
-    Module-level state (_vault_watcher, _sync_service) is managed by
-    FastAPI's lifespan context, which runs startup/shutdown sequentially.
+    Module-level state (_vault_watcher, _sync_service, _startup_task) is
+    managed by FastAPI's lifespan context, which runs startup/shutdown
+    sequentially. The background task only runs on the main event loop.
     The watcher runs in a background thread but schedules async work
     via asyncio.create_task() in the main event loop.
 
@@ -57,6 +77,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from app.config.settings import settings
@@ -72,6 +93,15 @@ logger = logging.getLogger(__name__)
 _vault_watcher: VaultWatcher | None = None
 _sync_service: VaultSyncService | None = None
 
+# Background note index rebuild + reconciliation started by startup
+_startup_task: asyncio.Task | None = None
+_startup_phase: str = "not_started"
+_startup_error: str | None = None
+_startup_results: dict = {}
+
+# Phases in which startup work is still running
+STARTUP_PENDING_PHASES = ("pending", "indexing", "reconciling")
+
 
 async def startup_vault_services() -> dict:
     """
@@ -80,13 +110,20 @@ async def startup_vault_services() -> dict:
     This function is called during FastAPI startup to establish the connection
     between the Obsidian vault and the Neo4j knowledge graph. It performs:
 
-    1. **Reconciliation**: Syncs notes that were modified while the app was
-       offline. Compares file modification times against the last sync time
-       stored in PostgreSQL (SystemMeta table).
-
-    2. **Watcher Start**: Begins real-time file system monitoring. When users
+    1. **Watcher Start**: Begins real-time file system monitoring. When users
        edit notes in Obsidian, changes are automatically synced to Neo4j.
 
+    2. **Background Startup Task** (not awaited, see _run_startup_sync):
+       - Note Index Rebuild: Re-indexes notes whose mtime/size changed since
+         they were last indexed and drops rows for deleted notes, so the note
+         browser never has to walk the vault.
+       - Reconciliation: Syncs notes that were modified while the app was
+         offline. Compares file modification times against the last sync
+         time stored in PostgreSQL (SystemMeta table).
+
+    It returns as soon as the watcher is running, so the API starts serving
+    without waiting for reconciliation.
+
     The function is designed to fail gracefully:
     - If the vault path doesn't exist, it logs a warning and returns
     - If Neo4j is unavailable, sync operations are skipped
@@ -94,15 +131,18 @@ async def startup_vault_services() -> dict:
 
     Returns:
         Dict containing:
-            - reconciliation: Result dict from reconcile_on_startup() or None
+            - background_sync_started: True if the background task was started
             - watcher_started: Boolean indicating if watcher is running
             - vault_path: String path to the vault or None if not configured
+        Note index and reconciliation results are reported later via
+        get_startup_status().
 
     Raises:
         Exception: Only for unexpected errors; vault/Neo4j unavailability
                    is handled gracefully with warnings.
     """
-    global _vault_watcher, _sync_service
+    global _vault_watcher, _sync_service, _startup_task
+    global _startup_phase, _startup_error, _startup_results
 
     # Import here to avoid circular imports
     from app.services.obsidian.vault import get_vault_manager
@@ -110,70 +150,121 @@ async def startup_vault_services() -> dict:
     from app.services.obsidian.watcher import VaultWatcher
 
     results = {
-        "reconciliation": None,
+        "background_sync_started": False,
         "watcher_started": False,
         "vault_path": None,
     }
+    _startup_phase = "pending"
+    _startup_error = None
+    _startup_results = {"note_index": None, "reconciliation": None}
 
     # Check if vault sync is enabled
     vault_sync_enabled = getattr(settings, "VAULT_SYNC_NEO4J_ENABLED", True)
     vault_watch_enabled = getattr(settings, "VAULT_WATCH_ENABLED", True)
     debounce_ms = getattr(settings, "VAULT_SYNC_DEBOUNCE_MS", 1000)
+    task_batch_size = getattr(settings, "VAULT_SYNC_TASK_BATCH_SIZE", 500)
 
     try:
         vault = get_vault_manager()
         results["vault_path"] = str(vault.vault_path)
         _sync_service = VaultSyncService()
 
-        # Step 1: Reconcile offline changes
-        if vault_sync_enabled:
-            logger.info("Starting vault reconciliation...")
-            results["reconciliation"] = await _sync_service.reconcile_on_startup(
-                vault.vault_path
-            )
-            logger.info(
-                f"Reconciliation complete: {results['reconciliation']['synced']} notes synced"
-            )
-
-        # Step 2: Start real-time watcher
+        # Step 1: Start real-time watcher
         if vault_watch_enabled:
             # Import Celery task here to avoid circular imports
-            from app.services.tasks import sync_vault_note
+            from app.services.tasks import sync_vault_notes
 
-            def on_file_change(path):
-                """Handle file changes by queuing Celery task.
+            def on_files_changed(paths):
+                """Handle a chunk of file changes by queuing one Celery task.
 
                 Using Celery instead of direct async provides:
                 - Automatic retries if Neo4j is temporarily unavailable
                 - Task visibility and monitoring via Redis
                 - Decouples watcher thread from asyncio event loop
-                - Better handling of burst file changes
+                - Better handling of burst file changes: one task per chunk
+                  shares connections and writes the graph in bulk
                 """
                 if vault_sync_enabled:
                     try:
-                        sync_vault_note.delay(str(path))
-                        logger.debug(f"Queued vault sync task for: {path}")
+                        sync_vault_notes.delay([str(path) for path in paths])
+                        logger.debug(f"Queued vault sync task for {len(paths)} notes")
                     except Exception as e:
-                        logger.error(f"Failed to queue sync task for {path}: {e}")
+                        logger.error(
+                            f"Failed to queue sync task for {len(paths)} notes: {e}"
+                        )
 
             _vault_watcher = VaultWatcher(
                 vault_path=str(vault.vault_path),
-                on_change=on_file_change,
                 debounce_ms=debounce_ms,
+                on_batch=on_files_changed,
+                batch_size=task_batch_size,
             )
             _vault_watcher.start()
             results["watcher_started"] = True
             logger.info(f"Vault watcher started: {vault.vault_path}")
 
+        # Step 2: Index rebuild and reconciliation without blocking startup
+        _startup_task = asyncio.create_task(
+            _run_startup_sync(vault.vault_path, vault_sync_enabled),
+            name="vault-startup-sync",
+        )
+        results["background_sync_started"] = True
+
         return results
 
     except ValueError as e:
         # Vault path doesn't exist - this is expected in some environments
         logger.warning(f"Vault services not started: {e}")
+        _startup_phase = "not_configured"
         return results
     except Exception as e:
         logger.error(f"Failed to start vault services: {e}")
+        _startup_phase = "failed"
+        _startup_error = str(e)
+        raise
+
+
+async def _run_startup_sync(vault_path: Path, vault_sync_enabled: bool) -> None:
+    """
+    Rebuild the note index and reconcile offline changes in the background.
+
+    Progress of the reconciliation itself is tracked by VaultSyncService's
+    sync status; this only records which phase startup is in. Both steps walk
+    and stat the vault in a worker thread; only their database and Neo4j
+    writes run on the event loop. Failures are logged and leave the phase at
+    "failed" so readiness stops waiting.
+    """
+    global _startup_phase, _startup_error
+
+    from app.services.obsidian.note_index import NoteIndexService
+
+    try:
+        # Failures are non-fatal: the index only backs note browsing
+        _startup_phase = "indexing"
+        try:
+            _startup_results["note_index"] = await NoteIndexService().rebuild(
+                vault_path
+            )
+        except Exception as e:
+            logger.warning(f"Note index rebuild failed: {e}")
+
+        if vault_sync_enabled and _sync_service is not None:
+            _startup_phase = "reconciling"
+            logger.info("Starting vault reconciliation...")
+            reconciliation = await _sync_service.reconcile_on_startup(vault_path)
+            _startup_results["reconciliation"] = reconciliation
+            logger.info(
+                f"Reconciliation complete: {reconciliation['synced']} notes synced"
+            )
+
+        _startup_phase = "ready"
+    except asyncio.CancelledError:
+        logger.info(f"Vault startup sync cancelled during {_startup_phase}")
         raise
+    except Exception as e:
+        _startup_phase = "failed"
+        _startup_error = str(e)
+        logger.error(f"Vault startup sync failed: {e}")
 
 
 async def shutdown_vault_services() -> None:
@@ -182,29 +273,43 @@ async def shutdown_vault_services() -> None:
 
     Performs orderly shutdown of vault-related services:
 
-    1. **Stop Watcher**: Halts file system monitoring. The watchdog observer
+    1. **Cancel Startup Sync**: Stops the background index rebuild or
+       reconciliation if it is still running.
+
+    2. **Stop Watcher**: Halts file system monitoring. The watchdog observer
        thread is stopped, and no new file events will be processed.
 
-    2. **Update Last Sync Time**: Persists the current timestamp to PostgreSQL
+    3. **Update Last Sync Time**: Persists the current timestamp to PostgreSQL
        (SystemMeta table). This timestamp is used by reconcile_on_startup()
-       to determine which notes need syncing after the next restart.
+       to determine which notes need syncing after the next restart. Skipped
+       if reconciliation did not complete, so the next start retries it.
 
     This function is idempotent - safe to call even if startup failed or
     services weren't fully initialized.
 
     Called automatically by FastAPI's lifespan context manager on shutdown.
     """
-    global _vault_watcher, _sync_service
+    global _vault_watcher, _sync_service, _startup_task
 
     vault_sync_enabled = getattr(settings, "VAULT_SYNC_NEO4J_ENABLED", True)
 
+    if _startup_task is not None:
+        if not _startup_task.done():
+            _startup_task.cancel()
+            try:
+                await _startup_task
+            except asyncio.CancelledError:
+                pass
+        _startup_task = None
+
     if _vault_watcher:
         _vault_watcher.stop()
         _vault_watcher = None
         logger.info("Vault watcher stopped")
 
-    # Update last sync time on shutdown
-    if _sync_service and vault_sync_enabled:
+    # Update last sync time on shutdown (unless offline changes are unsynced)
+    reconciled = _startup_phase not in STARTUP_PENDING_PHASES + ("failed",)
+    if _sync_service and vault_sync_enabled and reconciled:
         await _sync_service._update_last_sync_time()
         logger.info("Updated last sync time")
 
@@ -240,3 +345,30 @@ def get_watcher_status() -> dict:
         "sync_enabled": vault_sync_enabled,
         "watch_enabled": vault_watch_enabled,
     }
+
+
+def is_vault_ready() -> bool:
+    """True once background startup work is no longer running."""
+    return _startup_phase not in STARTUP_PENDING_PHASES
+
+
+def get_startup_status() -> dict:
+    """
+    Get the state of the background startup sync.
+
+    Returns:
+        Dict containing:
+            - phase: "not_started", "pending", "indexing", "reconciling",
+              "ready", "failed" or "not_configured"
+            - ready: True once startup work is no longer running
+            - error: Error message if startup sync failed
+            - note_index: Result dict from NoteIndexService.rebuild() or None
+            - reconciliation: Result dict from reconcile_on_startup() or None
+    """
+    return {
+        "phase": _startup_phase,
+        "ready": is_vault_ready(),
+        "error": _startup_error,
+        "note_index": _startup_results.get("note_index"),
+        "reconciliation": _startup_results.get("reconciliation"),
+    }
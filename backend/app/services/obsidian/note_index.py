@@ -0,0 +1,550 @@
+"""
+Vault Note Metadata Index
+
+Maintains a persistent PostgreSQL index (vault_notes table) of note metadata
+so the note browser can filter, sort and paginate without touching the
+filesystem. Walking an 8k-note vault and parsing every note's frontmatter on
+each page request is what this replaces.
+
+What Gets Indexed (per note):
+    - path, name, folder (relative to the vault root)
+    - mtime, size (from stat)
+    - title, tags, type (from frontmatter)
+
+Keeping the Index Current:
+    1. Real-time: VaultSyncService.sync_note() upserts the note it just parsed
+       and VaultSyncService.remove_note() drops deleted notes, so watcher
+       events keep the index fresh.
+    2. Startup: rebuild() compares each file's mtime/size with the indexed
+       values and only re-parses notes that changed; rows for deleted files
+       are dropped.
+
+Pagination:
+    Supports classic page/offset pagination plus keyset pagination via an
+    opaque cursor (sort key + path), which stays O(page_size) for deep pages.
+
+Usage:
+    from app.services.obsidian.note_index import NoteIndexService
+
+    index = NoteIndexService()
+
+    # Upsert after parsing a note
+    await index.index_note(note_path, vault_path, fm)
+
+    # Query a page
+    page = await index.query(folder="sources/papers", sort_by="title")
+
+    # Startup validation
+    stats = await index.rebuild(vault_path)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import delete, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.db.base import async_session_maker, task_session_maker
+from app.db.models import VaultNote
+from app.services.obsidian.frontmatter import parse_frontmatter_file
+
+logger = logging.getLogger(__name__)
+
+# Sort options accepted by query(), mapped to their indexed sort column
+SORT_COLUMNS = {
+    "modified": VaultNote.mtime,
+    "name": VaultNote.sort_name,
+    "title": VaultNote.sort_title,
+    "size": VaultNote.size,
+}
+
+# Rows per upsert statement during rebuild
+REBUILD_BATCH_SIZE = 500
+
+
+@dataclass
+class NoteMetadata:
+    """Indexed metadata for a single vault note."""
+
+    path: str
+    name: str
+    folder: str
+    mtime: datetime
+    size: int
+    title: Optional[str] = None
+    tags: list[str] = field(default_factory=list)
+    note_type: Optional[str] = None
+    content_hash: Optional[str] = None
+
+    def to_row(self, with_hash: bool = False) -> dict[str, Any]:
+        """
+        Convert to a vault_notes row dict (including sort keys).
+
+        Args:
+            with_hash: Include content_hash. Only graph syncs set it; other
+                writers leave the stored hash untouched.
+        """
+        row = {
+            "path": self.path,
+            "name": self.name,
+            "folder": self.folder,
+            "title": self.title,
+            "tags": self.tags,
+            "note_type": self.note_type,
+            "mtime": self.mtime,
+            "size": self.size,
+            "sort_name": self.name.lower(),
+            "sort_title": (self.title or self.name).lower(),
+            "indexed_at": datetime.now(timezone.utc),
+        }
+        if with_hash:
+            row["content_hash"] = self.content_hash
+        return row
+
+
+@dataclass
+class NoteIndexPage:
+    """One page of index query results."""
+
+    notes: list[NoteMetadata]
+    total: int
+    has_more: bool
+    next_cursor: Optional[str] = None
+
+
+def is_hidden(rel_path: Path) -> bool:
+    """Whether a vault-relative path is inside a hidden folder or is hidden itself."""
+    return any(part.startswith(".") for part in rel_path.parts)
+
+
+def scan_vault_notes(
+    vault_path: Path,
+) -> list[tuple[Path, str, Optional[os.stat_result]]]:
+    """
+    Walk the vault and stat every visible note.
+
+    Blocking filesystem work; async callers run it with asyncio.to_thread.
+
+    Args:
+        vault_path: Absolute path to the Obsidian vault root
+
+    Returns:
+        (absolute path, vault-relative path, stat result) per note, with
+        None for notes that could not be stat'ed
+    """
+    entries = []
+    for note_path in vault_path.rglob("*.md"):
+        rel_path = note_path.relative_to(vault_path)
+        if is_hidden(rel_path):
+            continue
+        try:
+            st = note_path.stat()
+        except OSError as e:
+            logger.warning(f"Could not stat {note_path}: {e}")
+            st = None
+        entries.append((note_path, str(rel_path), st))
+    return entries
+
+
+def metadata_from_frontmatter(
+    note_path: Path, vault_path: Path, fm: dict, stat=None
+) -> NoteMetadata:
+    """
+    Build NoteMetadata from an already-parsed frontmatter dict.
+
+    Args:
+        note_path: Absolute path to the note
+        vault_path: Vault root used to compute the relative path
+        fm: Parsed frontmatter (may be empty)
+        stat: Optional os.stat_result (stat'ed here if not provided)
+
+    Returns:
+        NoteMetadata for the note
+    """
+    stat = stat or note_path.stat()
+    rel_path = note_path.relative_to(vault_path)
+
+    title = fm.get("title") or fm.get("name")
+    tags = fm.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tags]
+    note_type = fm.get("type") or fm.get("content_type")
+
+    return NoteMetadata(
+        path=str(rel_path),
+        name=note_path.stem,
+        folder=str(rel_path.parent) if rel_path.parent != Path(".") else "",
+        mtime=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+        size=stat.st_size,
+        title=str(title) if title is not None else None,
+        tags=[str(t) for t in tags if t is not None],
+        note_type=str(note_type) if note_type is not None else None,
+    )
+
+
+def encode_cursor(sort_by: str, note: NoteMetadata) -> str:
+    """Encode the keyset position after `note` as an opaque cursor string."""
+    if sort_by == "modified":
+        key: Any = note.mtime.isoformat()
+    elif sort_by == "name":
+        key = note.name.lower()
+    elif sort_by == "title":
+        key = (note.title or note.name).lower()
+    else:
+        key = note.size
+    payload = json.dumps({"s": sort_by, "k": key, "p": note.path})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_by: str) -> tuple[Any, str]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort order
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        key, path = payload["k"], payload["p"]
+        cursor_sort = payload["s"]
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+    if cursor_sort != sort_by:
+        raise ValueError("Cursor was issued for a different sort order")
+    if sort_by == "modified":
+        key = datetime.fromisoformat(key)
+    return key, path
+
+
+class NoteIndexService:
+    """
+    Reads and maintains the vault_notes metadata index.
+
+    Attributes:
+        task_context: Use task_session_maker (Celery tasks, new event loop per
+            task) instead of the pooled async_session_maker (FastAPI).
+    """
+
+    def __init__(self, task_context: bool = False):
+        """
+        Initialize the index service.
+
+        Args:
+            task_context: If True, use task_session_maker (safe for Celery tasks
+                with new event loops). If False, use async_session_maker.
+        """
+        self.task_context = task_context
+        self._session_maker = (
+            task_session_maker if task_context else async_session_maker
+        )
+
+    # ─────────────────────────────────────────────────────────────
+    # Writes
+    # ─────────────────────────────────────────────────────────────
+
+    async def upsert_many(
+        self, notes: list[NoteMetadata], with_hash: bool = False
+    ) -> None:
+        """
+        Insert or update index rows (keyed by path).
+
+        Args:
+            notes: Rows to write
+            with_hash: Also write each note's content_hash (graph syncs)
+        """
+        if not notes:
+            return
+
+        async with self._session_maker() as session:
+            for start in range(0, len(notes), REBUILD_BATCH_SIZE):
+                rows = [
+                    n.to_row(with_hash=with_hash)
+                    for n in notes[start : start + REBUILD_BATCH_SIZE]
+                ]
+                stmt = pg_insert(VaultNote).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[VaultNote.path],
+                    set_={
+                        col: stmt.excluded[col]
+                        for col in rows[0].keys()
+                        if col != "path"
+                    },
+                )
+                await session.execute(stmt)
+            await session.commit()
+
+    async def index_note(
+        self, note_path: Path, vault_path: Path, fm: Optional[dict] = None
+    ) -> NoteMetadata:
+        """
+        Index a single note, parsing its frontmatter if not provided.
+
+        Args:
+            note_path: Absolute path to the note
+            vault_path: Vault root
+            fm: Already-parsed frontmatter (avoids re-reading the file)
+
+        Returns:
+            The indexed NoteMetadata
+        """
+        if fm is None:
+            try:
+                fm, _ = await parse_frontmatter_file(note_path)
+            except Exception as e:
+                logger.debug(f"Frontmatter parse failed for {note_path}: {e}")
+                fm = {}
+        meta = metadata_from_frontmatter(note_path, vault_path, fm)
+        await self.upsert_many([meta])
+        return meta
+
+    async def remove_paths(self, paths: list[str]) -> int:
+        """
+        Remove index rows by relative path.
+
+        Returns:
+            Number of rows removed
+        """
+        if not paths:
+            return 0
+        async with self._session_maker() as session:
+            result = await session.execute(
+                delete(VaultNote).where(VaultNote.path.in_(paths))
+            )
+            await session.commit()
+            return result.rowcount or 0
+
+    async def get_content_hashes(
+        self, paths: Optional[list[str]] = None
+    ) -> dict[str, str]:
+        """
+        Content hashes stored by the last graph sync, keyed by relative path.
+
+        Args:
+            paths: Only these paths (default: every indexed note)
+
+        Returns:
+            Dict of path -> content_hash for notes that have one
+        """
+        stmt = select(VaultNote.path, VaultNote.content_hash).where(
+            VaultNote.content_hash.is_not(None)
+        )
+        if paths is not None:
+            if not paths:
+                return {}
+            stmt = stmt.where(VaultNote.path.in_(paths))
+        async with self._session_maker() as session:
+            result = await session.execute(stmt)
+            return {row.path: row.content_hash for row in result}
+
+    # ─────────────────────────────────────────────────────────────
+    # Startup validation
+    # ─────────────────────────────────────────────────────────────
+
+    async def rebuild(self, vault_path: Path) -> dict:
+        """
+        Bring the index in line with the vault using mtime validation.
+
+        Only stats every file; frontmatter is parsed just for notes that are
+        new or whose mtime/size differ from the indexed values. Index rows for
+        files that no longer exist are deleted.
+
+        Args:
+            vault_path: Absolute path to the Obsidian vault root
+
+        Returns:
+            Dict with scanned, added, updated, removed, unchanged counts
+        """
+        async with self._session_maker() as session:
+            result = await session.execute(
+                select(VaultNote.path, VaultNote.mtime, VaultNote.size)
+            )
+            indexed = {row.path: (row.mtime, row.size) for row in result}
+
+        stats = {"scanned": 0, "added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        seen: set[str] = set()
+        changed: list[NoteMetadata] = []
+
+        # Walk and stat in a thread so a large vault doesn't block the loop
+        entries = await asyncio.to_thread(scan_vault_notes, vault_path)
+        for note_path, rel, st in entries:
+            stats["scanned"] += 1
+            seen.add(rel)
+            if st is None:
+                continue
+
+            mtime = datetime.fromtimestamp(st.st_mtime, tz=timezone.utc)
+            current = indexed.get(rel)
+            if current and current[0] == mtime and current[1] == st.st_size:
+                stats["unchanged"] += 1
+                continue
+
+            try:
+                fm, _ = await parse_frontmatter_file(note_path)
+            except Exception as e:
+                logger.debug(f"Frontmatter parse failed for {note_path}: {e}")
+                fm = {}
+
+            changed.append(metadata_from_frontmatter(note_path, vault_path, fm, st))
+            stats["updated" if current else "added"] += 1
+
+        await self.upsert_many(changed)
+
+        removed = [p for p in indexed if p not in seen]
+        stats["removed"] = await self.remove_paths(removed) if removed else 0
+
+        logger.info(
+            f"Vault note index rebuilt: {stats['added']} added, "
+            f"{stats['updated']} updated, {stats['removed']} removed, "
+            f"{stats['unchanged']} unchanged"
+        )
+        return stats
+
+    # ─────────────────────────────────────────────────────────────
+    # Queries
+    # ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _build_filters(
+        folder: Optional[str],
+        search: Optional[str],
+        tag: Optional[str],
+        content_type: Optional[str],
+    ) -> list:
+        """Build WHERE clauses matching the note browser's filter semantics."""
+        filters = []
+
+        if folder:
+            folder = folder.strip("/")
+            filters.append(
+                or_(
+                    VaultNote.folder == folder,
+                    VaultNote.folder.startswith(f"{folder}/", autoescape=True),
+                )
+            )
+
+        if tag:
+            filters.append(VaultNote.tags.any(tag))
+
+        if content_type:
+            filters.append(VaultNote.note_type == content_type)
+
+        if search:
+            # Match the full term, or ANY significant word, against
+            # "name title path" (same semantics as the old filesystem scan)
+            search_lower = search.lower()
+            searchable = func.lower(
+                func.concat(
+                    VaultNote.name,
+                    " ",
+                    func.coalesce(VaultNote.title, ""),
+                    " ",
+                    VaultNote.path,
+                )
+            )
+            terms = [search_lower] + [w for w in search_lower.split() if len(w) > 2]
+            filters.append(
+                or_(*[searchable.contains(t, autoescape=True) for t in terms])
+            )
+
+        return filters
+
+    async def query(
+        self,
+        folder: Optional[str] = None,
+        search: Optional[str] = None,
+        tag: Optional[str] = None,
+        content_type: Optional[str] = None,
+        sort_by: str = "modified",
+        sort_desc: bool = True,
+        page: int = 1,
+        page_size: int = 50,
+        cursor: Optional[str] = None,
+    ) -> NoteIndexPage:
+        """
+        Query the index with filtering, sorting and pagination.
+
+        Args:
+            folder: Only notes in this folder (recursively)
+            search: Match against name, title and path
+            tag: Only notes with this frontmatter tag
+            content_type: Only notes of this type
+            sort_by: One of "modified", "name", "title", "size"
+            sort_desc: Sort descending
+            page: 1-based page number (ignored when cursor is given)
+            page_size: Notes per page
+            cursor: Keyset cursor from a previous page's next_cursor
+
+        Returns:
+            NoteIndexPage with notes, total matches, has_more and next_cursor
+
+        Raises:
+            ValueError: For an unknown sort_by or an invalid cursor
+        """
+        sort_col = SORT_COLUMNS.get(sort_by)
+        if sort_col is None:
+            raise ValueError(
+                f"Invalid sort_by '{sort_by}'. Use one of: {', '.join(SORT_COLUMNS)}"
+            )
+
+        filters = self._build_filters(folder, search, tag, content_type)
+
+        if sort_desc:
+            order_by = [sort_col.desc(), VaultNote.path.desc()]
+        else:
+            order_by = [sort_col.asc(), VaultNote.path.asc()]
+
+        stmt = select(VaultNote).where(*filters).order_by(*order_by)
+
+        if cursor:
+            key, path = decode_cursor(cursor, sort_by)
+            position = tuple_(sort_col, VaultNote.path)
+            stmt = stmt.where(
+                position < tuple_(key, path)
+                if sort_desc
+                else position > tuple_(key, path)
+            )
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+
+        # Fetch one extra row to know whether another page exists
+        stmt = stmt.limit(page_size + 1)
+
+        async with self._session_maker() as session:
+            total = (
+                await session.execute(
+                    select(func.count()).select_from(VaultNote).where(*filters)
+                )
+            ).scalar_one()
+            rows = (await session.execute(stmt)).scalars().all()
+
+        has_more = len(rows) > page_size
+        notes = [
+            NoteMetadata(
+                path=row.path,
+                name=row.name,
+                folder=row.folder,
+                mtime=row.mtime,
+                size=row.size,
+                title=row.title,
+                tags=list(row.tags or []),
+                note_type=row.note_type,
+            )
+            for row in rows[:page_size]
+        ]
+
+        return NoteIndexPage(
+            notes=notes,
+            total=total,
+            has_more=has_more,
+            next_cursor=encode_cursor(sort_by, notes[-1]) if has_more else None,
+        )
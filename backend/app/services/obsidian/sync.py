@@ -7,6 +7,7 @@ graph-based queries, visualization, and relationship discovery across notes.
 Three-Tier Sync Strategy:
     1. Real-time sync (sync_note): Called by VaultWatcher when user edits a note.
        Low latency, handles single notes. Best for active editing sessions.
+       Notes whose content hash is unchanged never reach Neo4j.
 
     2. Startup reconciliation (reconcile_on_startup): Runs during FastAPI startup.
        Compares file mtimes against last_sync_time stored in PostgreSQL (SystemMeta).
@@ -15,18 +16,30 @@ Three-Tier Sync Strategy:
     3. Manual full sync (full_sync): Triggered via API for bulk operations.
        Syncs entire vault. Useful after imports, migrations, or recovery.
 
+Vault-Wide Sync Engine (reconciliation and full sync):
+    - Notes are parsed in a thread pool (VAULT_SYNC_PARSE_WORKERS threads)
+      while the previous batch is being written
+    - Each batch of VAULT_SYNC_BATCH_SIZE notes is written to Neo4j in one
+      transaction of UNWIND statements (Neo4jClient.write_note_batch) and to
+      the vault_notes index in one upsert
+    - Notes whose content hash (normalized frontmatter + wikilinks + tags)
+      matches the hash stored at their last sync are skipped
+
 Neo4j Data Model:
     - Node: (Note {id, title, type, tags[], updated_at})
     - Relationship: (Note)-[:LINKS_TO]->(Note) for wikilinks
 
 What Gets Synced:
     - Frontmatter metadata (title, type, tags, custom fields)
-    - Wikilinks extracted from note body → LINKS_TO relationships
+    - Wikilinks extracted from note body → LINKS_TO relationships (applied as
+      a diff: stale edges deleted, new ones created, unchanged ones untouched)
     - Inline #tags merged with frontmatter tags
+    - Note metadata into the PostgreSQL vault_notes index (see note_index.py)
 
 Persistence:
     - last_sync_time stored in PostgreSQL SystemMeta table (key: vault_last_sync_time)
     - Survives app restarts for accurate reconciliation
+    - Per-note content hashes stored in vault_notes.content_hash
 
 Status Tracking:
     - Module-level SyncStatus tracks progress of long-running syncs
@@ -37,13 +50,16 @@ Usage:
 
     sync_service = VaultSyncService()
 
-    # Single note (from watcher callback)
+    # Single note
     await sync_service.sync_note(Path("/vault/sources/papers/my-paper.md"))
 
+    # Batch of changed paths (from the sync_vault_notes watcher task)
+    await sync_service.sync_notes([Path("/vault/a.md"), Path("/vault/b.md")])
+
     # Startup reconciliation
     await sync_service.reconcile_on_startup(Path("/vault"))
 
-    # Full sync (API endpoint)
+    # Full sync (API endpoint); force=True also rewrites unchanged notes
     result = await sync_service.full_sync(Path("/vault"))
 
     # Check progress
@@ -52,8 +68,12 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -61,12 +81,22 @@ from typing import Optional
 
 from sqlalchemy import select
 
+from app.config.settings import settings
 from app.db.base import async_session_maker
 from app.db.models import SystemMeta
 from app.services.knowledge_graph.client import get_neo4j_client
+from app.services.knowledge_graph.snapshot import request_snapshot_rebuild
 from app.services.obsidian import get_vault_manager
-from app.services.obsidian.frontmatter import parse_frontmatter_file, update_frontmatter
+from app.services.obsidian.frontmatter import (
+    load_frontmatter_file,
+    update_frontmatter,
+)
 from app.services.obsidian.links import extract_tags, extract_wikilinks
+from app.services.obsidian.note_index import (
+    NoteIndexService,
+    NoteMetadata,
+    metadata_from_frontmatter,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +121,7 @@ class SyncStatus:
         total_notes: Total notes to process in current operation
         processed_notes: Number of notes processed so far
         synced_notes: Notes successfully synced to Neo4j
+        skipped_notes: Notes skipped because their content hash is unchanged
         failed_notes: Notes that failed to sync (errors logged)
         last_result: Summary dict from most recent completed sync
         last_completed_at: UTC timestamp of last completed sync
@@ -103,6 +134,7 @@ class SyncStatus:
     total_notes: int = 0
     processed_notes: int = 0
     synced_notes: int = 0
+    skipped_notes: int = 0
     failed_notes: int = 0
     last_result: Optional[dict] = None
     last_completed_at: Optional[datetime] = None
@@ -124,6 +156,7 @@ class SyncStatus:
                 "total": self.total_notes,
                 "processed": self.processed_notes,
                 "synced": self.synced_notes,
+                "skipped": self.skipped_notes,
                 "failed": self.failed_notes,
                 "percent": (
                     round(self.processed_notes / self.total_notes * 100, 1)
@@ -156,6 +189,101 @@ def get_sync_status() -> dict:
     return _sync_status.to_dict()
 
 
+# ─────────────────────────────────────────────────────────────
+# Change Detection
+# ─────────────────────────────────────────────────────────────
+
+
+def find_modified_notes(
+    vault_path: Path, since: Optional[datetime]
+) -> tuple[int, list[Path]]:
+    """
+    Walk the vault for notes modified after `since` (all notes if None).
+
+    Blocking filesystem work; async callers run it with asyncio.to_thread.
+
+    Returns:
+        Tuple of (total notes in the vault, notes modified since `since`)
+    """
+    notes = [n for n in vault_path.rglob("*.md") if ".obsidian" not in str(n)]
+
+    modified = []
+    for note_path in notes:
+        try:
+            mtime = datetime.fromtimestamp(note_path.stat().st_mtime, tz=timezone.utc)
+            if since is None or mtime > since:
+                modified.append(note_path)
+        except OSError as e:
+            logger.warning(f"Could not stat {note_path}: {e}")
+    return len(notes), modified
+
+
+def compute_note_hash(node_id: str, fm: dict, links: list[str], tags: list[str]) -> str:
+    """
+    Hash the parts of a note that end up in the graph.
+
+    Frontmatter is normalized to sorted-key JSON and links/tags are sorted and
+    deduplicated, so reordering or whitespace-only edits hash the same. The
+    frontmatter "id" is replaced by the resolved node_id, which means writing
+    a generated id back to the file doesn't change the hash.
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        {
+            "id": node_id,
+            "frontmatter": {k: v for k, v in fm.items() if k != "id"},
+            "links": sorted(set(links)),
+            "tags": sorted(set(tags)),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class ParsedNote:
+    """
+    A note parsed for graph sync.
+
+    Attributes:
+        path: Absolute path to the note
+        node_id: Frontmatter id, or the deterministic id generated for the path
+        needs_id: True if node_id was generated and must be written back
+        title, note_type, tags, links, source_url: Graph node fields
+        file_path: Path relative to the vault root (absolute if outside it)
+        content_hash: compute_note_hash() of the note
+        metadata: vault_notes index row (None for notes outside the vault)
+    """
+
+    path: Path
+    file_path: str
+    node_id: str
+    needs_id: bool
+    title: str
+    note_type: str
+    tags: list[str]
+    links: list[str]
+    source_url: Optional[str]
+    content_hash: str
+    metadata: Optional[NoteMetadata]
+
+    def to_graph_row(self) -> dict:
+        """Row for Neo4jClient.write_note_batch()."""
+        return {
+            "node_id": self.node_id,
+            "title": self.title,
+            "note_type": self.note_type,
+            "tags": self.tags,
+            "file_path": self.file_path,
+            "source_url": self.source_url,
+            "target_ids": self.links,
+        }
+
+
 class VaultSyncService:
     """
     Synchronizes Obsidian vault content to Neo4j knowledge graph.
@@ -176,6 +304,8 @@ class VaultSyncService:
         - Uses module-level _sync_status for progress tracking
         - Prevents concurrent full syncs (returns error if already running)
         - Individual sync_note() calls are safe for concurrent use
+        - Vault-wide syncs parse notes in a private thread pool; all graph
+          and database writes stay on the event loop
 
     Error Handling:
         - Individual note failures don't stop batch operations
@@ -188,9 +318,16 @@ class VaultSyncService:
 
     LAST_SYNC_KEY = "vault_last_sync_time"
 
-    def __init__(self):
-        """Initialize the sync service with lazy-loaded Neo4j client."""
+    def __init__(self, task_context: bool = False):
+        """
+        Initialize the sync service with lazy-loaded Neo4j client.
+
+        Args:
+            task_context: If True, database access uses task_session_maker
+                (safe for Celery tasks with new event loops).
+        """
         self._neo4j = None
+        self._note_index = NoteIndexService(task_context=task_context)
 
     async def _ensure_neo4j(self):
         """
@@ -215,6 +352,11 @@ class VaultSyncService:
         "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
     )  # UUID namespace for URLs
 
+    @classmethod
+    def _node_id_for_path(cls, note_path: Path) -> str:
+        """Deterministic UUID5 node ID for a note path."""
+        return str(uuid.uuid5(cls._NODE_ID_NAMESPACE, str(note_path)))
+
     async def _generate_and_persist_node_id(self, note_path: Path) -> str:
         """
         Generate a deterministic UUID for a note and persist it to frontmatter.
@@ -233,7 +375,7 @@ class VaultSyncService:
             Writing to the file may trigger the VaultWatcher, but the debounce
             mechanism will coalesce rapid changes.
         """
-        node_id = str(uuid.uuid5(self._NODE_ID_NAMESPACE, str(note_path)))
+        node_id = self._node_id_for_path(note_path)
 
         # Persist the ID to frontmatter so it's stable across renames
         try:
@@ -261,7 +403,8 @@ class VaultSyncService:
             1. Retrieve last_sync_time from PostgreSQL SystemMeta
             2. Scan all .md files in vault (excluding .obsidian/)
             3. Filter to files with mtime > last_sync_time
-            4. Sync each modified file to Neo4j
+            4. Sync modified files with the batched engine (_sync_notes),
+               skipping those whose content hash is unchanged
             5. Update last_sync_time to now
 
         This should be called during FastAPI startup (via lifespan handler)
@@ -275,6 +418,7 @@ class VaultSyncService:
                 - total_notes: Total markdown files in vault
                 - modified_since_sync: Files needing sync
                 - synced: Successfully synced count
+                - skipped: Modified files whose content hash was unchanged
                 - failed: Failed sync count
                 - last_sync: Previous sync timestamp (or None if first run)
 
@@ -290,48 +434,34 @@ class VaultSyncService:
         _sync_status.started_at = datetime.now(timezone.utc)
         _sync_status.processed_notes = 0
         _sync_status.synced_notes = 0
+        _sync_status.skipped_notes = 0
         _sync_status.failed_notes = 0
         _sync_status.last_error = None
 
         try:
             last_sync = await self._get_last_sync_time()
 
-            notes = list(vault_path.rglob("*.md"))
-            notes = [n for n in notes if ".obsidian" not in str(n)]
-
-            # Find notes modified since last sync
-            modified_since_sync = []
-            for note_path in notes:
-                try:
-                    mtime = datetime.fromtimestamp(
-                        note_path.stat().st_mtime, tz=timezone.utc
-                    )
-                    if last_sync is None or mtime > last_sync:
-                        modified_since_sync.append(note_path)
-                except OSError as e:
-                    logger.warning(f"Could not stat {note_path}: {e}")
+            # Walk and stat in a thread so a large vault doesn't block the loop
+            total_notes, modified_since_sync = await asyncio.to_thread(
+                find_modified_notes, vault_path, last_sync
+            )
 
             _sync_status.total_notes = len(modified_since_sync)
 
+            # Sync only the changed files
+            counts = await self._sync_notes(
+                modified_since_sync, vault_path, status=_sync_status
+            )
+
             results = {
-                "total_notes": len(notes),
+                "total_notes": total_notes,
                 "modified_since_sync": len(modified_since_sync),
-                "synced": 0,
-                "failed": 0,
+                "synced": counts["synced"],
+                "skipped": counts["skipped"],
+                "failed": counts["failed"],
                 "last_sync": last_sync.isoformat() if last_sync else None,
             }
 
-            # Sync only the changed files
-            for note_path in modified_since_sync:
-                result = await self.sync_note(note_path)
-                _sync_status.processed_notes += 1
-                if "error" in result:
-                    results["failed"] += 1
-                    _sync_status.failed_notes += 1
-                else:
-                    results["synced"] += 1
-                    _sync_status.synced_notes += 1
-
             # Update last sync time
             await self._update_last_sync_time()
 
@@ -413,16 +543,25 @@ class VaultSyncService:
         """
         Sync a single note to Neo4j knowledge graph.
 
-        This is the core sync operation, used by both the real-time watcher
-        and batch operations. It's designed to be fast and idempotent.
+        This is the core sync operation used by the real-time watcher. It's
+        designed to be fast and idempotent.
 
         Processing Steps:
-            1. Parse frontmatter using python-frontmatter
+            1. Parse frontmatter using python-frontmatter (in a worker thread)
             2. Extract wikilinks from body using regex ([[target]])
             3. Extract inline #tags from body
             4. Merge inline tags with frontmatter tags (deduplicated)
-            5. MERGE Note node in Neo4j (create or update)
-            6. Clear and recreate LINKS_TO relationships
+            5. Compare the note's content hash with the one stored at its last
+               sync; if unchanged, only refresh the index row and stop
+            6. MERGE Note node in Neo4j (create or update)
+            7. Diff LINKS_TO relationships against the current wikilinks
+            8. Upsert the note's row (and new content hash) in vault_notes
+
+        Change Detection:
+            The hash covers normalized frontmatter, wikilinks and tags (see
+            compute_note_hash), so whitespace-only edits and our own id
+            write-back don't touch the graph. The hash is only stored after
+            the graph write succeeded.
 
         Node ID Strategy:
             - Uses frontmatter 'id' field if present
@@ -435,6 +574,7 @@ class VaultSyncService:
 
         Returns:
             Success: {"path": str, "node_id": str, "links_synced": int, "tags": list}
+            Unchanged: same keys with links_synced=0 and "skipped": True
             Failure: {"path": str, "error": str}
 
         Note:
@@ -443,72 +583,71 @@ class VaultSyncService:
             operating in degraded mode.
         """
         try:
-            # Parse note
-            fm, body = await parse_frontmatter_file(note_path)
-
-            # Extract links and tags
-            outgoing_links = extract_wikilinks(body)
-            inline_tags = extract_tags(body)
-
-            # Combine frontmatter tags with inline tags
-            fm_tags = fm.get("tags", [])
-            if isinstance(fm_tags, str):
-                fm_tags = [fm_tags]
-            all_tags = list(set(fm_tags + inline_tags))
-
-            # Determine node ID (use frontmatter id, or generate and persist a deterministic UUID)
-            node_id = fm.get("id") or await self._generate_and_persist_node_id(
-                note_path
+            note = await asyncio.to_thread(
+                self._parse_note, note_path, self._get_vault_path()
             )
-            title = fm.get("title", note_path.stem)
-            note_type = fm.get("type", "note")
-            
-            # Extract source_url from frontmatter (used for deduplication)
-            # Templates write this field, so synced notes can be linked to their sources
-            source_url = fm.get("source_url") or fm.get("url") or fm.get("source")
-
-            # Update Neo4j node if client is available
+
+            if note.metadata is not None:
+                stored = await self._get_content_hashes([note.file_path])
+                if stored.get(note.file_path) == note.content_hash:
+                    # Keep mtime/size current for the note browser
+                    await self._update_note_index(note)
+                    logger.debug(f"Note unchanged, skipped sync: {note_path.name}")
+                    return {
+                        "path": str(note_path),
+                        "node_id": note.node_id,
+                        "links_synced": 0,
+                        "tags": note.tags,
+                        "skipped": True,
+                    }
+
+            if note.needs_id:
+                note.node_id = await self._generate_and_persist_node_id(note_path)
+
+            graph_written = False
             neo4j = await self._ensure_neo4j()
             if neo4j:
-                # Get vault manager to compute relative path
-                vault = get_vault_manager()
-                try:
-                    file_path = str(note_path.relative_to(vault.vault_path))
-                except ValueError:
-                    file_path = str(note_path)
-
-                await self._update_neo4j_node(
-                    node_id=node_id,
-                    title=title,
-                    note_type=note_type,
-                    tags=all_tags,
-                    file_path=file_path,
-                    metadata=fm,
-                    source_url=source_url,
+                node_written = await self._update_neo4j_node(
+                    node_id=note.node_id,
+                    title=note.title,
+                    note_type=note.note_type,
+                    tags=note.tags,
+                    file_path=note.file_path,
+                    metadata=note.metadata,
+                    source_url=note.source_url,
                 )
 
                 # Sync outgoing links
-                await self._sync_links(node_id, outgoing_links)
+                links_written = await self._sync_links(note.node_id, note.links)
+                graph_written = node_written and links_written
+                if graph_written:
+                    await request_snapshot_rebuild()
 
                 # Link Note to Content node if they share the same file_path
                 # This bridges the vault note with its processed content representation
                 try:
-                    link_result = await neo4j.link_content_to_note_by_path(file_path)
+                    link_result = await neo4j.link_content_to_note_by_path(
+                        note.file_path
+                    )
                     if link_result:
                         logger.debug(
                             f"Linked Content to Note: {link_result['content_id']} "
                             f"-> {link_result['note_id']}"
                         )
                 except Exception as e:
-                    logger.debug(f"No Content node to link for {file_path}: {e}")
+                    logger.debug(f"No Content node to link for {note.file_path}: {e}")
+
+            await self._update_note_index(
+                note, content_hash=note.content_hash if graph_written else None
+            )
 
             logger.debug(f"Synced note to Neo4j: {note_path.name}")
 
             return {
                 "path": str(note_path),
-                "node_id": node_id,
-                "links_synced": len(outgoing_links),
-                "tags": all_tags,
+                "node_id": note.node_id,
+                "links_synced": len(note.links),
+                "tags": note.tags,
             }
 
         except Exception as e:
@@ -518,6 +657,103 @@ class VaultSyncService:
                 "error": str(e),
             }
 
+    def _get_vault_path(self) -> Optional[Path]:
+        """Vault root, or None if the vault isn't configured."""
+        try:
+            return get_vault_manager().vault_path
+        except Exception as e:
+            logger.debug(f"Vault manager unavailable: {e}")
+            return None
+
+    async def _update_note_index(
+        self, note: ParsedNote, content_hash: Optional[str] = None
+    ) -> None:
+        """
+        Upsert the note into the vault_notes metadata index.
+
+        Reuses the metadata already parsed by sync_note(). Index failures
+        are logged and never fail the sync; the startup rebuild repairs drift.
+
+        Args:
+            note: Parsed note (skipped if it lies outside the vault)
+            content_hash: Hash to record as synced; None leaves the stored
+                hash untouched
+        """
+        if note.metadata is None:
+            return
+        note.metadata.content_hash = content_hash
+        try:
+            await self._note_index.upsert_many(
+                [note.metadata], with_hash=content_hash is not None
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update note index for {note.path}: {e}")
+
+    async def remove_note(self, note_path: Path) -> dict:
+        """
+        Remove a deleted note from the vault_notes metadata index.
+
+        Called when the watcher reports a deletion (or a rename's old path).
+
+        Args:
+            note_path: Absolute path of the note that no longer exists
+
+        Returns:
+            {"path": str, "removed": int} or {"path": str, "error": str}
+        """
+        try:
+            vault = get_vault_manager()
+            rel_path = str(note_path.relative_to(vault.vault_path))
+            removed = await self._note_index.remove_paths([rel_path])
+            return {"path": str(note_path), "removed": removed}
+        except Exception as e:
+            logger.error(f"Failed to remove note {note_path} from index: {e}")
+            return {"path": str(note_path), "error": str(e)}
+
+    async def sync_notes(self, note_paths: list[Path]) -> dict:
+        """
+        Sync a batch of changed paths reported by the watcher.
+
+        Batch counterpart of sync_note()/remove_note(): existing notes go
+        through the batched engine (threaded parsing, one Neo4j transaction
+        and one index upsert per VAULT_SYNC_BATCH_SIZE notes, unchanged
+        notes skipped) and paths that no longer exist are dropped from the
+        note index with a single delete.
+
+        Args:
+            note_paths: Absolute paths of created, modified or deleted notes
+
+        Returns:
+            {"total": int, "synced": int, "skipped": int, "failed": int,
+             "removed": int, "errors": list}
+        """
+        vault_path = self._get_vault_path()
+        existing = [path for path in note_paths if path.exists()]
+        deleted = [path for path in note_paths if not path.exists()]
+
+        results = await self._sync_notes(existing, vault_path)
+        results["total"] = len(note_paths)
+        results["removed"] = 0
+
+        if deleted and vault_path is not None:
+            rel_paths = [
+                str(path.relative_to(vault_path))
+                for path in deleted
+                if path.is_relative_to(vault_path)
+            ]
+            try:
+                results["removed"] = await self._note_index.remove_paths(rel_paths)
+            except Exception as e:
+                logger.error(f"Failed to remove {len(rel_paths)} notes from index: {e}")
+                results["errors"].append({"path": None, "error": str(e)})
+
+        logger.info(
+            f"Vault batch sync: {results['synced']} synced, "
+            f"{results['skipped']} unchanged, {results['failed']} failed, "
+            f"{results['removed']} removed"
+        )
+        return results
+
     async def _update_neo4j_node(
         self,
         node_id: str,
@@ -527,7 +763,7 @@ class VaultSyncService:
         file_path: str,
         metadata: dict,
         source_url: Optional[str] = None,
-    ):
+    ) -> bool:
         """
         Create or update a Note node in Neo4j via the client.
 
@@ -540,12 +776,15 @@ class VaultSyncService:
             note_type: Content type (paper, article, concept, etc.)
             tags: List of all tags (frontmatter + inline)
             file_path: Relative path to the note file from vault root
-            metadata: Full frontmatter dict (reserved for future use)
+            metadata: Index metadata (reserved for future use)
             source_url: Original source URL if available (from frontmatter)
+
+        Returns:
+            True if the node was written
         """
         neo4j = await self._ensure_neo4j()
         if not neo4j:
-            return
+            return False
 
         try:
             await neo4j.merge_note_node(
@@ -556,34 +795,41 @@ class VaultSyncService:
                 file_path=file_path,
                 source_url=source_url,
             )
+            return True
         except Exception as e:
             logger.error(f"Failed to update Neo4j node {node_id}: {e}")
+            return False
 
-    async def _sync_links(self, source_id: str, targets: list[str]):
+    async def _sync_links(self, source_id: str, targets: list[str]) -> bool:
         """
         Synchronize outgoing wikilinks via the Neo4j client.
 
-        Delegates to Neo4jClient.sync_note_links() which implements
-        delete-and-recreate strategy. See client.py for details.
+        Delegates to Neo4jClient.sync_note_links() which applies the links
+        as a diff against the existing edges. See client.py for details.
 
         Args:
             source_id: Node ID of the source note
             targets: List of target node IDs (extracted wikilink texts)
+
+        Returns:
+            True if the links were written
         """
         neo4j = await self._ensure_neo4j()
         if not neo4j:
-            return
+            return False
 
         try:
             await neo4j.sync_note_links(source_id, targets)
+            return True
         except Exception as e:
             logger.error(f"Failed to sync links for {source_id}: {e}")
+            return False
 
     # ─────────────────────────────────────────────────────────────
     # Full Sync - Manual trigger via API
     # ─────────────────────────────────────────────────────────────
 
-    async def full_sync(self, vault_path: Path) -> dict:
+    async def full_sync(self, vault_path: Path, force: bool = False) -> dict:
         """
         Sync all notes in the vault to Neo4j.
 
@@ -602,19 +848,18 @@ class VaultSyncService:
             is in progress, returns immediately with an error status.
 
         Progress Tracking:
-            Updates module-level _sync_status throughout execution.
+            Updates module-level _sync_status after every batch.
             Poll via get_sync_status() for real-time progress.
 
         Args:
             vault_path: Absolute path to the Obsidian vault root
+            force: Rewrite notes even if their content hash is unchanged
+                (e.g., after Neo4j data loss)
 
         Returns:
-            Success: {"synced": int, "failed": int, "errors": list, "total": int}
+            Success: {"synced": int, "skipped": int, "failed": int,
+                "errors": list, "total": int}
             Already running: {"error": str, "status": dict}
-
-        Warning:
-            Can be slow for large vaults (1000+ notes). Consider running
-            during off-peak hours or with user notification.
         """
         global _sync_status
 
@@ -631,6 +876,7 @@ class VaultSyncService:
         _sync_status.started_at = datetime.now(timezone.utc)
         _sync_status.processed_notes = 0
         _sync_status.synced_notes = 0
+        _sync_status.skipped_notes = 0
         _sync_status.failed_notes = 0
         _sync_status.last_error = None
 
@@ -640,29 +886,23 @@ class VaultSyncService:
 
             _sync_status.total_notes = len(notes)
 
-            results = {"synced": 0, "failed": 0, "errors": [], "total": len(notes)}
-
-            for note_path in notes:
-                result = await self.sync_note(note_path)
-                _sync_status.processed_notes += 1
-                if "error" in result:
-                    results["failed"] += 1
-                    results["errors"].append(result)
-                    _sync_status.failed_notes += 1
-                else:
-                    results["synced"] += 1
-                    _sync_status.synced_notes += 1
+            results = await self._sync_notes(
+                notes, vault_path, force=force, status=_sync_status
+            )
+            results["total"] = len(notes)
 
             # Update last sync time after full sync
             await self._update_last_sync_time()
 
             logger.info(
-                f"Full sync complete: {results['synced']} synced, {results['failed']} failed"
+                f"Full sync complete: {results['synced']} synced, "
+                f"{results['skipped']} unchanged, {results['failed']} failed"
             )
 
             # Update status with result (exclude errors list for cleaner status)
             _sync_status.last_result = {
                 "synced": results["synced"],
+                "skipped": results["skipped"],
                 "failed": results["failed"],
                 "total": results["total"],
             }
@@ -677,3 +917,210 @@ class VaultSyncService:
         finally:
             _sync_status.is_running = False
             _sync_status.sync_type = None
+
+    # ─────────────────────────────────────────────────────────────
+    # Batched Sync Engine - Used by reconciliation and full sync
+    # ─────────────────────────────────────────────────────────────
+
+    def _parse_note(self, note_path: Path, vault_path: Optional[Path]) -> ParsedNote:
+        """
+        Read and parse a note for graph sync (blocking; runs in a worker thread).
+
+        Args:
+            note_path: Absolute path to the note
+            vault_path: Vault root; notes outside it (or without one) get no
+                index metadata and keep their absolute path as file_path
+
+        Raises:
+            Exception: If the file can't be read or its frontmatter is invalid
+        """
+        stat = note_path.stat()
+        fm, body = load_frontmatter_file(note_path)
+
+        links = list(dict.fromkeys(extract_wikilinks(body)))
+        fm_tags = fm.get("tags") or []
+        if isinstance(fm_tags, str):
+            fm_tags = [fm_tags]
+        tags = sorted(
+            {str(t) for t in fm_tags if t is not None} | set(extract_tags(body))
+        )
+
+        node_id = fm.get("id")
+        needs_id = not node_id
+        if needs_id:
+            node_id = self._node_id_for_path(note_path)
+        node_id = str(node_id)
+
+        metadata = None
+        file_path = str(note_path)
+        if vault_path is not None:
+            try:
+                metadata = metadata_from_frontmatter(note_path, vault_path, fm, stat)
+                file_path = metadata.path
+            except ValueError:
+                pass  # Not inside the vault
+
+        return ParsedNote(
+            path=note_path,
+            file_path=file_path,
+            node_id=node_id,
+            needs_id=needs_id,
+            title=str(fm.get("title", note_path.stem)),
+            note_type=str(fm.get("type", "note")),
+            tags=tags,
+            links=links,
+            source_url=fm.get("source_url") or fm.get("url") or fm.get("source"),
+            content_hash=compute_note_hash(node_id, fm, links, tags),
+            metadata=metadata,
+        )
+
+    async def _get_content_hashes(
+        self, paths: Optional[list[str]] = None
+    ) -> dict[str, str]:
+        """Stored content hashes by relative path ({} if the index is unavailable)."""
+        try:
+            return await self._note_index.get_content_hashes(paths)
+        except Exception as e:
+            logger.warning(f"Failed to load note content hashes: {e}")
+            return {}
+
+    async def _sync_notes(
+        self,
+        note_paths: list[Path],
+        vault_path: Optional[Path],
+        force: bool = False,
+        status: Optional[SyncStatus] = None,
+    ) -> dict:
+        """
+        Sync many notes with threaded parsing and batched writes.
+
+        Notes are split into batches of VAULT_SYNC_BATCH_SIZE. Each batch is
+        parsed concurrently in a thread pool of VAULT_SYNC_PARSE_WORKERS
+        threads, and the next batch is parsed while the current one is written.
+
+        Args:
+            note_paths: Absolute paths of the notes to sync
+            vault_path: Vault root (for relative paths)
+            force: Write notes even if their content hash is unchanged
+            status: SyncStatus whose progress is updated after every batch
+
+        Returns:
+            {"synced": int, "skipped": int, "failed": int, "errors": list}
+        """
+        results = {"synced": 0, "skipped": 0, "failed": 0, "errors": []}
+        if not note_paths:
+            return results
+
+        batch_size = max(1, settings.VAULT_SYNC_BATCH_SIZE)
+        if force:
+            previous: dict[str, str] = {}
+        elif vault_path is not None and len(note_paths) <= batch_size:
+            # Small (watcher) batches only need their own hashes
+            previous = await self._get_content_hashes(
+                [
+                    str(path.relative_to(vault_path))
+                    for path in note_paths
+                    if path.is_relative_to(vault_path)
+                ]
+            )
+        else:
+            previous = await self._get_content_hashes()
+        batches = [
+            note_paths[start : start + batch_size]
+            for start in range(0, len(note_paths), batch_size)
+        ]
+        loop = asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, settings.VAULT_SYNC_PARSE_WORKERS),
+            thread_name_prefix="vault-sync",
+        ) as executor:
+
+            def parse(paths: list[Path]) -> asyncio.Future:
+                return asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            executor, self._parse_note, path, vault_path
+                        )
+                        for path in paths
+                    ),
+                    return_exceptions=True,
+                )
+
+            pending = parse(batches[0])
+            for index, paths in enumerate(batches):
+                parsed = await pending
+                if index + 1 < len(batches):
+                    pending = parse(batches[index + 1])
+                await self._write_note_batch(paths, parsed, previous, results)
+                if status is not None:
+                    status.processed_notes += len(paths)
+                    status.synced_notes = results["synced"]
+                    status.skipped_notes = results["skipped"]
+                    status.failed_notes = results["failed"]
+
+        return results
+
+    async def _write_note_batch(
+        self,
+        paths: list[Path],
+        parsed: list,
+        previous: dict[str, str],
+        results: dict,
+    ) -> None:
+        """
+        Write one parsed batch to Neo4j and the note index, updating results.
+
+        Content hashes are only stored for notes whose graph write succeeded,
+        so notes synced while Neo4j is down or failing are retried next time.
+        """
+
+        def fail(path: Path, error: object) -> None:
+            logger.error(f"Failed to sync note {path}: {error}")
+            results["failed"] += 1
+            results["errors"].append({"path": str(path), "error": str(error)})
+
+        notes: list[ParsedNote] = []
+        for path, item in zip(paths, parsed):
+            if isinstance(item, BaseException):
+                fail(path, item)
+            elif previous.get(item.file_path) == item.content_hash:
+                results["skipped"] += 1
+            else:
+                notes.append(item)
+        if not notes:
+            return
+
+        missing_ids = [note for note in notes if note.needs_id]
+        if missing_ids:
+            node_ids = await asyncio.gather(
+                *(self._generate_and_persist_node_id(n.path) for n in missing_ids)
+            )
+            for note, node_id in zip(missing_ids, node_ids):
+                note.node_id = node_id
+
+        graph_written = False
+        neo4j = await self._ensure_neo4j()
+        if neo4j:
+            try:
+                await neo4j.write_note_batch([note.to_graph_row() for note in notes])
+                graph_written = True
+                await request_snapshot_rebuild()
+            except Exception as e:
+                for note in notes:
+                    fail(note.path, e)
+
+        indexed = [note.metadata for note in notes if note.metadata is not None]
+        for note in notes:
+            if note.metadata is not None:
+                note.metadata.content_hash = (
+                    note.content_hash if graph_written else None
+                )
+        try:
+            await self._note_index.upsert_many(indexed, with_hash=True)
+        except Exception as e:
+            logger.warning(f"Failed to update note index for {len(notes)} notes: {e}")
+
+        if neo4j and not graph_written:
+            return
+        results["synced"] += len(notes)
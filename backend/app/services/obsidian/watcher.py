@@ -8,7 +8,13 @@ synchronization with Neo4j and other downstream processing.
 Key Features:
 - Debounced callbacks: Rapid successive saves (e.g., during typing) are coalesced
   into a single callback, preventing unnecessary processing overhead
+- Batched delivery: With on_batch, every debounce window is delivered as a few
+  lists of at most batch_size paths (e.g., one Celery task per chunk) instead
+  of one callback per file, so a git pull touching 2,000 notes is a handful
+  of calls
 - Selective monitoring: Only watches .md files, ignores .obsidian/ config directory
+- Deletions and renames are reported too; callbacks should check whether the
+  path still exists (deleted notes are dropped from the note index)
 - Thread-safe: Uses locking for safe concurrent access to pending changes
 - Graceful lifecycle: Clean start/stop with proper thread cleanup
 
@@ -30,6 +36,9 @@ Usage:
     watcher.start()
     # ... application runs ...
     watcher.stop()
+
+    # Or receive each debounce window in chunks
+    watcher = VaultWatcher("/path/to/vault", on_batch=handle_paths, batch_size=500)
 """
 
 from __future__ import annotations
@@ -57,7 +66,8 @@ class VaultEventHandler(FileSystemEventHandler):
         When a file change is detected, it's added to a pending dict with a timestamp.
         A timer is started/reset to process all pending changes after debounce_ms.
         This means if a user saves a file multiple times in quick succession,
-        only one callback fires after they stop typing.
+        only one callback fires after they stop typing. With on_batch, all
+        paths of the window are delivered in chunks of batch_size.
 
     Thread Safety:
         Uses a threading.Lock to protect the pending dict and timer from
@@ -67,13 +77,18 @@ class VaultEventHandler(FileSystemEventHandler):
         vault_path: Root path of the Obsidian vault
         on_change: Callback function invoked with the changed file's Path
         debounce_ms: Milliseconds to wait before processing accumulated changes
+        on_batch: Callback invoked with lists of changed Paths (replaces
+            per-file on_change calls when set)
+        batch_size: Maximum number of paths per on_batch call
     """
 
     def __init__(
         self,
         vault_path: Path,
-        on_change: Callable[[Path], None],
+        on_change: Optional[Callable[[Path], None]] = None,
         debounce_ms: int = 1000,
+        on_batch: Optional[Callable[[list[Path]], None]] = None,
+        batch_size: int = 500,
     ):
         """
         Initialize the event handler.
@@ -82,30 +97,40 @@ class VaultEventHandler(FileSystemEventHandler):
             vault_path: Root path of the Obsidian vault being watched
             on_change: Callback invoked for each changed file after debouncing
             debounce_ms: Delay in ms before processing changes (default: 1000ms)
+            on_batch: Callback invoked with each chunk of changed files after
+                debouncing; takes precedence over on_change
+            batch_size: Maximum paths per on_batch chunk (default: 500)
         """
         self.vault_path = vault_path
         self.on_change = on_change
         self.debounce_ms = debounce_ms
+        self.on_batch = on_batch
+        self.batch_size = max(1, batch_size)
         self._pending: dict[str, float] = {}
         self._timer: Optional[threading.Timer] = None
         self._lock = threading.Lock()
 
-    def _handle_event(self, event):
+    def _handle_event(self, event, path: Optional[str] = None):
         """
-        Common handler for file creation and modification events.
+        Common handler for file creation, modification and deletion events.
 
         Filters out directories, non-markdown files, and .obsidian/ config files
         before scheduling the callback.
+
+        Args:
+            event: The watchdog event
+            path: Path to report (defaults to event.src_path)
         """
+        path = path or event.src_path
         if event.is_directory:
             return
-        if not event.src_path.endswith(".md"):
+        if not path.endswith(".md"):
             return
         # Ignore .obsidian directory (Obsidian's internal config)
-        if "/.obsidian/" in event.src_path or "\\.obsidian\\" in event.src_path:
+        if "/.obsidian/" in path or "\\.obsidian\\" in path:
             return
 
-        self._schedule_callback(Path(event.src_path))
+        self._schedule_callback(Path(path))
 
     def on_modified(self, event):
         """Handle file modification events (user saves an existing note)."""
@@ -115,6 +140,15 @@ class VaultEventHandler(FileSystemEventHandler):
         """Handle file creation events (user creates a new note)."""
         self._handle_event(event)
 
+    def on_deleted(self, event):
+        """Handle file deletion events (callback sees a path that no longer exists)."""
+        self._handle_event(event)
+
+    def on_moved(self, event):
+        """Handle renames/moves as a deletion of the old path plus a new file."""
+        self._handle_event(event)
+        self._handle_event(event, event.dest_path)
+
     def _schedule_callback(self, path: Path):
         """
         Schedule a debounced callback for a file change.
@@ -144,13 +178,23 @@ class VaultEventHandler(FileSystemEventHandler):
         Process all accumulated pending file changes.
 
         Called by the debounce timer after debounce_ms of inactivity.
-        Invokes on_change callback for each pending path, catching and
-        logging any exceptions to prevent one bad file from blocking others.
+        Invokes on_batch once per chunk of batch_size paths, or otherwise
+        on_change for each pending path, catching and logging any exceptions
+        to prevent one bad file (or chunk) from blocking others.
         """
         with self._lock:
             paths = list(self._pending.keys())
             self._pending.clear()
 
+        if self.on_batch is not None:
+            for start in range(0, len(paths), self.batch_size):
+                chunk = [Path(p) for p in paths[start : start + self.batch_size]]
+                try:
+                    self.on_batch(chunk)
+                except Exception as e:
+                    logger.error(f"Error processing batch of {len(chunk)} changes: {e}")
+            return
+
         for path_str in paths:
             try:
                 self.on_change(Path(path_str))
@@ -176,6 +220,8 @@ class VaultWatcher:
     Attributes:
         vault_path: Root path of the Obsidian vault
         on_change: Callback invoked for each changed file
+        on_batch: Callback invoked with chunks of changed files (optional)
+        batch_size: Maximum paths per on_batch call
         debounce_ms: Debounce delay in milliseconds
         is_running: Whether the watcher is currently active
 
@@ -195,6 +241,8 @@ class VaultWatcher:
         vault_path: str,
         on_change: Callable[[Path], None] | None = None,
         debounce_ms: int = 1000,
+        on_batch: Callable[[list[Path]], None] | None = None,
+        batch_size: int = 500,
     ):
         """
         Initialize the vault watcher.
@@ -206,10 +254,16 @@ class VaultWatcher:
             debounce_ms: Milliseconds to wait after last change before invoking
                         callback (default: 1000ms). Higher values reduce processing
                         during rapid edits but increase latency.
+            on_batch: Callback invoked with lists of changed Paths, one call per
+                     batch_size chunk of each debounce window. Takes precedence
+                     over on_change.
+            batch_size: Maximum number of paths per on_batch call.
         """
         self.vault_path = Path(vault_path)
         self.on_change = on_change or self._default_handler
         self.debounce_ms = debounce_ms
+        self.on_batch = on_batch
+        self.batch_size = batch_size
         self._observer: Optional[Observer] = None
         self._running = False
 
@@ -231,7 +285,13 @@ class VaultWatcher:
             logger.warning("Vault watcher already running")
             return
 
-        handler = VaultEventHandler(self.vault_path, self.on_change, self.debounce_ms)
+        handler = VaultEventHandler(
+            self.vault_path,
+            self.on_change,
+            self.debounce_ms,
+            on_batch=self.on_batch,
+            batch_size=self.batch_size,
+        )
 
         self._observer = Observer()
         self._observer.schedule(handler, str(self.vault_path), recursive=True)
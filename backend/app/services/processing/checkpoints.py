@@ -0,0 +1,252 @@
+"""
+Processing Stage Checkpoints
+
+Persists each pipeline stage's output as soon as it completes so that a
+retried or re-queued run of the same content can skip LLM calls whose results
+are still valid. Without this, a failure in a late step (Neo4j node creation,
+cost logging, saving the ProcessingRun) makes the Celery retry re-run every
+summarization, extraction and question call from scratch.
+
+Validity:
+    A checkpoint is reused only when all of these still match:
+    - content_hash: hash of the title, text and annotations the stage ran on
+    - config_hash: hash of the model and stage parameters (plus
+      CHECKPOINT_VERSION, bumped when prompts or output schemas change)
+    - its inputs: the pipeline only restores a stage when content analysis
+      and every enabled dependency were restored too, so a recomputed
+      summary also recomputes tagging, questions, etc.
+
+Invalidation:
+    PipelineConfig.invalidate_stages (exposed on the processing API and the
+    run_processing.py CLI) deletes checkpoints for specific stages before the
+    run starts, forcing them (and their dependents) to be recomputed.
+
+Usage:
+    from app.services.processing.checkpoints import CheckpointStore
+
+    result = await process_content(
+        content, config, checkpoints=CheckpointStore(task_context=True)
+    )
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import settings
+from app.db.base import async_session_maker, task_session_maker
+from app.db.models_processing import ProcessingCheckpoint
+from app.enums.processing import ProcessingStage
+from app.models.content import UnifiedContent
+from app.models.processing import (
+    Connection,
+    ContentAnalysis,
+    ExtractionResult,
+    FollowupTask,
+    MasteryQuestion,
+    TagAssignment,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when stage prompts or output schemas change to invalidate all checkpoints
+CHECKPOINT_VERSION = 1
+
+# Pydantic model of each stage's output (list stages hold lists of these).
+# SUMMARIZATION outputs a plain {level: text} dict.
+_STAGE_MODELS: dict[ProcessingStage, Any] = {
+    ProcessingStage.ANALYSIS: ContentAnalysis,
+    ProcessingStage.EXTRACTION: ExtractionResult,
+    ProcessingStage.TAGGING: TagAssignment,
+    ProcessingStage.CONNECTIONS: Connection,
+    ProcessingStage.FOLLOWUPS: FollowupTask,
+    ProcessingStage.QUESTIONS: MasteryQuestion,
+}
+
+
+@dataclass
+class StageCheckpoint:
+    """A stored stage output with the config hash it was produced under."""
+
+    stage: str
+    config_hash: str
+    output: Any
+    cost_usd: float = 0.0
+
+
+def compute_content_hash(content: UnifiedContent) -> str:
+    """Hash the parts of the content that stage prompts are built from."""
+    digest = hashlib.sha256()
+    digest.update((content.title or "").encode())
+    digest.update(b"\0")
+    digest.update((content.full_text or "").encode())
+    for annotation in content.annotations:
+        digest.update(b"\0")
+        digest.update((annotation.content or "").encode())
+    return digest.hexdigest()
+
+
+def stage_config_hash(stage: ProcessingStage, config: Any) -> str:
+    """
+    Hash the settings that shape a stage's output.
+
+    Args:
+        stage: Pipeline stage
+        config: PipelineConfig of the current run
+    """
+    params: dict[str, Any] = {
+        "version": CHECKPOINT_VERSION,
+        "stage": stage.value,
+        "model": settings.TEXT_MODEL,
+    }
+    if stage == ProcessingStage.CONNECTIONS:
+        params["top_k"] = config.max_connection_candidates
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def serialize_stage_output(stage: ProcessingStage, value: Any) -> dict:
+    """Convert a stage's output into a JSON-compatible checkpoint payload."""
+    if isinstance(value, list):
+        data: Any = [item.model_dump(mode="json") for item in value]
+    elif hasattr(value, "model_dump"):
+        data = value.model_dump(mode="json")
+    else:
+        data = value
+    return {"value": data}
+
+
+def deserialize_stage_output(stage: ProcessingStage, payload: dict) -> Any:
+    """Rebuild a stage's output from a checkpoint payload."""
+    data = payload["value"]
+    model = _STAGE_MODELS.get(stage)
+    if model is None:
+        return data
+    if isinstance(data, list):
+        return [model.model_validate(item) for item in data]
+    return model.model_validate(data)
+
+
+class CheckpointStore:
+    """
+    Reads and writes processing_checkpoints rows.
+
+    Attributes:
+        task_context: Use task_session_maker (Celery tasks, new event loop per
+            task) instead of the pooled async_session_maker (FastAPI).
+    """
+
+    def __init__(self, task_context: bool = False):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            task_context: If True, use task_session_maker (safe for Celery tasks
+                with new event loops). If False, use async_session_maker.
+        """
+        self.task_context = task_context
+        self._session_maker = (
+            task_session_maker if task_context else async_session_maker
+        )
+
+    async def load(
+        self, content_uuid: str, content_hash: str
+    ) -> dict[ProcessingStage, StageCheckpoint]:
+        """
+        Load the checkpoints recorded for this version of the content.
+
+        Rows whose content_hash differs (content changed since) are ignored.
+        Config hashes are checked by the caller, per stage.
+
+        Returns:
+            Dict mapping stage to its deserialized checkpoint
+        """
+        async with self._session_maker() as session:
+            result = await session.execute(
+                select(ProcessingCheckpoint).where(
+                    ProcessingCheckpoint.content_uuid == content_uuid,
+                    ProcessingCheckpoint.content_hash == content_hash,
+                )
+            )
+            rows = result.scalars().all()
+
+        checkpoints: dict[ProcessingStage, StageCheckpoint] = {}
+        for row in rows:
+            try:
+                stage = ProcessingStage(row.stage)
+                output = deserialize_stage_output(stage, row.output or {})
+            except Exception as e:
+                logger.warning(
+                    f"Ignoring unreadable {row.stage} checkpoint for {content_uuid}: {e}"
+                )
+                continue
+            checkpoints[stage] = StageCheckpoint(
+                stage=row.stage,
+                config_hash=row.config_hash,
+                output=output,
+                cost_usd=row.cost_usd or 0.0,
+            )
+        return checkpoints
+
+    async def save(
+        self,
+        content_uuid: str,
+        content_hash: str,
+        stage: ProcessingStage,
+        config_hash: str,
+        output: Any,
+        cost_usd: float = 0.0,
+    ) -> None:
+        """Insert or replace the checkpoint for (content, stage)."""
+        row = {
+            "content_uuid": content_uuid,
+            "stage": stage.value,
+            "content_hash": content_hash,
+            "config_hash": config_hash,
+            "output": serialize_stage_output(stage, output),
+            "cost_usd": cost_usd,
+        }
+        stmt = pg_insert(ProcessingCheckpoint).values(**row)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_processing_checkpoint",
+            set_={
+                "content_hash": stmt.excluded.content_hash,
+                "config_hash": stmt.excluded.config_hash,
+                "output": stmt.excluded.output,
+                "cost_usd": stmt.excluded.cost_usd,
+                "created_at": stmt.excluded.created_at,
+            },
+        )
+        async with self._session_maker() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def invalidate(
+        self, content_uuid: str, stages: Optional[list[str]] = None
+    ) -> int:
+        """
+        Delete checkpoints for a content item.
+
+        Args:
+            content_uuid: UUID string of the content
+            stages: ProcessingStage values to invalidate (all stages if None)
+
+        Returns:
+            Number of checkpoints deleted
+        """
+        stmt = delete(ProcessingCheckpoint).where(
+            ProcessingCheckpoint.content_uuid == content_uuid
+        )
+        if stages is not None:
+            values = [getattr(stage, "value", stage) for stage in stages]
+            stmt = stmt.where(ProcessingCheckpoint.stage.in_(values))
+        async with self._session_maker() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount or 0
@@ -135,6 +135,8 @@ async def cleanup_spaced_rep_cards(
 
     By default, cards are NOT deleted during reprocessing since users
     may have review history. Set delete_cards=True to force deletion.
+    Deleted cards are removed from the mastery rollups in the same
+    transaction.
 
     Args:
         content_uuid: Content UUID string
@@ -149,6 +151,12 @@ async def cleanup_spaced_rep_cards(
         return 0
 
     from app.db.models_learning import SpacedRepCard
+    from app.services.learning.mastery_rollup import MasteryRollupService
+
+    cards = await session.execute(
+        select(SpacedRepCard).where(SpacedRepCard.content_id == content_uuid)
+    )
+    await MasteryRollupService(session).apply_cards_deleted(cards.scalars().all())
 
     result = await session.execute(
         delete(SpacedRepCard).where(SpacedRepCard.content_id == content_uuid)
@@ -33,6 +33,7 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 from dataclasses import dataclass
@@ -51,6 +52,7 @@ from sqlalchemy import select
 from app.config import settings
 from app.db.base import task_session_maker
 from app.db.models import Image as DBImage, Content as DBContent
+from app.services.cpu_executor import run_cpu_bound
 from app.services.obsidian.vault import get_vault_manager
 
 if TYPE_CHECKING:
@@ -139,15 +141,20 @@ async def save_extracted_images(
     # Ensure directory exists
     await aiofiles.os.makedirs(assets_folder, exist_ok=True)
 
-    # Process each page
-    for page in ocr_result.pages:
-        page_images = await _save_page_images(
-            page=page,
-            content_id=content_id,
-            assets_folder=assets_folder,
-            vault_root=vault.vault_path,
-            optimize=optimize,
+    # Process pages concurrently so the CPU executor works on several at once
+    pages_images = await asyncio.gather(
+        *(
+            _save_page_images(
+                page=page,
+                content_id=content_id,
+                assets_folder=assets_folder,
+                vault_root=vault.vault_path,
+                optimize=optimize,
+            )
+            for page in ocr_result.pages
         )
+    )
+    for page_images in pages_images:
         saved_images.extend(page_images)
 
     if saved_images:
@@ -349,6 +356,28 @@ async def _process_image(
     """
     Process and optionally optimize a base64-encoded image.
 
+    Runs the decode/resize/encode work on the shared CPU executor so the
+    event loop stays free while images are being transformed.
+
+    Args:
+        base64_data: Base64-encoded image data (may include data URI prefix)
+        optimize: Whether to resize and compress
+
+    Returns:
+        Tuple of (image_bytes, width, height)
+    """
+    return await run_cpu_bound(process_image_bytes, base64_data, optimize)
+
+
+def process_image_bytes(
+    base64_data: str,
+    optimize: bool = True,
+) -> tuple[bytes, int, int]:
+    """
+    Decode, normalize to RGB, optionally resize, and encode an image.
+
+    Synchronous and module-level so it can run in a worker process.
+
     Args:
         base64_data: Base64-encoded image data (may include data URI prefix)
         optimize: Whether to resize and compress
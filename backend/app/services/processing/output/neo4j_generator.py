@@ -7,14 +7,28 @@ Nodes created:
 - Content node with embedding
 - Concept nodes for core concepts (with optional Obsidian notes)
 
+Embeddings for the content node and all core concepts are requested in one
+EmbeddingService.embed_many() call. Pass the pipeline run's service to reuse
+the content vector already computed for connection discovery.
+
 Relationships created:
 - CONTAINS: Content -> Concept
 - RELATES_TO/EXTENDS/etc: Content -> Content
+- Concept -> Concept (from extracted related concepts)
+- REPRESENTS: Content -> Note (when the vault note already exists)
+
+All of a document's nodes and relationships are collected into a
+GraphWriteBatch and written by Neo4jClient.write_graph_batch() with a few UNWIND
+statements in one transaction. bulk_create_knowledge_nodes() does the same for
+many documents at once (backfills).
 
 Usage:
     from app.services.processing.output.neo4j_generator import create_knowledge_nodes
 
     node_id = await create_knowledge_nodes(content, result, llm_client, neo4j_client)
+
+    # Backfill: list of (content, result) pairs
+    written = await bulk_create_knowledge_nodes(processed, llm_client, neo4j_client)
 """
 
 import logging
@@ -23,8 +37,14 @@ from typing import Optional
 from app.models.content import UnifiedContent
 from app.config.processing import processing_settings
 from app.enums.processing import SummaryLevel, ConceptImportance
-from app.models.processing import ProcessingResult
+from app.models.processing import Concept, ProcessingResult
 from app.services.llm.client import LLMClient
+from app.services.llm.embeddings import (
+    EmbeddingService,
+    concept_embedding_text,
+    content_embedding_text,
+)
+from app.services.knowledge_graph.batch import GraphWriteBatch
 from app.services.knowledge_graph.client import Neo4jClient
 from app.services.processing.output.obsidian_generator import (
     generate_concept_notes_for_content,
@@ -33,21 +53,153 @@ from app.services.processing.output.obsidian_generator import (
 logger = logging.getLogger(__name__)
 
 
+def _flatten_tags(result: ProcessingResult) -> list[str]:
+    """Combine domain and meta tags into a flat list of strings."""
+    all_tags = []
+    for tag in result.tags.domain_tags + result.tags.meta_tags:
+        if isinstance(tag, list):
+            all_tags.extend(str(t) for t in tag)
+        else:
+            all_tags.append(str(tag))
+    return all_tags
+
+
+def _core_concepts(result: ProcessingResult) -> list[Concept]:
+    return [
+        c
+        for c in result.extraction.concepts
+        if c.importance == ConceptImportance.CORE.value
+    ]
+
+
+def _embedding_texts(title: str, summary: str, concepts: list[Concept]) -> list[str]:
+    """Content text followed by one text per concept (see embed_many)."""
+    return [content_embedding_text(title, summary)] + [
+        concept_embedding_text(c.name, c.definition) for c in concepts
+    ]
+
+
+async def _concept_note_paths(
+    content: UnifiedContent, result: ProcessingResult
+) -> dict[str, str]:
+    """Generate Obsidian notes for core concepts; returns name -> file path."""
+    try:
+        created_notes = await generate_concept_notes_for_content(
+            content=content,
+            result=result,
+            importance_filter=ConceptImportance.CORE,
+        )
+        logger.info(f"Generated {len(created_notes)} concept notes")
+        return {note["name"]: note["file_path"] for note in created_notes}
+    except Exception as e:
+        logger.error(f"Failed to generate concept notes: {e}")
+        # Continue without concept notes - they're optional
+        return {}
+
+
+def build_graph_batch(
+    content_id: str,
+    title: str,
+    result: ProcessingResult,
+    embedding: list[float],
+    concept_embeddings: list[list[float]],
+    concept_file_paths: Optional[dict[str, str]] = None,
+    source_url: Optional[str] = None,
+    file_path: Optional[str] = None,
+    authors: Optional[list[str]] = None,
+    replace_existing: bool = False,
+) -> GraphWriteBatch:
+    """
+    Collect all graph writes for one processed document.
+
+    Args:
+        content_id: Content node ID
+        title: Content title
+        result: Processing result
+        embedding: Content embedding
+        concept_embeddings: One embedding per core concept, in extraction order
+        concept_file_paths: Concept name -> Obsidian note path
+        source_url: Original source URL
+        file_path: Obsidian note path of the content
+        authors: Content authors (stored in node metadata)
+        replace_existing: Delete the content's outgoing relationships first
+            (reprocessing)
+
+    Returns:
+        GraphWriteBatch for Neo4jClient.write_graph_batch()
+    """
+    concept_file_paths = concept_file_paths or {}
+    core_concepts = _core_concepts(result)
+    summary = result.summaries.get(SummaryLevel.STANDARD.value, title)
+
+    metadata = {
+        "domain": str(result.analysis.domain) if result.analysis.domain else "",
+        "complexity": (
+            str(result.analysis.complexity) if result.analysis.complexity else ""
+        ),
+    }
+    if authors is not None:
+        metadata["authors"] = ", ".join(authors)
+
+    batch = GraphWriteBatch()
+    if replace_existing:
+        batch.replace_relationships_for.append(content_id)
+
+    batch.add_content_node(
+        content_id=content_id,
+        title=title,
+        content_type=result.analysis.content_type,
+        summary=summary[: processing_settings.NEO4J_SUMMARY_TRUNCATE],
+        embedding=embedding,
+        tags=_flatten_tags(result),
+        source_url=source_url,
+        file_path=file_path,
+        metadata=metadata,
+    )
+
+    for concept, concept_embedding in zip(core_concepts, concept_embeddings):
+        batch.add_concept_node(
+            concept,
+            embedding=concept_embedding,
+            file_path=concept_file_paths.get(concept.name),
+        )
+        batch.link_content_to_concept(content_id, concept.name, concept.importance)
+
+    for concept in core_concepts:
+        for related in concept.related_concepts:
+            batch.link_concepts(concept.name, related.name, related.relationship)
+
+    for conn in result.connections:
+        batch.add_relationship(
+            source_id=content_id,
+            target_id=conn.target_id,
+            relationship_type=conn.relationship_type,
+            properties={"strength": conn.strength, "explanation": conn.explanation},
+        )
+
+    # Bridge processed content with its Obsidian vault Note node
+    if file_path:
+        batch.link_content_to_note(file_path)
+
+    return batch
+
+
 async def create_knowledge_nodes(
     content: UnifiedContent,
     result: ProcessingResult,
     llm_client: LLMClient,
     neo4j_client: Neo4jClient,
     generate_concept_notes: bool = True,
+    embedding_service: Optional[EmbeddingService] = None,
 ) -> Optional[str]:
     """
     Create knowledge graph nodes and relationships.
 
-    Creates:
+    Creates (in one transaction):
     1. Content node with embedding for the processed content
     2. Concept nodes for core concepts (with Obsidian notes if enabled)
     3. CONTAINS relationships from content to concepts
-    4. Cross-content relationships from connection discovery
+    4. Concept-to-concept and cross-content relationships
 
     Args:
         content: Original unified content
@@ -56,175 +208,137 @@ async def create_knowledge_nodes(
         neo4j_client: Neo4j client for graph operations
         generate_concept_notes: If True, also generate Obsidian markdown notes
                                for core concepts (default: True)
+        embedding_service: Shared EmbeddingService of the pipeline run (a new
+                           one is created from llm_client if omitted)
 
     Returns:
         Created content node ID, or None if failed
     """
     try:
-        # Get summary for embedding
         summary = result.summaries.get(SummaryLevel.STANDARD.value, content.title)
-        embedding_text = f"{content.title}\n\n{summary}"
+        core_concepts = _core_concepts(result)
 
-        # Generate embedding - embed() returns (list[list[float]], LLMUsage)
-        embeddings, _usage = await llm_client.embed([embedding_text])
-        embedding = embeddings[0] if embeddings else []
+        # Embed content and all core concepts in one batched request
+        if embedding_service is None:
+            embedding_service = EmbeddingService(llm_client, content_id=content.id)
+        embedding, *concept_embeddings = await embedding_service.embed_many(
+            _embedding_texts(content.title, summary, core_concepts)
+        )
 
-        # Combine all tags and ensure flat list of strings (no nested lists)
-        all_tags = []
-        for tag in result.tags.domain_tags + result.tags.meta_tags:
-            if isinstance(tag, list):
-                all_tags.extend(str(t) for t in tag)
-            else:
-                all_tags.append(str(tag))
+        # Generate Obsidian notes for concepts first (if enabled)
+        # This gives us file paths to store in Neo4j
+        concept_file_paths: dict[str, str] = {}
+        if generate_concept_notes:
+            concept_file_paths = await _concept_note_paths(content, result)
 
-        # Create content node
         # Use the obsidian note path from result (set by pipeline after note generation)
         # or fall back to content.obsidian_path if available
-        file_path = result.obsidian_note_path or content.obsidian_path
-
-        content_node_id = await neo4j_client.create_content_node(
+        batch = build_graph_batch(
             content_id=content.id,
             title=content.title,
-            content_type=result.analysis.content_type,
-            summary=summary[: processing_settings.NEO4J_SUMMARY_TRUNCATE],
+            result=result,
             embedding=embedding,
-            tags=all_tags,
+            concept_embeddings=concept_embeddings,
+            concept_file_paths=concept_file_paths,
             source_url=content.source_url,
-            file_path=file_path,
-            metadata={
-                "domain": str(result.analysis.domain) if result.analysis.domain else "",
-                "complexity": (
-                    str(result.analysis.complexity)
-                    if result.analysis.complexity
-                    else ""
-                ),
-                "authors": ", ".join(content.authors) if content.authors else "",
-            },
+            file_path=result.obsidian_note_path or content.obsidian_path,
+            authors=content.authors or [],
         )
-
-        logger.debug(f"Created content node: {content_node_id}")
-
-        # Generate Obsidian notes for concepts first (if enabled)
-        # This gives us file paths to store in Neo4j
-        concept_file_paths: dict[str, str] = {}
-        if generate_concept_notes:
-            try:
-                created_notes = await generate_concept_notes_for_content(
-                    content=content,
-                    result=result,
-                    importance_filter=ConceptImportance.CORE,
-                )
-                concept_file_paths = {
-                    note["name"]: note["file_path"] for note in created_notes
-                }
-                logger.info(f"Generated {len(created_notes)} concept notes")
-            except Exception as e:
-                logger.error(f"Failed to generate concept notes: {e}")
-                # Continue without concept notes - they're optional
-
-        # Create concept nodes for core concepts
-        core_concepts = [
-            c
-            for c in result.extraction.concepts
-            if c.importance == ConceptImportance.CORE.value
-        ]
-
-        for concept in core_concepts:
-            try:
-                # Generate concept embedding - embed() returns (list[list[float]], LLMUsage)
-                concept_text = f"{concept.name}: {concept.definition}"
-                concept_emb, _usage = await llm_client.embed([concept_text])
-                concept_embedding = concept_emb[0] if concept_emb else []
-
-                # Get file path if we generated a note for this concept
-                concept_file_path = concept_file_paths.get(concept.name)
-
-                # Create concept node with file path
-                await neo4j_client.create_concept_node(
-                    concept=concept,
-                    embedding=concept_embedding,
-                    file_path=concept_file_path,
-                )
-
-                # Link content to concept
-                await neo4j_client.link_content_to_concept(
-                    content_id=content.id,
-                    concept_id=concept.id,
-                    importance=concept.importance,
-                )
-
-                logger.debug(
-                    f"Created concept node: {concept.name} (note: {concept_file_path})"
-                )
-
-            except Exception as e:
-                logger.error(f"Failed to create concept node '{concept.name}': {e}")
-
-        # Create concept-to-concept relationships
-        for concept in core_concepts:
-            for related in concept.related_concepts:
-                try:
-                    created = await neo4j_client.link_concept_to_concept(
-                        source_name=concept.name,
-                        target_name=related.name,
-                        relationship_type=related.relationship,
-                    )
-                    if created:
-                        logger.debug(
-                            f"Created concept link: {concept.name} "
-                            f"-[{related.relationship}]-> {related.name}"
-                        )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to link concept '{concept.name}' to '{related.name}': {e}"
-                    )
-
-        # Create cross-content relationships
-        for conn in result.connections:
-            try:
-                await neo4j_client.create_relationship(
-                    source_id=content.id,
-                    target_id=conn.target_id,
-                    relationship_type=conn.relationship_type,
-                    properties={
-                        "strength": conn.strength,
-                        "explanation": conn.explanation,
-                    },
-                )
-                logger.debug(
-                    f"Created relationship: {content.title} "
-                    f"-[{conn.relationship_type}]-> {conn.target_title}"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to create relationship to '{conn.target_title}': {e}"
-                )
-
-        # Link Content node to Note node if they share the same file_path
-        # This bridges processed content with Obsidian vault representation
-        if file_path:
-            try:
-                link_result = await neo4j_client.link_content_to_note_by_path(file_path)
-                if link_result:
-                    logger.debug(
-                        f"Linked Content to Note: {link_result['content_id']} "
-                        f"-> {link_result['note_id']}"
-                    )
-            except Exception as e:
-                logger.debug(f"No Note node found to link for {file_path}: {e}")
+        counts = await neo4j_client.write_graph_batch(batch)
 
         logger.info(
             f"Created knowledge graph nodes for {content.title}: "
-            f"1 content, {len(core_concepts)} concepts, {len(result.connections)} connections"
+            f"1 content, {counts.get('concept_nodes', 0)} concepts, "
+            f"{counts.get('relationships', 0)} connections"
         )
 
-        return content_node_id
+        return content.id
 
     except Exception as e:
         logger.error(f"Failed to create knowledge nodes: {e}")
         return None
 
 
+async def bulk_create_knowledge_nodes(
+    items: list[tuple[UnifiedContent, ProcessingResult]],
+    llm_client: LLMClient,
+    neo4j_client: Neo4jClient,
+    generate_concept_notes: bool = False,
+    embedding_service: Optional[EmbeddingService] = None,
+    documents_per_transaction: Optional[int] = None,
+) -> int:
+    """
+    Create knowledge graph nodes for many documents (backfills, rebuilds).
+
+    Embeddings for all documents are requested together (batched up to the
+    provider's input limit) and the graph is written with
+    Neo4jClient.write_graph_batches(), several documents per transaction.
+
+    Args:
+        items: (content, processing result) pairs
+        llm_client: LLM client for embedding generation
+        neo4j_client: Neo4j client for graph operations
+        generate_concept_notes: Also generate Obsidian notes for core concepts
+        embedding_service: EmbeddingService to use (created if omitted)
+        documents_per_transaction: Documents per write transaction (default
+            from NEO4J_BULK_DOCUMENTS_PER_TRANSACTION)
+
+    Returns:
+        Number of content nodes written
+    """
+    if not items:
+        return 0
+    if embedding_service is None:
+        embedding_service = EmbeddingService(llm_client)
+
+    core_concepts = [_core_concepts(result) for _, result in items]
+    texts_per_item = [
+        _embedding_texts(
+            content.title,
+            result.summaries.get(SummaryLevel.STANDARD.value, content.title),
+            concepts,
+        )
+        for (content, result), concepts in zip(items, core_concepts)
+    ]
+    vectors = await embedding_service.embed_many(
+        [text for texts in texts_per_item for text in texts]
+    )
+
+    batches = []
+    offset = 0
+    for (content, result), texts in zip(items, texts_per_item):
+        embedding, *concept_embeddings = vectors[offset : offset + len(texts)]
+        offset += len(texts)
+
+        concept_file_paths: dict[str, str] = {}
+        if generate_concept_notes:
+            concept_file_paths = await _concept_note_paths(content, result)
+
+        batches.append(
+            build_graph_batch(
+                content_id=content.id,
+                title=content.title,
+                result=result,
+                embedding=embedding,
+                concept_embeddings=concept_embeddings,
+                concept_file_paths=concept_file_paths,
+                source_url=content.source_url,
+                file_path=result.obsidian_note_path or content.obsidian_path,
+                authors=content.authors or [],
+            )
+        )
+
+    counts = await neo4j_client.write_graph_batches(
+        batches, documents_per_transaction=documents_per_transaction
+    )
+    logger.info(
+        f"Bulk-created knowledge graph nodes for {len(items)} documents: "
+        f"{counts.get('concept_nodes', 0)} concepts, "
+        f"{counts.get('relationships', 0)} connections"
+    )
+    return counts.get("content_nodes", 0)
+
+
 async def update_content_node(
     content_id: str,
     title: str,
@@ -233,11 +347,13 @@ async def update_content_node(
     neo4j_client: Neo4jClient,
     content: Optional[UnifiedContent] = None,
     generate_concept_notes: bool = True,
+    embedding_service: Optional[EmbeddingService] = None,
 ) -> bool:
     """
     Update an existing content node with new processing results.
 
-    Used when content is reprocessed. This performs a full update:
+    Used when content is reprocessed. This performs a full update in one
+    transaction:
     1. Deletes old outgoing relationships
     2. Updates the content node properties and embedding
     3. Creates new concept nodes and CONTAINS relationships (with optional Obsidian notes)
@@ -251,121 +367,41 @@ async def update_content_node(
         neo4j_client: Neo4j client for updates
         content: Optional UnifiedContent for concept note generation
         generate_concept_notes: If True and content provided, generate Obsidian notes
+        embedding_service: Shared EmbeddingService (a new one is created from
+                           llm_client if omitted)
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Step 1: Delete old outgoing relationships
-        deleted_count = await neo4j_client.delete_content_relationships(content_id)
-        logger.debug(f"Deleted {deleted_count} old relationships for {content_id}")
-
-        # Step 2: Update content node with new embedding - embed() returns (list[list[float]], LLMUsage)
         summary = result.summaries.get(SummaryLevel.STANDARD.value, "")
-        embedding_text = f"{title}\n\n{summary}"
-        embeddings, _usage = await llm_client.embed([embedding_text])
-
-        # Flatten tags to ensure no nested lists
-        all_tags = []
-        for tag in result.tags.domain_tags + result.tags.meta_tags:
-            if isinstance(tag, list):
-                all_tags.extend(str(t) for t in tag)
-            else:
-                all_tags.append(str(tag))
-
-        await neo4j_client.create_content_node(
-            content_id=content_id,
-            title=title,
-            content_type=result.analysis.content_type,
-            summary=summary[: processing_settings.NEO4J_SUMMARY_TRUNCATE],
-            embedding=embeddings[0] if embeddings else [],
-            tags=all_tags,
-            metadata={
-                "domain": str(result.analysis.domain) if result.analysis.domain else "",
-                "complexity": (
-                    str(result.analysis.complexity)
-                    if result.analysis.complexity
-                    else ""
-                ),
-            },
+        core_concepts = _core_concepts(result)
+
+        # Content and core concepts are embedded in one batched request
+        if embedding_service is None:
+            embedding_service = EmbeddingService(llm_client, content_id=content_id)
+        embedding, *concept_embeddings = await embedding_service.embed_many(
+            _embedding_texts(title, summary, core_concepts)
         )
 
-        # Step 3: Generate concept notes if enabled and content provided
         concept_file_paths: dict[str, str] = {}
         if generate_concept_notes and content is not None:
-            try:
-                created_notes = await generate_concept_notes_for_content(
-                    content=content,
-                    result=result,
-                    importance_filter=ConceptImportance.CORE,
-                )
-                concept_file_paths = {
-                    note["name"]: note["file_path"] for note in created_notes
-                }
-            except Exception as e:
-                logger.error(f"Failed to generate concept notes: {e}")
-
-        # Step 4: Create concept nodes for core concepts
-        core_concepts = [
-            c
-            for c in result.extraction.concepts
-            if c.importance == ConceptImportance.CORE.value
-        ]
-
-        for concept in core_concepts:
-            try:
-                concept_text = f"{concept.name}: {concept.definition}"
-                concept_emb, _usage = await llm_client.embed([concept_text])
-                concept_file_path = concept_file_paths.get(concept.name)
-
-                await neo4j_client.create_concept_node(
-                    concept=concept,
-                    embedding=concept_emb[0] if concept_emb else [],
-                    file_path=concept_file_path,
-                )
-
-                await neo4j_client.link_content_to_concept(
-                    content_id=content_id,
-                    concept_id=concept.id,
-                    importance=concept.importance,
-                )
-
-            except Exception as e:
-                logger.error(f"Failed to update concept node '{concept.name}': {e}")
-
-        # Step 5: Create concept-to-concept relationships
-        for concept in core_concepts:
-            for related in concept.related_concepts:
-                try:
-                    await neo4j_client.link_concept_to_concept(
-                        source_name=concept.name,
-                        target_name=related.name,
-                        relationship_type=related.relationship,
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to link concept '{concept.name}' to '{related.name}': {e}"
-                    )
-
-        # Step 6: Create cross-content relationships
-        for conn in result.connections:
-            try:
-                await neo4j_client.create_relationship(
-                    source_id=content_id,
-                    target_id=conn.target_id,
-                    relationship_type=conn.relationship_type,
-                    properties={
-                        "strength": conn.strength,
-                        "explanation": conn.explanation,
-                    },
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to create relationship to '{conn.target_title}': {e}"
-                )
+            concept_file_paths = await _concept_note_paths(content, result)
+
+        batch = build_graph_batch(
+            content_id=content_id,
+            title=title,
+            result=result,
+            embedding=embedding,
+            concept_embeddings=concept_embeddings,
+            concept_file_paths=concept_file_paths,
+            replace_existing=True,
+        )
+        counts = await neo4j_client.write_graph_batch(batch)
 
         logger.info(
             f"Updated knowledge graph for {content_id}: "
+            f"replaced {counts.get('deleted_relationships', 0)} relationships, "
             f"{len(core_concepts)} concepts, {len(result.connections)} connections"
         )
 
@@ -13,6 +13,30 @@ Pipeline stages:
 6. Follow-up Generation - Create actionable learning tasks
 7. Question Generation - Create mastery questions
 
+Stage Scheduling:
+    Content analysis runs first (every stage reads its result). Stages 2-7 are
+    then executed as a DAG driven by STAGE_DEPENDENCIES: each stage starts as
+    soon as its dependencies finish, and independent stages run concurrently
+    (capped by PipelineConfig.max_concurrent_stages). Wall time per document
+    therefore tracks the critical path (e.g. analysis -> summarization ->
+    questions) rather than the sum of all stages. Per-stage wall times are
+    reported in ProcessingResult.stage_timings.
+
+Checkpointing:
+    When process_content() is given a CheckpointStore, every stage's output is
+    persisted as soon as the stage completes, and a later run of the same
+    content (e.g. a Celery retry after a late Neo4j failure) restores stages
+    whose checkpoints are still valid instead of calling the LLM again. See
+    app/services/processing/checkpoints.py for the validity rules.
+    PipelineConfig.invalidate_stages forces specific stages to be recomputed.
+
+Embeddings:
+    A single EmbeddingService per run serves connection discovery and Neo4j
+    node creation. When connections are discovered, the content text and all
+    core concept texts are embedded up front in one batched request, so both
+    consumers read from the run memo (one embedding call per document instead
+    of one per consumer plus one per concept).
+
 Cost Tracking:
     Each LLM call returns an LLMUsage object. These are collected throughout
     the pipeline and persisted to the database via CostTracker at the end.
@@ -26,10 +50,11 @@ Usage:
     print(f"Estimated cost: ${result.estimated_cost_usd:.4f}")
 """
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -39,9 +64,14 @@ from app.models.processing import (
     ExtractionResult,
     TagAssignment,
 )
-from app.enums.processing import ProcessingStage, SummaryLevel
+from app.enums.processing import ConceptImportance, ProcessingStage, SummaryLevel
 from app.models.llm_usage import LLMUsage
 from app.services.llm.client import get_llm_client, LLMClient
+from app.services.llm.embeddings import (
+    EmbeddingService,
+    concept_embedding_text,
+    content_embedding_text,
+)
 from app.services.knowledge_graph.client import get_neo4j_client, Neo4jClient
 from app.services.processing.stages.content_analysis import analyze_content
 from app.services.processing.stages.summarization import generate_all_summaries
@@ -57,6 +87,12 @@ from app.services.processing.output.obsidian_generator import (
     get_best_title,
 )
 from app.services.processing.output.neo4j_generator import create_knowledge_nodes
+from app.services.processing.checkpoints import (
+    CheckpointStore,
+    StageCheckpoint,
+    compute_content_hash,
+    stage_config_hash,
+)
 from app.services.cost_tracking import CostTracker
 from app.config.processing import processing_settings
 
@@ -154,6 +190,15 @@ class PipelineConfig:
         default_factory=lambda: processing_settings.MAX_CONNECTION_CANDIDATES
     )
 
+    # Maximum number of pipeline stages running concurrently for one content item
+    max_concurrent_stages: int = field(
+        default_factory=lambda: processing_settings.PIPELINE_MAX_CONCURRENT_STAGES
+    )
+
+    # Stage checkpoints to discard before running (ProcessingStage values).
+    # Only used when process_content() is given a CheckpointStore.
+    invalidate_stages: list[str] = field(default_factory=list)
+
     def __post_init__(self):
         """Auto-enable dependencies for enabled stages."""
         auto_enabled = []
@@ -173,12 +218,69 @@ class PipelineConfig:
             logger.info(f"Auto-enabled pipeline stages: {', '.join(auto_enabled)}")
 
 
+# Runs a single stage; must record its own outputs (and handle its own errors)
+StageRunner = Callable[[], Awaitable[None]]
+
+
+async def run_stage_dag(
+    runners: dict[ProcessingStage, StageRunner],
+    max_concurrency: int,
+    dependencies: dict[ProcessingStage, list[ProcessingStage]] = STAGE_DEPENDENCIES,
+) -> dict[str, float]:
+    """
+    Execute pipeline stages as a dependency DAG.
+
+    Every stage waits only for its own dependencies, then runs under a shared
+    semaphore, so independent stages (e.g. summarization and extraction) run
+    concurrently. Dependencies that are not in `runners` (disabled stages) are
+    treated as already satisfied; dependents then see that stage's defaults.
+
+    A stage that raises is logged and still counts as finished, so it never
+    blocks its dependents (stage runners are expected to handle their own
+    errors; this is a safety net).
+
+    Args:
+        runners: Enabled stages mapped to zero-arg coroutine functions
+        max_concurrency: Maximum number of stages running at once (>= 1)
+        dependencies: Stage -> required stages (defaults to STAGE_DEPENDENCIES)
+
+    Returns:
+        Dict mapping stage value (e.g. "SUMMARIZATION") to its wall time in
+        seconds, excluding time spent waiting for dependencies or the semaphore.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    done: dict[ProcessingStage, asyncio.Event] = {
+        stage: asyncio.Event() for stage in runners
+    }
+    timings: dict[str, float] = {}
+
+    async def run(stage: ProcessingStage, runner: StageRunner) -> None:
+        try:
+            for dependency in dependencies.get(stage, []):
+                if dependency in done:
+                    await done[dependency].wait()
+            async with semaphore:
+                stage_start = time.perf_counter()
+                try:
+                    await runner()
+                except Exception as e:
+                    logger.error(f"Stage {stage.value} failed: {e}")
+                finally:
+                    timings[stage.value] = time.perf_counter() - stage_start
+        finally:
+            done[stage].set()
+
+    await asyncio.gather(*(run(stage, runner) for stage, runner in runners.items()))
+    return timings
+
+
 async def process_content(
     content: UnifiedContent,
     config: PipelineConfig = None,
     llm_client: LLMClient = None,
     neo4j_client: Neo4jClient = None,
     db: AsyncSession = None,
+    checkpoints: Optional[CheckpointStore] = None,
 ) -> ProcessingResult:
     """
     Run the full LLM processing pipeline on ingested content.
@@ -191,6 +293,10 @@ async def process_content(
         config: Pipeline configuration (uses defaults if not provided)
         llm_client: LLM client (creates new one if not provided)
         neo4j_client: Neo4j client (creates new one if not provided)
+        db: Session used for card/exercise generation
+        checkpoints: Store for stage checkpoints; when provided, valid
+            checkpoints are restored instead of re-running stages and new
+            stage outputs are persisted as they complete
 
     Returns:
         ProcessingResult with all stage outputs
@@ -211,33 +317,120 @@ async def process_content(
     if neo4j_client is None and config.discover_connections:
         neo4j_client = await get_neo4j_client()
 
+    # Shared by connection discovery and Neo4j node creation
+    embedding_service = EmbeddingService(llm_client, content_id=content.id)
+    create_graph_nodes = bool(
+        config.create_neo4j_nodes
+        and processing_settings.GENERATE_NEO4J_NODES
+        and neo4j_client
+    )
+
     logger.info(f"Starting processing pipeline for: {content.title}")
 
     # =========================================================================
-    # Stage 1: Content Analysis (always runs)
+    # Checkpoints (restore valid stage outputs from a previous attempt)
+    # =========================================================================
+    content_hash = ""
+    saved: dict[ProcessingStage, StageCheckpoint] = {}
+    restored: set[ProcessingStage] = set()
+    if checkpoints is not None:
+        content_hash = compute_content_hash(content)
+        try:
+            if config.invalidate_stages:
+                await checkpoints.invalidate(content.id, config.invalidate_stages)
+                # Consumed: an in-process retry with this config should resume
+                config.invalidate_stages = []
+            saved = await checkpoints.load(content.id, content_hash)
+        except Exception as e:
+            logger.warning(f"Could not load stage checkpoints: {e}")
+
+    def restore(stage: ProcessingStage, scheduled: set[ProcessingStage]) -> Any:
+        """Return the checkpointed output for a stage, or None to run it.
+
+        Only restores when analysis and every scheduled dependency were
+        restored too; otherwise the stage's inputs may have changed.
+        """
+        checkpoint = saved.get(stage)
+        if checkpoint is None:
+            return None
+        if stage != ProcessingStage.ANALYSIS and (
+            ProcessingStage.ANALYSIS not in restored
+            or any(
+                dep in scheduled and dep not in restored
+                for dep in STAGE_DEPENDENCIES[stage]
+            )
+        ):
+            return None
+        if checkpoint.config_hash != stage_config_hash(stage, config):
+            return None
+        restored.add(stage)
+        logger.info(f"Restored {stage.value} from checkpoint")
+        return checkpoint.output
+
+    async def checkpoint(
+        stage: ProcessingStage, output: Any, usages: list[LLMUsage]
+    ) -> None:
+        """Persist a completed stage's output (failures are non-fatal)."""
+        if checkpoints is None:
+            return
+        try:
+            await checkpoints.save(
+                content.id,
+                content_hash,
+                stage,
+                stage_config_hash(stage, config),
+                output,
+                cost_usd=sum(u.cost_usd or 0 for u in usages),
+            )
+        except Exception as e:
+            logger.warning(f"Could not save {stage.value} checkpoint: {e}")
+
+    # =========================================================================
+    # Stage 1: Content Analysis (always runs, every other stage depends on it)
     # =========================================================================
     logger.debug("Stage 1: Content Analysis")
-    analysis, analysis_usages = await analyze_content(
-        content=content, llm_client=llm_client
-    )
-    all_usages.extend(analysis_usages)
+    analysis_start = time.perf_counter()
+    analysis = restore(ProcessingStage.ANALYSIS, set())
+    if analysis is None:
+        analysis, analysis_usages = await analyze_content(
+            content=content, llm_client=llm_client
+        )
+        all_usages.extend(analysis_usages)
+        await checkpoint(ProcessingStage.ANALYSIS, analysis, analysis_usages)
+    stage_timings: dict[str, float] = {
+        ProcessingStage.ANALYSIS.value: time.perf_counter() - analysis_start
+    }
     logger.info(
         f"Analysis: type={analysis.content_type}, "
         f"domain={analysis.domain}, "
         f"complexity={analysis.complexity}"
     )
 
+    # Stage outputs (defaults are used by dependents when a stage is disabled
+    # or fails)
+    summaries: dict[str, str] = {}
+    extraction = ExtractionResult()
+    tags = TagAssignment()
+    connections = []
+    followups = []
+    questions = []
+
     # =========================================================================
     # Stage 2: Generate Summaries
     # =========================================================================
-    summaries = {}
-    if config.generate_summaries:
+    async def run_summarization() -> None:
+        nonlocal summaries
+        cached = restore(ProcessingStage.SUMMARIZATION, set(runners))
+        if cached is not None:
+            summaries = cached
+            return
         logger.debug("Stage 2: Summarization")
         try:
             summaries, summary_usages = await generate_all_summaries(
                 content=content, analysis=analysis, llm_client=llm_client
             )
             all_usages.extend(summary_usages)
+            await checkpoint(ProcessingStage.SUMMARIZATION, summaries, summary_usages)
             logger.info(f"Generated {len(summaries)} summaries")
         except Exception as e:
             logger.error(f"Summarization failed: {e}")
@@ -246,14 +439,19 @@ async def process_content(
     # =========================================================================
     # Stage 3: Extract Concepts
     # =========================================================================
-    extraction = ExtractionResult()
-    if config.extract_concepts:
+    async def run_extraction() -> None:
+        nonlocal extraction
+        cached = restore(ProcessingStage.EXTRACTION, set(runners))
+        if cached is not None:
+            extraction = cached
+            return
         logger.debug("Stage 3: Concept Extraction")
         try:
             extraction, extraction_usages = await extract_concepts(
                 content=content, analysis=analysis, llm_client=llm_client
             )
             all_usages.extend(extraction_usages)
+            await checkpoint(ProcessingStage.EXTRACTION, extraction, extraction_usages)
             logger.info(
                 f"Extracted {len(extraction.concepts)} concepts, "
                 f"{len(extraction.key_findings)} findings"
@@ -264,8 +462,12 @@ async def process_content(
     # =========================================================================
     # Stage 4: Assign Tags
     # =========================================================================
-    tags = TagAssignment()
-    if config.assign_tags:
+    async def run_tagging() -> None:
+        nonlocal tags
+        cached = restore(ProcessingStage.TAGGING, set(runners))
+        if cached is not None:
+            tags = cached
+            return
         logger.debug("Stage 4: Tagging")
         try:
             standard_summary = summaries.get(SummaryLevel.STANDARD.value, "")
@@ -277,6 +479,7 @@ async def process_content(
                 content_id=content.id,
             )
             all_usages.extend(tagging_usages)
+            await checkpoint(ProcessingStage.TAGGING, tags, tagging_usages)
             logger.info(
                 f"Assigned {len(tags.domain_tags)} domain tags, "
                 f"{len(tags.meta_tags)} meta tags"
@@ -284,9 +487,123 @@ async def process_content(
         except Exception as e:
             logger.error(f"Tagging failed: {e}")
 
+    # =========================================================================
+    # Stage 5: Discover Connections
+    # =========================================================================
+    async def run_connections() -> None:
+        nonlocal connections
+        cached = restore(ProcessingStage.CONNECTIONS, set(runners))
+        if cached is not None:
+            connections = cached
+            return
+        logger.debug("Stage 5: Connection Discovery")
+        try:
+            standard_summary = summaries.get(SummaryLevel.STANDARD.value, "")
+            # Embed content and core concepts (needed later for Neo4j nodes)
+            # in one batched request; discover_connections reads the memo
+            embedding_texts = [content_embedding_text(content.title, standard_summary)]
+            if create_graph_nodes:
+                embedding_texts += [
+                    concept_embedding_text(c.name, c.definition)
+                    for c in extraction.concepts
+                    if c.importance == ConceptImportance.CORE.value
+                ]
+            try:
+                await embedding_service.embed_many(embedding_texts)
+            except Exception as e:
+                logger.warning(f"Embedding prefetch failed: {e}")
+            connections, connection_usages = await discover_connections(
+                content=content,
+                summary=standard_summary,
+                extraction=extraction,
+                analysis=analysis,
+                llm_client=llm_client,
+                neo4j_client=neo4j_client,
+                top_k=config.max_connection_candidates,
+                embedding_service=embedding_service,
+            )
+            all_usages.extend(connection_usages)
+            await checkpoint(ProcessingStage.CONNECTIONS, connections, connection_usages)
+            logger.info(f"Discovered {len(connections)} connections")
+        except Exception as e:
+            logger.error(f"Connection discovery failed: {e}")
+
+    # =========================================================================
+    # Stage 6: Generate Follow-ups
+    # =========================================================================
+    async def run_followups() -> None:
+        nonlocal followups
+        cached = restore(ProcessingStage.FOLLOWUPS, set(runners))
+        if cached is not None:
+            followups = cached
+            return
+        logger.debug("Stage 6: Follow-up Generation")
+        try:
+            standard_summary = summaries.get(SummaryLevel.STANDARD.value, "")
+            followups, followup_usages = await generate_followups(
+                content=content,
+                analysis=analysis,
+                summary=standard_summary,
+                extraction=extraction,
+                llm_client=llm_client,
+            )
+            all_usages.extend(followup_usages)
+            await checkpoint(ProcessingStage.FOLLOWUPS, followups, followup_usages)
+            logger.info(f"Generated {len(followups)} follow-up tasks")
+        except Exception as e:
+            logger.error(f"Follow-up generation failed: {e}")
+
+    # =========================================================================
+    # Stage 7: Generate Mastery Questions
+    # =========================================================================
+    async def run_questions() -> None:
+        nonlocal questions
+        cached = restore(ProcessingStage.QUESTIONS, set(runners))
+        if cached is not None:
+            questions = cached
+            return
+        logger.debug("Stage 7: Question Generation")
+        try:
+            detailed_summary = summaries.get(SummaryLevel.DETAILED.value, "")
+            questions, question_usages = await generate_mastery_questions(
+                content=content,
+                analysis=analysis,
+                summary=detailed_summary,
+                extraction=extraction,
+                llm_client=llm_client,
+            )
+            all_usages.extend(question_usages)
+            await checkpoint(ProcessingStage.QUESTIONS, questions, question_usages)
+            logger.info(f"Generated {len(questions)} mastery questions")
+        except Exception as e:
+            logger.error(f"Question generation failed: {e}")
+
+    # =========================================================================
+    # Run stages 2-7 as a DAG (independent stages run concurrently)
+    # =========================================================================
+    runners: dict[ProcessingStage, StageRunner] = {}
+    if config.generate_summaries:
+        runners[ProcessingStage.SUMMARIZATION] = run_summarization
+    if config.extract_concepts:
+        runners[ProcessingStage.EXTRACTION] = run_extraction
+    if config.assign_tags:
+        runners[ProcessingStage.TAGGING] = run_tagging
+    if config.discover_connections and neo4j_client:
+        runners[ProcessingStage.CONNECTIONS] = run_connections
+    if config.generate_followups:
+        runners[ProcessingStage.FOLLOWUPS] = run_followups
+    if config.generate_questions:
+        runners[ProcessingStage.QUESTIONS] = run_questions
+
+    stage_timings.update(
+        await run_stage_dag(runners, max_concurrency=config.max_concurrent_stages)
+    )
+
     # =========================================================================
     # Stage 4b: Generate Spaced Repetition Cards
     # =========================================================================
+    # Runs after the DAG: needs extraction + tags, and shares the caller's
+    # database session, which must not be used concurrently.
     generated_cards = []
     if config.generate_cards and extraction.concepts and db is not None:
         logger.debug("Stage 4b: Card Generation")
@@ -374,71 +691,11 @@ async def process_content(
     elif config.generate_exercises and db is None:
         logger.warning("Exercise generation skipped: no database session provided")
 
-    # =========================================================================
-    # Stage 5: Discover Connections
-    # =========================================================================
-    connections = []
-    if config.discover_connections and neo4j_client:
-        logger.debug("Stage 5: Connection Discovery")
-        try:
-            standard_summary = summaries.get(SummaryLevel.STANDARD.value, "")
-            connections, connection_usages = await discover_connections(
-                content=content,
-                summary=standard_summary,
-                extraction=extraction,
-                analysis=analysis,
-                llm_client=llm_client,
-                neo4j_client=neo4j_client,
-                top_k=config.max_connection_candidates,
-            )
-            all_usages.extend(connection_usages)
-            logger.info(f"Discovered {len(connections)} connections")
-        except Exception as e:
-            logger.error(f"Connection discovery failed: {e}")
-
-    # =========================================================================
-    # Stage 6: Generate Follow-ups
-    # =========================================================================
-    followups = []
-    if config.generate_followups:
-        logger.debug("Stage 6: Follow-up Generation")
-        try:
-            standard_summary = summaries.get(SummaryLevel.STANDARD.value, "")
-            followups, followup_usages = await generate_followups(
-                content=content,
-                analysis=analysis,
-                summary=standard_summary,
-                extraction=extraction,
-                llm_client=llm_client,
-            )
-            all_usages.extend(followup_usages)
-            logger.info(f"Generated {len(followups)} follow-up tasks")
-        except Exception as e:
-            logger.error(f"Follow-up generation failed: {e}")
-
-    # =========================================================================
-    # Stage 7: Generate Mastery Questions
-    # =========================================================================
-    questions = []
-    if config.generate_questions:
-        logger.debug("Stage 7: Question Generation")
-        try:
-            detailed_summary = summaries.get(SummaryLevel.DETAILED.value, "")
-            questions, question_usages = await generate_mastery_questions(
-                content=content,
-                analysis=analysis,
-                summary=detailed_summary,
-                extraction=extraction,
-                llm_client=llm_client,
-            )
-            all_usages.extend(question_usages)
-            logger.info(f"Generated {len(questions)} mastery questions")
-        except Exception as e:
-            logger.error(f"Question generation failed: {e}")
-
     # =========================================================================
     # Persist LLM Usage to Database
     # =========================================================================
+    all_usages.extend(embedding_service.usages)
+    logged_embedding_usages = len(embedding_service.usages)
     if all_usages:
         try:
             await CostTracker.log_usages_batch(all_usages)
@@ -462,6 +719,8 @@ async def process_content(
         followups=followups,
         mastery_questions=questions,
         processing_time_seconds=processing_time,
+        stage_timings=stage_timings,
+        restored_stages=sorted(stage.value for stage in restored),
         estimated_cost_usd=estimated_cost,
     )
 
@@ -498,19 +757,28 @@ async def process_content(
             except Exception as e:
                 logger.error(f"Exercise note generation failed: {e}")
 
-    if (
-        config.create_neo4j_nodes
-        and processing_settings.GENERATE_NEO4J_NODES
-        and neo4j_client
-    ):
+    if create_graph_nodes:
         try:
             result.neo4j_node_id = await create_knowledge_nodes(
-                content, result, llm_client, neo4j_client
+                content,
+                result,
+                llm_client,
+                neo4j_client,
+                embedding_service=embedding_service,
             )
             logger.info(f"Created Neo4j node: {result.neo4j_node_id}")
         except Exception as e:
             logger.error(f"Neo4j node creation failed: {e}")
 
+        # Embeddings not prefetched during connection discovery (e.g. the
+        # stage was restored from a checkpoint) are requested here
+        late_usages = embedding_service.usages[logged_embedding_usages:]
+        if late_usages:
+            try:
+                await CostTracker.log_usages_batch(late_usages)
+            except Exception as e:
+                logger.error(f"Failed to persist embedding usage records: {e}")
+
     logger.info(
         f"Processing complete: {content.title} in {processing_time:.2f}s, "
         f"cost: ${estimated_cost:.4f}"
@@ -4,7 +4,7 @@ Processing Stages
 Each stage is a standalone module that performs a specific transformation:
 
 - content_analysis: Initial content classification and metadata extraction
-- summarization: Multi-level summary generation
+- summarization: Multi-level summary generation (map-reduce for long texts)
 - extraction: Concept, entity, and key finding extraction
 - taxonomy_loader: Dynamic tag taxonomy loading from config
 - tagging: Tag assignment from controlled vocabulary
@@ -26,6 +26,8 @@ from app.services.processing.stages.content_analysis import analyze_content
 from app.services.processing.stages.summarization import (
     generate_summary,
     generate_all_summaries,
+    generate_detailed_summary,
+    summarize_parts,
 )
 from app.services.processing.stages.extraction import extract_concepts
 from app.services.processing.stages.taxonomy_loader import (
@@ -42,6 +44,8 @@ __all__ = [
     "analyze_content",
     "generate_summary",
     "generate_all_summaries",
+    "generate_detailed_summary",
+    "summarize_parts",
     "extract_concepts",
     "get_tag_taxonomy",
     "TagTaxonomy",
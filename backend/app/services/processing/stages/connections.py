@@ -28,6 +28,7 @@ from app.models.processing import Connection, ExtractionResult, ContentAnalysis
 from app.enums import PipelineOperation, RelationshipType, NodeType
 from app.models.llm_usage import LLMUsage
 from app.services.llm.client import LLMClient
+from app.services.llm.embeddings import EmbeddingService, content_embedding_text
 from app.services.knowledge_graph.client import Neo4jClient
 from app.config.processing import processing_settings
 
@@ -148,6 +149,7 @@ async def discover_connections(
     similarity_threshold: float = None,
     connection_threshold: float = None,
     batch_size: int = None,
+    embedding_service: Optional[EmbeddingService] = None,
 ) -> tuple[list[Connection], list[LLMUsage]]:
     """
     Discover connections to existing knowledge in the graph.
@@ -169,6 +171,9 @@ async def discover_connections(
         similarity_threshold: Min embedding similarity (default from settings)
         connection_threshold: Min connection strength (default from settings)
         batch_size: Number of candidates to evaluate per LLM call (default: 5)
+        embedding_service: Shared EmbeddingService of the pipeline run. Its
+            embedding usages are left on the service for the caller to log;
+            if omitted, a private service is used and its usages are returned.
 
     Returns:
         Tuple of (list of Connection objects sorted by strength, list of LLMUsage)
@@ -189,23 +194,27 @@ async def discover_connections(
     usages: list[LLMUsage] = []
 
     # Generate embedding for new content
-    embedding_text = f"{content.title}\n\n{summary[:processing_settings.CONNECTION_EMBEDDING_TRUNCATE]}"
+    owns_embedding_service = embedding_service is None
+    if owns_embedding_service:
+        embedding_service = EmbeddingService(llm_client, content_id=content.id)
     try:
-        embeddings, embed_usage = await llm_client.embed(
-            [embedding_text], content_id=content.id
+        embedding = await embedding_service.embed(
+            content_embedding_text(content.title, summary)
         )
-        usages.append(embed_usage)
-        if not embeddings:
-            logger.warning("Failed to generate embedding for connection discovery")
-            return [], usages
     except Exception as e:
         logger.error(f"Embedding generation failed: {e}")
+        embedding = []
+    finally:
+        if owns_embedding_service:
+            usages.extend(embedding_service.usages)
+    if not embedding:
+        logger.warning("Failed to generate embedding for connection discovery")
         return [], usages
 
     # Find similar content via vector search
     try:
         candidates = await neo4j_client.vector_search(
-            embedding=embeddings[0],
+            embedding=embedding,
             node_type=NodeType.CONTENT.value,
             top_k=top_k * processing_settings.CONNECTION_CANDIDATE_MULTIPLIER,
             threshold=similarity_threshold,
@@ -8,6 +8,20 @@ Generates multi-level summaries for content:
 
 Content-type-specific prompts ensure relevant information is prioritized.
 
+Generation Strategy:
+    The detailed summary is written first, from the source text: in one call
+    for texts up to SUMMARY_TRUNCATE_DETAILED characters, otherwise by
+    map-reduce. Long texts are split with split_markdown_into_chunks(), the
+    chunks are summarized concurrently (at most SUMMARY_MAX_CONCURRENT_CHUNKS
+    calls at once) and the chunk summaries are reduced into the detailed
+    summary; if they are still too long to reduce in one call, consecutive
+    summaries are summarized again in groups first. Nothing past the
+    truncation limit is dropped, so a whole book is summarized.
+
+    The standard and brief summaries are then derived from the detailed
+    summary, concurrently, instead of re-reading the source. If the detailed
+    summary fails, they are generated from the truncated source instead.
+
 Usage:
     from app.services.processing.stages.summarization import generate_all_summaries
 
@@ -15,6 +29,7 @@ Usage:
     print(summaries["standard"])
 """
 
+import asyncio
 import logging
 
 from app.models.content import UnifiedContent
@@ -24,6 +39,8 @@ from app.models.processing import ContentAnalysis
 from app.models.llm_usage import LLMUsage
 from app.services.llm.client import LLMClient
 from app.config.processing import processing_settings
+from app.pipelines.utils.text_utils import split_markdown_into_chunks
+from app.services.cpu_executor import run_cpu_bound
 
 logger = logging.getLogger(__name__)
 
@@ -350,12 +367,40 @@ Provide a {level} summary:""",
 }
 
 
+# Map step: one part of a text too long to summarize in one call. Also used
+# to condense groups of part summaries when they are too long to reduce.
+CHUNK_SUMMARY_PROMPT = """You are reading part {index} of {total} of a long {content_type}.
+
+Title: {title}
+
+Part {index} of {total}:
+{content}
+
+Write a dense summary of this part only. It will be combined with the summaries of the other parts into a summary of the whole work, so:
+- Keep every key claim, argument, method, result and definition, with specific numbers, names and examples
+- Keep the order in which ideas appear
+- Do not add an introduction or conclusion, and do not speculate about other parts
+
+Summary of part {index}:"""
+
+# Reduce step: replaces the source text in the detailed summary prompt
+PART_SUMMARIES_SOURCE = """The full text is too long to include. Below are summaries of its {total} consecutive parts, in order. Base the summary on all of them.
+
+{parts}"""
+
+# Standard and brief summaries: replaces the source text in their prompts
+DETAILED_SUMMARY_SOURCE = """Detailed summary of the full text (use it as the source):
+
+{detailed}"""
+
+
 async def generate_summary(
     content: UnifiedContent,
     analysis: ContentAnalysis,
     level: SummaryLevel,
     llm_client: LLMClient,
     content_id: str | None = None,
+    source_text: str | None = None,
 ) -> tuple[str, LLMUsage]:
     """
     Generate a summary at the specified level.
@@ -365,6 +410,9 @@ async def generate_summary(
         analysis: Content analysis result
         level: Summary level (brief, standard, detailed)
         llm_client: LLM client for completion
+        content_id: Content ID for usage tracking (defaults to content.id)
+        source_text: Text to summarize instead of content.full_text (part
+            summaries or the detailed summary); not truncated
 
     Returns:
         Tuple of (summary text, LLMUsage)
@@ -391,7 +439,11 @@ async def generate_summary(
         title=content.title,
         authors=", ".join(content.authors) if content.authors else "Unknown",
         source=content.source_url or "Unknown",
-        content=content.full_text[:max_content] if content.full_text else "",
+        content=(
+            source_text
+            if source_text is not None
+            else (content.full_text or "")[:max_content]
+        ),
         annotations=annotations_text,
         level=level.value.upper(),
     )
@@ -416,12 +468,141 @@ async def generate_summary(
     )
 
 
+async def summarize_parts(
+    content: UnifiedContent,
+    analysis: ContentAnalysis,
+    parts: list[str],
+    llm_client: LLMClient,
+) -> tuple[list[str], list[LLMUsage]]:
+    """
+    Summarize consecutive parts of a text concurrently (map step).
+
+    At most SUMMARY_MAX_CONCURRENT_CHUNKS calls run at once. A part that
+    fails is left out (and logged) rather than failing the whole summary.
+
+    Args:
+        content: Unified content from ingestion
+        analysis: Content analysis result
+        parts: Text parts in document order
+        llm_client: LLM client for completion
+
+    Returns:
+        Tuple of (part summaries in document order, list of LLMUsage)
+
+    Raises:
+        Exception: The first part's error if every part failed
+    """
+    semaphore = asyncio.Semaphore(
+        max(1, processing_settings.SUMMARY_MAX_CONCURRENT_CHUNKS)
+    )
+
+    async def summarize(index: int, part: str) -> tuple[str, LLMUsage]:
+        prompt = CHUNK_SUMMARY_PROMPT.format(
+            index=index,
+            total=len(parts),
+            content_type=analysis.content_type,
+            title=content.title,
+            content=part,
+        )
+        async with semaphore:
+            return await llm_client.complete(
+                operation=PipelineOperation.SUMMARIZATION,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=processing_settings.SUMMARY_TEMPERATURE,
+                max_tokens=processing_settings.SUMMARY_MAX_TOKENS_CHUNK,
+                content_id=content.id,
+            )
+
+    results = await asyncio.gather(
+        *(summarize(index, part) for index, part in enumerate(parts, start=1)),
+        return_exceptions=True,
+    )
+
+    summaries: list[str] = []
+    usages: list[LLMUsage] = []
+    errors: list[BaseException] = []
+    for index, result in enumerate(results, start=1):
+        if isinstance(result, BaseException):
+            logger.warning(f"Failed to summarize part {index}/{len(parts)}: {result}")
+            errors.append(result)
+            continue
+        summary_text, usage = result
+        summaries.append(summary_text)
+        usages.append(usage)
+
+    if not summaries and errors:
+        raise errors[0]
+    return summaries, usages
+
+
+async def generate_detailed_summary(
+    content: UnifiedContent, analysis: ContentAnalysis, llm_client: LLMClient
+) -> tuple[str, list[LLMUsage]]:
+    """
+    Generate the detailed summary from the whole source text.
+
+    Texts up to SUMMARY_TRUNCATE_DETAILED characters are summarized in one
+    call; longer texts by map-reduce (see module docstring).
+
+    Args:
+        content: Unified content from ingestion
+        analysis: Content analysis result
+        llm_client: LLM client for completion
+
+    Returns:
+        Tuple of (detailed summary text, list of LLMUsage)
+    """
+    text = content.full_text or ""
+    max_content = processing_settings.SUMMARY_TRUNCATE_DETAILED
+    if len(text) <= max_content:
+        summary_text, usage = await generate_summary(
+            content, analysis, SummaryLevel.DETAILED, llm_client
+        )
+        return summary_text, [usage]
+
+    chunks = await run_cpu_bound(
+        split_markdown_into_chunks,
+        text,
+        processing_settings.SUMMARY_CHUNK_SIZE,
+        processing_settings.SUMMARY_CHUNK_OVERLAP,
+    )
+    logger.debug(f"Summarizing {len(text)} chars in {len(chunks)} chunks")
+    summaries, usages = await summarize_parts(content, analysis, chunks, llm_client)
+
+    # Condense until the part summaries fit in one reduce call
+    while len(summaries) > 1 and _joined_length(summaries) > max_content:
+        groups = _group_parts(summaries, processing_settings.SUMMARY_CHUNK_SIZE)
+        summaries, group_usages = await summarize_parts(
+            content, analysis, ["\n\n".join(group) for group in groups], llm_client
+        )
+        usages.extend(group_usages)
+
+    parts = "\n\n".join(
+        f"### Part {index}\n{summary}"
+        for index, summary in enumerate(summaries, start=1)
+    )
+    summary_text, usage = await generate_summary(
+        content,
+        analysis,
+        SummaryLevel.DETAILED,
+        llm_client,
+        source_text=PART_SUMMARIES_SOURCE.format(
+            total=len(summaries), parts=parts[:max_content]
+        ),
+    )
+    usages.append(usage)
+    return summary_text, usages
+
+
 async def generate_all_summaries(
     content: UnifiedContent, analysis: ContentAnalysis, llm_client: LLMClient
 ) -> tuple[dict[str, str], list[LLMUsage]]:
     """
     Generate summaries at all levels.
 
+    The detailed summary is generated from the source text; the standard and
+    brief summaries are then derived from it concurrently.
+
     Args:
         content: Unified content from ingestion
         analysis: Content analysis result
@@ -434,19 +615,72 @@ async def generate_all_summaries(
     summaries = {}
     usages: list[LLMUsage] = []
 
-    for level in SummaryLevel:
-        try:
-            summary_text, usage = await generate_summary(
-                content, analysis, level, llm_client
+    source_text = None
+    try:
+        detailed, detailed_usages = await generate_detailed_summary(
+            content, analysis, llm_client
+        )
+        summaries[SummaryLevel.DETAILED.value] = detailed
+        usages.extend(detailed_usages)
+        source_text = DETAILED_SUMMARY_SOURCE.format(detailed=detailed)
+        logger.debug(
+            f"Generated detailed summary ({len(detailed)} chars, "
+            f"{len(detailed_usages)} calls)"
+        )
+    except Exception as e:
+        logger.error(f"Failed to generate detailed summary: {e}")
+        summaries[SummaryLevel.DETAILED.value] = f"[Summary generation failed: {e}]"
+
+    derived_levels = [SummaryLevel.STANDARD, SummaryLevel.BRIEF]
+    results = await asyncio.gather(
+        *(
+            generate_summary(
+                content, analysis, level, llm_client, source_text=source_text
             )
-            summaries[level.value] = summary_text
-            usages.append(usage)
-            logger.debug(f"Generated {level.value} summary ({len(summary_text)} chars)")
-        except Exception as e:
-            logger.error(f"Failed to generate {level.value} summary: {e}")
-            summaries[level.value] = f"[Summary generation failed: {e}]"
+            for level in derived_levels
+        ),
+        return_exceptions=True,
+    )
+    for level, result in zip(derived_levels, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to generate {level.value} summary: {result}")
+            summaries[level.value] = f"[Summary generation failed: {result}]"
+            continue
+        summary_text, usage = result
+        summaries[level.value] = summary_text
+        usages.append(usage)
+        logger.debug(f"Generated {level.value} summary ({len(summary_text)} chars)")
 
-    return summaries, usages
+    return {level.value: summaries[level.value] for level in SummaryLevel}, usages
+
+
+def _joined_length(summaries: list[str]) -> int:
+    """Length of the part summaries joined for the reduce prompt."""
+    return sum(len(summary) + 2 for summary in summaries)
+
+
+def _group_parts(summaries: list[str], max_chars: int) -> list[list[str]]:
+    """
+    Group consecutive part summaries into groups of about max_chars.
+
+    Every group but possibly the last has at least two summaries, so each
+    condensing round shrinks the number of parts.
+    """
+    groups: list[list[str]] = []
+    current: list[str] = []
+    size = 0
+    for summary in summaries:
+        if len(current) >= 2 and size + len(summary) > max_chars:
+            groups.append(current)
+            current, size = [], 0
+        current.append(summary)
+        size += len(summary) + 2
+    if current:
+        if len(current) == 1 and groups:
+            groups[-1].append(current[0])
+        else:
+            groups.append(current)
+    return groups
 
 
 def _format_annotations(content: UnifiedContent, max_annotations: int = 20) -> str:
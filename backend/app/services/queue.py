@@ -31,15 +31,20 @@ Usage:
 
 import logging
 
-import litellm
 from celery import Celery
-from celery.signals import task_prerun, worker_process_init
-from litellm.litellm_core_utils import logging_worker as litellm_logging_worker
+from celery.signals import task_prerun, worker_process_init, worker_process_shutdown
 
 from app.config import settings
+from app.lazy_imports import is_imported, lazy_import
+from app.services import worker_runtime
+from app.services.cpu_executor import shutdown_cpu_executor
 
 logger = logging.getLogger(__name__)
 
+# LiteLLM is imported on first use (see app.lazy_imports)
+litellm = lazy_import("litellm")
+litellm_logging_worker = lazy_import("litellm.litellm_core_utils.logging_worker")
+
 celery_app = Celery(
     "second_brain",
     broker=settings.CELERY_BROKER_URL,
@@ -65,6 +70,7 @@ celery_app.conf.update(
         "app.services.tasks.process_content": {"queue": "llm_processing"},
         "app.services.tasks.sync_raindrop": {"queue": "ingestion_low"},
         "app.services.tasks.sync_github": {"queue": "ingestion_low"},
+        "app.services.tasks.rebuild_graph_snapshot": {"queue": "ingestion_low"},
     },
     # Task-specific time limits (override defaults for long-running tasks)
     task_annotations={
@@ -117,8 +123,12 @@ def _reset_litellm_logging_state():
     Reset LiteLLM's async logging state to prevent event loop binding issues.
 
     This clears all singletons and instances that may hold references to
-    asyncio.Queue objects bound to a previous event loop.
+    asyncio.Queue objects bound to a previous event loop. Nothing to reset
+    (and nothing is imported) if no task has used LiteLLM yet.
     """
+    if not is_imported("litellm"):
+        return True
+
     try:
         # Reset top-level litellm attributes that may hold event loop references
         if hasattr(litellm, "_logging_worker"):
@@ -162,10 +172,37 @@ def reset_litellm_on_task_prerun(task_id, task, *args, **kwargs):
     This is the key fix: each task may create a new event loop via asyncio.run(),
     so we need to ensure litellm's LoggingWorker Queue is re-created fresh for
     each task's event loop, not bound to a previous task's closed event loop.
+
+    Skipped in persistent loop mode, where every task runs on the same loop.
     """
+    if worker_runtime.is_worker_loop_running():
+        return
     _reset_litellm_logging_state()
 
 
+# =============================================================================
+# Persistent Worker Event Loop
+# =============================================================================
+# With CELERY_PERSISTENT_EVENT_LOOP enabled, each prefork worker process starts
+# one long-lived event loop with a pooled Postgres engine and shared Neo4j/LLM
+# clients, and tasks submit their coroutines onto it instead of calling
+# asyncio.run(). See app.services.worker_runtime.
+
+
+@worker_process_init.connect
+def start_worker_runtime(**kwargs):
+    """Start the persistent event loop and shared clients after fork."""
+    if settings.CELERY_PERSISTENT_EVENT_LOOP:
+        worker_runtime.init_worker_runtime()
+
+
+@worker_process_shutdown.connect
+def stop_worker_runtime(**kwargs):
+    """Close shared clients, stop the persistent event loop and CPU executor."""
+    worker_runtime.shutdown_worker_runtime()
+    shutdown_cpu_executor(wait=False)
+
+
 def get_queue_stats() -> dict:
     """
     Get statistics about the task queues.
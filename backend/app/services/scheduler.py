@@ -6,6 +6,7 @@ Configures periodic sync jobs using APScheduler:
 - GitHub starred repos sync daily at 7 AM
 - Task cleanup daily at 3 AM
 - Tag taxonomy sync daily at 4 AM
+- Mastery rollup reconcile daily at 5 AM
 
 Execution Context:
     The scheduler runs IN-PROCESS with FastAPI inside the backend Docker container.
@@ -64,6 +65,7 @@ RAINDROP_SYNC_INTERVAL_HOURS = 6
 GITHUB_SYNC_CRON_HOUR = 7  # 7 AM UTC
 CLEANUP_CRON_HOUR = 3  # 3 AM UTC
 TAXONOMY_SYNC_CRON_HOUR = 4  # 4 AM UTC
+MASTERY_ROLLUP_RECONCILE_CRON_HOUR = 5  # 5 AM UTC
 
 # Misfire handling
 MISFIRE_GRACE_TIME_SEC = 3600  # 1 hour grace period
@@ -114,6 +116,17 @@ async def trigger_taxonomy_sync() -> None:
         logger.info(f"Taxonomy sync complete: {count} tags created")
 
 
+async def trigger_mastery_rollup_reconcile() -> None:
+    """Rebuild mastery rollups from cards, reviews and exercise attempts."""
+    # Deferred imports: Avoid loading DB and service modules until job execution.
+    from app.db.base import async_session_maker
+    from app.services.learning.mastery_rollup import MasteryRollupService
+
+    async with async_session_maker() as db:
+        count = await MasteryRollupService(db).reconcile()
+        logger.info(f"Mastery rollup reconcile complete: {count} rows")
+
+
 def setup_scheduled_jobs() -> None:
     """Configure all scheduled sync jobs."""
 
@@ -157,11 +170,22 @@ def setup_scheduled_jobs() -> None:
         misfire_grace_time=MISFIRE_GRACE_TIME_SEC,
     )
 
+    # Mastery rollup reconcile - daily at configured hour UTC
+    scheduler.add_job(
+        trigger_mastery_rollup_reconcile,
+        CronTrigger(hour=MASTERY_ROLLUP_RECONCILE_CRON_HOUR, minute=0),
+        id="mastery_rollup_reconcile",
+        name="Mastery Rollup Reconcile",
+        replace_existing=True,
+        misfire_grace_time=MISFIRE_GRACE_TIME_SEC,
+    )
+
     logger.info("Scheduled jobs configured:")
     logger.info("  - Raindrop sync: every 6 hours")
     logger.info("  - GitHub sync: daily at 07:00 UTC")
     logger.info("  - Cleanup: daily at 03:00 UTC")
     logger.info("  - Taxonomy sync: daily at 04:00 UTC")
+    logger.info("  - Mastery rollup reconcile: daily at 05:00 UTC")
 
 
 def start_scheduler() -> None:
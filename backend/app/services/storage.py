@@ -43,15 +43,19 @@ Usage:
     # Save uploaded file
     file_path = await save_upload(upload_file, directory="pdfs")
 
+    # Save and hash in one streaming pass (for duplicate checks)
+    file_path, file_hash = await save_upload_with_hash(upload_file, directory="pdfs")
+
     # Save content to database
     await save_content(unified_content)
 """
 
+import hashlib
 import logging
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import aiofiles
 from fastapi import UploadFile
@@ -95,6 +99,10 @@ logger = logging.getLogger(__name__)
 #
 UPLOAD_DIR = Path(settings.UPLOAD_DIR)
 
+# Uploads are copied to disk in chunks of this size, so memory stays flat
+# regardless of file size
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
 
 async def save_upload(file: UploadFile, directory: str = "uploads") -> Path:
     """
@@ -109,6 +117,47 @@ async def save_upload(file: UploadFile, directory: str = "uploads") -> Path:
     Returns:
         Path to the saved file
     """
+    file_path, _ = await _stream_upload(file, directory)
+    return file_path
+
+
+async def save_upload_with_hash(
+    file: UploadFile, directory: str = "uploads"
+) -> tuple[Path, str]:
+    """
+    Save uploaded file and compute its SHA-256 while writing.
+
+    The hash matches calculate_file_hash() on the saved file, without reading
+    it back from disk.
+
+    Args:
+        file: FastAPI UploadFile object
+        directory: Subdirectory under UPLOAD_DIR (e.g., "pdfs", "photos")
+
+    Returns:
+        Tuple of (path to the saved file, SHA-256 hex digest)
+    """
+    hasher = hashlib.sha256()
+    file_path, _ = await _stream_upload(file, directory, hasher)
+    return file_path, hasher.hexdigest()
+
+
+async def _stream_upload(
+    file: UploadFile,
+    directory: str,
+    hasher: Optional[Any] = None,
+) -> tuple[Path, int]:
+    """
+    Copy an upload to a unique path under UPLOAD_DIR in fixed-size chunks.
+
+    Args:
+        file: FastAPI UploadFile object
+        directory: Subdirectory under UPLOAD_DIR
+        hasher: Optional hashlib object updated with every chunk
+
+    Returns:
+        Tuple of (path to the saved file, bytes written)
+    """
     # Create upload directory if it doesn't exist
     upload_dir = UPLOAD_DIR / directory
     upload_dir.mkdir(parents=True, exist_ok=True)
@@ -118,13 +167,22 @@ async def save_upload(file: UploadFile, directory: str = "uploads") -> Path:
     filename = f"{uuid.uuid4()}{ext}"
     file_path = upload_dir / filename
 
-    # Save file asynchronously
-    async with aiofiles.open(file_path, "wb") as out_file:
-        content = await file.read()
-        await out_file.write(content)
-
-    logger.info(f"Saved upload: {file_path} ({len(content)} bytes)")
-    return file_path
+    # Save file asynchronously, one chunk at a time
+    size = 0
+    try:
+        async with aiofiles.open(file_path, "wb") as out_file:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                if hasher is not None:
+                    hasher.update(chunk)
+                await out_file.write(chunk)
+                size += len(chunk)
+    except Exception:
+        # Don't leave partial files in the staging area
+        file_path.unlink(missing_ok=True)
+        raise
+
+    logger.info(f"Saved upload: {file_path} ({size} bytes)")
+    return file_path, size
 
 
 async def save_content(
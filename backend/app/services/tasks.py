@@ -6,6 +6,7 @@ Defines async tasks for content processing, including:
 - ingest_book: Specialized ingestion task for batch book OCR processing
 - sync_raindrop: Periodic sync of Raindrop.io bookmarks
 - sync_github: Periodic sync of GitHub starred repos
+- rebuild_graph_snapshot: Debounced rebuild of the graph visualization snapshot
 
 Pipeline Routing:
     Tasks use PipelineContentType to route content to the appropriate pipeline:
@@ -33,10 +34,17 @@ Queue Routing:
     - process_content       → llm_processing queue (LLM pipeline)
     - sync_raindrop         → ingestion_low queue
     - sync_github           → ingestion_low queue
+    - rebuild_graph_snapshot → ingestion_low queue
 
     To run workers for specific queues:
         celery -A app.services.queue worker -Q ingestion_high,ingestion_default,ingestion_low,llm_processing -l info
 
+Event Loop:
+    Task bodies run their async work through run_async(): on a worker with
+    CELERY_PERSISTENT_EVENT_LOOP enabled the coroutine is submitted to the
+    process's long-lived loop (pooled DB connections, shared Neo4j driver);
+    otherwise it runs in a fresh loop via asyncio.run().
+
 Usage:
     from app.services.tasks import ingest_content, ingest_book
     from app.pipelines import PipelineContentType
@@ -70,7 +78,6 @@ Usage:
 # =============================================================================
 # Standard library imports
 # =============================================================================
-import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -110,6 +117,11 @@ from app.enums import ProcessingRunStatus
 from app.enums.processing import ProcessingRunStatus as PRunStatus
 from app.enums.content import ProcessingStatus
 from app.models.content import UnifiedContent
+from app.services.knowledge_graph.client import get_neo4j_client
+from app.services.knowledge_graph.snapshot import (
+    build_graph_snapshot,
+    request_snapshot_rebuild,
+)
 from app.services.obsidian.sync import VaultSyncService
 from app.services.queue import celery_app
 from app.services.storage import (
@@ -121,7 +133,9 @@ from app.services.processing.pipeline import (
     process_content as run_llm_pipeline,
     PipelineConfig,
 )
+from app.services.processing.checkpoints import CheckpointStore
 from app.services.processing.cleanup import cleanup_before_reprocessing
+from app.services.worker_runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -235,6 +249,36 @@ class VaultSyncResult(TaskResultBase):
     """Path to the synced note."""
 
 
+class VaultBatchSyncResult(TaskResultBase):
+    """Return type for batched vault sync task."""
+
+    total: int
+    """Number of paths in the batch."""
+    synced: int
+    """Notes written to Neo4j and the note index."""
+    skipped: int
+    """Notes whose content hash was unchanged."""
+    failed: int
+    """Notes that failed to sync."""
+    removed: int
+    """Deleted notes dropped from the note index."""
+    errors: list[dict[str, Any]]
+    """Per-note errors ({"path", "error"})."""
+
+
+class GraphSnapshotResult(TaskResultBase):
+    """Return type for graph snapshot rebuild task."""
+
+    version: str
+    """Version (content hash) of the published snapshot."""
+    nodes: int
+    """Nodes in the full view."""
+    edges: int
+    """Edges in the full view."""
+    clusters: int
+    """Nodes in the clusters view."""
+
+
 # =============================================================================
 # Retry configurations using tenacity
 # =============================================================================
@@ -298,6 +342,10 @@ async def _run_llm_processing_impl(
     - Tags, connections, follow-ups, mastery questions
     - Obsidian notes and Neo4j nodes
 
+    Stage outputs are checkpointed as they complete, so a retry after a late
+    failure (e.g. Neo4j or cost logging) restores them instead of repeating
+    the LLM calls.
+
     Args:
         content_id: UUID of the content to process
         config: Pipeline configuration controlling which stages to run
@@ -359,7 +407,10 @@ async def _run_llm_processing_impl(
     try:
         async with task_session_maker() as db_session:
             processing_result = await run_llm_pipeline(
-                unified_content, config, db=db_session
+                unified_content,
+                config,
+                db=db_session,
+                checkpoints=CheckpointStore(task_context=True),
             )
 
         # Save processing results
@@ -392,6 +443,7 @@ async def _run_llm_processing_impl(
             f"{processing_result.processing_time_seconds:.2f}s, "
             f"${processing_result.estimated_cost_usd:.4f}"
         )
+        await request_snapshot_rebuild()
 
         return {
             "status": ProcessingRunStatus.COMPLETED.value,
@@ -437,7 +489,7 @@ def _process_content_with_retry(
     config: PipelineConfig,
 ) -> ProcessingResult:
     """Run LLM processing (pipeline) with tenacity retry logic."""
-    return asyncio.run(_run_llm_processing_impl(content_id, config))
+    return run_async(_run_llm_processing_impl(content_id, config))
 
 
 @celery_app.task(name="app.services.tasks.process_content")
@@ -471,6 +523,8 @@ def process_content(
             - extract_concepts (bool): Extract concepts
             - create_obsidian_note (bool): Create Obsidian note
             - create_neo4j_nodes (bool): Create Neo4j nodes
+            - invalidate_stages (list[str]): Stages whose checkpoints are
+              discarded so they are recomputed (e.g. ["SUMMARIZATION"])
             If None, uses PipelineConfig defaults (all stages enabled).
 
     Returns:
@@ -479,6 +533,20 @@ def process_content(
     # Build PipelineConfig from dict (Celery requires serializable args)
     config = PipelineConfig(**(config_dict or {}))
 
+    # Discard the requested checkpoints once, before the retry loop, so a retry
+    # resumes from the checkpoints written by the failed attempt
+    if config.invalidate_stages:
+        try:
+            run_async(
+                CheckpointStore(task_context=True).invalidate(
+                    content_id, config.invalidate_stages
+                )
+            )
+            config.invalidate_stages = []
+        except Exception as e:
+            # Left on the config so the pipeline retries the invalidation
+            logger.warning(f"Could not invalidate stage checkpoints: {e}")
+
     try:
         return _process_content_with_retry(content_id, config)
     except RetryError as e:
@@ -560,7 +628,7 @@ def _ingest_content_impl(
         return result
 
     # Run the async pipeline and DB update in a single event loop
-    result = asyncio.run(run_pipeline_and_update())
+    result = run_async(run_pipeline_and_update())
 
     if result is None:
         logger.warning(f"No pipeline found for content type: {content_type}")
@@ -658,7 +726,7 @@ def ingest_content(
         )
     except RetryError as e:
         logger.error(f"Processing failed for {content_id} after all retries: {e}")
-        asyncio.run(
+        run_async(
             update_status(
                 content_id, ContentStatus.FAILED.value, str(e), task_context=True
             )
@@ -768,7 +836,7 @@ def _process_book_impl(
         return result
 
     # Run the async pipeline and DB update in a single event loop
-    result = asyncio.run(run_pipeline_and_update())
+    result = run_async(run_pipeline_and_update())
 
     logger.info(
         f"Book {content_id} ingestion complete: "
@@ -859,7 +927,7 @@ def ingest_book(
     except RetryError as e:
         logger.error(f"Book processing failed for {content_id} after all retries: {e}")
         # Update status to failed
-        asyncio.run(
+        run_async(
             update_status(
                 content_id, ContentStatus.FAILED.value, str(e), task_context=True
             )
@@ -899,7 +967,7 @@ def _sync_raindrop_impl(since_dt: datetime, limit: Optional[int] = None) -> list
         finally:
             await sync.close()
 
-    return asyncio.run(run_sync())
+    return run_async(run_sync())
 
 
 @celery_app.task(name="app.services.tasks.sync_raindrop")
@@ -944,7 +1012,7 @@ def sync_raindrop(
         for item in items:
             try:
                 # Save content to database first
-                # Use task_context=True because we're in a Celery task with asyncio.run()
+                # Use task_context=True because we're in a Celery task (see run_async)
                 await save_content(item, task_context=True)
                 saved_count += 1
                 # Then queue for processing
@@ -957,7 +1025,7 @@ def sync_raindrop(
                 logger.error(f"Failed to save/queue content {item.id}: {e}")
         return saved_count
 
-    saved_count = asyncio.run(save_and_queue())
+    saved_count = run_async(save_and_queue())
     logger.info(f"Raindrop sync complete: {saved_count} items saved and queued")
 
     return {
@@ -993,7 +1061,7 @@ def _sync_github_impl(limit: int) -> list[Any]:
         finally:
             await importer.close()
 
-    return asyncio.run(run_sync())
+    return run_async(run_sync())
 
 
 @celery_app.task(name="app.services.tasks.sync_github")
@@ -1038,7 +1106,7 @@ def sync_github(limit: int = 50) -> SyncResult:
         for item in items:
             try:
                 # Save content to database first
-                # Use task_context=True because we're in a Celery task with asyncio.run()
+                # Use task_context=True because we're in a Celery task (see run_async)
                 await save_content(item, task_context=True)
                 saved_count += 1
                 # Queue for LLM processing (skip ingestion - already done by GitHubImporter)
@@ -1053,7 +1121,7 @@ def sync_github(limit: int = 50) -> SyncResult:
                 logger.error(f"Failed to save/queue repo {item.id}: {e}")
         return saved_count
 
-    saved_count = asyncio.run(save_and_queue())
+    saved_count = run_async(save_and_queue())
     logger.info(f"GitHub sync complete: {saved_count} repos saved and queued")
 
     return {
@@ -1073,12 +1141,13 @@ def sync_vault_note(note_path: str) -> VaultSyncResult:
     """
     Sync a single vault note to Neo4j knowledge graph.
 
-    Called by VaultWatcher when a note is created or modified in Obsidian.
-    Uses VaultSyncService to:
+    Called by VaultWatcher when a note is created, modified or deleted in
+    Obsidian. Uses VaultSyncService to:
     1. Parse frontmatter and extract metadata
     2. Extract wikilinks and tags from content
     3. Create/update Note node in Neo4j
     4. Sync LINKS_TO relationships
+    5. Update the vault_notes metadata index (or remove deleted notes)
 
     Retry behavior: 3 attempts with exponential backoff (handled by Celery).
     This is appropriate because Neo4j might be temporarily unavailable.
@@ -1092,12 +1161,16 @@ def sync_vault_note(note_path: str) -> VaultSyncResult:
     logger.info(f"Syncing vault note: {note_path}")
 
     async def run_sync():
-        sync_service = VaultSyncService()
-        result = await sync_service.sync_note(Path(note_path))
+        sync_service = VaultSyncService(task_context=True)
+        path = Path(note_path)
+        if not path.exists():
+            # Deleted or renamed away - drop it from the note index
+            return await sync_service.remove_note(path)
+        result = await sync_service.sync_note(path)
         return result
 
     try:
-        result = asyncio.run(run_sync())
+        result = run_async(run_sync())
         logger.info(f"Vault note synced: {note_path}")
         return result
     except Exception as e:
@@ -1109,6 +1182,81 @@ def sync_vault_note(note_path: str) -> VaultSyncResult:
         }
 
 
+@celery_app.task(name="app.services.tasks.sync_vault_notes")
+def sync_vault_notes(note_paths: list[str]) -> VaultBatchSyncResult:
+    """
+    Sync a batch of changed vault notes to the Neo4j knowledge graph.
+
+    Queued by VaultWatcher once per debounce window (chunked to
+    VAULT_SYNC_TASK_BATCH_SIZE paths), so a git pull or Obsidian Sync burst
+    becomes a few tasks instead of one per file. The whole batch runs in one
+    event loop with a single VaultSyncService, sharing its database and Neo4j
+    connections, and uses VaultSyncService.sync_notes():
+    1. Parse existing notes in a thread pool, skipping unchanged content
+    2. Write Note nodes, LINKS_TO diffs and REPRESENTS links in batched
+       UNWIND transactions
+    3. Upsert the vault_notes index rows and drop deleted notes
+
+    Args:
+        note_paths: Absolute paths of created, modified or deleted notes
+
+    Returns:
+        Dictionary with total, synced, skipped, failed, removed and errors
+    """
+    logger.info(f"Syncing {len(note_paths)} vault notes")
+
+    async def run_sync():
+        sync_service = VaultSyncService(task_context=True)
+        return await sync_service.sync_notes([Path(p) for p in note_paths])
+
+    try:
+        result = run_async(run_sync())
+        logger.info(
+            f"Vault notes synced: {result['synced']} synced, "
+            f"{result['skipped']} unchanged, {result['failed']} failed"
+        )
+        return result
+    except Exception as e:
+        logger.error(f"Failed to sync {len(note_paths)} vault notes: {e}")
+        return {
+            "total": len(note_paths),
+            "error": str(e),
+            "status": ProcessingRunStatus.FAILED.value,
+        }
+
+
+# =============================================================================
+# Knowledge graph tasks
+# =============================================================================
+
+
+@celery_app.task(name="app.services.tasks.rebuild_graph_snapshot")
+def rebuild_graph_snapshot() -> GraphSnapshotResult:
+    """
+    Rebuild the cached graph visualization snapshot.
+
+    Queued (debounced) by request_snapshot_rebuild() after processing runs
+    and vault syncs. Reads every node and relationship once, precomputes the
+    clusters/top/full views and publishes them as a new snapshot version.
+    Not retried: a failed rebuild keeps the previous snapshot, and the next
+    graph write queues another one.
+
+    Returns:
+        Dictionary with the snapshot version and node/edge/cluster counts
+    """
+
+    async def run_rebuild():
+        neo4j_client = await get_neo4j_client()
+        return await build_graph_snapshot(neo4j_client)
+
+    try:
+        result = run_async(run_rebuild())
+        return {"status": ProcessingRunStatus.COMPLETED.value, **result}
+    except Exception as e:
+        logger.error(f"Failed to rebuild graph snapshot: {e}")
+        return {"status": ProcessingRunStatus.FAILED.value, "error": str(e)}
+
+
 # =============================================================================
 # Maintenance tasks
 # =============================================================================
@@ -1164,7 +1312,7 @@ def cleanup_old_tasks() -> TaskResultBase:
             logger.info(f"Marked {count} stuck items as FAILED")
             return count
 
-    stuck_count = asyncio.run(cleanup_stuck_items())
+    stuck_count = run_async(cleanup_stuck_items())
 
     return {
         "status": ProcessingRunStatus.COMPLETED.value,
@@ -0,0 +1,206 @@
+"""
+Celery Worker Event Loop Runtime
+
+Celery task bodies are synchronous, while the services they call are async.
+By default every task bridges the two with asyncio.run(), so each task gets a
+brand-new event loop and therefore has to pay for:
+    - a fresh Postgres connection (task_engine uses NullPool, because pooled
+      connections are bound to the loop that created them)
+    - a fresh Neo4j driver and LLM client setup on that loop
+
+Persistent Loop Mode (CELERY_PERSISTENT_EVENT_LOOP=true):
+    Each worker process owns ONE long-lived event loop, started at
+    worker_process_init and running in a daemon thread. At startup the worker:
+    1. Rebinds task_session_maker to a pooled engine (use_pooled_task_engine)
+    2. Opens the shared Neo4j driver and creates the LLM client on the loop
+    Tasks submit their coroutine onto that loop with run_async() and block
+    until it finishes, so connections and drivers are reused across tasks.
+    On worker_process_shutdown the clients are closed, the engine disposed and
+    the loop stopped.
+
+When the loop is not running (mode disabled, API process, scripts, tests),
+run_async() falls back to asyncio.run(), i.e. the previous behavior, and
+closes the shared HTTP client and Redis pool opened on that loop before it
+ends (their connections cannot be used from the next task's loop).
+
+Usage:
+    from app.services.worker_runtime import run_async
+
+    @celery_app.task(name="app.services.tasks.my_task")
+    def my_task(arg: str) -> dict:
+        async def run():
+            ...
+        return run_async(run())
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Coroutine
+from typing import Any, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds to wait for the shared clients to open/close on the worker loop
+CLIENT_SETUP_TIMEOUT_SECONDS = 30
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+
+
+def is_worker_loop_running() -> bool:
+    """True if this process has a persistent worker event loop."""
+    return _loop is not None and _loop.is_running()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous task code.
+
+    Submits the coroutine onto the persistent worker loop when one is running
+    and waits for its result; otherwise runs it in a new loop via asyncio.run().
+    If the waiting thread is interrupted (e.g. Celery's SoftTimeLimitExceeded),
+    the coroutine is cancelled on the loop before the exception propagates.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result (its exception is re-raised).
+    """
+    if not is_worker_loop_running():
+        return asyncio.run(_run_on_fresh_loop(coro))
+
+    future = asyncio.run_coroutine_threadsafe(coro, _loop)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+async def _run_on_fresh_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Await a coroutine, then close the clients bound to this loop."""
+    from app.db.redis import close_redis_pool
+    from app.services.http_client import close_http_client
+
+    try:
+        return await coro
+    finally:
+        try:
+            await close_http_client()
+        except Exception as e:
+            logger.warning(f"Failed to close HTTP client: {e}")
+        try:
+            await close_redis_pool()
+        except Exception as e:
+            logger.warning(f"Failed to close Redis pool: {e}")
+
+
+def start_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Start the persistent event loop in a daemon thread.
+
+    Idempotent: returns the running loop if one was already started.
+    """
+    global _loop, _loop_thread
+    if is_worker_loop_running():
+        return _loop
+
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+
+    def run_loop() -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    thread = threading.Thread(target=run_loop, name="worker-event-loop", daemon=True)
+    thread.start()
+    ready.wait()
+
+    _loop, _loop_thread = loop, thread
+    return loop
+
+
+def stop_worker_loop(timeout: float = 10.0) -> None:
+    """Stop and close the persistent event loop, if running."""
+    global _loop, _loop_thread
+    loop, thread = _loop, _loop_thread
+    _loop, _loop_thread = None, None
+    if loop is None:
+        return
+
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout)
+    if not loop.is_running():
+        loop.close()
+
+
+async def _open_shared_clients() -> None:
+    """Create the process-wide Neo4j and LLM clients on the worker loop."""
+    from app.services.knowledge_graph.client import get_neo4j_client
+    from app.services.llm.client import get_llm_client
+
+    get_llm_client()
+    try:
+        neo4j_client = await get_neo4j_client()
+        await neo4j_client.verify_connectivity()
+    except Exception as e:
+        # Tasks retry the connection lazily; the worker must still start
+        logger.warning(f"Neo4j unavailable at worker startup: {e}")
+
+
+async def _close_shared_clients() -> None:
+    """Close the Neo4j driver, shared HTTP client, Redis pool and task engine."""
+    from app.db import base as db_base
+    from app.db.redis import close_redis_pool
+    from app.services.http_client import close_http_client
+    from app.services.knowledge_graph.client import close_neo4j_client
+
+    try:
+        await close_neo4j_client()
+    except Exception as e:
+        logger.warning(f"Failed to close Neo4j client: {e}")
+    try:
+        await close_http_client()
+    except Exception as e:
+        logger.warning(f"Failed to close HTTP client: {e}")
+    try:
+        await close_redis_pool()
+    except Exception as e:
+        logger.warning(f"Failed to close Redis pool: {e}")
+    await db_base.task_engine.dispose()
+
+
+def init_worker_runtime() -> None:
+    """
+    Set up persistent loop mode for this worker process.
+
+    Called from worker_process_init (after fork) when
+    CELERY_PERSISTENT_EVENT_LOOP is enabled.
+    """
+    from app.db.base import use_pooled_task_engine
+
+    loop = start_worker_loop()
+    use_pooled_task_engine()
+    asyncio.run_coroutine_threadsafe(_open_shared_clients(), loop).result(
+        CLIENT_SETUP_TIMEOUT_SECONDS
+    )
+    logger.info("Worker process running tasks on a persistent event loop")
+
+
+def shutdown_worker_runtime() -> None:
+    """Close shared clients and stop the loop (worker_process_shutdown)."""
+    if not is_worker_loop_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_shared_clients(), _loop).result(
+            CLIENT_SETUP_TIMEOUT_SECONDS
+        )
+    except Exception as e:
+        logger.warning(f"Failed to close worker clients: {e}")
+    stop_worker_loop()
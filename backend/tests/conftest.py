@@ -10,7 +10,7 @@ import os
 import sys
 from pathlib import Path
 from typing import Any, Generator
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from dotenv import load_dotenv
@@ -223,6 +223,80 @@ def mock_redis() -> MagicMock:
     return mock
 
 
+class LoopBoundRedisPool:
+    """Stand-in for a redis.asyncio pool: its connections belong to one loop."""
+
+    def __init__(self, store: dict[str, Any]) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.store = store
+        self.disconnected = False
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+
+class LoopBoundRedis:
+    """
+    Stand-in for redis.asyncio.Redis over a LoopBoundRedisPool.
+
+    Like real pooled connections, commands fail once the pool is used from an
+    event loop other than the one that created it.
+    """
+
+    def __init__(self, connection_pool: LoopBoundRedisPool) -> None:
+        self.pool = connection_pool
+
+    def _check_loop(self) -> dict[str, Any]:
+        if self.pool.disconnected or self.pool.loop is not asyncio.get_running_loop():
+            raise RuntimeError("Event loop is closed")
+        return self.pool.store
+
+    async def get(self, key: str) -> Any:
+        return self._check_loop().get(key)
+
+    async def set(self, key: str, value: Any, nx: bool = False, ex: Any = None) -> Any:
+        store = self._check_loop()
+        if nx and key in store:
+            return None
+        store[key] = value
+        return True
+
+    async def setex(self, key: str, ttl: int, value: Any) -> bool:
+        self._check_loop()[key] = value
+        return True
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        return key in self._check_loop()
+
+    async def delete(self, *keys: str) -> int:
+        store = self._check_loop()
+        return sum(store.pop(key, None) is not None for key in keys)
+
+
+@pytest.fixture
+def loop_bound_redis() -> Generator[list[LoopBoundRedisPool], None, None]:
+    """
+    Route app.db.redis through loop-bound fakes; yields the pools created.
+
+    For code run under run_async(), where every call may get a new event loop.
+    """
+    from app.db import redis as redis_db
+
+    store: dict[str, Any] = {}
+    pools: list[LoopBoundRedisPool] = []
+
+    def from_url(*args: Any, **kwargs: Any) -> LoopBoundRedisPool:
+        pools.append(LoopBoundRedisPool(store))
+        return pools[-1]
+
+    with (
+        patch.object(redis_db.redis.ConnectionPool, "from_url", side_effect=from_url),
+        patch.object(redis_db.redis, "Redis", LoopBoundRedis),
+        patch.object(redis_db, "_redis_pool", None),
+    ):
+        yield pools
+
+
 @pytest.fixture
 def mock_db_session() -> MagicMock:
     """
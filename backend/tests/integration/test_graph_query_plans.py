@@ -0,0 +1,128 @@
+"""
+Integration Tests for Knowledge Graph Query Plans
+
+Query-plan regression test: EXPLAINs the hot-path lookups (node details,
+connections, relationship creation, traversal, file_path linking) against a
+migrated schema and fails if any plan scans every node in the database.
+EXPLAIN only plans the query, so no data is read or written; the schema
+migrations are applied to the configured database first, as on app start.
+
+Requires a running Neo4j instance (skipped if unreachable).
+
+Run with: pytest tests/integration/test_graph_query_plans.py -v
+"""
+
+import pytest
+import pytest_asyncio
+from neo4j import AsyncGraphDatabase
+
+from app.config.settings import settings
+from app.services.knowledge_graph.queries import (
+    BULK_CREATE_RELATIONSHIPS,
+    BULK_LINK_CONTENT_TO_NOTES_BY_PATH,
+    BULK_MERGE_NOTE_LINKS,
+    CREATE_RELATIONSHIP,
+    FIND_CONTENT_BY_FILE_PATH,
+    FIND_NOTE_BY_FILE_PATH,
+    GET_CONNECTED_NODES,
+    GET_CONTENT_BY_ID,
+    GET_INCOMING_CONNECTIONS,
+    GET_NODE_DETAILS_BY_ID,
+    GET_OUTGOING_CONNECTIONS,
+    LINK_CONTENT_TO_NOTE_BY_FILE_PATH,
+    get_centered_visualization_query,
+)
+from app.services.knowledge_graph.schema_manager import (
+    SCHEMA_VERSION,
+    GraphSchemaManager,
+)
+
+ROW = {"source_id": "a", "target_id": "b", "properties": {}}
+
+HOT_PATH_QUERIES = {
+    "node_details": (GET_NODE_DETAILS_BY_ID, {"node_id": "a"}),
+    "incoming_connections": (GET_INCOMING_CONNECTIONS, {"node_id": "a", "limit": 10}),
+    "outgoing_connections": (GET_OUTGOING_CONNECTIONS, {"node_id": "a", "limit": 10}),
+    "create_relationship": (
+        CREATE_RELATIONSHIP.format(rel_type="RELATES_TO"),
+        {"source_id": "a", "target_id": "b", "properties": {}},
+    ),
+    "bulk_create_relationships": (
+        BULK_CREATE_RELATIONSHIPS.format(rel_type="RELATES_TO"),
+        {"rows": [ROW]},
+    ),
+    "connected_nodes": (
+        GET_CONNECTED_NODES.format(rel_filter="", max_depth=2),
+        {"node_id": "a"},
+    ),
+    "centered_graph": (
+        get_centered_visualization_query(2),
+        {"center_id": "a", "node_types": ["Content", "Note"], "limit": 100},
+    ),
+    "content_by_id": (GET_CONTENT_BY_ID, {"id": "a"}),
+    "note_by_file_path": (FIND_NOTE_BY_FILE_PATH, {"file_path": "a.md"}),
+    "content_by_file_path": (FIND_CONTENT_BY_FILE_PATH, {"file_path": "a.md"}),
+    "link_content_to_note": (LINK_CONTENT_TO_NOTE_BY_FILE_PATH, {"file_path": "a.md"}),
+    "bulk_link_content_to_notes": (
+        BULK_LINK_CONTENT_TO_NOTES_BY_PATH,
+        {"file_paths": ["a.md"]},
+    ),
+    "merge_note_links": (
+        BULK_MERGE_NOTE_LINKS,
+        {"rows": [{"node_id": "a", "target_ids": ["b"]}]},
+    ),
+}
+
+
+def operators(plan: dict) -> list[str]:
+    """All operator names in a plan tree, without the runtime suffix."""
+    names = [plan["operatorType"].split("@")[0]]
+    for child in plan.get("children", []):
+        names.extend(operators(child))
+    return names
+
+
+@pytest_asyncio.fixture
+async def neo4j_driver():
+    """Driver for the configured Neo4j database with the schema migrated."""
+    driver = AsyncGraphDatabase.driver(
+        settings.NEO4J_URI,
+        auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+    )
+    try:
+        await driver.verify_connectivity()
+    except Exception as e:
+        await driver.close()
+        pytest.skip(f"Neo4j not available: {e}")
+
+    manager = GraphSchemaManager(driver, database=settings.NEO4J_DATABASE)
+    await manager.migrate()
+    yield driver
+    await driver.close()
+
+
+class TestQueryPlans:
+    """Hot-path queries must not plan an AllNodesScan."""
+
+    @pytest.mark.asyncio
+    async def test_schema_up_to_date(self, neo4j_driver) -> None:
+        """Migrating brings the database to the latest schema version."""
+        manager = GraphSchemaManager(neo4j_driver, database=settings.NEO4J_DATABASE)
+
+        assert await manager.current_version() == SCHEMA_VERSION
+        assert await manager.migrate() == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", sorted(HOT_PATH_QUERIES))
+    async def test_no_all_nodes_scan(self, neo4j_driver, name: str) -> None:
+        """The query is planned with label/index lookups only."""
+        query, params = HOT_PATH_QUERIES[name]
+
+        async with neo4j_driver.session(database=settings.NEO4J_DATABASE) as session:
+            result = await session.run("EXPLAIN " + query, **params)
+            summary = await result.consume()
+
+        plan_operators = operators(summary.plan)
+        assert "AllNodesScan" not in plan_operators, (
+            f"{name} scans all nodes: {plan_operators}"
+        )
@@ -1,12 +1,13 @@
 """
 Unit Tests for Vault Lifecycle Management
 
-Tests for startup_vault_services, shutdown_vault_services, and
-get_watcher_status functions.
+Tests for startup_vault_services, shutdown_vault_services,
+get_watcher_status and the background startup sync/readiness state.
 """
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from unittest.mock import patch, MagicMock, AsyncMock
 
@@ -15,7 +16,9 @@ import pytest
 from app.services.obsidian.lifecycle import (
     startup_vault_services,
     shutdown_vault_services,
+    get_startup_status,
     get_watcher_status,
+    is_vault_ready,
     _vault_watcher,
     _sync_service,
 )
@@ -33,9 +36,31 @@ def reset_module_state():
 
     lifecycle._vault_watcher = None
     lifecycle._sync_service = None
+    lifecycle._startup_task = None
+    lifecycle._startup_phase = "not_started"
+    lifecycle._startup_error = None
     yield
     lifecycle._vault_watcher = None
     lifecycle._sync_service = None
+    lifecycle._startup_task = None
+    lifecycle._startup_phase = "not_started"
+    lifecycle._startup_error = None
+
+
+@pytest.fixture(autouse=True)
+def mock_note_index():
+    """Keep the background note index rebuild off the database."""
+    with patch("app.services.obsidian.note_index.NoteIndexService") as mock_cls:
+        mock_cls.return_value.rebuild = AsyncMock(return_value={"indexed": 0})
+        yield mock_cls
+
+
+async def wait_for_startup_sync():
+    """Await the background startup task started by startup_vault_services."""
+    import app.services.obsidian.lifecycle as lifecycle
+
+    if lifecycle._startup_task is not None:
+        await lifecycle._startup_task
 
 
 @pytest.fixture
@@ -108,12 +133,15 @@ class TestStartupVaultServices:
                         "app.services.obsidian.watcher.VaultWatcher",
                         return_value=mock_vault_watcher,
                     ):
-                        with patch("app.services.tasks.sync_vault_note"):
+                        with patch("app.services.tasks.sync_vault_notes"):
                             result = await startup_vault_services()
+                            await wait_for_startup_sync()
 
         assert result["vault_path"] == str(mock_vault_manager.vault_path)
-        assert result["reconciliation"] is not None
+        assert result["background_sync_started"] is True
         assert result["watcher_started"] is True
+        assert get_startup_status()["reconciliation"]["synced"] == 5
+        assert is_vault_ready() is True
         mock_sync_service.reconcile_on_startup.assert_called_once()
         mock_vault_watcher.start.assert_called_once()
 
@@ -139,10 +167,12 @@ class TestStartupVaultServices:
                         "app.services.obsidian.watcher.VaultWatcher",
                         return_value=mock_vault_watcher,
                     ):
-                        with patch("app.services.tasks.sync_vault_note"):
-                            result = await startup_vault_services()
+                        with patch("app.services.tasks.sync_vault_notes"):
+                            await startup_vault_services()
+                            await wait_for_startup_sync()
 
-        assert result["reconciliation"] is None
+        assert get_startup_status()["reconciliation"] is None
+        assert get_startup_status()["phase"] == "ready"
         mock_sync_service.reconcile_on_startup.assert_not_called()
 
     @pytest.mark.asyncio
@@ -164,6 +194,7 @@ class TestStartupVaultServices:
                     return_value=mock_sync_service,
                 ):
                     result = await startup_vault_services()
+                    await wait_for_startup_sync()
 
         assert result["watcher_started"] is False
 
@@ -181,25 +212,29 @@ class TestStartupVaultServices:
                 result = await startup_vault_services()
 
         assert result["vault_path"] is None
-        assert result["reconciliation"] is None
+        assert result["background_sync_started"] is False
         assert result["watcher_started"] is False
+        assert get_startup_status()["phase"] == "not_configured"
+        assert is_vault_ready() is True
 
     @pytest.mark.asyncio
     async def test_startup_uses_celery_task(
         self, mock_vault_manager, mock_sync_service, mock_vault_watcher
     ):
-        """Startup configures watcher to use Celery task."""
+        """Startup configures watcher to queue one Celery task per batch."""
         captured_callback = None
 
-        def capture_watcher_init(vault_path, on_change, debounce_ms):
+        def capture_watcher_init(vault_path, debounce_ms, on_batch, batch_size):
             nonlocal captured_callback
-            captured_callback = on_change
+            captured_callback = on_batch
+            assert batch_size == 250
             return mock_vault_watcher
 
         with patch("app.services.obsidian.lifecycle.settings") as mock_settings:
             mock_settings.VAULT_SYNC_NEO4J_ENABLED = True
             mock_settings.VAULT_WATCH_ENABLED = True
             mock_settings.VAULT_SYNC_DEBOUNCE_MS = 1000
+            mock_settings.VAULT_SYNC_TASK_BATCH_SIZE = 250
 
             with patch(
                 "app.services.obsidian.vault.get_vault_manager",
@@ -213,15 +248,86 @@ class TestStartupVaultServices:
                         "app.services.obsidian.watcher.VaultWatcher",
                         side_effect=capture_watcher_init,
                     ):
-                        with patch("app.services.tasks.sync_vault_note") as mock_task:
+                        with patch("app.services.tasks.sync_vault_notes") as mock_task:
                             mock_task.delay = MagicMock()
                             await startup_vault_services()
 
                             # Call the captured callback
                             assert captured_callback is not None
-                            captured_callback("/path/to/note.md")
+                            captured_callback(
+                                [Path("/path/to/a.md"), Path("/path/to/b.md")]
+                            )
+
+                            mock_task.delay.assert_called_once_with(
+                                ["/path/to/a.md", "/path/to/b.md"]
+                            )
+                            await wait_for_startup_sync()
+
+    @pytest.mark.asyncio
+    async def test_startup_does_not_wait_for_reconciliation(
+        self, mock_vault_manager, mock_sync_service
+    ):
+        """Startup returns while reconciliation is still running."""
+        import app.services.obsidian.lifecycle as lifecycle
 
-                            mock_task.delay.assert_called_once_with("/path/to/note.md")
+        release = asyncio.Event()
+
+        async def slow_reconcile(vault_path):
+            await release.wait()
+            return {"synced": 1}
+
+        mock_sync_service.reconcile_on_startup = AsyncMock(side_effect=slow_reconcile)
+
+        with patch("app.services.obsidian.lifecycle.settings") as mock_settings:
+            mock_settings.VAULT_SYNC_NEO4J_ENABLED = True
+            mock_settings.VAULT_WATCH_ENABLED = False
+
+            with patch(
+                "app.services.obsidian.vault.get_vault_manager",
+                return_value=mock_vault_manager,
+            ), patch(
+                "app.services.obsidian.sync.VaultSyncService",
+                return_value=mock_sync_service,
+            ):
+                await startup_vault_services()
+                await asyncio.sleep(0)
+
+                assert get_startup_status()["phase"] == "reconciling"
+                assert is_vault_ready() is False
+
+                release.set()
+                await lifecycle._startup_task
+
+        assert get_startup_status()["phase"] == "ready"
+        assert is_vault_ready() is True
+
+    @pytest.mark.asyncio
+    async def test_reconciliation_failure_marks_failed(
+        self, mock_vault_manager, mock_sync_service
+    ):
+        """A failed reconciliation stops readiness from waiting on it."""
+        mock_sync_service.reconcile_on_startup = AsyncMock(
+            side_effect=RuntimeError("neo4j down")
+        )
+
+        with patch("app.services.obsidian.lifecycle.settings") as mock_settings:
+            mock_settings.VAULT_SYNC_NEO4J_ENABLED = True
+            mock_settings.VAULT_WATCH_ENABLED = False
+
+            with patch(
+                "app.services.obsidian.vault.get_vault_manager",
+                return_value=mock_vault_manager,
+            ), patch(
+                "app.services.obsidian.sync.VaultSyncService",
+                return_value=mock_sync_service,
+            ):
+                await startup_vault_services()
+                await wait_for_startup_sync()
+
+        status = get_startup_status()
+        assert status["phase"] == "failed"
+        assert status["error"] == "neo4j down"
+        assert status["ready"] is True
 
 
 # ============================================================================
@@ -277,6 +383,28 @@ class TestShutdownVaultServices:
 
         mock_sync_service._update_last_sync_time.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_unfinished_reconciliation(
+        self, mock_sync_service
+    ):
+        """Shutdown cancels reconciliation and keeps the old last sync time."""
+        import app.services.obsidian.lifecycle as lifecycle
+
+        async def never_finishes():
+            await asyncio.Event().wait()
+
+        lifecycle._sync_service = mock_sync_service
+        lifecycle._startup_phase = "reconciling"
+        lifecycle._startup_task = asyncio.create_task(never_finishes())
+
+        with patch("app.services.obsidian.lifecycle.settings") as mock_settings:
+            mock_settings.VAULT_SYNC_NEO4J_ENABLED = True
+
+            await shutdown_vault_services()
+
+        assert lifecycle._startup_task is None
+        mock_sync_service._update_last_sync_time.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_shutdown_idempotent(self):
         """Shutdown is safe to call when services not started."""
@@ -0,0 +1,308 @@
+"""
+Unit Tests for the Vault Note Metadata Index
+
+Tests metadata extraction, cursor encoding, query validation and the
+mtime-validated rebuild logic of NoteIndexService. Database access is mocked.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.obsidian.note_index import (
+    NoteIndexService,
+    NoteMetadata,
+    decode_cursor,
+    encode_cursor,
+    is_hidden,
+    metadata_from_frontmatter,
+    scan_vault_notes,
+)
+
+
+def _note(**overrides) -> NoteMetadata:
+    """Build a NoteMetadata with sensible defaults."""
+    data = {
+        "path": "sources/papers/attention.md",
+        "name": "attention",
+        "folder": "sources/papers",
+        "mtime": datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+        "size": 1234,
+        "title": "Attention Is All You Need",
+        "tags": ["ml"],
+        "note_type": "paper",
+    }
+    data.update(overrides)
+    return NoteMetadata(**data)
+
+
+def _mock_session_maker(rows: list) -> MagicMock:
+    """Session maker whose session.execute() returns the given rows."""
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=rows)
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=context)
+
+
+# ============================================================================
+# Metadata Extraction
+# ============================================================================
+
+
+class TestMetadataFromFrontmatter:
+    """Tests for metadata_from_frontmatter."""
+
+    def test_extracts_fields(self, temp_vault: Path):
+        """Title, tags and type come from frontmatter; path fields from disk."""
+        note_path = temp_vault / "sources" / "papers" / "attention.md"
+        note_path.write_text("body")
+
+        meta = metadata_from_frontmatter(
+            note_path,
+            temp_vault,
+            {"title": "Attention", "tags": ["ml", "nlp"], "type": "paper"},
+        )
+
+        assert meta.path == "sources/papers/attention.md"
+        assert meta.name == "attention"
+        assert meta.folder == "sources/papers"
+        assert meta.title == "Attention"
+        assert meta.tags == ["ml", "nlp"]
+        assert meta.note_type == "paper"
+        assert meta.size == 4
+        assert meta.mtime.tzinfo is not None
+
+    def test_fallback_fields(self, temp_vault: Path):
+        """Falls back to name/content_type and wraps a string tag."""
+        note_path = temp_vault / "root-note.md"
+        note_path.write_text("")
+
+        meta = metadata_from_frontmatter(
+            note_path,
+            temp_vault,
+            {"name": "Root", "tags": "solo", "content_type": "idea"},
+        )
+
+        assert meta.folder == ""
+        assert meta.title == "Root"
+        assert meta.tags == ["solo"]
+        assert meta.note_type == "idea"
+
+    def test_empty_frontmatter(self, temp_vault: Path):
+        """Notes without frontmatter are still indexed."""
+        note_path = temp_vault / "plain.md"
+        note_path.write_text("just text")
+
+        meta = metadata_from_frontmatter(note_path, temp_vault, {})
+
+        assert meta.title is None
+        assert meta.tags == []
+        assert meta.note_type is None
+
+    def test_sort_keys(self):
+        """to_row precomputes lowercased sort keys, title falling back to name."""
+        assert _note(title="Zeta").to_row()["sort_title"] == "zeta"
+        assert _note(title=None, name="Alpha").to_row()["sort_title"] == "alpha"
+        assert _note(name="Alpha").to_row()["sort_name"] == "alpha"
+
+    def test_is_hidden(self):
+        """Hidden folders and files are detected on the relative path."""
+        assert is_hidden(Path(".obsidian/workspace.md"))
+        assert is_hidden(Path("notes/.draft.md"))
+        assert not is_hidden(Path("notes/draft.md"))
+
+
+# ============================================================================
+# Cursors
+# ============================================================================
+
+
+class TestCursor:
+    """Tests for keyset cursor encoding."""
+
+    @pytest.mark.parametrize("sort_by", ["modified", "name", "title", "size"])
+    def test_roundtrip(self, sort_by: str):
+        """Cursors decode to the sort key and path they were built from."""
+        note = _note()
+        key, path = decode_cursor(encode_cursor(sort_by, note), sort_by)
+
+        expected = {
+            "modified": note.mtime,
+            "name": "attention",
+            "title": "attention is all you need",
+            "size": 1234,
+        }[sort_by]
+        assert key == expected
+        assert path == note.path
+
+    def test_sort_mismatch(self):
+        """A cursor cannot be reused with a different sort order."""
+        cursor = encode_cursor("name", _note())
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "size")
+
+    def test_malformed(self):
+        """Garbage cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor", "name")
+
+
+# ============================================================================
+# Query
+# ============================================================================
+
+
+class TestQuery:
+    """Tests for NoteIndexService.query."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_sort(self):
+        """Unknown sort_by raises ValueError before touching the database."""
+        with pytest.raises(ValueError):
+            await NoteIndexService().query(sort_by="colour")
+
+    def test_filters_compile(self):
+        """Folder, tag, type and search filters render as indexable SQL."""
+        filters = NoteIndexService._build_filters(
+            folder="sources/", search="deep learning", tag="ml", content_type="paper"
+        )
+        sql = " ".join(
+            str(f.compile(dialect=postgresql.dialect())) for f in filters
+        )
+
+        assert len(filters) == 4
+        assert "vault_notes.folder" in sql
+        assert "ANY (vault_notes.tags)" in sql
+        assert "vault_notes.note_type" in sql
+        assert "lower(concat(" in sql
+
+    def test_no_filters(self):
+        """No filters yields no WHERE clauses."""
+        assert NoteIndexService._build_filters(None, None, None, None) == []
+
+
+# ============================================================================
+# Rebuild
+# ============================================================================
+
+
+class TestRebuild:
+    """Tests for the mtime-validated rebuild."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_notes_reindexed(self, tmp_path: Path):
+        """Unchanged notes are skipped, changed/new upserted, missing removed."""
+        temp_vault = tmp_path
+        (temp_vault / "concepts").mkdir()
+        unchanged = temp_vault / "concepts" / "unchanged.md"
+        unchanged.write_text("---\ntitle: Same\n---\n")
+        changed = temp_vault / "concepts" / "changed.md"
+        changed.write_text("---\ntitle: New Title\n---\n")
+        new = temp_vault / "concepts" / "new.md"
+        new.write_text("new note")
+        hidden = temp_vault / ".obsidian" / "hidden.md"
+        hidden.parent.mkdir(exist_ok=True)
+        hidden.write_text("ignored")
+
+        st = unchanged.stat()
+        indexed_rows = [
+            MagicMock(
+                path="concepts/unchanged.md",
+                mtime=datetime.fromtimestamp(st.st_mtime, tz=timezone.utc),
+                size=st.st_size,
+            ),
+            MagicMock(
+                path="concepts/changed.md",
+                mtime=datetime(2000, 1, 1, tzinfo=timezone.utc),
+                size=1,
+            ),
+            MagicMock(
+                path="concepts/deleted.md",
+                mtime=datetime(2000, 1, 1, tzinfo=timezone.utc),
+                size=1,
+            ),
+        ]
+
+        service = NoteIndexService()
+        service._session_maker = _mock_session_maker(indexed_rows)
+        with patch.object(service, "upsert_many", AsyncMock()) as upsert, patch.object(
+            service, "remove_paths", AsyncMock(return_value=1)
+        ) as remove:
+            stats = await service.rebuild(temp_vault)
+
+        upserted = {n.path: n for n in upsert.call_args.args[0]}
+        assert set(upserted) == {"concepts/changed.md", "concepts/new.md"}
+        assert upserted["concepts/changed.md"].title == "New Title"
+        remove.assert_awaited_once_with(["concepts/deleted.md"])
+
+        assert stats["scanned"] == 3
+        assert stats["unchanged"] == 1
+        assert stats["updated"] == 1
+        assert stats["added"] == 1
+        assert stats["removed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_touching_file_triggers_reindex(self, tmp_path: Path):
+        """A newer mtime alone is enough to re-parse the note."""
+        temp_vault = tmp_path
+        (temp_vault / "daily").mkdir()
+        note = temp_vault / "daily" / "today.md"
+        note.write_text("same content")
+        st = note.stat()
+        os.utime(note, (st.st_atime, st.st_mtime + 10))
+
+        indexed_rows = [
+            MagicMock(
+                path="daily/today.md",
+                mtime=datetime.fromtimestamp(st.st_mtime, tz=timezone.utc),
+                size=st.st_size,
+            )
+        ]
+        service = NoteIndexService()
+        service._session_maker = _mock_session_maker(indexed_rows)
+        with patch.object(service, "upsert_many", AsyncMock()) as upsert:
+            stats = await service.rebuild(temp_vault)
+
+        assert stats["updated"] == 1
+        assert [n.path for n in upsert.call_args.args[0]] == ["daily/today.md"]
+
+    @pytest.mark.asyncio
+    async def test_vault_walked_in_thread(self, tmp_path: Path):
+        """The filesystem walk runs off the event loop."""
+        service = NoteIndexService()
+        service._session_maker = _mock_session_maker([])
+        with patch(
+            "app.services.obsidian.note_index.asyncio.to_thread",
+            AsyncMock(return_value=[]),
+        ) as to_thread, patch.object(service, "upsert_many", AsyncMock()):
+            stats = await service.rebuild(tmp_path)
+
+        to_thread.assert_awaited_once_with(scan_vault_notes, tmp_path)
+        assert stats["scanned"] == 0
+
+
+class TestScanVaultNotes:
+    """Tests for the blocking vault walk."""
+
+    def test_hidden_notes_skipped(self, tmp_path: Path):
+        """Notes in hidden folders are not returned; others are stat'ed."""
+        (tmp_path / ".obsidian").mkdir()
+        (tmp_path / ".obsidian" / "workspace.md").write_text("hidden")
+        (tmp_path / "concepts").mkdir()
+        note = tmp_path / "concepts" / "note.md"
+        note.write_text("visible")
+
+        entries = scan_vault_notes(tmp_path)
+
+        assert [(path, rel) for path, rel, _ in entries] == [
+            (note, "concepts/note.md")
+        ]
+        assert entries[0][2].st_size == len("visible")
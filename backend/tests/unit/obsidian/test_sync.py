@@ -7,6 +7,7 @@ with the Neo4j knowledge graph.
 
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch, MagicMock, AsyncMock
@@ -16,6 +17,8 @@ import pytest
 from app.services.obsidian.sync import (
     VaultSyncService,
     SyncStatus,
+    compute_note_hash,
+    find_modified_notes,
     get_sync_status,
     _sync_status,
 )
@@ -56,12 +59,23 @@ def sync_service() -> VaultSyncService:
     return VaultSyncService()
 
 
+@pytest.fixture
+def note_index(sync_service: VaultSyncService) -> MagicMock:
+    """Replace the service's note index with a mock (no stored hashes)."""
+    index = MagicMock()
+    index.get_content_hashes = AsyncMock(return_value={})
+    index.upsert_many = AsyncMock()
+    sync_service._note_index = index
+    return index
+
+
 @pytest.fixture
 def mock_neo4j():
     """Create a mock Neo4j client."""
     mock = MagicMock()
     mock.merge_note_node = AsyncMock()
     mock.sync_note_links = AsyncMock()
+    mock.write_note_batch = AsyncMock(return_value={})
     return mock
 
 
@@ -368,6 +382,81 @@ Content
         assert result["path"] == str(note_path)
 
 
+class TestSyncNoteChangeDetection:
+    """Tests for content-hash short-circuiting in sync_note."""
+
+    @pytest.fixture
+    def note(self, temp_vault: Path) -> Path:
+        note_path = temp_vault / "hashed.md"
+        note_path.write_text(
+            "---\nid: hashed-1\ntitle: Hashed\n---\nSee [[Other]]\n"
+        )
+        return note_path
+
+    async def _sync(self, sync_service, note: Path, vault: Path, mock_neo4j):
+        with patch(
+            "app.services.obsidian.sync.get_vault_manager",
+            return_value=create_mock_vault_manager(vault),
+        ), patch.object(
+            sync_service, "_ensure_neo4j", AsyncMock(return_value=mock_neo4j)
+        ):
+            return await sync_service.sync_note(note)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_note_skips_graph(
+        self, sync_service, note, temp_vault, mock_neo4j, note_index
+    ):
+        """A matching stored hash short-circuits before any graph write."""
+        parsed = sync_service._parse_note(note, temp_vault)
+        note_index.get_content_hashes.return_value = {"hashed.md": parsed.content_hash}
+
+        result = await self._sync(sync_service, note, temp_vault, mock_neo4j)
+
+        assert result["skipped"] is True
+        assert result["node_id"] == "hashed-1"
+        mock_neo4j.merge_note_node.assert_not_called()
+        mock_neo4j.sync_note_links.assert_not_called()
+        # Index row is refreshed without touching the stored hash
+        assert note_index.upsert_many.call_args.kwargs["with_hash"] is False
+
+    def test_whitespace_edit_is_unchanged(self, sync_service, note, temp_vault):
+        """Whitespace-only body edits keep the same hash."""
+        before = sync_service._parse_note(note, temp_vault).content_hash
+        note.write_text(
+            "---\nid: hashed-1\ntitle: Hashed\n---\n\n\nSee   [[Other]]\n\n"
+        )
+        assert sync_service._parse_note(note, temp_vault).content_hash == before
+
+    @pytest.mark.asyncio
+    async def test_changed_note_stores_hash(
+        self, sync_service, note, temp_vault, mock_neo4j, note_index
+    ):
+        """After a successful graph write the new hash is recorded."""
+        note_index.get_content_hashes.return_value = {"hashed.md": "stale"}
+
+        result = await self._sync(sync_service, note, temp_vault, mock_neo4j)
+
+        assert "skipped" not in result
+        mock_neo4j.merge_note_node.assert_called_once()
+        mock_neo4j.sync_note_links.assert_called_once_with("hashed-1", ["Other"])
+        [metadata] = note_index.upsert_many.call_args.args[0]
+        assert metadata.content_hash == sync_service._parse_note(
+            note, temp_vault
+        ).content_hash
+        assert note_index.upsert_many.call_args.kwargs["with_hash"] is True
+
+    @pytest.mark.asyncio
+    async def test_failed_graph_write_keeps_old_hash(
+        self, sync_service, note, temp_vault, mock_neo4j, note_index
+    ):
+        """If Neo4j rejects the write, the note is retried on the next event."""
+        mock_neo4j.sync_note_links = AsyncMock(side_effect=Exception("down"))
+
+        await self._sync(sync_service, note, temp_vault, mock_neo4j)
+
+        assert note_index.upsert_many.call_args.kwargs["with_hash"] is False
+
+
 # ============================================================================
 # Full Sync Tests
 # ============================================================================
@@ -474,6 +563,204 @@ class TestFullSync:
         assert "already in progress" in result["error"]
 
 
+# ============================================================================
+# Batched Sync Engine Tests
+# ============================================================================
+
+
+@pytest.fixture
+def clean_vault(tmp_path: Path) -> Path:
+    """Vault with five notes that have ids (no frontmatter write-back)."""
+    vault = tmp_path / "engine_vault"
+    vault.mkdir()
+    for i in range(5):
+        (vault / f"Note{i}.md").write_text(
+            f"---\nid: note-{i}\ntitle: Note {i}\n---\nSee [[Note{(i + 1) % 5}]] #tag\n"
+        )
+    return vault
+
+
+class TestNoteHash:
+    """Tests for compute_note_hash."""
+
+    def test_order_insensitive(self):
+        """Key, link and tag order don't change the hash."""
+        assert compute_note_hash(
+            "id", {"a": 1, "b": 2}, ["x", "y"], ["t1", "t2"]
+        ) == compute_note_hash("id", {"b": 2, "a": 1}, ["y", "x", "x"], ["t2", "t1"])
+
+    def test_id_write_back_keeps_hash(self):
+        """Persisting the generated id to frontmatter doesn't change the hash."""
+        assert compute_note_hash("gen", {"title": "T"}, [], []) == compute_note_hash(
+            "gen", {"id": "gen", "title": "T"}, [], []
+        )
+
+    def test_content_changes_hash(self):
+        base = compute_note_hash("id", {"title": "T"}, ["a"], ["t"])
+        assert base != compute_note_hash("id", {"title": "U"}, ["a"], ["t"])
+        assert base != compute_note_hash("id", {"title": "T"}, ["b"], ["t"])
+        assert base != compute_note_hash("id", {"title": "T"}, ["a"], ["u"])
+
+
+class TestSyncEngine:
+    """Tests for the batched engine behind full_sync and reconciliation."""
+
+    @pytest.mark.asyncio
+    async def test_batches_writes(
+        self, sync_service, clean_vault: Path, mock_neo4j, note_index
+    ):
+        """Notes are written in batches of VAULT_SYNC_BATCH_SIZE."""
+        with patch.object(
+            sync_service, "_ensure_neo4j", AsyncMock(return_value=mock_neo4j)
+        ), patch("app.services.obsidian.sync.settings") as settings:
+            settings.VAULT_SYNC_BATCH_SIZE = 2
+            settings.VAULT_SYNC_PARSE_WORKERS = 3
+            with patch.object(sync_service, "_update_last_sync_time", AsyncMock()):
+                result = await sync_service.full_sync(clean_vault)
+
+        assert result["synced"] == 5
+        assert [len(c.args[0]) for c in mock_neo4j.write_note_batch.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+        mock_neo4j.merge_note_node.assert_not_called()
+        rows = [
+            row for c in mock_neo4j.write_note_batch.call_args_list for row in c.args[0]
+        ]
+        row = next(r for r in rows if r["node_id"] == "note-0")
+        assert row["target_ids"] == ["Note1"]
+        assert row["tags"] == ["tag"]
+        assert row["file_path"] == "Note0.md"
+        # Hashes are stored with the index rows
+        stored = [m for c in note_index.upsert_many.call_args_list for m in c.args[0]]
+        assert all(m.content_hash for m in stored)
+        assert get_sync_status()["last_result"]["synced"] == 5
+
+    @pytest.mark.asyncio
+    async def test_unchanged_notes_skipped(
+        self, sync_service, clean_vault: Path, mock_neo4j, note_index
+    ):
+        """Notes whose hash matches the stored one are not rewritten."""
+        parsed = sync_service._parse_note(clean_vault / "Note0.md", clean_vault)
+        note_index.get_content_hashes.return_value = {"Note0.md": parsed.content_hash}
+
+        with patch.object(
+            sync_service, "_ensure_neo4j", AsyncMock(return_value=mock_neo4j)
+        ), patch.object(sync_service, "_update_last_sync_time", AsyncMock()):
+            result = await sync_service.full_sync(clean_vault)
+
+        assert result["skipped"] == 1
+        assert result["synced"] == 4
+        written = {r["node_id"] for r in mock_neo4j.write_note_batch.call_args.args[0]}
+        assert "note-0" not in written
+        assert get_sync_status()["progress"]["processed"] == 5
+
+    @pytest.mark.asyncio
+    async def test_force_rewrites_unchanged(
+        self, sync_service, clean_vault: Path, mock_neo4j, note_index
+    ):
+        """force=True ignores stored hashes."""
+        with patch.object(
+            sync_service, "_ensure_neo4j", AsyncMock(return_value=mock_neo4j)
+        ), patch.object(sync_service, "_update_last_sync_time", AsyncMock()):
+            result = await sync_service.full_sync(clean_vault, force=True)
+
+        note_index.get_content_hashes.assert_not_called()
+        assert result["synced"] == 5
+
+    @pytest.mark.asyncio
+    async def test_graph_failure_not_hashed(
+        self, sync_service, clean_vault: Path, mock_neo4j, note_index
+    ):
+        """A failed batch counts as failed and stores no hashes."""
+        mock_neo4j.write_note_batch = AsyncMock(side_effect=Exception("Neo4j down"))
+
+        with patch.object(
+            sync_service, "_ensure_neo4j", AsyncMock(return_value=mock_neo4j)
+        ), patch.object(sync_service, "_update_last_sync_time", AsyncMock()):
+            result = await sync_service.full_sync(clean_vault)
+
+        assert result["failed"] == 5
+        assert result["synced"] == 0
+        stored = note_index.upsert_many.call_args.args[0]
+        assert all(m.content_hash is None for m in stored)
+
+    @pytest.mark.asyncio
+    async def test_parse_errors_reported(
+        self, sync_service, clean_vault: Path, mock_neo4j, note_index
+    ):
+        """Unparseable notes fail individually without stopping the batch."""
+        (clean_vault / "Broken.md").write_text("---\ntitle: [unclosed\n---\n")
+
+        with patch.object(
+            sync_service, "_ensure_neo4j", AsyncMock(return_value=mock_neo4j)
+        ), patch.object(sync_service, "_update_last_sync_time", AsyncMock()):
+            result = await sync_service.full_sync(clean_vault)
+
+        assert result["failed"] == 1
+        assert result["synced"] == 5
+        assert result["errors"][0]["path"].endswith("Broken.md")
+
+    @pytest.mark.asyncio
+    async def test_generated_ids_persisted(
+        self, sync_service, tmp_path: Path, mock_neo4j, note_index
+    ):
+        """Notes without an id get one generated and written back."""
+        vault = tmp_path / "no_ids"
+        vault.mkdir()
+        (vault / "A.md").write_text("---\ntitle: A\n---\n")
+
+        with patch.object(
+            sync_service, "_ensure_neo4j", AsyncMock(return_value=mock_neo4j)
+        ), patch.object(
+            sync_service,
+            "_generate_and_persist_node_id",
+            AsyncMock(return_value="generated"),
+        ) as gen, patch.object(
+            sync_service, "_update_last_sync_time", AsyncMock()
+        ):
+            await sync_service.full_sync(vault)
+
+        gen.assert_called_once_with(vault / "A.md")
+        assert (
+            mock_neo4j.write_note_batch.call_args.args[0][0]["node_id"] == "generated"
+        )
+
+
+class TestSyncNotes:
+    """Tests for sync_notes (watcher batches)."""
+
+    @pytest.mark.asyncio
+    async def test_syncs_existing_and_removes_deleted(
+        self, sync_service, clean_vault: Path, mock_neo4j, note_index
+    ):
+        """Existing notes are bulk-written; deleted paths leave the index."""
+        note_index.remove_paths = AsyncMock(return_value=1)
+        paths = [clean_vault / "Note0.md", clean_vault / "Note1.md"]
+        paths.append(clean_vault / "Deleted.md")
+
+        with patch(
+            "app.services.obsidian.sync.get_vault_manager",
+            return_value=create_mock_vault_manager(clean_vault),
+        ), patch.object(
+            sync_service, "_ensure_neo4j", AsyncMock(return_value=mock_neo4j)
+        ):
+            result = await sync_service.sync_notes(paths)
+
+        assert result["total"] == 3
+        assert result["synced"] == 2
+        assert result["removed"] == 1
+        mock_neo4j.write_note_batch.assert_called_once()
+        note_index.remove_paths.assert_called_once_with(["Deleted.md"])
+        # Only this batch's hashes are looked up
+        note_index.get_content_hashes.assert_called_once_with(
+            ["Note0.md", "Note1.md"]
+        )
+        # Watcher batches don't touch the full-sync progress
+        assert get_sync_status()["progress"]["processed"] == 0
+
+
 # ============================================================================
 # Reconcile on Startup Tests
 # ============================================================================
@@ -562,6 +849,22 @@ class TestReconcileOnStartup:
         assert status["is_running"] is False
         assert status["last_result"] is not None
 
+    def test_find_modified_notes(self, tmp_path: Path):
+        """Only notes newer than the last sync count as modified."""
+        old = tmp_path / "old.md"
+        new = tmp_path / "new.md"
+        for note in (old, new, tmp_path / ".obsidian" / "cache.md"):
+            note.parent.mkdir(exist_ok=True)
+            note.write_text("---\ntitle: Note\n---\n")
+        os.utime(old, (1_000_000_000, 1_000_000_000))
+        since = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+        total, modified = find_modified_notes(tmp_path, since)
+
+        assert total == 2
+        assert modified == [new]
+        assert sorted(find_modified_notes(tmp_path, None)[1]) == sorted([old, new])
+
 
 # ============================================================================
 # Generate Node ID Tests
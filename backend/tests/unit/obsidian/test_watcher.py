@@ -0,0 +1,106 @@
+"""
+Unit Tests for the Vault File Watcher
+
+Tests event filtering and debounced delivery of VaultEventHandler, including
+chunked batch delivery via on_batch. Timers are bypassed by calling
+_process_pending() directly.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from app.services.obsidian.watcher import VaultEventHandler, VaultWatcher
+
+
+def _event(path: str, is_directory: bool = False) -> MagicMock:
+    event = MagicMock()
+    event.src_path = path
+    event.is_directory = is_directory
+    return event
+
+
+def _handler(**kwargs) -> VaultEventHandler:
+    """Handler whose debounce timer never fires on its own."""
+    return VaultEventHandler(Path("/vault"), debounce_ms=60_000, **kwargs)
+
+
+class TestVaultEventHandler:
+    """Tests for VaultEventHandler."""
+
+    def test_filters_non_markdown_and_obsidian(self):
+        """Only markdown files outside .obsidian/ are scheduled."""
+        handler = _handler(on_change=MagicMock())
+        handler.on_modified(_event("/vault/a.md"))
+        handler.on_modified(_event("/vault/image.png"))
+        handler.on_modified(_event("/vault/.obsidian/workspace.md"))
+        handler.on_modified(_event("/vault/folder", is_directory=True))
+        handler._timer.cancel()
+
+        assert list(handler._pending) == ["/vault/a.md"]
+
+    def test_per_file_callbacks_without_on_batch(self):
+        """Without on_batch, on_change fires once per debounced path."""
+        on_change = MagicMock()
+        handler = _handler(on_change=on_change)
+        for name in ["a", "b", "a"]:
+            handler.on_modified(_event(f"/vault/{name}.md"))
+        handler._timer.cancel()
+
+        handler._process_pending()
+
+        assert [c.args[0] for c in on_change.call_args_list] == [
+            Path("/vault/a.md"),
+            Path("/vault/b.md"),
+        ]
+
+    def test_batch_delivery_is_chunked(self):
+        """A burst is delivered as chunks of batch_size paths."""
+        on_change = MagicMock()
+        on_batch = MagicMock()
+        handler = _handler(on_change=on_change, on_batch=on_batch, batch_size=2)
+        for i in range(5):
+            handler.on_created(_event(f"/vault/note{i}.md"))
+        handler._timer.cancel()
+
+        handler._process_pending()
+
+        assert [len(c.args[0]) for c in on_batch.call_args_list] == [2, 2, 1]
+        assert on_batch.call_args_list[0].args[0][0] == Path("/vault/note0.md")
+        on_change.assert_not_called()
+        assert handler._pending == {}
+
+    def test_failed_chunk_does_not_block_others(self):
+        """An exception from one chunk is logged and later chunks still run."""
+        on_batch = MagicMock(side_effect=[Exception("broker down"), None])
+        handler = _handler(on_batch=on_batch, batch_size=1)
+        handler.on_created(_event("/vault/a.md"))
+        handler.on_created(_event("/vault/b.md"))
+        handler._timer.cancel()
+
+        handler._process_pending()
+
+        assert on_batch.call_count == 2
+
+    def test_moves_report_both_paths(self):
+        """A rename schedules the old and the new path."""
+        handler = _handler(on_batch=MagicMock())
+        event = _event("/vault/old.md")
+        event.dest_path = "/vault/new.md"
+        handler.on_moved(event)
+        handler._timer.cancel()
+
+        assert set(handler._pending) == {"/vault/old.md", "/vault/new.md"}
+
+
+class TestVaultWatcher:
+    """Tests for VaultWatcher configuration."""
+
+    def test_passes_batch_settings(self):
+        on_batch = MagicMock()
+        watcher = VaultWatcher("/vault", on_batch=on_batch, batch_size=100)
+
+        assert watcher.on_batch is on_batch
+        assert watcher.batch_size == 100
+        assert watcher.is_running is False
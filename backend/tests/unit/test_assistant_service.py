@@ -75,7 +75,7 @@ def mock_mastery_service() -> MagicMock:
 def mock_spaced_rep_service() -> MagicMock:
     """Create a mock SpacedRepService."""
     service = MagicMock()
-    service.get_due_cards = AsyncMock(return_value=MagicMock(total_due=0, cards=[]))
+    service.count_due = AsyncMock(return_value=0)
     return service
 
 
@@ -309,6 +309,108 @@ class TestChat:
         assert "unable to generate responses" in result.response.lower()
 
 
+class TestChatStream:
+    """Tests for the chat_stream method."""
+
+    @staticmethod
+    def _llm_stream(tokens: list[str], error: Exception | None = None) -> MagicMock:
+        """Build a mock LLMStream yielding tokens, then optionally raising."""
+        stream = MagicMock()
+        stream.usage = MagicMock()
+
+        async def iterate():
+            for token in tokens:
+                yield token
+            if error:
+                raise error
+
+        stream.__aiter__ = lambda self: iterate()
+        return stream
+
+    async def test_chat_stream_emits_start_tokens_done(
+        self,
+        service: AssistantService,
+        mock_db_session: AsyncMock,
+        mock_llm_client: MagicMock,
+    ) -> None:
+        """chat_stream() yields sources first, then tokens, then done."""
+        mock_llm_client.stream = MagicMock(
+            return_value=self._llm_stream(["Machine ", "learning"])
+        )
+        search_results = [{"id": "doc-1", "title": "ML Basics", "score": 0.9}]
+
+        with patch(
+            "app.services.assistant.service.KnowledgeSearchService"
+        ) as mock_search_class, patch(
+            "app.services.assistant.service.CostTracker.log_usage", AsyncMock()
+        ) as mock_log_usage:
+            mock_search = MagicMock()
+            mock_search.semantic_search = AsyncMock(return_value=(search_results, 5.0))
+            mock_search_class.return_value = mock_search
+
+            events = [e async for e in service.chat_stream(message="What is ML?")]
+
+        names = [name for name, _ in events]
+        assert names == ["start", "token", "token", "done"]
+        assert events[0][1]["sources"][0]["id"] == "doc-1"
+        assert "".join(data["content"] for name, data in events if name == "token") == (
+            "Machine learning"
+        )
+        mock_log_usage.assert_awaited_once_with(mock_llm_client.stream.return_value.usage)
+
+        # Context from search was sent with the user message
+        messages = mock_llm_client.stream.call_args.kwargs["messages"]
+        assert "ML Basics" in messages[-1]["content"]
+
+        # Assistant message persisted with the full streamed text
+        saved = [c.args[0] for c in mock_db_session.add.call_args_list]
+        assert saved[-1].role == MessageRole.ASSISTANT
+        assert saved[-1].content == "Machine learning"
+
+    async def test_chat_stream_reports_llm_failure_in_band(
+        self,
+        service: AssistantService,
+        mock_db_session: AsyncMock,
+        mock_llm_client: MagicMock,
+    ) -> None:
+        """A failing stream ends with an apology token and still saves."""
+        mock_llm_client.stream = MagicMock(
+            return_value=self._llm_stream(["Partial"], error=RuntimeError("reset"))
+        )
+        mock_llm_client.stream.return_value.usage = None
+
+        with patch(
+            "app.services.assistant.service.KnowledgeSearchService"
+        ) as mock_search_class:
+            mock_search = MagicMock()
+            mock_search.semantic_search = AsyncMock(return_value=([], 0.0))
+            mock_search_class.return_value = mock_search
+
+            events = [e async for e in service.chat_stream(message="Hello")]
+
+        assert events[-1][0] == "done"
+        assert "error" in events[-2][1]["content"]
+        saved = mock_db_session.add.call_args_list[-1].args[0]
+        assert saved.content.startswith("Partial")
+
+    async def test_chat_stream_raises_before_first_event(
+        self,
+        service: AssistantService,
+        mock_db_session: AsyncMock,
+    ) -> None:
+        """chat_stream() raises ValueError for an unknown conversation."""
+        mock_scalars = MagicMock()
+        mock_scalars.first.return_value = None
+        mock_result = MagicMock()
+        mock_result.scalars.return_value = mock_scalars
+        mock_db_session.execute = AsyncMock(return_value=mock_result)
+
+        with pytest.raises(ValueError, match="Conversation not found"):
+            await anext(
+                service.chat_stream(message="Hello", conversation_id="missing")
+            )
+
+
 # =============================================================================
 # Conversation Management Tests
 # =============================================================================
@@ -596,6 +698,24 @@ class TestRecommendations:
             assert rec.reason is not None
             assert rec.priority is not None
 
+    async def test_get_recommendations_uses_due_count(
+        self,
+        service: AssistantService,
+        mock_spaced_rep_service: MagicMock,
+    ) -> None:
+        """get_recommendations() reads the due count without fetching cards."""
+        # Arrange
+        mock_spaced_rep_service.count_due.return_value = 4
+
+        # Act
+        result = await service.get_recommendations()
+
+        # Assert
+        mock_spaced_rep_service.count_due.assert_awaited_once_with()
+        mock_spaced_rep_service.get_due_cards.assert_not_called()
+        assert result.recommendations[0].topic_id == "spaced-rep"
+        assert "4 cards" in result.recommendations[0].reason
+
 
 # =============================================================================
 # Quiz Generation Tests
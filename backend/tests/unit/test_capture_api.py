@@ -2,11 +2,17 @@
 Unit tests for the Capture API endpoints.
 
 Tests the text capture endpoint including the create_cards/create_exercises
-toggles that control learning material generation.
+toggles that control learning material generation, and the streaming upload
+writer with early duplicate rejection used by the file capture endpoints.
 """
 
+import hashlib
 import inspect
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from fastapi import UploadFile
 
 from app.enums import ContentType
 
@@ -204,3 +210,70 @@ class TestCaptureRouterRegistration:
                 break
         else:
             pytest.fail("/text route not found")
+
+
+# =============================================================================
+# Test Streaming Uploads and Early Dedupe
+# =============================================================================
+
+
+class TestStreamingUpload:
+    """Tests for save_upload_with_hash and duplicate rejection."""
+
+    @pytest.mark.asyncio
+    async def test_hash_computed_while_writing(self, tmp_path):
+        """The file is written in chunks and its SHA-256 matches the content."""
+        from app.pipelines.utils.hash_utils import calculate_file_hash
+        from app.services import storage
+
+        data = b"%PDF-1.7 " + bytes(range(256)) * 20_000  # spans several chunks
+        upload = UploadFile(file=io.BytesIO(data), filename="paper.pdf")
+
+        with patch.object(storage, "UPLOAD_DIR", tmp_path), patch.object(
+            storage, "UPLOAD_CHUNK_SIZE", 64 * 1024
+        ):
+            file_path, file_hash = await storage.save_upload_with_hash(
+                upload, directory="pdfs"
+            )
+
+        assert file_path.parent == tmp_path / "pdfs"
+        assert file_path.suffix == ".pdf"
+        assert file_path.read_bytes() == data
+        assert file_hash == hashlib.sha256(data).hexdigest()
+        assert file_hash == calculate_file_hash(file_path)
+
+    @pytest.mark.asyncio
+    async def test_pdf_duplicate_rejected_before_queueing(self, tmp_path):
+        """A known hash returns the existing id, removes the staged file and
+        queues nothing."""
+        from app.routers import capture
+
+        staged = tmp_path / "dup.pdf"
+        staged.write_bytes(b"%PDF")
+        upload = MagicMock(content_type="application/pdf", filename="dup.pdf")
+        background_tasks = MagicMock()
+
+        with patch.object(
+            capture,
+            "save_upload_with_hash",
+            AsyncMock(return_value=(staged, "abc123")),
+        ), patch.object(
+            capture, "check_hash_exists", AsyncMock(return_value="existing-uuid")
+        ) as mock_check, patch.object(
+            capture, "save_content", AsyncMock()
+        ) as mock_save_content:
+            result = await capture.capture_pdf(
+                background_tasks=background_tasks,
+                file=upload,
+                content_type_hint=None,
+                detect_handwriting=True,
+                create_cards=True,
+                create_exercises=True,
+            )
+
+        mock_check.assert_awaited_once_with("abc123")
+        mock_save_content.assert_not_called()
+        background_tasks.add_task.assert_not_called()
+        assert result["status"] == "deduped"
+        assert result["existing_id"] == "existing-uuid"
+        assert not staged.exists()
@@ -5,6 +5,10 @@ Tests the Docker-based code execution sandbox functionality.
 Note: Some tests require Docker to be available and will be skipped if not.
 """
 
+import json
+import shutil
+import subprocess
+
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 
@@ -12,6 +16,7 @@ from app.services.learning.code_sandbox import (
     CodeSandbox,
     ExecutionResult,
     LANGUAGE_CONFIG,
+    RESULTS_MARKER,
     TEST_WRAPPERS,
     get_code_sandbox,
 )
@@ -31,6 +36,7 @@ def _is_docker_available() -> bool:
 
 
 DOCKER_AVAILABLE = _is_docker_available()
+NODE_AVAILABLE = shutil.which("node") is not None
 
 
 class TestExecutionResult:
@@ -105,14 +111,16 @@ class TestTestWrappers:
         assert "python" in TEST_WRAPPERS
         wrapper = TEST_WRAPPERS["python"]
         assert "{code}" in wrapper
-        assert "{test_input}" in wrapper
-        assert "{expected_output}" in wrapper
+        assert "{test_cases!r}" in wrapper
+        assert "{test_timeout}" in wrapper
+        assert "{marker}" in wrapper
 
     def test_javascript_wrapper_exists(self):
         """Test JavaScript test wrapper template exists."""
         assert "javascript" in TEST_WRAPPERS
         wrapper = TEST_WRAPPERS["javascript"]
-        assert "{code}" in wrapper
+        assert "{code_literal}" in wrapper
+        assert "{test_timeout_ms}" in wrapper
 
 
 class TestCodeSandbox:
@@ -185,8 +193,7 @@ class TestCodeSandbox:
         code = "def solution(x): return x * 2"
         wrapper = sandbox._create_test_wrapper(
             code=code,
-            test_input="5",
-            expected_output="10",
+            test_cases=[{"input": "5", "expected": "10"}],
             language="python",
         )
 
@@ -200,21 +207,96 @@ class TestCodeSandbox:
         code = "function solution(x) { return x * 2; }"
         wrapper = sandbox._create_test_wrapper(
             code=code,
-            test_input="5",
-            expected_output="10",
+            test_cases=[{"input": "5", "expected": "10"}],
             language="javascript",
         )
 
         assert code in wrapper
-        assert "testInput" in wrapper
+        assert "vm.runInContext" in wrapper
+        assert "timeout: testTimeoutMs" in wrapper
+
+    def test_create_test_wrapper_batches_cases(self):
+        """All test cases are embedded in one harness with the per-test timeout."""
+        sandbox = CodeSandbox(enabled=False, test_timeout=3)
+        wrapper = sandbox._create_test_wrapper(
+            code="def solution(x): return x",
+            test_cases=[
+                {"input": "1", "expected": "1"},
+                {"input": "2", "expected": "2"},
+            ],
+            language="python",
+        )
+
+        assert wrapper.count("def solution") == 1
+        assert '{"input": 1, "expected": 1}, {"input": 2, "expected": 2}' in wrapper
+        assert "_TEST_TIMEOUT = 3" in wrapper
+        compile(wrapper, "<harness>", "exec")
+
+    @pytest.mark.asyncio
+    async def test_run_tests_single_execution(self):
+        """run_tests runs once and maps the harness JSON to per-test results."""
+        sandbox = CodeSandbox(enabled=False, timeout=10, test_timeout=2)
+        sandbox.enabled = True
+        harness_output = [
+            {"passed": True, "actual": "10", "expected": "10"},
+            {
+                "passed": False,
+                "actual": "",
+                "expected": "6",
+                "error": "Test timed out",
+                "timed_out": True,
+            },
+        ]
+        sandbox.execute_code = AsyncMock(
+            return_value=ExecutionResult(
+                success=True,
+                stdout="learner print\n" + RESULTS_MARKER + json.dumps(harness_output),
+            )
+        )
+
+        results = await sandbox.run_tests(
+            code="def solution(x): return x * 2",
+            test_cases=[
+                {"input": "5", "expected": "10"},
+                {"input": "3", "expected": "6"},
+            ],
+            language="python",
+        )
+
+        sandbox.execute_code.assert_awaited_once()
+        assert sandbox.execute_code.call_args.kwargs["timeout"] == 10 + 2 * 2
+        assert [r.passed for r in results] == [True, False]
+        assert results[0].actual == "10"
+        assert results[1].error == "Test timed out"
+        assert results[1].input_value == "3"
+
+    @pytest.mark.asyncio
+    async def test_run_tests_harness_failure(self):
+        """Without harness output every test fails with the execution error."""
+        sandbox = CodeSandbox(enabled=False)
+        sandbox.enabled = True
+        sandbox.execute_code = AsyncMock(
+            return_value=ExecutionResult(
+                success=False, stderr="SyntaxError: invalid syntax", exit_code=1
+            )
+        )
+
+        results = await sandbox.run_tests(
+            code="def solution(x) return x",
+            test_cases=[{"input": "1", "expected": "1"}] * 3,
+            language="python",
+        )
+
+        assert len(results) == 3
+        assert all(not r.passed for r in results)
+        assert all("SyntaxError" in r.error for r in results)
 
     def test_create_test_wrapper_json_input(self):
         """Test wrapper handles JSON input correctly."""
         sandbox = CodeSandbox(enabled=False)
         wrapper = sandbox._create_test_wrapper(
             code="def solution(x): return x",
-            test_input="[1, 2, 3]",
-            expected_output="[1, 2, 3]",
+            test_cases=[{"input": "[1, 2, 3]", "expected": "[1, 2, 3]"}],
             language="python",
         )
 
@@ -225,14 +307,62 @@ class TestCodeSandbox:
         sandbox = CodeSandbox(enabled=False)
         wrapper = sandbox._create_test_wrapper(
             code="def solution(x): return x",
-            test_input="hello",
-            expected_output="hello",
+            test_cases=[{"input": "hello", "expected": "hello"}],
             language="python",
         )
 
         assert "hello" in wrapper
 
 
+@pytest.mark.skipif(not NODE_AVAILABLE, reason="node not installed")
+class TestJavaScriptHarness:
+    """Runs the JavaScript test harness with the local node binary."""
+
+    def run_harness(self, tmp_path, code: str, test_cases: list[dict]) -> list[dict]:
+        sandbox = CodeSandbox(enabled=False, test_timeout=1)
+        harness = tmp_path / "harness.js"
+        harness.write_text(
+            sandbox._create_test_wrapper(code, test_cases, "javascript")
+        )
+        result = subprocess.run(
+            ["node", str(harness)], capture_output=True, text=True, timeout=30
+        )
+        line = next(
+            line
+            for line in result.stdout.splitlines()
+            if line.startswith(RESULTS_MARKER)
+        )
+        return json.loads(line[len(RESULTS_MARKER) :])
+
+    def test_require_and_module_exports(self, tmp_path):
+        """Learner code can use require() and module.exports, as in plain node."""
+        code = (
+            "const assert = require('assert');\n"
+            "function solution(x) {\n"
+            "  assert.ok(typeof x === 'number');\n"
+            "  return x * 2;\n"
+            "}\n"
+            "module.exports = { solution };"
+        )
+
+        test_cases = [
+            {"input": "5", "expected": "10"},
+            {"input": "3", "expected": "6"},
+        ]
+
+        results = self.run_harness(tmp_path, code, test_cases)
+
+        assert [r["passed"] for r in results] == [True, True]
+
+    def test_infinite_loop_times_out_per_test(self, tmp_path):
+        """A synchronous infinite loop is interrupted by the per-test timeout."""
+        code = "function solution(x) { while (true) {} }"
+
+        results = self.run_harness(tmp_path, code, [{"input": "1", "expected": "1"}])
+
+        assert results[0]["timed_out"] is True
+
+
 class TestCodeSandboxSecurityLimits:
     """Tests for sandbox security limits."""
 
@@ -272,6 +402,27 @@ class TestGetCodeSandbox:
         sandbox2 = get_code_sandbox()
         assert sandbox1 is sandbox2
 
+    def test_reads_sandbox_settings(self):
+        """Timeouts and the warm pool size come from settings."""
+        import app.services.learning.code_sandbox as sandbox_module
+
+        sandbox_module._sandbox_instance = None
+        docker_client = MagicMock()
+        with (
+            patch.object(sandbox_module.settings, "SANDBOX_TIMEOUT_SECONDS", 20),
+            patch.object(sandbox_module.settings, "SANDBOX_TEST_TIMEOUT_SECONDS", 2),
+            patch.object(sandbox_module.settings, "SANDBOX_WARM_POOL_SIZE", 3),
+            patch.object(sandbox_module.settings, "SANDBOX_ENABLED", True),
+            patch.object(sandbox_module.docker, "from_env", return_value=docker_client),
+        ):
+            sandbox = get_code_sandbox()
+        sandbox_module._sandbox_instance = None
+
+        assert sandbox.timeout == 20
+        assert sandbox.test_timeout == 2
+        assert sandbox.warm_pool is not None
+        assert sandbox.warm_pool.size == 3
+
 
 @pytest.mark.skipif(not DOCKER_AVAILABLE, reason="Docker daemon not available")
 class TestCodeSandboxIntegration:
@@ -0,0 +1,106 @@
+"""
+Unit tests for the shared CPU executor and the image transforms it runs.
+
+Tests cover:
+- Process pool execution off the event loop
+- Thread pool fallback in daemonic (Celery prefork) processes
+- Disabled mode via asyncio.to_thread
+- process_image_bytes decode/composite/resize/encode
+"""
+
+import base64
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from app.services import cpu_executor
+from app.services.cpu_executor import (
+    get_cpu_executor,
+    run_cpu_bound,
+    shutdown_cpu_executor,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor(monkeypatch):
+    """Start each test without a pool and shut down whatever it created."""
+    monkeypatch.setattr(cpu_executor.settings, "CPU_EXECUTOR_MAX_WORKERS", 2)
+    shutdown_cpu_executor()
+    yield
+    shutdown_cpu_executor()
+
+
+class TestCpuExecutor:
+    """Tests for get_cpu_executor() and run_cpu_bound()."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self):
+        """Work runs in a separate process from the event loop."""
+        pid = await run_cpu_bound(os.getpid)
+
+        assert pid != os.getpid()
+        assert isinstance(get_cpu_executor(), ProcessPoolExecutor)
+
+    def test_processes_not_forked(self):
+        """Pool processes never fork the (multi-threaded) parent."""
+        executor = get_cpu_executor()
+
+        assert executor._mp_context.get_start_method() in ("forkserver", "spawn")
+
+    def test_executor_is_shared(self):
+        """Repeated calls reuse one executor."""
+        assert get_cpu_executor() is get_cpu_executor()
+
+    def test_daemon_process_uses_threads(self):
+        """Daemonic processes (Celery prefork children) get a thread pool."""
+        with patch.object(
+            cpu_executor.multiprocessing,
+            "current_process",
+            return_value=MagicMock(daemon=True),
+        ):
+            assert isinstance(get_cpu_executor(), ThreadPoolExecutor)
+
+    @pytest.mark.asyncio
+    async def test_disabled_runs_in_thread(self, monkeypatch):
+        """A negative worker count skips the pool entirely."""
+        monkeypatch.setattr(cpu_executor.settings, "CPU_EXECUTOR_MAX_WORKERS", -1)
+
+        assert get_cpu_executor() is None
+        assert await run_cpu_bound(os.getpid) == os.getpid()
+
+
+class TestProcessImageBytes:
+    """Tests for image_storage.process_image_bytes()."""
+
+    def _encode(self, image: Image.Image) -> str:
+        buffer = BytesIO()
+        image.save(buffer, format="PNG")
+        return base64.b64encode(buffer.getvalue()).decode()
+
+    def test_rgba_resized_to_rgb(self, monkeypatch):
+        """Transparent images are composited to RGB and downscaled."""
+        from app.services.processing.output import image_storage
+
+        monkeypatch.setattr(image_storage.settings, "IMAGE_MAX_DIMENSION", 100)
+        monkeypatch.setattr(image_storage.settings, "IMAGE_DEFAULT_FORMAT", "png")
+        data = self._encode(Image.new("RGBA", (400, 200), (255, 0, 0, 128)))
+
+        image_bytes, width, height = image_storage.process_image_bytes(
+            f"data:image/png;base64,{data}"
+        )
+
+        assert (width, height) == (100, 50)
+        saved = Image.open(BytesIO(image_bytes))
+        assert saved.mode == "RGB"
+        assert saved.size == (100, 50)
+
+    def test_invalid_data_raises(self):
+        """Undecodable payloads raise ValueError."""
+        from app.services.processing.output import image_storage
+
+        with pytest.raises(ValueError):
+            image_storage.process_image_bytes("bm90IGFuIGltYWdl")
@@ -0,0 +1,282 @@
+"""
+Unit tests for the embedding service.
+
+Tests request coalescing, provider batch limits, run memoization, the
+persistent vector cache (including Redis hits across Celery task loops), and
+that connection discovery plus Neo4j node
+creation share a single embedding call per document.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.enums import ConceptImportance, SummaryLevel
+from app.models.content import UnifiedContent
+from app.models.llm_usage import LLMUsage
+from app.models.processing import (
+    Concept,
+    ContentAnalysis,
+    ExtractionResult,
+    ProcessingResult,
+    TagAssignment,
+)
+from app.services.llm.cache import LLMResponseCache
+from app.services.llm.embeddings import (
+    EmbeddingService,
+    concept_embedding_text,
+    content_embedding_text,
+    get_embedding_cache,
+    make_embedding_key,
+    reset_embedding_cache,
+)
+from app.services.processing.output.neo4j_generator import create_knowledge_nodes
+from app.services.processing.stages.connections import discover_connections
+
+MODEL = "openai/text-embedding-3-small"
+
+
+class InMemoryBackend:
+    """Dict-backed cache backend."""
+
+    def __init__(self):
+        self.data: dict[str, dict] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value):
+        self.data[key] = value
+
+
+def _vector(text: str) -> list[float]:
+    """Deterministic fake embedding."""
+    return [float(len(text)), 1.0]
+
+
+@pytest.fixture
+def llm_client() -> MagicMock:
+    """LLM client whose embed() returns one vector per input text."""
+    client = MagicMock()
+    client.get_model_for_operation.return_value = MODEL
+
+    async def embed(texts, pipeline=None, content_id=None):
+        return [_vector(t) for t in texts], LLMUsage(cost_usd=0.001)
+
+    client.embed = AsyncMock(side_effect=embed)
+    return client
+
+
+@pytest.fixture
+def cache() -> LLMResponseCache:
+    return LLMResponseCache(InMemoryBackend(), enabled=True)
+
+
+@pytest.fixture
+def disabled_cache() -> LLMResponseCache:
+    return LLMResponseCache(InMemoryBackend(), enabled=False)
+
+
+# =============================================================================
+# EmbeddingService
+# =============================================================================
+
+
+class TestEmbeddingService:
+    """Tests for EmbeddingService."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_coalesced(self, llm_client, disabled_cache):
+        """Concurrent embed() calls are sent as one provider request."""
+        service = EmbeddingService(llm_client, cache=disabled_cache)
+
+        vectors = await asyncio.gather(
+            service.embed("alpha"), service.embed("be"), service.embed("c")
+        )
+
+        assert vectors == [_vector("alpha"), _vector("be"), _vector("c")]
+        llm_client.embed.assert_called_once()
+        assert llm_client.embed.call_args.args[0] == ["alpha", "be", "c"]
+        assert len(service.usages) == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_split_at_max_batch_size(self, llm_client, disabled_cache):
+        """Requests never exceed the provider input limit."""
+        service = EmbeddingService(llm_client, cache=disabled_cache, max_batch_size=2)
+
+        vectors = await service.embed_many(["a", "bb", "ccc", "dddd", "eeeee"])
+
+        assert vectors == [_vector(t) for t in ["a", "bb", "ccc", "dddd", "eeeee"]]
+        batches = [call.args[0] for call in llm_client.embed.call_args_list]
+        assert batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+    @pytest.mark.asyncio
+    async def test_run_memo_reuses_vectors(self, llm_client, disabled_cache):
+        """Texts embedded earlier in the run are not requested again."""
+        service = EmbeddingService(llm_client, cache=disabled_cache)
+
+        await service.embed_many(["title\n\nsummary", "concept"])
+        vector = await service.embed("title\n\nsummary")
+
+        assert vector == _vector("title\n\nsummary")
+        llm_client.embed.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_embedded_once(self, llm_client, disabled_cache):
+        """Duplicates within one request share a single input."""
+        service = EmbeddingService(llm_client, cache=disabled_cache)
+
+        vectors = await service.embed_many(["same", "same"])
+
+        assert vectors == [_vector("same"), _vector("same")]
+        assert llm_client.embed.call_args.args[0] == ["same"]
+
+    @pytest.mark.asyncio
+    async def test_persistent_cache_hit(self, llm_client, cache):
+        """Vectors cached by an earlier run skip the provider."""
+        await EmbeddingService(llm_client, cache=cache).embed("cached text")
+        llm_client.embed.reset_mock()
+
+        service = EmbeddingService(llm_client, cache=cache)
+        vectors = await service.embed_many(["cached text", "new text"])
+
+        assert vectors == [_vector("cached text"), _vector("new text")]
+        assert llm_client.embed.call_args.args[0] == ["new text"]
+        assert make_embedding_key(MODEL, "new text") in cache.backend.data
+
+    def test_cache_key_includes_model(self):
+        """The same text under another model is a different entry."""
+        assert make_embedding_key("a", "text") != make_embedding_key("b", "text")
+
+    @pytest.mark.asyncio
+    async def test_missing_vectors_not_cached(self, llm_client, cache):
+        """Inputs the provider returned no vector for resolve to [] and retry."""
+        llm_client.embed = AsyncMock(return_value=([], LLMUsage()))
+        service = EmbeddingService(llm_client, cache=cache)
+
+        assert await service.embed("text") == []
+        assert cache.backend.data == {}
+
+        await service.embed("text")
+        assert llm_client.embed.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_provider_error_propagates(self, llm_client, disabled_cache):
+        """Provider errors reach every waiting caller and are not memoized."""
+        llm_client.embed = AsyncMock(side_effect=RuntimeError("rate limited"))
+        service = EmbeddingService(llm_client, cache=disabled_cache)
+
+        results = await asyncio.gather(
+            service.embed("a"), service.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        llm_client.embed = AsyncMock(return_value=([[1.0]], LLMUsage()))
+        assert await service.embed("a") == [1.0]
+
+    def test_content_embedding_text_truncates_summary(self):
+        """Content text uses the title as fallback and truncates the summary."""
+        assert content_embedding_text("Title", "") == "Title\n\nTitle"
+        with patch("app.config.processing.processing_settings") as settings:
+            settings.CONNECTION_EMBEDDING_TRUNCATE = 5
+            assert content_embedding_text("T", "abcdefgh") == "T\n\nabcde"
+
+
+class TestEmbeddingCache:
+    """Tests for the process-wide embedding cache."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        reset_embedding_cache()
+        yield
+        reset_embedding_cache()
+
+    def test_redis_hits_across_task_loops(self, loop_bound_redis):
+        """A vector cached by one task is a hit in the next task's loop."""
+        from app.services.worker_runtime import run_async
+
+        with (
+            patch("app.services.llm.embeddings.settings.LLM_CACHE_BACKEND", "redis"),
+            patch("app.services.llm.embeddings.settings.EMBEDDING_CACHE_ENABLED", True),
+        ):
+            cache = get_embedding_cache()
+        key = make_embedding_key("model", "text")
+
+        run_async(cache.set(key, {"embedding": [0.1, 0.2]}))
+
+        assert run_async(cache.get(key)) == {"embedding": [0.1, 0.2]}
+        assert len(loop_bound_redis) == 2
+
+
+# =============================================================================
+# Pipeline Integration
+# =============================================================================
+
+
+class TestSharedEmbeddings:
+    """Connection discovery and Neo4j nodes share one embedding call."""
+
+    @pytest.mark.asyncio
+    async def test_one_embedding_call_per_document(self, llm_client, disabled_cache):
+        """Prefetch + discover_connections + create_knowledge_nodes -> 1 call."""
+        content = UnifiedContent(
+            id="doc-1", source_type="PAPER", title="Attention", full_text="..."
+        )
+        concepts = [
+            Concept(
+                name=name,
+                definition=f"{name} definition",
+                importance=ConceptImportance.CORE.value,
+            )
+            for name in ["Attention", "Transformer", "Softmax"]
+        ]
+        extraction = ExtractionResult(concepts=concepts)
+        analysis = ContentAnalysis(
+            content_type="paper",
+            domain="ml",
+            complexity="advanced",
+            estimated_length="medium",
+        )
+        summary = "Standard summary"
+        result = ProcessingResult(
+            content_id=content.id,
+            analysis=analysis,
+            summaries={SummaryLevel.STANDARD.value: summary},
+            extraction=extraction,
+            tags=TagAssignment(),
+            processing_time_seconds=1.0,
+        )
+        neo4j_client = MagicMock()
+        neo4j_client.vector_search = AsyncMock(return_value=[])
+        neo4j_client.write_graph_batch = AsyncMock(return_value={})
+
+        service = EmbeddingService(llm_client, cache=disabled_cache)
+        await service.embed_many(
+            [content_embedding_text(content.title, summary)]
+            + [concept_embedding_text(c.name, c.definition) for c in concepts]
+        )
+        await discover_connections(
+            content,
+            summary,
+            extraction,
+            analysis,
+            llm_client,
+            neo4j_client,
+            embedding_service=service,
+        )
+        await create_knowledge_nodes(
+            content,
+            result,
+            llm_client,
+            neo4j_client,
+            generate_concept_notes=False,
+            embedding_service=service,
+        )
+
+        llm_client.embed.assert_called_once()
+        assert len(llm_client.embed.call_args.args[0]) == 1 + len(concepts)
+        batch = neo4j_client.write_graph_batch.call_args.args[0]
+        content_vector = batch.content_nodes[0]["embedding"]
+        assert content_vector == neo4j_client.vector_search.call_args.kwargs["embedding"]
+        assert len(batch.concept_nodes) == len(concepts)
@@ -0,0 +1,270 @@
+"""
+Unit tests for batched knowledge graph writes.
+
+Tests GraphWriteBatch row collection, Neo4jClient.write_graph_batch() /
+write_graph_batches() statement ordering, transaction use and grouping, and
+the diff-based vault note link writes.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.enums import ConceptImportance
+from app.models.processing import Concept
+from app.services.knowledge_graph.batch import (
+    GraphWriteBatch,
+    normalize_relationship_type,
+)
+from app.services.knowledge_graph.client import Neo4jClient
+from app.services.knowledge_graph.queries import (
+    BULK_DELETE_CONTENT_OUTGOING_RELATIONSHIPS,
+    BULK_DELETE_STALE_NOTE_LINKS,
+    BULK_LINK_CONTENT_TO_CONCEPTS,
+    BULK_MERGE_CONCEPT_NODES,
+    BULK_MERGE_CONTENT_NODES,
+    BULK_MERGE_NOTE_LINKS,
+    BULK_MERGE_NOTE_NODES,
+)
+
+
+def make_batch(content_id: str = "doc-1") -> GraphWriteBatch:
+    """A batch with one document, one concept and two typed relationships."""
+    batch = GraphWriteBatch()
+    batch.add_content_node(
+        content_id, "Title", "paper", "Summary", [0.1], ["ml"], metadata={"a": 1}
+    )
+    concept = Concept(
+        name="Behavior Cloning (BC)",
+        definition="Imitation learning",
+        importance=ConceptImportance.CORE.value,
+    )
+    batch.add_concept_node(concept, [0.2], file_path="concepts/bc.md")
+    batch.link_content_to_concept(content_id, concept.name, concept.importance)
+    batch.link_concepts("Behavior Cloning (BC)", "Imitation Learning", "is type of")
+    batch.add_relationship(content_id, "other", "extends", {"strength": 0.9})
+    batch.add_relationship(content_id, "third", "relates-to")
+    return batch
+
+
+class FakeTransaction:
+    """Records statements; every statement reports `count` rows."""
+
+    def __init__(self, count: int = 1):
+        self.count = count
+        self.statements: list[tuple[str, dict]] = []
+
+    async def run(self, query, **params):
+        self.statements.append((query, params))
+        result = MagicMock()
+        result.single = AsyncMock(return_value={"count": self.count})
+        return result
+
+
+@pytest.fixture
+def client_and_tx():
+    """Neo4jClient wired to a fake driver whose write transactions use one tx."""
+    tx = FakeTransaction()
+
+    async def execute_write(work):
+        return await work(tx)
+
+    session = MagicMock()
+    session.execute_write = AsyncMock(side_effect=execute_write)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+
+    client = Neo4jClient()
+    client._initialized = True
+    client._async_driver = MagicMock()
+    client._async_driver.session.return_value = session
+    return client, tx, session
+
+
+class TestGraphWriteBatch:
+    """Tests for GraphWriteBatch."""
+
+    def test_concepts_are_canonicalized(self):
+        """Concept rows and links use canonical names, aliases are extracted."""
+        batch = make_batch()
+
+        [node] = batch.concept_nodes
+        assert node["canonical_name"] == "behavior cloning"
+        assert node["display_name"] == "Behavior Cloning"
+        assert "BC" in node["aliases"]
+        assert batch.concept_links[0]["canonical_name"] == "behavior cloning"
+
+    def test_relationships_grouped_by_sanitized_type(self):
+        """Relationship rows are grouped by Cypher-safe type."""
+        batch = make_batch()
+
+        assert set(batch.relationships) == {"EXTENDS", "RELATES_TO"}
+        assert set(batch.concept_relationships) == {"IS_TYPE_OF"}
+        assert batch.relationships["RELATES_TO"][0]["properties"] == {}
+
+    @pytest.mark.parametrize(
+        "relationship, expected",
+        [
+            ("is part of (subset)", "IS_PART_OF_SUBSET"),
+            ("builds-on", "BUILDS_ON"),
+            ("cause/effect", "CAUSE_EFFECT"),
+            ("author's method", "AUTHOR_S_METHOD"),
+            ("2nd order effect", "RELATES_TO"),
+            ("()", "RELATES_TO"),
+            ("", "RELATES_TO"),
+        ],
+    )
+    def test_relationship_type_is_cypher_identifier(self, relationship, expected):
+        """Free-text LLM relationships map to [A-Z][A-Z0-9_]* types."""
+        assert normalize_relationship_type(relationship) == expected
+
+    def test_content_metadata_serialized(self):
+        """Metadata is stored as a JSON string."""
+        assert make_batch().content_nodes[0]["metadata"] == '{"a": 1}'
+
+    def test_extend_merges_documents(self):
+        """extend() appends rows from another batch."""
+        batch = make_batch("doc-1")
+        batch.extend(make_batch("doc-2"))
+
+        assert len(batch) == 2
+        assert len(batch.relationships["EXTENDS"]) == 2
+        assert len(batch.concept_relationships["IS_TYPE_OF"]) == 2
+
+    def test_is_empty(self):
+        assert GraphWriteBatch().is_empty
+        assert not make_batch().is_empty
+
+
+class TestWriteGraphBatch:
+    """Tests for Neo4jClient.write_graph_batch()."""
+
+    @pytest.mark.asyncio
+    async def test_single_transaction_in_dependency_order(self, client_and_tx):
+        """All statements run in one write transaction, nodes before edges."""
+        client, tx, session = client_and_tx
+        batch = make_batch()
+        batch.replace_relationships_for.append("doc-1")
+        batch.link_content_to_note("papers/title.md")
+
+        counts = await client.write_graph_batch(batch)
+
+        session.execute_write.assert_called_once()
+        queries = [query for query, _ in tx.statements]
+        assert queries[:4] == [
+            BULK_DELETE_CONTENT_OUTGOING_RELATIONSHIPS,
+            BULK_MERGE_CONTENT_NODES,
+            BULK_MERGE_CONCEPT_NODES,
+            BULK_LINK_CONTENT_TO_CONCEPTS,
+        ]
+        # 1 concept type + 2 relationship types + note links
+        assert len(tx.statements) == 8
+        assert all("UNWIND" in query for query in queries)
+        assert counts == {
+            "deleted_relationships": 1,
+            "content_nodes": 1,
+            "concept_nodes": 1,
+            "concept_links": 1,
+            "concept_relationships": 1,
+            "relationships": 2,
+            "note_links": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_relationship_type_in_query(self, client_and_tx):
+        """Relationship templates are formatted with the sanitized type."""
+        client, tx, _ = client_and_tx
+
+        await client.write_graph_batch(make_batch())
+
+        queries = [query for query, _ in tx.statements]
+        assert any("[r:IS_TYPE_OF]" in q for q in queries)
+        assert any("[r:EXTENDS]" in q for q in queries)
+        assert any("[r:RELATES_TO]" in q for q in queries)
+
+    @pytest.mark.asyncio
+    async def test_free_text_relationship_sanitized(self, client_and_tx):
+        """Punctuation in an LLM relationship never reaches the Cypher."""
+        client, tx, _ = client_and_tx
+        batch = make_batch()
+        batch.link_concepts("Subset", "Set", "is part of (subset)")
+
+        await client.write_graph_batch(batch)
+
+        queries = [query for query, _ in tx.statements]
+        assert any("[r:IS_PART_OF_SUBSET]" in q for q in queries)
+        assert not any("(subset)" in q for q in queries)
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_database(self, client_and_tx):
+        client, _, session = client_and_tx
+
+        assert await client.write_graph_batch(GraphWriteBatch()) == {}
+        session.execute_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_mode_groups_documents(self, client_and_tx):
+        """write_graph_batches() merges documents into grouped transactions."""
+        client, tx, session = client_and_tx
+        batches = [make_batch(f"doc-{i}") for i in range(5)]
+
+        counts = await client.write_graph_batches(batches, documents_per_transaction=2)
+
+        # 3 transactions for 5 documents; one content statement per transaction
+        assert session.execute_write.call_count == 3
+        content_statements = [
+            params["rows"]
+            for query, params in tx.statements
+            if query == BULK_MERGE_CONTENT_NODES
+        ]
+        assert [len(rows) for rows in content_statements] == [2, 2, 1]
+        assert counts["content_nodes"] == 3
+
+
+class TestNoteLinkDiff:
+    """Tests for diff-based LINKS_TO writes."""
+
+    @pytest.mark.asyncio
+    async def test_sync_note_links_diffs_in_one_transaction(self, client_and_tx):
+        """Stale edges are deleted and targets merged; nothing is cleared."""
+        client, tx, session = client_and_tx
+
+        count = await client.sync_note_links("note-1", ["A", "B", "A"])
+
+        session.execute_write.assert_called_once()
+        assert [query for query, _ in tx.statements] == [
+            BULK_DELETE_STALE_NOTE_LINKS,
+            BULK_MERGE_NOTE_LINKS,
+        ]
+        rows = tx.statements[0][1]["rows"]
+        assert rows == [{"node_id": "note-1", "target_ids": ["A", "B"]}]
+        assert count == 2
+
+    def test_link_queries_are_diffs(self):
+        """Only edges to unlinked targets are deleted; merges don't rewrite."""
+        assert "NOT target.id IN row.target_ids" in BULK_DELETE_STALE_NOTE_LINKS
+        assert "ON CREATE SET r.synced_at" in BULK_MERGE_NOTE_LINKS
+
+    @pytest.mark.asyncio
+    async def test_write_note_batch(self, client_and_tx):
+        """Vault batches merge nodes, diff links and link content together."""
+        client, tx, session = client_and_tx
+        rows = [
+            {"node_id": "a", "file_path": "a.md", "target_ids": ["b"]},
+            {"node_id": "b", "file_path": "b.md", "target_ids": []},
+        ]
+
+        counts = await client.write_note_batch(rows)
+
+        session.execute_write.assert_called_once()
+        queries = [query for query, _ in tx.statements]
+        assert queries[:3] == [
+            BULK_MERGE_NOTE_NODES,
+            BULK_DELETE_STALE_NOTE_LINKS,
+            BULK_MERGE_NOTE_LINKS,
+        ]
+        # Notes without links still get stale edges removed
+        assert len(tx.statements[1][1]["rows"]) == 2
+        assert len(tx.statements[2][1]["rows"]) == 1
+        assert tx.statements[3][1]["file_paths"] == ["a.md", "b.md"]
+        assert set(counts) == {"notes", "stale_links", "links", "content_links"}
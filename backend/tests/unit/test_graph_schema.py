@@ -0,0 +1,132 @@
+"""
+Unit tests for the knowledge graph schema manager.
+
+Tests cover:
+- Pending migrations applied in order and the version recorded
+- Up-to-date databases run no schema statements
+- A failing statement leaves its migration unrecorded
+- Id lookups in queries.py are label-scoped (no unlabeled {id: ...} match)
+"""
+
+import re
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.knowledge_graph import queries
+from app.services.knowledge_graph.queries import GET_SCHEMA_VERSION, SET_SCHEMA_VERSION
+from app.services.knowledge_graph.schema_manager import (
+    MIGRATIONS,
+    SCHEMA_VERSION,
+    GraphSchemaManager,
+    SchemaMigration,
+)
+
+
+class FakeSession:
+    """Records statements; GET_SCHEMA_VERSION returns `version`."""
+
+    def __init__(self, version=None, fail_on: str = ""):
+        self.version = version
+        self.fail_on = fail_on
+        self.statements: list[tuple[str, dict]] = []
+
+    async def run(self, query, **params):
+        if self.fail_on and self.fail_on in query:
+            raise RuntimeError("schema statement failed")
+        self.statements.append((query, params))
+        result = MagicMock()
+        record = None if self.version is None else {"version": self.version}
+        result.single = AsyncMock(return_value=record)
+        result.consume = AsyncMock()
+        return result
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+
+def make_manager(session: FakeSession, migrations=MIGRATIONS) -> GraphSchemaManager:
+    driver = MagicMock()
+    driver.session.return_value = session
+    return GraphSchemaManager(driver, database="neo4j", migrations=migrations)
+
+
+class TestGraphSchemaManager:
+    """Tests for GraphSchemaManager.migrate()."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_database_applies_all(self):
+        """A never-migrated database gets every migration, in order."""
+        session = FakeSession()
+
+        applied = await make_manager(session).migrate()
+
+        assert applied == [m.version for m in MIGRATIONS]
+        queries_run = [query for query, _ in session.statements]
+        expected = [GET_SCHEMA_VERSION]
+        for migration in MIGRATIONS:
+            expected.extend(migration.statements)
+            expected.append(SET_SCHEMA_VERSION)
+        assert queries_run == expected
+        assert session.statements[-1][1]["version"] == SCHEMA_VERSION
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_runs_nothing(self):
+        """Only the version is read when the schema is current."""
+        session = FakeSession(version=SCHEMA_VERSION)
+
+        assert await make_manager(session).migrate() == []
+        assert [query for query, _ in session.statements] == [GET_SCHEMA_VERSION]
+
+    @pytest.mark.asyncio
+    async def test_applies_only_newer(self):
+        """Migrations at or below the recorded version are skipped."""
+        session = FakeSession(version=1)
+
+        applied = await make_manager(session).migrate()
+
+        assert applied == [m.version for m in MIGRATIONS if m.version > 1]
+        assert MIGRATIONS[0].statements[0] not in [q for q, _ in session.statements]
+
+    @pytest.mark.asyncio
+    async def test_failure_not_recorded(self):
+        """A failing statement stops the run before its version is set."""
+        migrations = (
+            SchemaMigration(1, "ok", ("CREATE INDEX a",)),
+            SchemaMigration(2, "broken", ("CREATE INDEX broken",)),
+        )
+        session = FakeSession(fail_on="broken")
+
+        with pytest.raises(RuntimeError):
+            await make_manager(session, migrations).migrate()
+
+        versions = [p["version"] for q, p in session.statements if q == SET_SCHEMA_VERSION]
+        assert versions == [1]
+
+    def test_versions_ascending(self):
+        """Migration versions are unique and increasing."""
+        versions = [m.version for m in MIGRATIONS]
+        assert versions == sorted(set(versions))
+
+
+class TestLabelScopedLookups:
+    """Id lookups must not match unlabeled nodes (AllNodesScan)."""
+
+    def test_no_unlabeled_id_match(self):
+        """No query matches a node by id without a label."""
+        # "(n {id: ...})"; variables are lowercase, "(DISTINCT {id: ...})" isn't a match
+        unlabeled = re.compile(r"\(\s*[a-z_]\w*\s*\{\{?\s*id\s*:")
+        sources = {
+            name: value
+            for name, value in vars(queries).items()
+            if name.isupper() and isinstance(value, str)
+        }
+        sources["get_centered_visualization_query"] = (
+            queries.get_centered_visualization_query(2)
+        )
+
+        offenders = [name for name, cypher in sources.items() if unlabeled.search(cypher)]
+        assert offenders == []
@@ -0,0 +1,265 @@
+"""
+Unit tests for graph visualization snapshots.
+
+Tests cover:
+- Label propagation clusters (connected groups share a cluster, 0 is largest)
+- Level-of-detail views: degree sizing, ranking, top/clusters selection
+- Duplicate node ids and edges collapsed
+- Snapshot versions stable for an unchanged graph, ETags per request
+- Rebuild requests debounced through the Redis marker, across task loops
+- Parsed views cached per version
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.enums.knowledge import GraphLevelOfDetail
+from app.services.knowledge_graph import snapshot
+from app.services.knowledge_graph.snapshot import (
+    REBUILD_SCHEDULED_KEY,
+    REBUILD_TASK_NAME,
+    assign_clusters,
+    clear_snapshot_views,
+    compute_snapshot,
+    get_snapshot_view,
+    request_snapshot_rebuild,
+    serialize_snapshot,
+    snapshot_etag,
+)
+
+FULL = GraphLevelOfDetail.FULL.value
+TOP = GraphLevelOfDetail.TOP.value
+CLUSTERS = GraphLevelOfDetail.CLUSTERS.value
+
+
+def node(node_id: str, node_type: str = "Concept") -> dict:
+    return {"id": node_id, "label": node_id.upper(), "type": node_type, "tags": []}
+
+
+def edge(source: str, target: str, edge_type: str = "RELATES_TO") -> dict:
+    return {"source": source, "target": target, "type": edge_type, "strength": 0.5}
+
+
+def two_triangles() -> tuple[list[dict], list[dict]]:
+    """Triangles a-b-c and x-y-z, bridged by c-x, plus isolated node q."""
+    nodes = [node(i) for i in ("a", "b", "c", "x", "y", "z", "q")]
+    edges = [
+        edge("a", "b"),
+        edge("b", "c"),
+        edge("c", "a"),
+        edge("x", "y"),
+        edge("y", "z"),
+        edge("z", "x"),
+        edge("c", "x"),
+    ]
+    return nodes, edges
+
+
+class TestAssignClusters:
+    """Tests for assign_clusters()."""
+
+    def test_separate_components(self):
+        """Disconnected groups never share a cluster."""
+        neighbors = {"a": {"b"}, "b": {"a"}, "x": {"y"}, "y": {"x"}}
+
+        clusters = assign_clusters(["a", "b", "x", "y"], neighbors)
+
+        assert clusters["a"] == clusters["b"]
+        assert clusters["x"] == clusters["y"]
+        assert clusters["a"] != clusters["x"]
+
+    def test_largest_cluster_is_zero(self):
+        """Clusters are numbered by size, largest first."""
+        neighbors = {
+            "a": {"b", "c"},
+            "b": {"a", "c"},
+            "c": {"a", "b"},
+            "x": {"y"},
+            "y": {"x"},
+        }
+
+        clusters = assign_clusters(["x", "y", "a", "b", "c"], neighbors)
+
+        assert clusters["a"] == 0
+        assert clusters["x"] == 1
+
+    def test_isolated_nodes_keep_own_cluster(self):
+        """Nodes without neighbours are singleton clusters."""
+        clusters = assign_clusters(["a", "b"], {})
+
+        assert sorted(clusters.values()) == [0, 1]
+
+
+class TestComputeSnapshot:
+    """Tests for compute_snapshot()."""
+
+    def test_views_and_degree(self):
+        """Nodes are sized by degree and ranked highest first."""
+        nodes, edges = two_triangles()
+
+        views = compute_snapshot(nodes, edges, top_nodes=2, max_clusters=10)
+
+        full = views[FULL]
+        sizes = {n["id"]: n["size"] for n in full["nodes"]}
+        assert sizes == {"a": 2, "b": 2, "c": 3, "x": 3, "y": 2, "z": 2, "q": 1}
+        assert [n["id"] for n in full["nodes"]][:2] == ["c", "x"]
+        assert len(full["edges"]) == 7
+        assert full["type_counts"] == {"Concept": 7}
+
+        top = views[TOP]
+        assert [n["id"] for n in top["nodes"]] == ["c", "x"]
+        assert [(e["source"], e["target"]) for e in top["edges"]] == [("c", "x")]
+
+    def test_cluster_view(self):
+        """Each cluster becomes one node; bridges become weighted edges."""
+        nodes, edges = two_triangles()
+
+        views = compute_snapshot(nodes, edges, top_nodes=2, max_clusters=10)
+
+        clusters = views[CLUSTERS]
+        assert sorted(n["size"] for n in clusters["nodes"]) == [1, 3, 3]
+        assert all(n["type"] == "Cluster" for n in clusters["nodes"])
+        assert len(clusters["edges"]) == 1
+        assert clusters["edges"][0]["label"] == "1"
+        assert clusters["edges"][0]["strength"] == 1.0
+
+        full_clusters = {n["id"]: n["cluster_id"] for n in views[FULL]["nodes"]}
+        assert full_clusters["a"] == full_clusters["b"] == full_clusters["c"]
+        assert full_clusters["a"] != full_clusters["x"]
+
+    def test_max_clusters(self):
+        """Only the largest clusters are kept, with edges between them."""
+        nodes, edges = two_triangles()
+
+        views = compute_snapshot(nodes, edges, top_nodes=2, max_clusters=1)
+
+        assert [n["size"] for n in views[CLUSTERS]["nodes"]] == [3]
+        assert views[CLUSTERS]["edges"] == []
+
+    def test_duplicates_collapsed(self):
+        """Nodes sharing an id and repeated edges appear once."""
+        nodes = [node("a", "Content"), node("a", "Note"), node("b")]
+        edges = [edge("a", "b"), edge("a", "b"), edge("a", "missing")]
+
+        views = compute_snapshot(nodes, edges, top_nodes=10, max_clusters=10)
+
+        assert [n["id"] for n in views[FULL]["nodes"]] == ["a", "b"]
+        assert len(views[FULL]["edges"]) == 1
+
+
+class TestVersioning:
+    """Tests for serialize_snapshot() versions and snapshot_etag()."""
+
+    def test_version_stable_for_same_graph(self):
+        """Row order does not change the version; graph changes do."""
+        nodes, edges = two_triangles()
+
+        version, payloads, counts = serialize_snapshot(nodes, edges, 2, 10)
+        same, _, _ = serialize_snapshot(list(reversed(nodes)), edges, 2, 10)
+        changed, _, _ = serialize_snapshot(nodes, edges[:-1], 2, 10)
+
+        assert version == same
+        assert version != changed
+        assert set(payloads) == {FULL, TOP, CLUSTERS}
+        assert json.loads(payloads[TOP])["nodes"][0]["id"] == "c"
+        assert counts == {"nodes": 7, "edges": 7, "clusters": 3}
+
+    def test_etag_per_request(self):
+        """ETags differ per view parameters but not per node type order."""
+        etag = snapshot_etag("v1", GraphLevelOfDetail.TOP, ["Content", "Note"], 100)
+
+        assert etag.startswith('W/"v1-')
+        assert etag == snapshot_etag(
+            "v1", GraphLevelOfDetail.TOP, ["Note", "Content"], 100
+        )
+        assert etag != snapshot_etag(
+            "v1", GraphLevelOfDetail.FULL, ["Content", "Note"], 100
+        )
+        assert etag != snapshot_etag("v1", GraphLevelOfDetail.TOP, ["Content"], 100)
+        assert etag != snapshot_etag("v2", GraphLevelOfDetail.TOP, ["Content", "Note"], 100)
+
+
+class TestRebuildRequests:
+    """Tests for request_snapshot_rebuild()."""
+
+    @pytest.fixture
+    def celery_app(self):
+        with patch("app.services.queue.celery_app") as app:
+            yield app
+
+    async def test_queues_once(self, mock_redis, celery_app):
+        """Only the first request in a burst queues the rebuild task."""
+        mock_redis.set = AsyncMock(side_effect=[True, None])
+        with patch.object(snapshot, "get_redis", AsyncMock(return_value=mock_redis)):
+            assert await request_snapshot_rebuild() is True
+            assert await request_snapshot_rebuild() is False
+
+        celery_app.send_task.assert_called_once()
+        assert celery_app.send_task.call_args.args == (REBUILD_TASK_NAME,)
+        assert mock_redis.set.call_args.args[0] == REBUILD_SCHEDULED_KEY
+        assert mock_redis.set.call_args.kwargs["nx"] is True
+
+    def test_queues_from_consecutive_task_loops(self, loop_bound_redis, celery_app):
+        """Each Celery task's fresh event loop gets working Redis connections."""
+        from app.db import redis as redis_db
+        from app.services.worker_runtime import run_async
+
+        async def rebuild_done():
+            r = await redis_db.get_redis()
+            await r.delete(REBUILD_SCHEDULED_KEY)
+
+        assert run_async(request_snapshot_rebuild()) is True
+        run_async(rebuild_done())
+        assert run_async(request_snapshot_rebuild()) is True
+
+        assert celery_app.send_task.call_count == 2
+        assert len(loop_bound_redis) == 3
+        assert all(pool.disconnected for pool in loop_bound_redis)
+
+    async def test_redis_error_ignored(self, celery_app):
+        """Redis failures don't propagate to the graph write."""
+        with patch.object(
+            snapshot, "get_redis", AsyncMock(side_effect=ConnectionError("down"))
+        ):
+            assert await request_snapshot_rebuild() is False
+
+        celery_app.send_task.assert_not_called()
+
+    async def test_disabled(self, mock_redis, celery_app):
+        """Nothing is queued with snapshots disabled."""
+        with (
+            patch.object(snapshot.settings, "GRAPH_SNAPSHOT_ENABLED", False),
+            patch.object(snapshot, "get_redis", AsyncMock(return_value=mock_redis)),
+        ):
+            assert await request_snapshot_rebuild() is False
+
+        mock_redis.set.assert_not_called()
+
+
+class TestSnapshotViews:
+    """Tests for get_snapshot_view()."""
+
+    @pytest.fixture(autouse=True)
+    def clear_views(self):
+        clear_snapshot_views()
+        yield
+        clear_snapshot_views()
+
+    async def test_parsed_once_per_version(self, mock_redis):
+        """A view is read from Redis once, then served from memory."""
+        mock_redis.get = AsyncMock(return_value='{"nodes": [], "edges": []}')
+        with patch.object(snapshot, "get_redis", AsyncMock(return_value=mock_redis)):
+            first = await get_snapshot_view("v1", GraphLevelOfDetail.TOP)
+            second = await get_snapshot_view("v1", GraphLevelOfDetail.TOP)
+            await get_snapshot_view("v2", GraphLevelOfDetail.TOP)
+
+        assert first is second
+        assert mock_redis.get.await_count == 2
+        assert ("v1", TOP) not in snapshot._views
+
+    async def test_expired_version(self, mock_redis):
+        """An expired version's view is None."""
+        with patch.object(snapshot, "get_redis", AsyncMock(return_value=mock_redis)):
+            assert await get_snapshot_view("old", GraphLevelOfDetail.FULL) is None
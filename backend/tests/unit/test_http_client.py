@@ -0,0 +1,179 @@
+"""
+Unit tests for the shared HTTP client.
+
+Tests cover:
+- One client per event loop, reused across sessions
+- Replaced and closed clients are closed on their own loop
+- Session default headers merged into each request
+- Per-host concurrency limits
+- ETag/Last-Modified revalidation against the on-disk cache
+"""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from app.services import http_client
+from app.services.http_client import (
+    HTTPSession,
+    SharedHTTPClient,
+    close_http_client,
+    fetch_text,
+    get_http_client,
+    reset_http_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def http_cache(tmp_path, monkeypatch):
+    """Point the response cache at a temp dir and start without a client."""
+    monkeypatch.setattr(http_client.settings, "HTTP_CACHE_ENABLED", True)
+    monkeypatch.setattr(http_client.settings, "HTTP_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(http_client, "_shared_client", None)
+    reset_http_cache()
+    yield
+    reset_http_cache()
+
+
+def use_transport(handler) -> SharedHTTPClient:
+    """Route the shared client through an in-process mock transport."""
+    shared = get_http_client()
+    shared.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return shared
+
+
+class TestSharedClient:
+    """Tests for get_http_client() and HTTPSession."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_loop(self):
+        """Sessions on the same loop share one client."""
+        assert get_http_client() is get_http_client()
+
+    @pytest.mark.asyncio
+    async def test_session_merges_headers(self):
+        """Session defaults and per-request headers are both sent."""
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(200, text="ok")
+
+        use_transport(handler)
+        session = HTTPSession(headers={"Authorization": "Bearer t"})
+
+        response = await session.get("https://api.example.com/x", headers={"X-A": "1"})
+
+        assert response.text == "ok"
+        assert seen["authorization"] == "Bearer t"
+        assert seen["x-a"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self, monkeypatch):
+        """No more than the per-host limit of requests run at once."""
+        monkeypatch.setattr(http_client.settings, "HTTP_MAX_CONNECTIONS_PER_HOST", 2)
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200)
+
+        use_transport(handler)
+        session = HTTPSession()
+
+        await asyncio.gather(
+            *(session.get(f"https://example.com/{i}") for i in range(6))
+        )
+
+        assert peak == 2
+
+
+    @pytest.mark.asyncio
+    async def test_client_of_other_loop_closed_when_replaced(self):
+        """A client replaced from another loop is closed on its own loop."""
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        try:
+
+            async def create():
+                return get_http_client()
+
+            old = asyncio.run_coroutine_threadsafe(create(), other).result(5)
+
+            assert get_http_client() is not old
+            for _ in range(100):
+                if old.client.is_closed:
+                    break
+                await asyncio.sleep(0.01)
+            assert old.client.is_closed
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(5)
+            other.close()
+
+    @pytest.mark.asyncio
+    async def test_close_http_client(self):
+        """close_http_client() closes and drops the running loop's client."""
+        shared = get_http_client()
+
+        await close_http_client()
+
+        assert shared.client.is_closed
+        assert http_client._shared_client is None
+
+
+class TestFetchText:
+    """Tests for conditional requests in fetch_text()."""
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_etag(self):
+        """A cached page is revalidated and reused on 304."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text="<html>v1</html>", headers={"ETag": '"v1"'})
+
+        use_transport(handler)
+
+        first = await fetch_text("https://example.com/article")
+        second = await fetch_text("https://example.com/article")
+
+        assert first == second == "<html>v1</html>"
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_no_validators_not_cached(self):
+        """Responses without ETag/Last-Modified are always refetched."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="fresh")
+
+        use_transport(handler)
+
+        await fetch_text("https://example.com/a")
+        await fetch_text("https://example.com/a")
+
+        assert all("If-None-Match" not in r.headers for r in requests)
+        assert all("If-Modified-Since" not in r.headers for r in requests)
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self):
+        """4xx/5xx responses raise HTTPStatusError."""
+        use_transport(lambda request: httpx.Response(404))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await fetch_text("https://example.com/missing")
@@ -0,0 +1,268 @@
+"""
+Unit tests for the LLM response cache.
+
+Tests cache keys, per-operation enablement, the disk backend's TTL/LRU
+eviction, Redis backend hits across Celery task loops, and LLMClient.complete()
+cache hits (zero-cost cached usage).
+"""
+
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.enums.pipeline import PipelineOperation
+from app.services.llm.cache import (
+    DiskCacheBackend,
+    LLMResponseCache,
+    RedisCacheBackend,
+    make_cache_key,
+)
+from app.services.llm.client import LLMClient
+
+MESSAGES = [{"role": "user", "content": "Summarize this"}]
+
+
+class InMemoryBackend:
+    """Dict-backed cache backend."""
+
+    def __init__(self):
+        self.data: dict[str, dict] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value):
+        self.data[key] = value
+
+
+def _response(content: str, cost: float = 0.01) -> MagicMock:
+    """Build a LiteLLM-like response."""
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    response.usage = MagicMock(
+        prompt_tokens=100, completion_tokens=20, total_tokens=120
+    )
+    response._hidden_params = {"response_cost": cost}
+    return response
+
+
+# =============================================================================
+# Keys and Enablement
+# =============================================================================
+
+
+class TestCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_deterministic(self):
+        """Identical requests map to the same key."""
+        params = {"temperature": 0.3, "json_mode": False}
+        assert make_cache_key("m", MESSAGES, params) == make_cache_key(
+            "m", list(MESSAGES), dict(reversed(params.items()))
+        )
+
+    @pytest.mark.parametrize(
+        "model,messages,params",
+        [
+            ("other", MESSAGES, {"temperature": 0.3}),
+            ("m", [{"role": "user", "content": "Different"}], {"temperature": 0.3}),
+            ("m", MESSAGES, {"temperature": 0.7}),
+        ],
+    )
+    def test_sensitive_to_request(self, model, messages, params):
+        """Model, messages and params all change the key."""
+        assert make_cache_key(model, messages, params) != make_cache_key(
+            "m", MESSAGES, {"temperature": 0.3}
+        )
+
+
+class TestEnablement:
+    """Tests for LLMResponseCache.enabled_for."""
+
+    def test_disabled_by_default_switch(self):
+        """Nothing is cached while the global switch is off."""
+        cache = LLMResponseCache(InMemoryBackend(), enabled=False)
+        assert not cache.enabled_for(PipelineOperation.SUMMARIZATION)
+
+    def test_all_operations_when_unrestricted(self):
+        """An empty allowlist caches every operation."""
+        cache = LLMResponseCache(InMemoryBackend(), enabled=True)
+        assert cache.enabled_for(PipelineOperation.SUMMARIZATION)
+        assert cache.enabled_for("anything")
+
+    def test_operation_allowlist(self):
+        """Only listed operations are cached (case-insensitive)."""
+        cache = LLMResponseCache(
+            InMemoryBackend(), enabled=True, operations=["summarization"]
+        )
+        assert cache.enabled_for(PipelineOperation.SUMMARIZATION)
+        assert not cache.enabled_for(PipelineOperation.CONCEPT_EXTRACTION)
+
+    def test_override_wins(self):
+        """The per-call override beats the settings."""
+        cache = LLMResponseCache(InMemoryBackend(), enabled=False)
+        assert cache.enabled_for(PipelineOperation.SUMMARIZATION, override=True)
+        cache.enabled = True
+        assert not cache.enabled_for(PipelineOperation.SUMMARIZATION, override=False)
+
+
+# =============================================================================
+# Disk Backend
+# =============================================================================
+
+
+class TestDiskBackend:
+    """Tests for DiskCacheBackend."""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, tmp_path):
+        """Stored entries are read back; unknown keys miss."""
+        backend = DiskCacheBackend(tmp_path, ttl_seconds=60, max_entries=10)
+        await backend.set("ab" * 32, {"content": "hello"})
+
+        assert await backend.get("ab" * 32) == {"content": "hello"}
+        assert await backend.get("cd" * 32) is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_a_miss(self, tmp_path):
+        """Entries older than the TTL are deleted on read."""
+        backend = DiskCacheBackend(tmp_path, ttl_seconds=60, max_entries=10)
+        key = "ab" * 32
+        await backend.set(key, {"content": "stale"})
+        old = time.time() - 120
+        os.utime(backend._path(key), (old, old))
+
+        assert await backend.get(key) is None
+        assert not backend._path(key).exists()
+
+    def test_lru_eviction(self, tmp_path):
+        """Beyond max_entries, the least recently used entries are removed."""
+        backend = DiskCacheBackend(tmp_path, ttl_seconds=3600, max_entries=100)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for age, key in zip((30, 20, 10), keys):
+            backend._write(key, {"content": key})
+            stamp = time.time() - age
+            os.utime(backend._path(key), (stamp, stamp))
+
+        # Reading the oldest entry makes it the most recently used
+        backend._read(keys[0])
+        backend.max_entries = 2
+
+        assert backend.evict() == 1
+
+        assert backend._path(keys[0]).exists()
+        assert not backend._path(keys[1]).exists()
+        assert backend._path(keys[2]).exists()
+
+
+class TestRedisBackend:
+    """Tests for RedisCacheBackend under run_async()."""
+
+    def test_hits_across_task_loops(self, loop_bound_redis):
+        """A response cached by one task is a hit in the next task's loop."""
+        from app.services.worker_runtime import run_async
+
+        cache = LLMResponseCache(RedisCacheBackend(ttl_seconds=60))
+
+        run_async(cache.set("k", {"content": "cached"}))
+
+        assert run_async(cache.get("k")) == {"content": "cached"}
+        assert len(loop_bound_redis) == 2
+
+
+# =============================================================================
+# LLMClient Integration
+# =============================================================================
+
+
+class TestCompleteCaching:
+    """Tests for LLMClient.complete() with the response cache."""
+
+    @pytest.fixture
+    def cache(self):
+        """Enabled in-memory cache installed as the client's response cache."""
+        cache = LLMResponseCache(InMemoryBackend(), enabled=True)
+        with patch("app.services.llm.client.get_response_cache", return_value=cache):
+            yield cache
+
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self, cache):
+        """Identical requests hit the provider once; the hit is zero-cost."""
+        client = LLMClient()
+        with patch(
+            "app.services.llm.client.acompletion",
+            AsyncMock(return_value=_response("A summary")),
+        ) as m_completion:
+            first, first_usage = await client.complete(
+                PipelineOperation.SUMMARIZATION, MESSAGES, content_id="c1"
+            )
+            second, second_usage = await client.complete(
+                PipelineOperation.SUMMARIZATION, MESSAGES, content_id="c1"
+            )
+
+        assert m_completion.await_count == 1
+        assert first == second == "A summary"
+        assert first_usage.cost_usd == 0.01 and not first_usage.cached
+        assert second_usage.cached
+        assert second_usage.cost_usd == 0.0
+        assert second_usage.total_tokens == 0
+        assert second_usage.content_id == "c1"
+        assert second_usage.operation == PipelineOperation.SUMMARIZATION
+
+    @pytest.mark.asyncio
+    async def test_json_mode_hit_is_parsed(self, cache):
+        """Cached raw JSON is parsed again on a json_mode hit."""
+        client = LLMClient()
+        with patch(
+            "app.services.llm.client.acompletion",
+            AsyncMock(return_value=_response('{"tags": ["ml"]}')),
+        ):
+            await client.complete(
+                PipelineOperation.TAG_ASSIGNMENT, MESSAGES, json_mode=True
+            )
+            result, usage = await client.complete(
+                PipelineOperation.TAG_ASSIGNMENT, MESSAGES, json_mode=True
+            )
+
+        assert result == {"tags": ["ml"]}
+        assert usage.cached
+
+    @pytest.mark.asyncio
+    async def test_per_call_opt_out(self, cache):
+        """cache=False bypasses lookups and writes."""
+        client = LLMClient()
+        with patch(
+            "app.services.llm.client.acompletion",
+            AsyncMock(return_value=_response("A summary")),
+        ) as m_completion:
+            for _ in range(2):
+                await client.complete(
+                    PipelineOperation.SUMMARIZATION, MESSAGES, cache=False
+                )
+
+        assert m_completion.await_count == 2
+        assert cache.backend.data == {}
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_falls_through(self):
+        """A broken backend never fails the completion."""
+        backend = MagicMock()
+        backend.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        backend.set = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache = LLMResponseCache(backend, enabled=True)
+
+        client = LLMClient()
+        with patch(
+            "app.services.llm.client.get_response_cache", return_value=cache
+        ), patch(
+            "app.services.llm.client.acompletion",
+            AsyncMock(return_value=_response("A summary")),
+        ):
+            result, usage = await client.complete(
+                PipelineOperation.SUMMARIZATION, MESSAGES
+            )
+
+        assert result == "A summary"
+        assert not usage.cached
@@ -0,0 +1,107 @@
+"""
+Unit tests for LLMClient.stream().
+
+Tests that text deltas are yielded as chunks arrive and that usage is
+assembled from the collected chunks once the stream is exhausted.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.enums.pipeline import PipelineOperation
+from app.services.llm.client import LLMClient
+
+MESSAGES = [{"role": "user", "content": "Explain attention"}]
+
+
+def _chunk(content):
+    """Build a LiteLLM-like stream chunk."""
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = content
+    return chunk
+
+
+async def _chunks(*contents, error=None):
+    for content in contents:
+        yield _chunk(content)
+    if error:
+        raise error
+
+
+def _built_response(cost=0.002):
+    """Build the response stream_chunk_builder would return."""
+    response = MagicMock()
+    response.usage.prompt_tokens = 12
+    response.usage.completion_tokens = 3
+    response.usage.total_tokens = 15
+    response._hidden_params = {"response_cost": cost}
+    return response
+
+
+class TestLLMStream:
+    """Tests for streamed completions."""
+
+    @pytest.mark.asyncio
+    async def test_yields_deltas_then_sets_usage(self):
+        """Deltas are yielded in order; text and usage are set at the end."""
+        client = LLMClient()
+        stream = client.stream(
+            PipelineOperation.CONTENT_ANALYSIS, MESSAGES, model="openai/gpt-4o"
+        )
+        with patch(
+            "app.services.llm.client.acompletion",
+            AsyncMock(return_value=_chunks("Atten", None, "tion", "!")),
+        ) as m_completion, patch(
+            "app.services.llm.client.litellm.stream_chunk_builder",
+            return_value=_built_response(),
+        ):
+            assert stream.usage is None  # nothing is sent before iteration
+            tokens = [token async for token in stream]
+
+        assert tokens == ["Atten", "tion", "!"]
+        assert stream.text == "Attention!"
+        assert m_completion.call_args.kwargs["stream"] is True
+        assert stream.usage.total_tokens == 15
+        assert stream.usage.cost_usd == 0.002
+        assert stream.usage.operation == PipelineOperation.CONTENT_ANALYSIS
+
+    @pytest.mark.asyncio
+    async def test_cost_computed_when_missing(self):
+        """Cost falls back to litellm.completion_cost on the rebuilt response."""
+        client = LLMClient()
+        stream = client.stream(
+            PipelineOperation.CONTENT_ANALYSIS, MESSAGES, model="openai/gpt-4o"
+        )
+        built = _built_response(cost=None)
+        with patch(
+            "app.services.llm.client.acompletion",
+            AsyncMock(return_value=_chunks("Hi")),
+        ), patch(
+            "app.services.llm.client.litellm.stream_chunk_builder",
+            return_value=built,
+        ), patch(
+            "app.services.llm.client.litellm.completion_cost", return_value=0.0005
+        ):
+            _ = [token async for token in stream]
+
+        assert stream.usage.cost_usd == 0.0005
+
+    @pytest.mark.asyncio
+    async def test_error_midstream_is_raised(self):
+        """Provider errors propagate after the tokens already yielded."""
+        client = LLMClient()
+        stream = client.stream(
+            PipelineOperation.CONTENT_ANALYSIS, MESSAGES, model="openai/gpt-4o"
+        )
+        tokens = []
+        with patch(
+            "app.services.llm.client.acompletion",
+            AsyncMock(return_value=_chunks("Par", error=RuntimeError("reset"))),
+        ), pytest.raises(RuntimeError, match="reset"):
+            async for token in stream:
+                tokens.append(token)
+
+        assert tokens == ["Par"]
+        assert stream.usage is None
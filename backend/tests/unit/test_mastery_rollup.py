@@ -0,0 +1,249 @@
+"""
+Unit tests for MasteryRollupService.
+
+Tests incremental rollup maintenance:
+- Per-card contributions to rollup counters
+- Delta upserts for topic rows and the global row
+- Exercise attempt completion/mastery detection
+- Card and exercise deletions
+- Reconcile serialized by an advisory lock
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.config import settings
+from app.db.models_learning import Exercise, ExerciseAttempt, SpacedRepCard
+from app.enums.learning import CardState
+from app.services.learning.mastery_rollup import (
+    MasteryRollupService,
+    card_contribution,
+)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def mock_db():
+    """Create a mock session whose UPDATE finds the global row."""
+    mock = MagicMock()
+    result = MagicMock()
+    result.rowcount = 1
+    result.one.return_value = (0, None)
+    mock.execute = AsyncMock(return_value=result)
+    return mock
+
+
+class TestCardContribution:
+    """Tests for card_contribution()."""
+
+    def test_new_card(self):
+        """A new card counts as new with no reviews."""
+        card = SpacedRepCard(state=CardState.NEW.value, stability=0.0, tags=["ml"])
+
+        contribution = card_contribution(card)
+
+        assert contribution["card_count"] == 1
+        assert contribution["new_cards"] == 1
+        assert contribution["learning_cards"] == 0
+        assert contribution["mastered_cards"] == 0
+        assert contribution["total_reviews"] == 0
+
+    @pytest.mark.parametrize(
+        "stability,learning,mastered",
+        [
+            (5.0, 1, 0),
+            (float(settings.MASTERY_MASTERED_STABILITY_DAYS), 0, 1),
+            (None, 0, 0),
+        ],
+        ids=["learning", "mastered", "null_stability"],
+    )
+    def test_review_card(self, stability, learning, mastered):
+        """Review cards are learning or mastered by stability."""
+        card = SpacedRepCard(
+            state=CardState.REVIEW.value,
+            stability=stability,
+            total_reviews=4,
+            correct_reviews=3,
+        )
+
+        contribution = card_contribution(card)
+
+        assert contribution["learning_cards"] == learning
+        assert contribution["mastered_cards"] == mastered
+        assert contribution["review_cards"] == 1
+        assert contribution["review_stability_sum"] == (stability or 0.0)
+        assert contribution["correct_reviews"] == 3
+
+
+class TestApplyCardChange:
+    """Tests for incremental card updates."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_topic_rows_with_deltas(self, mock_db):
+        """A review updates the global row, then upserts each topic row."""
+        service = MasteryRollupService(mock_db)
+        before = {"total_reviews": 3, "correct_reviews": 2, "learning_cards": 1}
+        after = {"total_reviews": 4, "correct_reviews": 3, "learning_cards": 1}
+
+        await service.apply_card_change(
+            ["ml", "ml", "python"],
+            before,
+            after,
+            review_seconds=12,
+            reviewed_at=datetime.now(timezone.utc),
+        )
+
+        assert mock_db.execute.await_count == 2
+        global_sql = _sql(mock_db.execute.call_args_list[0].args[0])
+        assert global_sql.startswith("UPDATE mastery_rollups")
+        assert "learning_cards" not in global_sql  # unchanged counters skipped
+
+        upsert = mock_db.execute.call_args_list[1].args[0]
+        upsert_sql = _sql(upsert)
+        assert "ON CONFLICT (topic_path) DO UPDATE" in upsert_sql
+        assert "greatest(mastery_rollups.last_reviewed" in upsert_sql
+        params = upsert.compile(dialect=postgresql.dialect()).params
+        assert {v for k, v in params.items() if k.startswith("topic_path")} == {
+            "ml",
+            "python",
+        }
+
+    @pytest.mark.asyncio
+    async def test_skipped_before_first_reconcile(self, mock_db):
+        """Without a global row nothing beyond the global UPDATE is written."""
+        mock_db.execute.return_value.rowcount = 0
+        service = MasteryRollupService(mock_db)
+
+        await service.apply_card_change(["ml"], None, {"card_count": 1})
+
+        mock_db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_change_writes_nothing(self, mock_db):
+        """A change with all-zero deltas issues no statements."""
+        service = MasteryRollupService(mock_db)
+        contribution = {"card_count": 1, "new_cards": 1}
+
+        await service.apply_card_change(["ml"], contribution, contribution)
+
+        mock_db.execute.assert_not_called()
+
+
+class TestApplyExerciseAttempt:
+    """Tests for incremental exercise attempt updates."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "prior,score,completed,mastered",
+        [
+            ((0, None), 0.95, 1, 1),
+            ((2, 0.5), 0.95, 0, 1),
+            ((2, 0.95), 0.99, 0, 0),
+            ((0, None), 0.2, 1, 0),
+        ],
+        ids=["first_mastering", "first_mastery", "already_mastered", "first_low"],
+    )
+    async def test_completion_and_mastery(
+        self, mock_db, prior, score, completed, mastered
+    ):
+        """Completed/mastered only count the first qualifying attempt."""
+        mock_db.execute.return_value.one.return_value = prior
+        service = MasteryRollupService(mock_db)
+        exercise = Exercise(id=7, topic="ml")
+        attempt = ExerciseAttempt(id=42, exercise_id=7, score=score, is_correct=True)
+
+        await service.apply_exercise_attempt(exercise, attempt)
+
+        # Zero deltas are left out of the UPDATE
+        global_sql = _sql(mock_db.execute.call_args_list[1].args[0])
+        assert ("exercises_completed=" in global_sql) == bool(completed)
+        assert ("exercises_mastered=" in global_sql) == bool(mastered)
+
+
+class TestApplyDeleted:
+    """Tests for bulk card/exercise deletions."""
+
+    @pytest.mark.asyncio
+    async def test_cards_deleted_summed_per_tag_set(self, mock_db):
+        """Deleted cards subtract their contributions, one change per tag set."""
+        service = MasteryRollupService(mock_db)
+        service.apply_card_change = AsyncMock()
+        cards = [
+            SpacedRepCard(state=CardState.NEW.value, stability=0.0, tags=["ml"]),
+            SpacedRepCard(
+                state=CardState.REVIEW.value,
+                stability=float(settings.MASTERY_MASTERED_STABILITY_DAYS),
+                total_reviews=5,
+                correct_reviews=4,
+                tags=["ml"],
+            ),
+            SpacedRepCard(state=CardState.NEW.value, stability=0.0, tags=["python"]),
+        ]
+
+        await service.apply_cards_deleted(cards)
+
+        calls = {
+            call.args[0]: call.args[1:]
+            for call in service.apply_card_change.call_args_list
+        }
+        assert set(calls) == {("ml",), ("python",)}
+        before, after = calls[("ml",)]
+        assert after is None
+        assert before["card_count"] == 2
+        assert before["mastered_cards"] == 1
+        assert before["total_reviews"] == 5
+
+    @pytest.mark.asyncio
+    async def test_exercises_deleted_remove_attempts(self, mock_db):
+        """Deleted exercises subtract themselves and their attempts."""
+        mock_db.execute.return_value.all.return_value = [(7, 2, 1, 1.5, 0.95)]
+        service = MasteryRollupService(mock_db)
+        service._apply = AsyncMock()
+
+        await service.apply_exercises_deleted(
+            [Exercise(id=7, topic="ml"), Exercise(id=8, topic="ml")]
+        )
+
+        service._apply.assert_awaited_once()
+        topics, deltas = service._apply.call_args.args
+        assert topics == ["ml"]
+        assert deltas == {
+            "exercise_count": -2,
+            "exercise_attempts": -2,
+            "exercise_correct": -1,
+            "exercise_score_sum": -1.5,
+            "exercises_completed": -1,
+            "exercises_mastered": -1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_no_exercises_no_queries(self, mock_db):
+        """An empty delete issues no statements."""
+        await MasteryRollupService(mock_db).apply_exercises_deleted([])
+
+        mock_db.execute.assert_not_called()
+
+
+class TestReconcile:
+    """Tests for reconcile()."""
+
+    @pytest.mark.asyncio
+    async def test_serialized_by_advisory_lock(self, mock_db):
+        """The lock is taken before anything is read, deleted or inserted."""
+        mock_db.execute.return_value.scalar.return_value = 0
+        mock_db.commit = AsyncMock()
+
+        rows = await MasteryRollupService(mock_db).reconcile()
+
+        statements = [_sql(call.args[0]) for call in mock_db.execute.call_args_list]
+        assert "pg_advisory_xact_lock" in statements[0]
+        assert not any("pg_advisory" in sql for sql in statements[1:])
+        assert statements[-2].startswith("DELETE FROM mastery_rollups")
+        assert rows == 1
+        mock_db.commit.assert_awaited_once()
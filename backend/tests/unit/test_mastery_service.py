@@ -9,16 +9,22 @@ Tests the mastery tracking and analytics service including:
 - Practice history
 """
 
+import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.config import settings
 from app.enums.learning import MasteryTrend, ExerciseType, CardState
+from app.db.models_learning import MasteryRollup
 from app.models.learning import MasteryState, LearningCurveDataPoint
+from app.services.learning.mastery_rollup import GLOBAL_ROLLUP_TOPIC
 from app.services.learning.mastery_service import (
+    CARD_FRAME_COLUMNS,
     MasteryService,
     _calculate_trend,
 )
@@ -266,7 +272,7 @@ class TestGetWeakSpots:
         ) as mock_topics:
             mock_topics.return_value = [s.topic_path for s in weak_spot_states]
             with patch.object(
-                service, "_calculate_mastery_batch", new_callable=AsyncMock
+                service, "_calculate_mastery_from_rollups", new_callable=AsyncMock
             ) as mock_batch:
                 mock_batch.return_value = weak_spot_states
 
@@ -302,7 +308,7 @@ class TestGetWeakSpots:
         ) as mock_topics:
             mock_topics.return_value = [s.topic_path for s in test_states]
             with patch.object(
-                service, "_calculate_mastery_batch", new_callable=AsyncMock
+                service, "_calculate_mastery_from_rollups", new_callable=AsyncMock
             ) as mock_batch:
                 mock_batch.return_value = test_states
                 result = await service.get_weak_spots(limit=10)
@@ -329,7 +335,7 @@ class TestGetWeakSpots:
         ) as mock_topics:
             mock_topics.return_value = [s.topic_path for s in test_states]
             with patch.object(
-                service, "_calculate_mastery_batch", new_callable=AsyncMock
+                service, "_calculate_mastery_from_rollups", new_callable=AsyncMock
             ) as mock_batch:
                 mock_batch.return_value = test_states
                 result = await service.get_weak_spots(limit=limit)
@@ -346,55 +352,60 @@ class TestGetOverview:
     """Tests for get_overview method."""
 
     @pytest.fixture
-    def mock_db_with_counts(self):
-        """Create mock db that returns card counts."""
-        mock = MagicMock()
-        counts = iter([100, 30, 50, 20])  # total, mastered, learning, new
+    def global_rollup(self):
+        """Create the global rollup row."""
+        return MasteryRollup(
+            topic_path=GLOBAL_ROLLUP_TOPIC,
+            card_count=100,
+            mastered_cards=30,
+            learning_cards=50,
+            new_cards=20,
+            total_reviews=400,
+            review_time_seconds=1800,
+            exercise_count=8,
+            exercises_completed=5,
+            exercises_mastered=2,
+            exercise_attempts=10,
+            exercise_score_sum=7.0,
+        )
 
-        def execute_side_effect(query):
-            result = MagicMock()
-            result.scalar.return_value = next(counts, 0)
-            return result
+    @pytest.fixture
+    def overview_service(self, global_rollup):
+        """Create a MasteryService reading rollups; practice sessions total 60 minutes."""
+        mock_db = MagicMock()
+        result = MagicMock()
+        result.scalar.return_value = 60
+        mock_db.execute = AsyncMock(return_value=result)
+        service = MasteryService(mock_db)
+        service._get_all_topics = AsyncMock(return_value=[])
+        service._load_rollups = AsyncMock(
+            return_value={GLOBAL_ROLLUP_TOPIC: global_rollup}
+        )
+        service._calculate_streak = AsyncMock(return_value=5)
+        return service
 
-        mock.execute = AsyncMock(side_effect=execute_side_effect)
-        return mock
+    @pytest.mark.asyncio
+    async def test_aggregates_card_counts(self, overview_service):
+        """Card and exercise totals come from the global rollup."""
+        result = await overview_service.get_overview()
+
+        assert result.spaced_rep_cards_total == 100
+        assert result.spaced_rep_cards_mastered == 30
+        assert result.spaced_rep_cards_learning == 50
+        assert result.spaced_rep_cards_new == 20
+        assert result.spaced_rep_reviews_total == 400
+        assert result.exercises_total == 8
+        assert result.exercises_completed == 5
+        assert result.exercises_mastered == 2
+        assert result.exercises_avg_score == pytest.approx(0.7)
+        assert result.streak_days == 5
 
     @pytest.mark.asyncio
-    async def test_aggregates_card_counts(self, mock_db_with_counts):
-        """Test that card counts are aggregated correctly."""
-        service = MasteryService(mock_db_with_counts)
+    async def test_only_practice_session_time_is_queried(self, overview_service):
+        """Everything except practice session time is read from rollups."""
+        await overview_service.get_overview()
 
-        with patch.object(
-            service, "_get_all_topics", new_callable=AsyncMock
-        ) as mock_topics:
-            mock_topics.return_value = ["topic1", "topic2"]
-            with patch.object(
-                service, "_calculate_mastery_batch", new_callable=AsyncMock
-            ) as mock_batch:
-                mock_batch.return_value = [
-                    MasteryState(
-                        topic_path="topic1", mastery_score=0.7, practice_count=10
-                    ),
-                    MasteryState(
-                        topic_path="topic2", mastery_score=0.5, practice_count=5
-                    ),
-                ]
-                with patch.object(
-                    service, "_enhance_with_exercise_data", new_callable=AsyncMock
-                ) as mock_enhance:
-                    mock_enhance.return_value = mock_batch.return_value
-                    with patch.object(
-                        service, "_calculate_streak", new_callable=AsyncMock
-                    ) as mock_streak:
-                        mock_streak.return_value = 5
-                        result = await service.get_overview()
-
-                        # Use current attribute names (spaced_rep_cards_*)
-                        assert result.spaced_rep_cards_total == 100
-                        assert result.spaced_rep_cards_mastered == 30
-                        assert result.spaced_rep_cards_learning == 50
-                        assert result.spaced_rep_cards_new == 20
-                        assert result.streak_days == 5
+        overview_service.db.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -408,81 +419,106 @@ class TestGetOverview:
         ids=["basic", "same", "extremes", "three_topics"],
     )
     async def test_calculates_overall_mastery(
-        self, mock_db_with_counts, scores, expected_avg
+        self, overview_service, scores, expected_avg
     ):
         """Test overall mastery is average of topic scores."""
-        service = MasteryService(mock_db_with_counts)
         topics = [f"topic{i}" for i in range(len(scores))]
+        overview_service._get_all_topics.return_value = topics
         states = [
             MasteryState(topic_path=t, mastery_score=s, practice_count=10)
             for t, s in zip(topics, scores)
         ]
 
         with patch.object(
-            service, "_get_all_topics", new_callable=AsyncMock
-        ) as mock_topics:
-            mock_topics.return_value = topics
-            with patch.object(
-                service, "_calculate_mastery_batch", new_callable=AsyncMock
-            ) as mock_batch:
-                mock_batch.return_value = states
-                with patch.object(
-                    service, "_calculate_streak", new_callable=AsyncMock
-                ) as mock_streak:
-                    mock_streak.return_value = 0
-                    result = await service.get_overview()
+            overview_service,
+            "_calculate_mastery_from_rollups",
+            new_callable=AsyncMock,
+        ) as mock_states:
+            mock_states.return_value = states
+            result = await overview_service.get_overview()
 
-                    assert abs(result.overall_mastery - expected_avg) < 0.01
+        assert abs(result.overall_mastery - expected_avg) < 0.01
 
     @pytest.mark.asyncio
-    async def test_includes_card_review_time_in_total(self):
-        """Test that card review time from CardReviewHistory is included in total practice time."""
-        mock_db = MagicMock()
+    async def test_includes_card_review_time_in_total(self, overview_service):
+        """Test that rolled-up card review time is included in total practice time."""
+        result = await overview_service.get_overview()
 
-        # Mock returns for different queries (in order they're called):
-        # 1. total spaced cards: 10
-        # 2. mastered cards: 5
-        # 3. learning cards: 3
-        # 4. new cards: 2
-        # 5. total reviews: 20
-        # 6. exercises total: 0
-        # 7. exercises completed: 0
-        # 8. exercises mastered: 0
-        # 9. exercises attempts: 0
-        # 10. exercises avg score: 0
-        # 11. practice session minutes: 60 (1 hour)
-        # 12. card review time seconds: 1800 (30 minutes)
-        query_results = iter([10, 5, 3, 2, 20, 0, 0, 0, 0, 0.0, 60, 1800])
+        # 60 minutes from sessions + 30 minutes from card reviews = 1.5 hours
+        assert result.total_practice_time_hours == 1.5
 
-        def execute_side_effect(query):
-            result = MagicMock()
-            result.scalar.return_value = next(query_results, 0)
-            return result
 
-        mock_db.execute = AsyncMock(side_effect=execute_side_effect)
-        service = MasteryService(mock_db)
+class TestMasteryFromRollups:
+    """Tests for rollup-based mastery calculation."""
 
-        with patch.object(
-            service, "_get_all_topics", new_callable=AsyncMock
-        ) as mock_topics:
-            mock_topics.return_value = []
-            with patch.object(
-                service, "_calculate_mastery_batch", new_callable=AsyncMock
-            ) as mock_batch:
-                mock_batch.return_value = []
-                with patch.object(
-                    service, "_enhance_with_exercise_data", new_callable=AsyncMock
-                ) as mock_enhance:
-                    mock_enhance.return_value = []
-                    with patch.object(
-                        service, "_calculate_streak", new_callable=AsyncMock
-                    ) as mock_streak:
-                        mock_streak.return_value = 0
-                        result = await service.get_overview()
+    @pytest.fixture
+    def rollups(self):
+        """Create global and topic rollups."""
+        return {
+            GLOBAL_ROLLUP_TOPIC: MasteryRollup(topic_path=GLOBAL_ROLLUP_TOPIC),
+            "ml": MasteryRollup(
+                topic_path="ml",
+                card_count=2,
+                review_cards=2,
+                review_stability_sum=35.0,
+                total_reviews=25,
+                correct_reviews=22,
+                last_reviewed=datetime.now(timezone.utc) - timedelta(days=1),
+                exercise_count=3,
+                exercise_attempts=4,
+                exercise_correct=3,
+                exercise_score_sum=3.6,
+            ),
+        }
 
-                        # Total time should include both practice sessions and card reviews
-                        # 60 minutes from sessions + 30 minutes from card reviews = 90 minutes = 1.5 hours
-                        assert result.total_practice_time_hours == 1.5
+    @pytest.mark.asyncio
+    async def test_matches_dataframe_scoring(self, service, rollups, sample_cards_df):
+        """Rollup scoring agrees with the card-scan computation."""
+        service._get_recent_snapshots_batch = AsyncMock(return_value={})
+
+        states = await service._calculate_mastery_from_rollups(["ml"], rollups)
+        expected = service._compute_mastery_dataframe(sample_cards_df, ["ml"])
+
+        assert states[0].mastery_score == pytest.approx(
+            expected.loc["ml", "mastery_score"]
+        )
+        assert states[0].practice_count == 25
+        assert states[0].success_rate == pytest.approx(22 / 25)
+        assert states[0].days_since_review == 1
+
+    @pytest.mark.asyncio
+    async def test_topic_without_rollup_is_empty(self, service, rollups):
+        """Topics without a rollup row have zero mastery."""
+        service._get_recent_snapshots_batch = AsyncMock(return_value={})
+
+        states = await service._calculate_mastery_from_rollups(["unknown"], rollups)
+
+        assert states[0].mastery_score == 0.0
+        assert states[0].practice_count == 0
+
+    @pytest.mark.asyncio
+    async def test_load_rollups_reconciles_when_missing(self, service, rollups):
+        """The first read builds the rollups when the global row is missing."""
+        service._rollups = MagicMock()
+        service._rollups.get_rollups = AsyncMock(side_effect=[{}, rollups])
+        service._rollups.reconcile = AsyncMock(return_value=2)
+
+        result = await service._load_rollups(["ml"])
+
+        service._rollups.reconcile.assert_awaited_once()
+        assert result is rollups
+
+    def test_merge_exercise_rollup(self, service, rollups):
+        """Exercise attempts raise combined mastery to the exercise average."""
+        state = MasteryState(topic_path="ml", mastery_score=0.5, practice_count=25)
+
+        merged = service._merge_exercise_rollup(state, rollups["ml"])
+
+        assert merged.exercise_mastery_score == pytest.approx(0.9)
+        assert merged.mastery_score == pytest.approx(0.9)
+        assert merged.card_mastery_score == 0.5
+        assert merged.practice_count == 29
+        assert merged.exercise_count == 3
 
 
 # ============================================================================
@@ -497,7 +533,7 @@ class TestFetchCardsDataframe:
     async def test_returns_empty_dataframe_when_no_cards(self, mock_db, service):
         """Test empty DataFrame is returned when no cards exist."""
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.all.return_value = []
         mock_db.execute = AsyncMock(return_value=mock_result)
 
         result = await service._fetch_cards_dataframe()
@@ -507,37 +543,37 @@ class TestFetchCardsDataframe:
         assert all(col in result.columns for col in ["id", "tags", "state"])
 
     @pytest.mark.asyncio
-    async def test_converts_cards_to_dataframe(self, mock_db, service):
-        """Test cards are converted to DataFrame correctly."""
-        mock_cards = [
-            MagicMock(
-                id=1,
-                tags=["ml"],
-                state=CardState.REVIEW,
-                stability=10.0,
-                total_reviews=5,
-                correct_reviews=4,
-                last_reviewed=datetime.utcnow(),
-            ),
-            MagicMock(
-                id=2,
-                tags=["python"],
-                state=CardState.LEARNING,
-                stability=2.0,
-                total_reviews=2,
-                correct_reviews=2,
-                last_reviewed=datetime.utcnow(),
-            ),
-        ]
+    async def test_converts_rows_to_dataframe(self, mock_db, service):
+        """Test row tuples are converted to DataFrame columns, nulls filled."""
+        now = datetime.utcnow()
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_cards
+        mock_result.all.return_value = [
+            (1, ["ml"], CardState.REVIEW, 10.0, 5, 4, now),
+            (2, ["python"], CardState.NEW, None, None, None, None),
+        ]
         mock_db.execute = AsyncMock(return_value=mock_result)
 
         result = await service._fetch_cards_dataframe()
 
-        assert len(result) == 2
-        assert result.iloc[0]["id"] == 1
-        assert result.iloc[1]["id"] == 2
+        assert list(result["id"]) == [1, 2]
+        assert list(result["stability"]) == [10.0, 0.0]
+        assert list(result["total_reviews"]) == [5, 0]
+        assert list(result["correct_reviews"]) == [4, 0]
+
+    @pytest.mark.asyncio
+    async def test_selects_only_needed_columns(self, mock_db, service):
+        """Card text is not loaded, and topics filter by tag overlap."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        await service._fetch_cards_dataframe(["ml"])
+
+        query = mock_db.execute.call_args.args[0]
+        columns = [column.name for column in query.selected_columns]
+        assert columns == list(CARD_FRAME_COLUMNS)
+        assert "question" not in columns
+        assert "&&" in str(query.compile(dialect=postgresql.dialect()))
 
 
 # ============================================================================
@@ -605,6 +641,76 @@ class TestComputeMasteryDataframe:
         assert result.loc["new_topic"]["success_rate"] is None
         assert result.loc["new_topic"]["mastery_score"] == 0.0
 
+    def test_matches_string_states_and_missing_tags(self, service):
+        """States loaded as plain strings count as review; null tags are skipped."""
+        cards_df = pd.DataFrame(
+            [
+                {
+                    "id": 1,
+                    "tags": ["ml"],
+                    "state": "review",
+                    "stability": 15.0,
+                    "total_reviews": 10,
+                    "correct_reviews": 8,
+                    "last_reviewed": datetime.now(timezone.utc),
+                },
+                {
+                    "id": 2,
+                    "tags": None,
+                    "state": "review",
+                    "stability": 30.0,
+                    "total_reviews": 4,
+                    "correct_reviews": 4,
+                    "last_reviewed": None,
+                },
+            ]
+        )
+        result = service._compute_mastery_dataframe(cards_df, ["ml"])
+
+        assert result.loc["ml"]["review_cards"] == 1
+        assert result.loc["ml"]["total_reviews"] == 10
+        assert result.loc["ml"]["days_since_review"] == 0
+        expected_stability = min(
+            1.0, 15.0 / settings.MASTERY_STABILITY_NORMALIZATION_DAYS
+        )
+        assert result.loc["ml"]["stability_factor"] == pytest.approx(
+            expected_stability
+        )
+
+    @pytest.mark.slow
+    def test_benchmark_100k_cards_500_topics(self, service):
+        """Mastery for 100k cards across 500 topics is computed in well under a second."""
+        rng = np.random.default_rng(0)
+        n_cards = 100_000
+        topics = [f"topic/{i}" for i in range(500)]
+        now = datetime.now(timezone.utc)
+        cards_df = pd.DataFrame(
+            {
+                "id": np.arange(n_cards),
+                "tags": [
+                    list(rng.choice(topics, size=3, replace=False))
+                    for _ in range(n_cards)
+                ],
+                "state": rng.choice(
+                    [state.value for state in CardState], size=n_cards
+                ),
+                "stability": rng.random(n_cards) * 60,
+                "total_reviews": rng.integers(0, 20, n_cards),
+                "correct_reviews": rng.integers(0, 10, n_cards),
+                "last_reviewed": now
+                - pd.to_timedelta(rng.integers(0, 90, n_cards), unit="D"),
+            }
+        )
+
+        start = time.perf_counter()
+        result = service._compute_mastery_dataframe(cards_df, topics)
+        elapsed = time.perf_counter() - start
+
+        assert len(result) == len(topics)
+        assert result["review_cards"].sum() > 0
+        # ~70ms on a laptop; the bound leaves headroom for slow CI runners
+        assert elapsed < 0.5
+
 
 # ============================================================================
 # Test _calculate_mastery_batch
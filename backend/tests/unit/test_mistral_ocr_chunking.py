@@ -0,0 +1,131 @@
+"""
+Unit tests for chunked PDF OCR.
+
+Runs offline against StubOCRBackend (PyMuPDF text layer) to test:
+- Page-range splitting
+- Merging chunk results with document-level page indices
+- Per-chunk retries that leave successful chunks alone
+- Routing of large documents from ocr_pdf_document_annotated
+"""
+
+import base64
+from unittest.mock import AsyncMock, patch
+
+import fitz
+import pytest
+
+from app.pipelines.utils import mistral_ocr_client as ocr_client
+from app.pipelines.utils.mistral_ocr_client import (
+    StubOCRBackend,
+    _page_ranges,
+    ocr_pdf_document_annotated,
+    ocr_pdf_document_chunked,
+)
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    """A 7-page PDF whose pages read 'Page 1' ... 'Page 7'."""
+    path = tmp_path / "textbook.pdf"
+    with fitz.open() as doc:
+        for number in range(1, 8):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Page {number}")
+        doc.save(path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def stub_backend(monkeypatch):
+    """Use the offline backend and no backoff between chunk attempts."""
+    monkeypatch.setattr(ocr_client.settings, "PDF_OCR_BACKEND", "stub")
+    monkeypatch.setattr(ocr_client.settings, "PDF_OCR_CHUNK_ATTEMPTS", 3)
+    monkeypatch.setattr(ocr_client, "OCR_CHUNK_RETRY_MIN_SEC", 0)
+    monkeypatch.setattr(ocr_client, "OCR_CHUNK_RETRY_MAX_SEC", 0)
+
+
+class FlakyBackend(StubOCRBackend):
+    """Stub backend that fails the first request for chunks containing a marker."""
+
+    def __init__(self, failing_text: str, failures: int = 1):
+        self.failing_text = failing_text
+        self.failures = failures
+        self.calls: list[str] = []
+
+    def process(self, model, document, **kwargs):
+        pdf_bytes = base64.b64decode(document["document_url"].split(",", 1)[1])
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            first_page = doc[0].get_text().strip()
+        self.calls.append(first_page)
+        if first_page == self.failing_text and self.failures > 0:
+            self.failures -= 1
+            raise TimeoutError("request timed out")
+        return super().process(model, document, **kwargs)
+
+
+def test_page_ranges_cover_document():
+    """Ranges are consecutive, cover every page and end with a short chunk."""
+    assert _page_ranges(7, 3) == [(0, 3), (3, 6), (6, 7)]
+    assert _page_ranges(3, 5) == [(0, 3)]
+
+
+class TestChunkedOCR:
+    """Tests for ocr_pdf_document_chunked."""
+
+    @pytest.mark.asyncio
+    async def test_merges_chunks_with_document_page_indices(self, sample_pdf):
+        """Chunk-local page numbers are shifted back to document indices."""
+        result = await ocr_pdf_document_chunked(
+            sample_pdf, chunk_pages=3, max_concurrency=2, include_images=False
+        )
+
+        assert [page.index for page in result.pages] == list(range(7))
+        assert [page.markdown.strip() for page in result.pages] == [
+            f"Page {n}" for n in range(1, 8)
+        ]
+        assert "[Page 7]" in result.full_markdown
+        assert result.usage.prompt_tokens == 7
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_retried_alone(self, sample_pdf):
+        """Only the failing chunk is re-sent; the others run once."""
+        backend = FlakyBackend(failing_text="Page 4")
+
+        with patch.object(ocr_client, "get_ocr_backend", return_value=backend):
+            result = await ocr_pdf_document_chunked(
+                sample_pdf, chunk_pages=3, include_images=False
+            )
+
+        assert sorted(backend.calls) == ["Page 1", "Page 4", "Page 4", "Page 7"]
+        assert result.page_count == 7
+
+    @pytest.mark.asyncio
+    async def test_chunk_failing_all_attempts_raises(self, sample_pdf):
+        """A chunk that never succeeds fails the document."""
+        backend = FlakyBackend(failing_text="Page 4", failures=10)
+
+        with patch.object(
+            ocr_client, "get_ocr_backend", return_value=backend
+        ), pytest.raises(TimeoutError):
+            await ocr_pdf_document_chunked(
+                sample_pdf, chunk_pages=3, include_images=False
+            )
+
+        assert backend.calls.count("Page 4") == 3
+
+    @pytest.mark.asyncio
+    async def test_annotated_ocr_routes_large_documents(
+        self, sample_pdf, monkeypatch
+    ):
+        """Documents above the threshold go through chunked OCR."""
+        monkeypatch.setattr(ocr_client.settings, "PDF_OCR_CHUNK_THRESHOLD_PAGES", 5)
+
+        with patch.object(
+            ocr_client,
+            "ocr_pdf_document_chunked",
+            AsyncMock(return_value="chunked"),
+        ) as mock_chunked:
+            result = await ocr_pdf_document_annotated(sample_pdf)
+
+        assert result == "chunked"
+        assert mock_chunked.call_args.kwargs["total_pages"] == 7
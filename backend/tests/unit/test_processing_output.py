@@ -23,6 +23,7 @@ from app.models.processing import (
     TagAssignment,
     Concept,
     Connection,
+    ConceptRelation,
     FollowupTask,
     MasteryQuestion,
 )
@@ -35,6 +36,7 @@ from app.services.processing.output.obsidian_generator import (
 )
 from app.services.obsidian.vault import VaultManager
 from app.services.processing.output.neo4j_generator import (
+    bulk_create_knowledge_nodes,
     create_knowledge_nodes,
     update_content_node,
 )
@@ -236,6 +238,8 @@ def mock_neo4j_client() -> MagicMock:
     mock.link_content_to_concept = AsyncMock()
     mock.create_relationship = AsyncMock()
     mock.delete_content_relationships = AsyncMock(return_value=5)
+    mock.write_graph_batch = AsyncMock(return_value={"content_nodes": 1})
+    mock.write_graph_batches = AsyncMock(return_value={"content_nodes": 1})
     return mock
 
 
@@ -477,6 +481,11 @@ class TestObsidianGenerator:
 class TestNeo4jGenerator:
     """Tests for the Neo4j knowledge graph generator."""
 
+    @staticmethod
+    def written_batch(mock_neo4j_client):
+        """The GraphWriteBatch passed to write_graph_batch."""
+        return mock_neo4j_client.write_graph_batch.call_args.args[0]
+
     @pytest.mark.asyncio
     async def test_create_knowledge_nodes_success(
         self,
@@ -485,13 +494,16 @@ class TestNeo4jGenerator:
         mock_llm_client,
         mock_neo4j_client,
     ):
-        """Test successful knowledge node creation."""
+        """Test successful knowledge node creation in one batched write."""
         node_id = await create_knowledge_nodes(
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
         )
 
-        assert node_id == "neo4j-node-123"
-        mock_neo4j_client.create_content_node.assert_called_once()
+        assert node_id == sample_content.id
+        mock_neo4j_client.write_graph_batch.assert_called_once()
+        mock_neo4j_client.create_content_node.assert_not_called()
+        mock_neo4j_client.create_concept_node.assert_not_called()
+        mock_neo4j_client.create_relationship.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_knowledge_nodes_content_node_params(
@@ -506,11 +518,12 @@ class TestNeo4jGenerator:
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
         )
 
-        call_kwargs = mock_neo4j_client.create_content_node.call_args.kwargs
-        assert call_kwargs["content_id"] == sample_content.id
-        assert call_kwargs["title"] == sample_content.title
-        assert call_kwargs["content_type"] == "paper"
-        assert "ml/transformers/attention" in call_kwargs["tags"]
+        [row] = self.written_batch(mock_neo4j_client).content_nodes
+        assert row["id"] == sample_content.id
+        assert row["title"] == sample_content.title
+        assert row["content_type"] == "paper"
+        assert "ml/transformers/attention" in row["tags"]
+        assert "Vaswani et al." in row["metadata"]
 
     @pytest.mark.asyncio
     async def test_create_knowledge_nodes_creates_core_concepts_only(
@@ -526,8 +539,31 @@ class TestNeo4jGenerator:
         )
 
         # 2 CORE concepts in sample_extraction
-        assert mock_neo4j_client.create_concept_node.call_count == 2
-        assert mock_neo4j_client.link_content_to_concept.call_count == 2
+        batch = self.written_batch(mock_neo4j_client)
+        assert [row["display_name"] for row in batch.concept_nodes] == [
+            "Transformer",
+            "Self-attention",
+        ]
+        assert [row["canonical_name"] for row in batch.concept_links] == [
+            "transformer",
+            "self-attention",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_create_knowledge_nodes_embeds_in_one_call(
+        self,
+        sample_content,
+        sample_processing_result,
+        mock_llm_client,
+        mock_neo4j_client,
+    ):
+        """Test that content and core concepts share one embedding request."""
+        await create_knowledge_nodes(
+            sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
+        )
+
+        mock_llm_client.embed.assert_called_once()
+        assert len(mock_llm_client.embed.call_args.args[0]) == 3
 
     @pytest.mark.asyncio
     async def test_create_knowledge_nodes_creates_relationships(
@@ -537,13 +573,16 @@ class TestNeo4jGenerator:
         mock_llm_client,
         mock_neo4j_client,
     ):
-        """Test that cross-content relationships are created."""
+        """Test that cross-content relationships are grouped by type."""
         await create_knowledge_nodes(
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
         )
 
-        # 2 connections in sample_processing_result
-        assert mock_neo4j_client.create_relationship.call_count == 2
+        # 2 connections in sample_processing_result, of different types
+        relationships = self.written_batch(mock_neo4j_client).relationships
+        assert sum(len(rows) for rows in relationships.values()) == 2
+        assert set(relationships) == {"EXTENDS", "RELATES_TO"}
+        assert relationships["EXTENDS"][0]["properties"]["strength"] == 0.85
 
     @pytest.mark.asyncio
     async def test_create_knowledge_nodes_empty_embedding(
@@ -560,7 +599,9 @@ class TestNeo4jGenerator:
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
         )
 
-        assert node_id == "neo4j-node-123"
+        assert node_id == sample_content.id
+        [row] = self.written_batch(mock_neo4j_client).content_nodes
+        assert row["embedding"] == []
 
     @pytest.mark.asyncio
     async def test_create_knowledge_nodes_db_error(
@@ -570,8 +611,8 @@ class TestNeo4jGenerator:
         mock_llm_client,
         mock_neo4j_client,
     ):
-        """Test graceful handling of database errors."""
-        mock_neo4j_client.create_content_node.side_effect = Exception("DB error")
+        """Test graceful handling of database errors (nothing is written)."""
+        mock_neo4j_client.write_graph_batch.side_effect = Exception("DB error")
 
         node_id = await create_knowledge_nodes(
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
@@ -580,41 +621,48 @@ class TestNeo4jGenerator:
         assert node_id is None
 
     @pytest.mark.asyncio
-    async def test_create_knowledge_nodes_concept_error_continues(
+    async def test_create_knowledge_nodes_embedding_error(
         self,
         sample_content,
         sample_processing_result,
         mock_llm_client,
         mock_neo4j_client,
     ):
-        """Test that concept creation errors don't stop the process."""
-        mock_neo4j_client.create_concept_node.side_effect = [
-            Exception("Failed"),
-            AsyncMock(return_value="c2"),
-        ]
+        """Test that an embedding failure skips the graph write."""
+        mock_llm_client.embed.side_effect = Exception("Rate limited")
 
         node_id = await create_knowledge_nodes(
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
         )
 
-        assert node_id == "neo4j-node-123"
+        assert node_id is None
+        mock_neo4j_client.write_graph_batch.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_create_knowledge_nodes_relationship_error_continues(
+    async def test_create_knowledge_nodes_links_related_concepts(
         self,
         sample_content,
         sample_processing_result,
         mock_llm_client,
         mock_neo4j_client,
     ):
-        """Test that relationship creation errors don't stop the process."""
-        mock_neo4j_client.create_relationship.side_effect = Exception("Failed")
+        """Test that related concepts become concept-to-concept rows."""
+        sample_processing_result.extraction.concepts[0].related_concepts = [
+            ConceptRelation(name="Self-attention", relationship="uses"),
+        ]
 
-        node_id = await create_knowledge_nodes(
+        await create_knowledge_nodes(
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
         )
 
-        assert node_id == "neo4j-node-123"
+        rows = self.written_batch(mock_neo4j_client).concept_relationships["USES"]
+        assert rows == [
+            {
+                "source_canonical": "transformer",
+                "target_canonical": "self-attention",
+                "properties": {},
+            }
+        ]
 
     @pytest.mark.asyncio
     async def test_create_knowledge_nodes_no_concepts(
@@ -631,8 +679,8 @@ class TestNeo4jGenerator:
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
         )
 
-        assert node_id == "neo4j-node-123"
-        mock_neo4j_client.create_concept_node.assert_not_called()
+        assert node_id == sample_content.id
+        assert self.written_batch(mock_neo4j_client).concept_nodes == []
 
     @pytest.mark.asyncio
     async def test_create_knowledge_nodes_no_connections(
@@ -649,8 +697,8 @@ class TestNeo4jGenerator:
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
         )
 
-        assert node_id == "neo4j-node-123"
-        mock_neo4j_client.create_relationship.assert_not_called()
+        assert node_id == sample_content.id
+        assert not self.written_batch(mock_neo4j_client).relationships
 
     @pytest.mark.asyncio
     async def test_create_knowledge_nodes_only_supporting_concepts(
@@ -670,8 +718,8 @@ class TestNeo4jGenerator:
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
         )
 
-        assert node_id == "neo4j-node-123"
-        mock_neo4j_client.create_concept_node.assert_not_called()
+        assert node_id == sample_content.id
+        assert self.written_batch(mock_neo4j_client).concept_nodes == []
 
     @pytest.mark.asyncio
     async def test_create_knowledge_nodes_special_chars_in_title(
@@ -688,13 +736,51 @@ class TestNeo4jGenerator:
             sample_content, sample_processing_result, mock_llm_client, mock_neo4j_client
         )
 
-        assert node_id == "neo4j-node-123"
+        assert node_id == sample_content.id
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_knowledge_nodes(
+        self,
+        sample_content,
+        sample_processing_result,
+        mock_llm_client,
+        mock_neo4j_client,
+    ):
+        """Test multi-document bulk mode: one embedding call, one bulk write."""
+        other_content = sample_content.model_copy(
+            update={"id": "other-content", "title": "BERT"}
+        )
+        other_result = sample_processing_result.model_copy(
+            update={"content_id": "other-content"}
+        )
+        mock_neo4j_client.write_graph_batches.return_value = {"content_nodes": 2}
+
+        written = await bulk_create_knowledge_nodes(
+            [(sample_content, sample_processing_result), (other_content, other_result)],
+            mock_llm_client,
+            mock_neo4j_client,
+            documents_per_transaction=10,
+        )
+
+        assert written == 2
+        mock_llm_client.embed.assert_called_once()
+        batches = mock_neo4j_client.write_graph_batches.call_args.args[0]
+        assert [b.content_nodes[0]["id"] for b in batches] == [
+            sample_content.id,
+            "other-content",
+        ]
+        assert (
+            mock_neo4j_client.write_graph_batches.call_args.kwargs[
+                "documents_per_transaction"
+            ]
+            == 10
+        )
 
     @pytest.mark.asyncio
     async def test_update_content_node_success(
         self, sample_processing_result, mock_llm_client, mock_neo4j_client
     ):
-        """Test successful content node update."""
+        """Test successful content node update (relationships replaced atomically)."""
         result = await update_content_node(
             "test-123",
             "Test Title",
@@ -704,18 +790,17 @@ class TestNeo4jGenerator:
         )
 
         assert result is True
-        mock_neo4j_client.delete_content_relationships.assert_called_once_with(
-            "test-123"
-        )
+        batch = self.written_batch(mock_neo4j_client)
+        assert batch.replace_relationships_for == ["test-123"]
+        assert batch.content_nodes[0]["id"] == "test-123"
+        mock_neo4j_client.delete_content_relationships.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_content_node_handles_exception(
         self, sample_processing_result, mock_llm_client, mock_neo4j_client
     ):
         """Test graceful handling of update exceptions."""
-        mock_neo4j_client.delete_content_relationships.side_effect = Exception(
-            "Delete failed"
-        )
+        mock_neo4j_client.write_graph_batch.side_effect = Exception("Write failed")
 
         result = await update_content_node(
             "test-123",
@@ -4,6 +4,8 @@ Unit tests for the processing pipeline orchestrator.
 Tests the main pipeline that coordinates all processing stages.
 """
 
+import asyncio
+import time
 from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
@@ -25,7 +27,18 @@ from app.models.processing import (
     MasteryQuestion,
 )
 from app.models.llm_usage import LLMUsage
-from app.services.processing.pipeline import process_content, PipelineConfig
+from app.enums.processing import ProcessingStage
+from app.services.processing.checkpoints import (
+    StageCheckpoint,
+    deserialize_stage_output,
+    serialize_stage_output,
+    stage_config_hash,
+)
+from app.services.processing.pipeline import (
+    process_content,
+    run_stage_dag,
+    PipelineConfig,
+)
 
 
 # =============================================================================
@@ -934,3 +947,377 @@ class TestTiming:
             )
 
         assert result.processing_time_seconds >= 0
+
+
+# =============================================================================
+# Stage DAG Tests
+# =============================================================================
+
+
+class TestStageDag:
+    """Tests for the dependency-driven stage executor."""
+
+    @pytest.mark.asyncio
+    async def test_dependencies_respected(self):
+        """Dependents start only after all of their dependencies finish."""
+        order = []
+
+        def runner(stage):
+            async def run():
+                order.append(f"start:{stage.value}")
+                await asyncio.sleep(0.01)
+                order.append(f"end:{stage.value}")
+
+            return run
+
+        stages = [
+            ProcessingStage.SUMMARIZATION,
+            ProcessingStage.EXTRACTION,
+            ProcessingStage.TAGGING,
+            ProcessingStage.QUESTIONS,
+        ]
+        timings = await run_stage_dag(
+            {stage: runner(stage) for stage in stages}, max_concurrency=4
+        )
+
+        assert set(timings) == {stage.value for stage in stages}
+        assert order.index("start:TAGGING") > order.index("end:SUMMARIZATION")
+        assert order.index("start:QUESTIONS") > order.index("end:SUMMARIZATION")
+        assert order.index("start:QUESTIONS") > order.index("end:EXTRACTION")
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently(self):
+        """Independent stages overlap, so wall time tracks the critical path."""
+        running = 0
+        peak = 0
+
+        async def run():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+
+        runners = {
+            ProcessingStage.SUMMARIZATION: run,
+            ProcessingStage.EXTRACTION: run,
+            ProcessingStage.FOLLOWUPS: run,
+            ProcessingStage.QUESTIONS: run,
+        }
+        start = time.perf_counter()
+        await run_stage_dag(runners, max_concurrency=4)
+        elapsed = time.perf_counter() - start
+
+        assert peak == 2
+        # Two levels of 50ms each, not four sequential stages
+        assert elapsed < 0.18
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        """No more than max_concurrency stages run at once."""
+        running = 0
+        peak = 0
+
+        async def run():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        runners = {
+            ProcessingStage.SUMMARIZATION: run,
+            ProcessingStage.EXTRACTION: run,
+        }
+        await run_stage_dag(runners, max_concurrency=1)
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_dependency_does_not_block(self):
+        """Dependencies that are not scheduled count as satisfied."""
+        ran = []
+
+        async def run():
+            ran.append(True)
+
+        timings = await run_stage_dag(
+            {ProcessingStage.TAGGING: run}, max_concurrency=2
+        )
+
+        assert ran == [True]
+        assert "TAGGING" in timings
+
+    @pytest.mark.asyncio
+    async def test_failing_stage_unblocks_dependents(self):
+        """A stage that raises is logged and its dependents still run."""
+        ran = []
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def run():
+            ran.append(True)
+
+        await run_stage_dag(
+            {
+                ProcessingStage.SUMMARIZATION: fail,
+                ProcessingStage.TAGGING: run,
+            },
+            max_concurrency=2,
+        )
+
+        assert ran == [True]
+
+    @pytest.mark.asyncio
+    async def test_stage_timings_in_result(
+        self, sample_content, mock_llm_client, mock_analysis
+    ):
+        """process_content reports per-stage wall time in the result."""
+        config = PipelineConfig(
+            discover_connections=False,
+            create_obsidian_note=False,
+            create_neo4j_nodes=False,
+            validate_output=False,
+        )
+
+        with pipeline_mocks(analysis=mock_analysis):
+            result = await process_content(
+                content=sample_content,
+                config=config,
+                llm_client=mock_llm_client,
+            )
+
+        assert set(result.stage_timings) == {
+            "ANALYSIS",
+            "SUMMARIZATION",
+            "EXTRACTION",
+            "TAGGING",
+            "FOLLOWUPS",
+            "QUESTIONS",
+        }
+        assert all(t >= 0 for t in result.stage_timings.values())
+
+
+# =============================================================================
+# Stage Checkpoint Tests
+# =============================================================================
+
+
+class InMemoryCheckpointStore:
+    """CheckpointStore stand-in that round-trips outputs through JSON payloads."""
+
+    def __init__(self):
+        self.rows: dict[tuple[str, str], dict] = {}
+        self.invalidated: list = []
+
+    async def load(self, content_uuid, content_hash):
+        return {
+            ProcessingStage(stage): StageCheckpoint(
+                stage=stage,
+                config_hash=row["config_hash"],
+                output=deserialize_stage_output(ProcessingStage(stage), row["output"]),
+            )
+            for (uuid, stage), row in self.rows.items()
+            if uuid == content_uuid and row["content_hash"] == content_hash
+        }
+
+    async def save(
+        self, content_uuid, content_hash, stage, config_hash, output, cost_usd=0.0
+    ):
+        self.rows[(content_uuid, stage.value)] = {
+            "content_hash": content_hash,
+            "config_hash": config_hash,
+            "output": serialize_stage_output(stage, output),
+        }
+
+    async def invalidate(self, content_uuid, stages=None):
+        self.invalidated.append(stages)
+        doomed = [
+            key
+            for key in self.rows
+            if key[0] == content_uuid and (stages is None or key[1] in stages)
+        ]
+        for key in doomed:
+            del self.rows[key]
+        return len(doomed)
+
+
+@pytest.fixture
+def checkpoint_config() -> PipelineConfig:
+    """Config running every DAG stage without side-effecting outputs."""
+    return PipelineConfig(
+        create_obsidian_note=False,
+        create_neo4j_nodes=False,
+        validate_output=False,
+    )
+
+
+class TestCheckpoints:
+    """Tests for stage checkpointing and resume."""
+
+    ALL_STAGES = [
+        "ANALYSIS",
+        "CONNECTIONS",
+        "EXTRACTION",
+        "FOLLOWUPS",
+        "QUESTIONS",
+        "SUMMARIZATION",
+        "TAGGING",
+    ]
+
+    async def _run(self, content, config, store, neo4j, analysis, extraction, tags):
+        with pipeline_mocks(
+            analysis=analysis,
+            extraction=extraction,
+            tags=tags,
+            questions=[MasteryQuestion(question="Why attention?")],
+        ) as mocks:
+            result = await process_content(
+                content=content,
+                config=config,
+                llm_client=MagicMock(),
+                neo4j_client=neo4j,
+                checkpoints=store,
+            )
+        return result, mocks
+
+    @pytest.mark.asyncio
+    async def test_completed_stages_are_saved(
+        self,
+        sample_content,
+        checkpoint_config,
+        mock_neo4j_client,
+        mock_analysis,
+        mock_extraction,
+        mock_tags,
+    ):
+        """Every completed stage writes a checkpoint; nothing is restored."""
+        store = InMemoryCheckpointStore()
+        result, _ = await self._run(
+            sample_content,
+            checkpoint_config,
+            store,
+            mock_neo4j_client,
+            mock_analysis,
+            mock_extraction,
+            mock_tags,
+        )
+
+        assert sorted(stage for _, stage in store.rows) == self.ALL_STAGES
+        assert result.restored_stages == []
+
+    @pytest.mark.asyncio
+    async def test_rerun_restores_all_stages(
+        self,
+        sample_content,
+        checkpoint_config,
+        mock_neo4j_client,
+        mock_analysis,
+        mock_extraction,
+        mock_tags,
+    ):
+        """A second run makes no stage LLM calls and reproduces the outputs."""
+        store = InMemoryCheckpointStore()
+        args = (mock_neo4j_client, mock_analysis, mock_extraction, mock_tags)
+        first, _ = await self._run(sample_content, checkpoint_config, store, *args)
+        second, mocks = await self._run(sample_content, checkpoint_config, store, *args)
+
+        for name in (
+            "analyze",
+            "summarize",
+            "extract",
+            "tag",
+            "connections",
+            "followups",
+            "questions",
+        ):
+            mocks[name].assert_not_called()
+        assert second.restored_stages == self.ALL_STAGES
+        assert second.estimated_cost_usd == 0
+        assert second.analysis == first.analysis
+        assert second.summaries == first.summaries
+        assert second.extraction == first.extraction
+        assert second.tags == first.tags
+        assert second.mastery_questions == first.mastery_questions
+
+    @pytest.mark.asyncio
+    async def test_invalidated_stage_recomputes_dependents(
+        self,
+        sample_content,
+        checkpoint_config,
+        mock_neo4j_client,
+        mock_analysis,
+        mock_extraction,
+        mock_tags,
+    ):
+        """Invalidating summarization reruns it and every stage reading it."""
+        store = InMemoryCheckpointStore()
+        args = (mock_neo4j_client, mock_analysis, mock_extraction, mock_tags)
+        await self._run(sample_content, checkpoint_config, store, *args)
+
+        checkpoint_config.invalidate_stages = ["SUMMARIZATION"]
+        result, mocks = await self._run(sample_content, checkpoint_config, store, *args)
+
+        assert store.invalidated == [["SUMMARIZATION"]]
+        assert checkpoint_config.invalidate_stages == []
+        mocks["analyze"].assert_not_called()
+        mocks["extract"].assert_not_called()
+        for name in ("summarize", "tag", "connections", "followups", "questions"):
+            mocks[name].assert_called_once()
+        assert result.restored_stages == ["ANALYSIS", "EXTRACTION"]
+
+    @pytest.mark.asyncio
+    async def test_content_change_invalidates(
+        self,
+        sample_content,
+        checkpoint_config,
+        mock_neo4j_client,
+        mock_analysis,
+        mock_extraction,
+        mock_tags,
+    ):
+        """Checkpoints for an older version of the text are not restored."""
+        store = InMemoryCheckpointStore()
+        args = (mock_neo4j_client, mock_analysis, mock_extraction, mock_tags)
+        await self._run(sample_content, checkpoint_config, store, *args)
+
+        sample_content.full_text += " Revised."
+        result, mocks = await self._run(sample_content, checkpoint_config, store, *args)
+
+        mocks["analyze"].assert_called_once()
+        assert result.restored_stages == []
+
+    @pytest.mark.asyncio
+    async def test_config_change_invalidates_stage(
+        self,
+        sample_content,
+        checkpoint_config,
+        mock_neo4j_client,
+        mock_analysis,
+        mock_extraction,
+        mock_tags,
+    ):
+        """Changing a stage parameter only recomputes that stage."""
+        store = InMemoryCheckpointStore()
+        args = (mock_neo4j_client, mock_analysis, mock_extraction, mock_tags)
+        await self._run(sample_content, checkpoint_config, store, *args)
+
+        checkpoint_config.max_connection_candidates += 5
+        result, mocks = await self._run(sample_content, checkpoint_config, store, *args)
+
+        mocks["connections"].assert_called_once()
+        mocks["summarize"].assert_not_called()
+        assert "CONNECTIONS" not in result.restored_stages
+
+    def test_config_hash_scoped_to_stage(self):
+        """Connection parameters do not affect other stages' config hashes."""
+        a = PipelineConfig(max_connection_candidates=5)
+        b = PipelineConfig(max_connection_candidates=20)
+
+        assert stage_config_hash(ProcessingStage.SUMMARIZATION, a) == (
+            stage_config_hash(ProcessingStage.SUMMARIZATION, b)
+        )
+        assert stage_config_hash(ProcessingStage.CONNECTIONS, a) != (
+            stage_config_hash(ProcessingStage.CONNECTIONS, b)
+        )
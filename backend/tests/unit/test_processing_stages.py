@@ -4,10 +4,13 @@ Unit tests for LLM processing stages.
 Tests each processing stage in isolation with mocked LLM client.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.config.processing import processing_settings
+
 from app.enums import (
     ContentType,
     AnnotationType,
@@ -40,7 +43,9 @@ from app.services.processing.stages.content_analysis import (
 from app.services.processing.stages.summarization import (
     generate_summary,
     generate_all_summaries,
+    summarize_parts,
     _format_annotations,
+    _group_parts,
 )
 from app.services.processing.stages.extraction import (
     extract_concepts,
@@ -489,6 +494,195 @@ class TestSummarization:
         assert len(summaries) == 3
         assert all("failed" in s.lower() for s in summaries.values())
 
+    @pytest.mark.asyncio
+    async def test_standard_and_brief_derived_from_detailed(
+        self, sample_content, sample_analysis, mock_llm_client, sample_usage
+    ):
+        """Only the detailed summary reads the source text."""
+
+        async def complete(messages, **kwargs):
+            prompt = messages[0]["content"]
+            if "Provide a DETAILED summary" in prompt:
+                return "DETAILED-SUMMARY", sample_usage
+            return "derived", sample_usage
+
+        mock_llm_client.complete.side_effect = complete
+
+        summaries, usages = await generate_all_summaries(
+            sample_content, sample_analysis, mock_llm_client
+        )
+
+        assert summaries[SummaryLevel.DETAILED.value] == "DETAILED-SUMMARY"
+        assert len(usages) == 3
+        prompts = [
+            call.kwargs["messages"][0]["content"]
+            for call in mock_llm_client.complete.call_args_list
+        ]
+        derived = [p for p in prompts if "Provide a DETAILED summary" not in p]
+        assert len(derived) == 2
+        assert all("DETAILED-SUMMARY" in p for p in derived)
+        assert all("dispensing with recurrence" not in p for p in derived)
+
+    @pytest.mark.asyncio
+    async def test_derived_fall_back_to_source(
+        self, sample_content, sample_analysis, mock_llm_client, sample_usage
+    ):
+        """Standard and brief read the source if the detailed summary failed."""
+
+        async def complete(messages, **kwargs):
+            if "Provide a DETAILED summary" in messages[0]["content"]:
+                raise Exception("LLM error")
+            return "derived", sample_usage
+
+        mock_llm_client.complete.side_effect = complete
+
+        summaries, usages = await generate_all_summaries(
+            sample_content, sample_analysis, mock_llm_client
+        )
+
+        assert "failed" in summaries[SummaryLevel.DETAILED.value].lower()
+        assert summaries[SummaryLevel.STANDARD.value] == "derived"
+        assert summaries[SummaryLevel.BRIEF.value] == "derived"
+        assert len(usages) == 2
+        prompts = [
+            call.kwargs["messages"][0]["content"]
+            for call in mock_llm_client.complete.call_args_list
+        ]
+        assert all("dispensing with recurrence" in p for p in prompts)
+
+    @pytest.mark.asyncio
+    async def test_long_text_map_reduce(
+        self, sample_content, sample_analysis, mock_llm_client, sample_usage
+    ):
+        """Texts over the detailed limit are summarized chunk by chunk."""
+        chunks = [f"chunk-{i} " * 20 for i in range(6)]
+        sample_content.full_text = "".join(chunks) + "TAIL-OF-THE-BOOK"
+
+        async def complete(messages, **kwargs):
+            prompt = messages[0]["content"]
+            if "Summary of part" in prompt:
+                return f"summary of {prompt.split('Part ')[1].split(':')[0]}", sample_usage
+            return "final", sample_usage
+
+        mock_llm_client.complete.side_effect = complete
+
+        with (
+            patch.object(processing_settings, "SUMMARY_TRUNCATE_DETAILED", 500),
+            patch(
+                "app.services.processing.stages.summarization.run_cpu_bound",
+                AsyncMock(return_value=chunks),
+            ) as split,
+        ):
+            summaries, usages = await generate_all_summaries(
+                sample_content, sample_analysis, mock_llm_client
+            )
+
+        assert split.await_args.args[1] == sample_content.full_text
+        # 6 chunk summaries + 1 reduce + standard + brief
+        assert mock_llm_client.complete.await_count == 9
+        assert len(usages) == 9
+        assert summaries[SummaryLevel.DETAILED.value] == "final"
+        reduce_prompt = next(
+            call.kwargs["messages"][0]["content"]
+            for call in mock_llm_client.complete.call_args_list
+            if "Provide a DETAILED summary" in call.kwargs["messages"][0]["content"]
+        )
+        assert "summary of 1 of 6" in reduce_prompt
+        assert "summary of 6 of 6" in reduce_prompt
+        assert reduce_prompt.index("### Part 1") < reduce_prompt.index("### Part 6")
+        assert "chunk-0" not in reduce_prompt
+
+    @pytest.mark.asyncio
+    async def test_part_summaries_condensed_until_they_fit(
+        self, sample_content, sample_analysis, mock_llm_client, sample_usage
+    ):
+        """Part summaries too long for one reduce call are condensed first."""
+        chunks = [f"chunk-{i}" for i in range(8)]
+        sample_content.full_text = "x" * 2000
+        mock_llm_client.complete.return_value = ("s" * 200, sample_usage)
+
+        with (
+            patch.object(processing_settings, "SUMMARY_TRUNCATE_DETAILED", 1000),
+            patch.object(processing_settings, "SUMMARY_CHUNK_SIZE", 500),
+            patch(
+                "app.services.processing.stages.summarization.run_cpu_bound",
+                AsyncMock(return_value=chunks),
+            ),
+        ):
+            _, usages = await generate_all_summaries(
+                sample_content, sample_analysis, mock_llm_client
+            )
+
+        # 8 chunks -> 1600 chars of summaries -> 4 groups of 2 -> 800 chars
+        # 8 + 4 condensing + 1 reduce + standard + brief
+        assert len(usages) == 15
+
+    @pytest.mark.asyncio
+    async def test_summarize_parts_bounded_concurrency(
+        self, sample_content, sample_analysis, mock_llm_client, sample_usage
+    ):
+        """At most SUMMARY_MAX_CONCURRENT_CHUNKS part calls run at once."""
+        running = 0
+        peak = 0
+
+        async def complete(messages, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "part summary", sample_usage
+
+        mock_llm_client.complete.side_effect = complete
+
+        with patch.object(processing_settings, "SUMMARY_MAX_CONCURRENT_CHUNKS", 3):
+            summaries, usages = await summarize_parts(
+                sample_content, sample_analysis, ["p"] * 10, mock_llm_client
+            )
+
+        assert peak == 3
+        assert len(summaries) == len(usages) == 10
+
+    @pytest.mark.asyncio
+    async def test_summarize_parts_skips_failed_part(
+        self, sample_content, sample_analysis, mock_llm_client, sample_usage
+    ):
+        """A failing part is left out; order of the others is kept."""
+        mock_llm_client.complete.side_effect = [
+            ("first", sample_usage),
+            Exception("LLM error"),
+            ("third", sample_usage),
+        ]
+
+        summaries, usages = await summarize_parts(
+            sample_content, sample_analysis, ["a", "b", "c"], mock_llm_client
+        )
+
+        assert summaries == ["first", "third"]
+        assert len(usages) == 2
+
+    @pytest.mark.asyncio
+    async def test_summarize_parts_all_failed_raises(
+        self, sample_content, sample_analysis, mock_llm_client
+    ):
+        """If every part fails, the error propagates."""
+        mock_llm_client.complete.side_effect = Exception("LLM error")
+
+        with pytest.raises(Exception, match="LLM error"):
+            await summarize_parts(
+                sample_content, sample_analysis, ["a", "b"], mock_llm_client
+            )
+
+    def test_group_parts(self):
+        """Groups stay under the size limit but hold at least two parts."""
+        assert _group_parts(["aa", "bb", "cc", "dd", "ee"], 6) == [
+            ["aa", "bb"],
+            ["cc", "dd", "ee"],
+        ]
+        assert _group_parts(["a" * 10, "b" * 10, "c" * 10], 5) == [
+            ["a" * 10, "b" * 10, "c" * 10]
+        ]
+
     @pytest.mark.parametrize(
         "annotations,expected_contains",
         [
@@ -8,13 +8,32 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.db.models_learning import CardReviewHistory
 from app.enums.learning import Rating
-from app.models.learning import CardCreate, CardReviewRequest, CardStats
+from app.models.learning import (
+    CardCreate,
+    CardReviewRequest,
+    CardStats,
+    ReviewForecast,
+)
 from app.services.learning.spaced_rep_service import SpacedRepService
 
 
+@pytest.fixture(autouse=True)
+def due_count_cache():
+    """Replace the Redis due-count cache with an in-memory mock."""
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock()
+    cache.clear_pattern = AsyncMock()
+    with patch(
+        "app.services.learning.spaced_rep_service._due_count_cache", cache
+    ):
+        yield cache
+
+
 class TestSpacedRepServiceInitialization:
     """Tests for SpacedRepService initialization."""
 
@@ -130,7 +149,14 @@ class TestSpacedRepServiceGetDueCards:
         # Mock execute to return empty results by default
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = []
-        mock_result.scalar.return_value = 0
+        mock_result.mappings.return_value.one.return_value = {
+            "due_now": 0,
+            "overdue": 0,
+            "today": 0,
+            "tomorrow": 0,
+            "this_week": 0,
+            "later": 0,
+        }
 
         mock.execute = AsyncMock(return_value=mock_result)
 
@@ -156,6 +182,119 @@ class TestSpacedRepServiceGetDueCards:
         # Verify execute was called (query was made)
         assert mock_db.execute.called
 
+    @pytest.mark.asyncio
+    async def test_get_due_cards_counts_in_one_query(self, mock_db):
+        """Cards are fetched, then total due and forecast come from one query."""
+        mock_db.execute.return_value.mappings.return_value.one.return_value = {
+            "due_now": 7,
+            "overdue": 3,
+            "today": 4,
+            "tomorrow": 2,
+            "this_week": 5,
+            "later": 9,
+        }
+        service = SpacedRepService(mock_db)
+
+        result = await service.get_due_cards(limit=10)
+
+        assert mock_db.execute.await_count == 2
+        assert result.total_due == 7
+        assert result.review_forecast == ReviewForecast(
+            overdue=3, today=4, tomorrow=2, this_week=5, later=9
+        )
+
+
+class TestSpacedRepServiceReviewForecast:
+    """Tests for the single-query review forecast."""
+
+    @pytest.fixture
+    def mock_db(self):
+        """Create a mock database session returning bucket counts."""
+        mock = MagicMock()
+        mock_result = MagicMock()
+        mock_result.mappings.return_value.one.return_value = {
+            "due_now": 1,
+            "overdue": 1,
+            "today": 2,
+            "tomorrow": None,
+            "this_week": 0,
+            "later": 6,
+        }
+        mock.execute = AsyncMock(return_value=mock_result)
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_forecast_uses_one_filtered_count_query(self, mock_db):
+        """All buckets are COUNT(*) FILTER aggregates of a single query."""
+        service = SpacedRepService(mock_db)
+
+        forecast = await service.get_review_forecast()
+
+        assert forecast == ReviewForecast(
+            overdue=1, today=2, tomorrow=0, this_week=0, later=6
+        )
+        mock_db.execute.assert_awaited_once()
+        query = mock_db.execute.call_args.args[0]
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert sql.count("FILTER (WHERE") == 6
+
+    @pytest.mark.asyncio
+    async def test_forecast_topic_filter_uses_array_containment(self, mock_db):
+        """Topic filter is tags @> ARRAY[topic], which the GIN index serves."""
+        service = SpacedRepService(mock_db)
+
+        await service.get_review_forecast(topic_filter="ml/transformers")
+
+        query = mock_db.execute.call_args.args[0]
+        assert "@>" in str(query.compile(dialect=postgresql.dialect()))
+
+
+class TestSpacedRepServiceCountDue:
+    """Tests for the cached due-card count."""
+
+    @pytest.fixture
+    def mock_db(self):
+        """Create a mock database session returning a due count."""
+        mock = MagicMock()
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = 5
+        mock.execute = AsyncMock(return_value=mock_result)
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_count_due_queries_and_caches(self, mock_db, due_count_cache):
+        """A cache miss runs one COUNT query and stores the result."""
+        service = SpacedRepService(mock_db)
+
+        count = await service.count_due(topic_filter="ml")
+
+        assert count == 5
+        mock_db.execute.assert_awaited_once()
+        due_count_cache.set.assert_awaited_once()
+        assert due_count_cache.set.call_args.args[:2] == ("ml", 5)
+
+    @pytest.mark.asyncio
+    async def test_count_due_cache_hit_skips_query(self, mock_db, due_count_cache):
+        """A cached count is returned without touching the database."""
+        due_count_cache.get.return_value = 3
+        service = SpacedRepService(mock_db)
+
+        count = await service.count_due()
+
+        assert count == 3
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_count_due_falls_back_when_redis_fails(
+        self, mock_db, due_count_cache
+    ):
+        """Redis errors fall back to the database count."""
+        due_count_cache.get.side_effect = ConnectionError("redis down")
+        due_count_cache.set.side_effect = ConnectionError("redis down")
+        service = SpacedRepService(mock_db)
+
+        assert await service.count_due() == 5
+
 
 class TestSpacedRepServiceReviewCard:
     """Tests for reviewing cards."""
@@ -270,6 +409,21 @@ class TestSpacedRepServiceReviewCard:
         )
         assert history_added, "CardReviewHistory record should be added to session"
 
+    @pytest.mark.asyncio
+    async def test_review_invalidates_due_counts(
+        self, mock_db, mock_card, due_count_cache
+    ):
+        """Reviewing a card drops cached due counts."""
+        service = SpacedRepService(mock_db)
+
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_card
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        await service.review_card(CardReviewRequest(card_id=1, rating=Rating.GOOD))
+
+        due_count_cache.clear_pattern.assert_awaited_once_with("*")
+
     @pytest.mark.asyncio
     async def test_review_history_contains_correct_data(self, mock_db, mock_card):
         """Test that the CardReviewHistory record contains correct data."""
@@ -309,16 +463,20 @@ class TestSpacedRepServiceCardStats:
         """Create a mock database session."""
         mock = MagicMock()
 
-        # Create multiple mock results for different queries
-        def execute_side_effect(query):
-            result = MagicMock()
-            # Default to returning 0 or empty
-            result.scalar.return_value = 0
-            result.fetchall.return_value = []
-            result.fetchone.return_value = (0.0, 0.0)  # For avg query
-            return result
-
-        mock.execute = AsyncMock(side_effect=execute_side_effect)
+        # Single aggregate row; empty collection (averages are NULL)
+        mock_result = MagicMock()
+        mock_result.mappings.return_value.one.return_value = {
+            "total": 0,
+            "new": 0,
+            "learning": 0,
+            "review": 0,
+            "relearning": 0,
+            "avg_stability": None,
+            "avg_difficulty": None,
+            "due_today": 0,
+            "overdue": 0,
+        }
+        mock.execute = AsyncMock(return_value=mock_result)
         return mock
 
     @pytest.mark.asyncio
@@ -341,6 +499,31 @@ class TestSpacedRepServiceCardStats:
 
         assert isinstance(result, CardStats)
 
+    @pytest.mark.asyncio
+    async def test_get_card_stats_single_query(self, mock_db):
+        """All statistics come from one query; empty states are omitted."""
+        mock_db.execute.return_value.mappings.return_value.one.return_value = {
+            "total": 5,
+            "new": 2,
+            "learning": 0,
+            "review": 3,
+            "relearning": 0,
+            "avg_stability": 12.5,
+            "avg_difficulty": 0.4,
+            "due_today": 1,
+            "overdue": 2,
+        }
+        service = SpacedRepService(mock_db)
+
+        result = await service.get_card_stats()
+
+        mock_db.execute.assert_awaited_once()
+        assert result.total_cards == 5
+        assert result.cards_by_state == {"new": 2, "review": 3}
+        assert result.avg_stability == 12.5
+        assert result.due_today == 1
+        assert result.overdue == 2
+
 
 class TestSpacedRepServiceInterleaving:
     """Tests for card interleaving by topic."""
@@ -0,0 +1,122 @@
+"""
+Unit tests for lazy imports and the startup import benchmark.
+
+Tests cover:
+- LazyModule/lazy_callable defer the import until first use
+- on_load hooks run once, when the module is imported
+- Attribute assignment (patch) is forwarded to the real module
+- `python -X importtime` of app.main and the Celery task module loads none
+  of the heavy dependencies and stays within an import-time budget
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.lazy_imports import HEAVY_MODULES, LazyModule, lazy_callable, lazy_import
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Generous cumulative budget (microseconds) so slow CI runners don't flake;
+# eager heavy imports alone used to exceed it
+STARTUP_IMPORT_BUDGET_US = 5_000_000
+
+
+def import_times(module: str) -> dict[str, int]:
+    """
+    Import `module` in a fresh interpreter with -X importtime.
+
+    Returns:
+        Cumulative import time in microseconds per imported module name
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "PYTHONPATH": str(BACKEND_DIR)},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyModule:
+    """Tests for lazy_import() and lazy_callable()."""
+
+    def test_import_deferred_until_use(self):
+        """The real module is imported on first attribute access."""
+        module = LazyModule("json")
+        with patch("app.lazy_imports.importlib.import_module") as import_module:
+            import_module.return_value = MagicMock(dumps=lambda obj: "[]")
+
+            assert not module.is_loaded
+            assert module.dumps([]) == "[]"
+            assert module.is_loaded
+            import_module.assert_called_once_with("json")
+
+    def test_on_load_hook_runs_once(self):
+        """Load hooks see the real module and run only on import."""
+        hook = MagicMock()
+        module = LazyModule("json")
+        module.add_load_hook(hook)
+        hook.assert_not_called()
+
+        module.load()
+        module.load()
+
+        hook.assert_called_once()
+        assert hook.call_args.args[0].__name__ == "json"
+
+    def test_shared_per_name(self):
+        """lazy_import returns one stand-in per module name."""
+        assert lazy_import("json") is lazy_import("json")
+
+    def test_patch_forwarded(self):
+        """patch() on a stand-in attribute patches the real module."""
+        import json
+
+        module = LazyModule("json")
+        with patch.object(module, "dumps", return_value="patched"):
+            assert json.dumps({}) == "patched"
+        assert json.dumps({}) == "{}"
+
+    def test_lazy_callable(self):
+        """lazy_callable resolves the attribute at call time."""
+        dumps = lazy_callable("json", "dumps")
+
+        assert dumps.__name__ == "dumps"
+        assert dumps({"a": 1}) == '{"a": 1}'
+
+
+class TestStartupImports:
+    """Import-time benchmark for API and worker startup."""
+
+    @pytest.mark.parametrize("module", ["app.main", "app.services.tasks"])
+    def test_heavy_modules_not_imported(self, module):
+        """Starting the API or a worker imports no heavy dependency."""
+        times = import_times(module)
+
+        loaded = [name for name in HEAVY_MODULES if name in times]
+        assert loaded == [], f"{module} imports {loaded} at startup"
+
+    @pytest.mark.parametrize("module", ["app.main", "app.services.tasks"])
+    def test_import_time_budget(self, module):
+        """Cumulative import time stays within the startup budget."""
+        times = import_times(module)
+
+        assert times[module] < STARTUP_IMPORT_BUDGET_US, (
+            f"{module} took {times[module] / 1e6:.2f}s to import"
+        )
@@ -5,6 +5,9 @@ Tests the PipelineConfig flags that control learning material generation.
 The actual task tests are lightweight to avoid Celery broker connections.
 """
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from app.services.processing.pipeline import PipelineConfig
@@ -97,6 +100,45 @@ class TestProcessContentTaskSignature:
         assert sig.parameters["content_id"].default is inspect.Parameter.empty
 
 
+# =============================================================================
+# Test process_content Checkpoint Invalidation
+# =============================================================================
+
+
+class TestProcessContentInvalidation:
+    """Tests that requested checkpoint invalidation happens once per task."""
+
+    def test_retry_after_invalidation_resumes(self):
+        """A retry keeps the checkpoints written by the failed attempt."""
+        from tenacity import wait_none
+
+        from app.services import tasks
+
+        store = MagicMock()
+        store.invalidate = AsyncMock(return_value=1)
+        seen = []
+
+        async def run(content_id, config):
+            seen.append(list(config.invalidate_stages))
+            if len(seen) == 1:
+                raise ConnectionError("database unavailable")
+            return {"status": "completed"}
+
+        with (
+            patch.object(tasks, "CheckpointStore", return_value=store),
+            patch.object(tasks, "_run_llm_processing_impl", side_effect=run),
+            patch.object(tasks, "run_async", side_effect=asyncio.run),
+            patch.object(tasks._process_content_with_retry.retry, "wait", wait_none()),
+        ):
+            result = tasks.process_content(
+                "content-1", config_dict={"invalidate_stages": ["SUMMARIZATION"]}
+            )
+
+        assert result == {"status": "completed"}
+        store.invalidate.assert_awaited_once_with("content-1", ["SUMMARIZATION"])
+        assert seen == [[], []]
+
+
 # =============================================================================
 # Test Capture Router Integration (without Celery)
 # =============================================================================
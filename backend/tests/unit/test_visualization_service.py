@@ -7,7 +7,8 @@ Tests for:
 - Topic hierarchy building
 
 Test organization:
-- TestVisualizationGraph: get_graph method tests
+- TestVisualizationGraph: get_graph method tests (live queries)
+- TestSnapshotGraph: get_graph served from the graph snapshot
 - TestVisualizationStats: get_stats method tests
 - TestNodeDetails: get_node_details method tests
 - TestHealthCheck: check_health method tests
@@ -16,13 +17,16 @@ Test organization:
 """
 
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.enums.knowledge import ConnectionDirection
+from app.enums.knowledge import ConnectionDirection, GraphLevelOfDetail
+from app.services.knowledge_graph.snapshot import compute_snapshot
 from app.services.knowledge_graph.visualization import KnowledgeVisualizationService
 
+VISUALIZATION_MODULE = "app.services.knowledge_graph.visualization"
+
 
 # =============================================================================
 # Test Helpers
@@ -111,6 +115,23 @@ def make_graph_edge(
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def no_snapshot() -> dict[str, AsyncMock]:
+    """
+    Run get_graph without a graph snapshot (live queries, no Redis).
+
+    Returns:
+        The patched get_snapshot_version/get_snapshot_view/request_snapshot_rebuild
+    """
+    mocks = {
+        "get_snapshot_version": AsyncMock(return_value=None),
+        "get_snapshot_view": AsyncMock(return_value=None),
+        "request_snapshot_rebuild": AsyncMock(return_value=True),
+    }
+    with patch.multiple(VISUALIZATION_MODULE, **mocks):
+        yield mocks
+
+
 @pytest.fixture
 def mock_neo4j_client() -> MagicMock:
     """Create a mock Neo4j client with async driver."""
@@ -281,6 +302,159 @@ class TestVisualizationGraph:
         call_args = configured_session.run.call_args_list[0]
         assert call_args.kwargs.get("node_types") == expected_types
 
+    async def test_get_graph_without_snapshot_requests_rebuild(
+        self,
+        visualization_service: KnowledgeVisualizationService,
+        configured_session: AsyncMock,
+        no_snapshot: dict[str, AsyncMock],
+    ) -> None:
+        """Falling back to live queries queues a snapshot rebuild."""
+        count_result = SingleResultMock({"total": 0})
+        graph_result = SingleResultMock({"nodes": [], "edges": []})
+        configured_session.run = AsyncMock(side_effect=[count_result, graph_result])
+
+        result = await visualization_service.get_graph()
+
+        no_snapshot["request_snapshot_rebuild"].assert_awaited_once()
+        assert result["lod"] is None
+        assert result["snapshot_version"] is None
+
+
+# =============================================================================
+# TestSnapshotGraph
+# =============================================================================
+
+
+def make_snapshot_views() -> dict[str, dict[str, Any]]:
+    """Snapshot views for a hub Content node linked to three Concepts and a Note."""
+    raw_nodes = [
+        {"id": "hub", "label": "Hub", "type": "Content", "content_type": "paper"},
+        {"id": "c1", "label": "Concept 1", "type": "Concept"},
+        {"id": "c2", "label": "Concept 2", "type": "Concept"},
+        {"id": "c3", "label": "Concept 3", "type": "Concept"},
+        {"id": "note", "label": "Note", "type": "Note"},
+    ]
+    raw_edges = [
+        {"source": "hub", "target": "c1", "type": "HAS_CONCEPT", "strength": 1.0},
+        {"source": "hub", "target": "c2", "type": "HAS_CONCEPT", "strength": 1.0},
+        {"source": "hub", "target": "c3", "type": "HAS_CONCEPT", "strength": 1.0},
+        {"source": "note", "target": "hub", "type": "REPRESENTS", "strength": 1.0},
+    ]
+    return compute_snapshot(raw_nodes, raw_edges, top_nodes=3, max_clusters=10)
+
+
+class TestSnapshotGraph:
+    """Tests for get_graph served from the graph snapshot."""
+
+    @pytest.fixture
+    def snapshot(self, no_snapshot: dict[str, AsyncMock]) -> dict[str, AsyncMock]:
+        """Serve make_snapshot_views() as snapshot version "v1"."""
+        views = make_snapshot_views()
+        no_snapshot["get_snapshot_version"].return_value = "v1"
+        no_snapshot["get_snapshot_view"].side_effect = lambda version, lod: views[
+            lod.value
+        ]
+        return no_snapshot
+
+    async def test_top_served_without_neo4j(
+        self,
+        visualization_service: KnowledgeVisualizationService,
+        configured_session: AsyncMock,
+        snapshot: dict[str, AsyncMock],
+    ) -> None:
+        """The default view comes from the snapshot, not Neo4j."""
+        configured_session.run = AsyncMock()
+
+        result = await visualization_service.get_graph(limit=10)
+
+        configured_session.run.assert_not_called()
+        snapshot["request_snapshot_rebuild"].assert_not_called()
+        assert result["lod"] == GraphLevelOfDetail.TOP
+        assert result["snapshot_version"] == "v1"
+        assert [n["id"] for n in result["nodes"]][0] == "hub"
+        assert result["total_nodes"] == 5
+
+    async def test_limit_keeps_highest_degree(
+        self,
+        visualization_service: KnowledgeVisualizationService,
+        snapshot: dict[str, AsyncMock],
+    ) -> None:
+        """Limiting keeps the most connected nodes and their edges only."""
+        result = await visualization_service.get_graph(limit=2)
+
+        ids = {n["id"] for n in result["nodes"]}
+        assert len(ids) == 2
+        assert "hub" in ids
+        assert all(
+            e["source"] in ids and e["target"] in ids for e in result["edges"]
+        )
+        assert result["total_edges"] == len(result["edges"]) == 1
+
+    async def test_type_filter_uses_full_view(
+        self,
+        visualization_service: KnowledgeVisualizationService,
+        snapshot: dict[str, AsyncMock],
+    ) -> None:
+        """A type filter selects from the full view, ranked across all types."""
+        result = await visualization_service.get_graph(node_types=["Concept"])
+
+        snapshot["get_snapshot_view"].assert_awaited_once_with(
+            "v1", GraphLevelOfDetail.FULL
+        )
+        assert {n["type"] for n in result["nodes"]} == {"Concept"}
+        assert result["total_nodes"] == 3
+        assert result["edges"] == []
+
+    async def test_clusters_view(
+        self,
+        visualization_service: KnowledgeVisualizationService,
+        snapshot: dict[str, AsyncMock],
+    ) -> None:
+        """The clusters level of detail returns cluster nodes."""
+        result = await visualization_service.get_graph(lod=GraphLevelOfDetail.CLUSTERS)
+
+        assert result["lod"] == GraphLevelOfDetail.CLUSTERS
+        assert result["nodes"]
+        assert {n["type"] for n in result["nodes"]} == {"Cluster"}
+        assert sum(n["size"] for n in result["nodes"]) == 5
+
+    async def test_centered_graph_bypasses_snapshot(
+        self,
+        visualization_service: KnowledgeVisualizationService,
+        configured_session: AsyncMock,
+        snapshot: dict[str, AsyncMock],
+    ) -> None:
+        """Centered graphs are always queried live."""
+        count_result = SingleResultMock({"total": 1})
+        graph_result = SingleResultMock(
+            {"nodes": [make_graph_node("hub", "Hub")], "edges": []}
+        )
+        configured_session.run = AsyncMock(side_effect=[count_result, graph_result])
+
+        result = await visualization_service.get_graph(center_id="hub")
+
+        snapshot["get_snapshot_view"].assert_not_called()
+        assert result["snapshot_version"] is None
+        assert result["center_id"] == "hub"
+
+    async def test_missing_view_falls_back_to_live(
+        self,
+        visualization_service: KnowledgeVisualizationService,
+        configured_session: AsyncMock,
+        snapshot: dict[str, AsyncMock],
+    ) -> None:
+        """An expired snapshot view falls back to the live queries."""
+        snapshot["get_snapshot_view"].side_effect = None
+        snapshot["get_snapshot_view"].return_value = None
+        count_result = SingleResultMock({"total": 0})
+        graph_result = SingleResultMock({"nodes": [], "edges": []})
+        configured_session.run = AsyncMock(side_effect=[count_result, graph_result])
+
+        result = await visualization_service.get_graph()
+
+        assert configured_session.run.await_count == 2
+        assert result["snapshot_version"] is None
+
 
 # =============================================================================
 # TestVisualizationStats
@@ -0,0 +1,180 @@
+"""
+Unit Tests for the Celery Worker Event Loop Runtime
+
+Tests run_async() with and without a persistent worker loop, the loop
+lifecycle, and worker startup/shutdown wiring. Database and Neo4j clients are
+mocked.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.worker_runtime import (
+    init_worker_runtime,
+    is_worker_loop_running,
+    run_async,
+    shutdown_worker_runtime,
+    start_worker_loop,
+    stop_worker_loop,
+)
+
+
+@pytest.fixture
+def worker_loop():
+    """Start a persistent worker loop and stop it after the test."""
+    loop = start_worker_loop()
+    yield loop
+    stop_worker_loop()
+
+
+class TestRunAsync:
+    """Tests for run_async."""
+
+    def test_falls_back_to_asyncio_run_without_worker_loop(self):
+        """Without a worker loop, each call runs in a fresh event loop."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert not is_worker_loop_running()
+        first = run_async(current_loop())
+        second = run_async(current_loop())
+
+        assert first is not second
+        assert first.is_closed()
+
+    def test_fallback_closes_http_client(self):
+        """The shared HTTP client of a fresh loop is closed with the loop."""
+        from app.services import http_client
+
+        async def open_client():
+            return http_client.get_http_client()
+
+        shared = run_async(open_client())
+
+        assert shared.client.is_closed
+        assert http_client._shared_client is None
+
+    def test_runs_on_persistent_loop(self, worker_loop):
+        """All calls share the worker loop, so loop-bound state is reused."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert run_async(current_loop()) is worker_loop
+        assert run_async(current_loop()) is worker_loop
+
+    def test_propagates_exceptions(self, worker_loop):
+        """Exceptions raised by the coroutine reach the task."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_async(fail())
+
+    def test_cancels_coroutine_when_wait_is_interrupted(self, worker_loop):
+        """An interrupted wait (e.g. soft time limit) cancels the coroutine."""
+        started = threading.Event()
+        cancelled = threading.Event()
+
+        async def slow():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        class SoftTimeLimit(Exception):
+            pass
+
+        def interrupted_wait(*args, **kwargs):
+            started.wait(1)
+            raise SoftTimeLimit()
+
+        with patch("concurrent.futures.Future.result", side_effect=interrupted_wait):
+            with pytest.raises(SoftTimeLimit):
+                run_async(slow())
+
+        assert cancelled.wait(1)
+
+
+class TestWorkerLoopLifecycle:
+    """Tests for starting and stopping the worker loop."""
+
+    def test_start_is_idempotent(self, worker_loop):
+        """Starting twice returns the running loop."""
+        assert start_worker_loop() is worker_loop
+
+    def test_stop_closes_loop(self):
+        """Stopping the loop closes it and restores the fallback."""
+        loop = start_worker_loop()
+        stop_worker_loop()
+
+        assert loop.is_closed()
+        assert not is_worker_loop_running()
+
+    def test_stop_without_loop_is_noop(self):
+        """Stopping when no loop was started does nothing."""
+        stop_worker_loop()
+        assert not is_worker_loop_running()
+
+
+class TestWorkerStartup:
+    """Tests for init_worker_runtime / shutdown_worker_runtime."""
+
+    def test_init_pools_engine_and_opens_clients(self):
+        """Startup rebinds the task engine and opens Neo4j on the worker loop."""
+        neo4j_client = MagicMock()
+        neo4j_client.verify_connectivity = AsyncMock(return_value=True)
+        engine = MagicMock()
+        engine.dispose = AsyncMock()
+
+        with (
+            patch(
+                "app.db.base.use_pooled_task_engine", return_value=engine
+            ) as use_pooled,
+            patch("app.db.base.task_engine", engine),
+            patch(
+                "app.services.knowledge_graph.client.get_neo4j_client",
+                AsyncMock(return_value=neo4j_client),
+            ),
+            patch("app.services.llm.client.get_llm_client") as get_llm_client,
+            patch(
+                "app.services.knowledge_graph.client.close_neo4j_client",
+                new_callable=AsyncMock,
+            ) as close_neo4j,
+        ):
+            init_worker_runtime()
+            try:
+                assert is_worker_loop_running()
+                use_pooled.assert_called_once()
+                get_llm_client.assert_called_once()
+                neo4j_client.verify_connectivity.assert_awaited_once()
+            finally:
+                shutdown_worker_runtime()
+
+            close_neo4j.assert_awaited_once()
+            engine.dispose.assert_awaited_once()
+        assert not is_worker_loop_running()
+
+    def test_init_tolerates_neo4j_outage(self):
+        """The worker still starts if Neo4j is unreachable."""
+        with (
+            patch("app.db.base.use_pooled_task_engine"),
+            patch(
+                "app.services.knowledge_graph.client.get_neo4j_client",
+                AsyncMock(side_effect=ConnectionError("down")),
+            ),
+            patch("app.services.llm.client.get_llm_client"),
+        ):
+            init_worker_runtime()
+            try:
+                assert is_worker_loop_running()
+            finally:
+                stop_worker_loop()
+
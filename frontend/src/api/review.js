@@ -65,11 +65,15 @@ export const reviewApi = {
   },
 
   /**
-   * Get count of cards due for review
-   * @returns {Promise<{due_count: number, new_count: number, learning_count: number, review_count: number}>} Counts by card state
+   * Get count of cards due for review (cached briefly server-side)
+   * @param {Object} [options] - Query options
+   * @param {string} [options.topic] - Filter by topic tag
+   * @returns {Promise<{due_count: number}>} Number of cards due now
    */
-  getDueCount: () => 
-    typedApi.GET('/api/review/due/count').then(r => r.data),
+  getDueCount: ({ topic } = {}) =>
+    typedApi.GET('/api/review/due/count', {
+      params: { query: topic ? { topic } : {} }
+    }).then(r => r.data),
 
   /**
    * Rate a card after review using SM-2 rating scale
@@ -37,6 +37,10 @@ Usage:
     # Skip specific stages
     python run_processing.py process <content_uuid> --no-summaries --no-questions
 
+    # Completed stages are checkpointed; re-running restores them. Force
+    # specific stages (and their dependents) to be recomputed:
+    python run_processing.py process <content_uuid> --force --invalidate-stage SUMMARIZATION
+
     # Dry run (show what would be processed without actually processing)
     python run_processing.py process-pending --dry-run
 
@@ -104,9 +108,11 @@ from sqlalchemy.orm import selectinload
 from app.db.base import async_session_maker
 from app.db.models import Content as DBContent, ContentStatus
 from app.models.content import ProcessingStatus
+from app.enums.processing import ProcessingStage
 from app.models.processing import ProcessingResult
 from app.services.storage import load_content, update_status
 from app.services.processing import process_content, PipelineConfig
+from app.services.processing.checkpoints import CheckpointStore
 from app.services.knowledge_graph.client import get_neo4j_client
 
 
@@ -267,6 +273,10 @@ def format_processing_result(result: ProcessingResult) -> str:
         f"⏱️  Processing time: {result.processing_time_seconds:.2f}s",
         f"💰 Estimated cost: ${result.estimated_cost_usd:.4f}",
     ]
+    if result.restored_stages:
+        lines.append(
+            f"♻️  Restored from checkpoint: {', '.join(result.restored_stages)}"
+        )
 
     # Analysis
     lines.append(f"\n📋 Analysis:")
@@ -364,6 +374,7 @@ async def process_single_content(
     force: bool = False,
     output_format: str = "summary",
     output_file: Optional[str] = None,
+    use_checkpoints: bool = True,
 ) -> Optional[ProcessingResult]:
     """Process a single content item."""
     print(f"\n🔍 Loading content: {content_id}")
@@ -388,7 +399,11 @@ async def process_single_content(
     print(f"\n🚀 Starting processing pipeline...")
 
     try:
-        result = await process_content(content, config=config)
+        result = await process_content(
+            content,
+            config=config,
+            checkpoints=CheckpointStore() if use_checkpoints else None,
+        )
 
         # Update status to PROCESSED
         await update_status(content_id, ContentStatus.PROCESSED.value)
@@ -422,6 +437,7 @@ async def process_pending_content(
     limit: int = 10,
     dry_run: bool = False,
     output_format: str = "summary",
+    use_checkpoints: bool = True,
 ) -> list[ProcessingResult]:
     """Process all pending content."""
     async with async_session_maker() as session:
@@ -465,6 +481,7 @@ async def process_pending_content(
             config=config,
             force=False,
             output_format=output_format,
+            use_checkpoints=use_checkpoints,
         )
         if result:
             results.append(result)
@@ -616,6 +633,21 @@ def add_processing_args(parser: argparse.ArgumentParser) -> None:
         help="Skip Neo4j node creation",
     )
 
+    # Checkpoints
+    parser.add_argument(
+        "--invalidate-stage",
+        action="append",
+        default=[],
+        choices=[stage.value for stage in ProcessingStage],
+        metavar="STAGE",
+        help="Discard this stage's checkpoint so it is recomputed (repeatable)",
+    )
+    parser.add_argument(
+        "--no-checkpoints",
+        action="store_true",
+        help="Neither restore nor save stage checkpoints",
+    )
+
 
 def build_config(args: argparse.Namespace) -> PipelineConfig:
     """Build PipelineConfig from command-line arguments."""
@@ -628,6 +660,7 @@ def build_config(args: argparse.Namespace) -> PipelineConfig:
         generate_questions=not getattr(args, "no_questions", False),
         create_obsidian_note=not getattr(args, "no_obsidian", False),
         create_neo4j_nodes=not getattr(args, "no_neo4j", False),
+        invalidate_stages=getattr(args, "invalidate_stage", []),
     )
 
 
@@ -659,6 +692,7 @@ async def main() -> None:
             force=args.force,
             output_format=args.format,
             output_file=getattr(args, "output_file", None),
+            use_checkpoints=not args.no_checkpoints,
         )
 
     elif args.command == "process-pending":
@@ -670,6 +704,7 @@ async def main() -> None:
             limit=args.limit,
             dry_run=args.dry_run,
             output_format=args.format,
+            use_checkpoints=not args.no_checkpoints,
         )
 
 